@@ -3,8 +3,12 @@ MV Del Monte Loadicator - Streamlit Web Application
 Stability Calculator and GZ Curve Generator
 """
 
+from io import BytesIO
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
 import streamlit as st
-import matplotlib.pyplot as plt
 from data_loader import DataLoader
 from interpolation import Interpolator
 from calculator import StabilityCalculator
@@ -20,13 +24,215 @@ st.set_page_config(
 
 
 @st.cache_resource
-def load_data():
-    """Load and cache vessel data from embedded sources"""
+def get_engine():
+    """Load vessel data from embedded sources and build the shared calculation engine"""
     loader = DataLoader(use_embedded=True)
     loader.load_hydrostatic_data()
     loader.load_kn_curves()
     loader.validate_data()
-    return loader
+    interpolator = Interpolator(loader)
+    return SimpleNamespace(
+        loader=loader,
+        interpolator=interpolator,
+        calculator=StabilityCalculator(interpolator),
+        visualizer=Visualizer()
+    )
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def compute_stability(_engine, draft, kg):
+    """Compute and cache stability results for a (draft, KG) condition"""
+    return _engine.calculator.calculate_stability(draft, kg)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def get_gz_plot(draft, kg, _engine, _results):
+    """Render and cache the GZ curve plot as PNG bytes for a (draft, KG) condition"""
+    fig = _engine.visualizer.plot_gz_curve(_results, show_plot=False)
+    buffer = BytesIO()
+    fig.savefig(buffer, format='png', dpi=_engine.visualizer.dpi)
+    return buffer.getvalue()
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def get_gz_table(heel_angles, kn_values, gz_values):
+    """Build and cache the numeric GZ curve data table"""
+    return pd.DataFrame({
+        'Heel Angle (deg)': heel_angles,
+        'KN (m)': np.round(kn_values, 3),
+        'GZ (m)': np.round(gz_values, 3)
+    })
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def get_pdf_report(draft, kg, _engine, _results):
+    """Render and cache the PDF report for a (draft, KG) condition"""
+    return _engine.visualizer.export_to_pdf_bytes(_results)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def get_text_report(draft, kg, _engine, _results):
+    """Generate and cache the text report for a (draft, KG) condition"""
+    return _engine.calculator.generate_report(_results)
+
+
+@st.fragment
+def render_results(engine, results, draft, kg):
+    """Render the results panel; its widgets rerun only this fragment"""
+    # Key metrics
+    st.header("Stability Results")
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric(
+            "Displacement",
+            f"{results['stability']['displacement']:,.0f} t"
+        )
+
+    with col2:
+        gm = results['stability']['gm']
+        st.metric(
+            "GM (Metacentric Height)",
+            f"{gm:.3f} m",
+            delta="OK" if gm >= 0.15 else "LOW"
+        )
+
+    with col3:
+        st.metric(
+            "Maximum GZ",
+            f"{results['stability']['max_gz']:.3f} m",
+            delta=f"at {results['stability']['angle_at_max_gz']:.1f} deg"
+        )
+
+    with col4:
+        compliance = results['compliance']['overall']
+        if compliance['pass']:
+            st.metric("IMO Status", "COMPLIANT")
+        else:
+            st.metric("IMO Status", "NON-COMPLIANT")
+
+    st.divider()
+
+    # Additional parameters
+    st.subheader("Hydrostatic Parameters")
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric("KB", f"{results['stability']['kb']:.3f} m")
+    with col2:
+        st.metric("KM", f"{results['stability']['km']:.3f} m")
+    with col3:
+        vanishing = results['stability']['vanishing_angle']
+        if vanishing:
+            st.metric("Vanishing Angle", f"{vanishing:.1f} deg")
+        else:
+            st.metric("Vanishing Angle", "Not found")
+    with col4:
+        st.metric("GZ at 30 deg", f"{results['stability']['gz_at_30']:.3f} m")
+
+    # Warning for vanishing angle
+    if results['stability']['vanishing_angle'] is None:
+        st.warning(
+            "**Note:** Vanishing angle not found within data range (0-90 degrees). "
+            "GZ remains positive at all calculated heel angles. "
+            "This is a known limitation of the KN curve data at high angles. "
+            "**The IMO stability criteria (evaluated up to 40 degrees) remain fully valid.**"
+        )
+
+    st.divider()
+
+    # GZ Curve Plot
+    st.subheader("GZ Curve (Righting Lever)")
+
+    st.image(get_gz_plot(draft, kg, engine, results))
+
+    st.divider()
+
+    # IMO Compliance Details
+    st.subheader("IMO Intact Stability Code Compliance")
+
+    compliance = results['compliance']
+
+    # Create compliance table
+    criteria_data = []
+    for key, criterion in compliance.items():
+        if key == 'overall':
+            continue
+        criteria_data.append({
+            'Criterion': criterion['requirement'],
+            'Actual Value': f"{criterion['value']:.4f}",
+            'Required': f">= {criterion['limit']}",
+            'Status': criterion['status']
+        })
+
+    # Display with color coding
+    for item in criteria_data:
+        col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
+        with col1:
+            st.write(item['Criterion'])
+        with col2:
+            st.write(item['Actual Value'])
+        with col3:
+            st.write(item['Required'])
+        with col4:
+            if item['Status'] == 'PASS':
+                st.success(item['Status'])
+            else:
+                st.error(item['Status'])
+
+    # Overall status
+    st.divider()
+    if compliance['overall']['pass']:
+        st.success("**OVERALL: VESSEL MEETS ALL IMO INTACT STABILITY CODE REQUIREMENTS**")
+    else:
+        st.error("**OVERALL: VESSEL DOES NOT MEET ALL IMO REQUIREMENTS - REVIEW LOADING CONDITION**")
+
+    st.divider()
+
+    # GZ Curve Data Table
+    with st.expander("View GZ Curve Data Table"):
+        gz_curve = results['gz_curve']
+        gz_df = get_gz_table(
+            tuple(gz_curve['heel_angles']),
+            tuple(gz_curve['kn_values']),
+            tuple(gz_curve['gz_values'])
+        )
+        st.dataframe(
+            gz_df,
+            width="stretch",
+            column_config={
+                'KN (m)': st.column_config.NumberColumn(format="%.3f"),
+                'GZ (m)': st.column_config.NumberColumn(format="%.3f")
+            }
+        )
+
+    # Download section
+    st.divider()
+    st.subheader("Export Report")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # PDF Download (rendered on click, off the script thread)
+        st.download_button(
+            label="Download PDF Report",
+            data=lambda: get_pdf_report(draft, kg, engine, results),
+            file_name=f"stability_report_draft{draft:.2f}_kg{kg:.2f}.pdf",
+            mime="application/pdf",
+            width="stretch"
+        )
+
+    with col2:
+        # Text report
+        text_report = get_text_report(draft, kg, engine, results)
+        st.download_button(
+            label="Download Text Report",
+            data=text_report,
+            file_name=f"stability_report_draft{draft:.2f}_kg{kg:.2f}.txt",
+            mime="text/plain",
+            width="stretch"
+        )
 
 
 def main():
@@ -38,10 +244,8 @@ def main():
 
     # Load data
     try:
-        loader = load_data()
-        interpolator = Interpolator(loader)
-        calculator = StabilityCalculator(interpolator)
-        visualizer = Visualizer()
+        engine = get_engine()
+        loader = engine.loader
     except Exception as e:
         st.error(f"Error loading vessel data: {e}")
         return
@@ -96,37 +300,45 @@ def main():
     # Main input section
     st.header("Input Parameters")
 
-    col1, col2 = st.columns(2)
+    # Inputs only trigger a rerun when the form is submitted
+    with st.form("inputs"):
+        col1, col2 = st.columns(2)
 
-    with col1:
-        draft = st.number_input(
-            "Draft at Perpendiculars (m)",
-            min_value=float(draft_min),
-            max_value=float(draft_max),
-            value=10.0,
-            step=0.01,
-            format="%.2f",
-            help=f"Enter draft between {draft_min:.2f}m and {draft_max:.2f}m"
-        )
+        with col1:
+            draft = st.number_input(
+                "Draft at Perpendiculars (m)",
+                min_value=float(draft_min),
+                max_value=float(draft_max),
+                value=10.0,
+                step=0.01,
+                format="%.2f",
+                help=f"Enter draft between {draft_min:.2f}m and {draft_max:.2f}m"
+            )
 
-    with col2:
-        kg = st.number_input(
-            "KG - Vertical Center of Gravity (m)",
-            min_value=0.1,
-            max_value=15.0,
-            value=8.5,
-            step=0.01,
-            format="%.2f",
-            help="Enter the vertical center of gravity from keel"
+        with col2:
+            kg = st.number_input(
+                "KG - Vertical Center of Gravity (m)",
+                min_value=0.1,
+                max_value=15.0,
+                value=8.5,
+                step=0.01,
+                format="%.2f",
+                help="Enter the vertical center of gravity from keel"
+            )
+
+        submitted = st.form_submit_button(
+            "Calculate Stability", type="primary", width="stretch"
         )
 
     st.divider()
 
-    # Calculate button
-    if st.button("Calculate Stability", type="primary", use_container_width=True):
+    # Calculate on submit
+    if submitted:
+        # Round to widget precision so cached results and reports are shared
+        draft, kg = round(draft, 2), round(kg, 2)
         try:
             with st.spinner("Calculating stability parameters..."):
-                results = calculator.calculate_stability(draft, kg)
+                results = compute_stability(engine, draft, kg)
 
             # Store results in session state
             st.session_state['results'] = results
@@ -145,158 +357,7 @@ def main():
         results = st.session_state['results']
         draft = st.session_state['draft']
         kg = st.session_state['kg']
-
-        # Key metrics
-        st.header("Stability Results")
-
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            st.metric(
-                "Displacement",
-                f"{results['stability']['displacement']:,.0f} t"
-            )
-
-        with col2:
-            gm = results['stability']['gm']
-            st.metric(
-                "GM (Metacentric Height)",
-                f"{gm:.3f} m",
-                delta="OK" if gm >= 0.15 else "LOW"
-            )
-
-        with col3:
-            st.metric(
-                "Maximum GZ",
-                f"{results['stability']['max_gz']:.3f} m",
-                delta=f"at {results['stability']['angle_at_max_gz']:.1f} deg"
-            )
-
-        with col4:
-            compliance = results['compliance']['overall']
-            if compliance['pass']:
-                st.metric("IMO Status", "COMPLIANT")
-            else:
-                st.metric("IMO Status", "NON-COMPLIANT")
-
-        st.divider()
-
-        # Additional parameters
-        st.subheader("Hydrostatic Parameters")
-        col1, col2, col3, col4 = st.columns(4)
-
-        with col1:
-            st.metric("KB", f"{results['stability']['kb']:.3f} m")
-        with col2:
-            st.metric("KM", f"{results['stability']['km']:.3f} m")
-        with col3:
-            vanishing = results['stability']['vanishing_angle']
-            if vanishing:
-                st.metric("Vanishing Angle", f"{vanishing:.1f} deg")
-            else:
-                st.metric("Vanishing Angle", "Not found")
-        with col4:
-            st.metric("GZ at 30 deg", f"{results['stability']['gz_at_30']:.3f} m")
-
-        # Warning for vanishing angle
-        if results['stability']['vanishing_angle'] is None:
-            st.warning(
-                "**Note:** Vanishing angle not found within data range (0-90 degrees). "
-                "GZ remains positive at all calculated heel angles. "
-                "This is a known limitation of the KN curve data at high angles. "
-                "**The IMO stability criteria (evaluated up to 40 degrees) remain fully valid.**"
-            )
-
-        st.divider()
-
-        # GZ Curve Plot
-        st.subheader("GZ Curve (Righting Lever)")
-
-        fig = visualizer.plot_gz_curve(results, show_plot=False)
-        st.pyplot(fig)
-        plt.close(fig)
-
-        st.divider()
-
-        # IMO Compliance Details
-        st.subheader("IMO Intact Stability Code Compliance")
-
-        compliance = results['compliance']
-
-        # Create compliance table
-        criteria_data = []
-        for key, criterion in compliance.items():
-            if key == 'overall':
-                continue
-            criteria_data.append({
-                'Criterion': criterion['requirement'],
-                'Actual Value': f"{criterion['value']:.4f}",
-                'Required': f">= {criterion['limit']}",
-                'Status': criterion['status']
-            })
-
-        # Display with color coding
-        for item in criteria_data:
-            col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
-            with col1:
-                st.write(item['Criterion'])
-            with col2:
-                st.write(item['Actual Value'])
-            with col3:
-                st.write(item['Required'])
-            with col4:
-                if item['Status'] == 'PASS':
-                    st.success(item['Status'])
-                else:
-                    st.error(item['Status'])
-
-        # Overall status
-        st.divider()
-        if compliance['overall']['pass']:
-            st.success("**OVERALL: VESSEL MEETS ALL IMO INTACT STABILITY CODE REQUIREMENTS**")
-        else:
-            st.error("**OVERALL: VESSEL DOES NOT MEET ALL IMO REQUIREMENTS - REVIEW LOADING CONDITION**")
-
-        st.divider()
-
-        # GZ Curve Data Table
-        with st.expander("View GZ Curve Data Table"):
-            gz_curve = results['gz_curve']
-            import pandas as pd
-            gz_df = pd.DataFrame({
-                'Heel Angle (deg)': gz_curve['heel_angles'],
-                'KN (m)': [f"{kn:.3f}" for kn in gz_curve['kn_values']],
-                'GZ (m)': [f"{gz:.3f}" for gz in gz_curve['gz_values']]
-            })
-            st.dataframe(gz_df, use_container_width=True)
-
-        # Download section
-        st.divider()
-        st.subheader("Export Report")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            # PDF Download
-            pdf_bytes = visualizer.export_to_pdf_bytes(results)
-            st.download_button(
-                label="Download PDF Report",
-                data=pdf_bytes,
-                file_name=f"stability_report_draft{draft:.2f}_kg{kg:.2f}.pdf",
-                mime="application/pdf",
-                use_container_width=True
-            )
-
-        with col2:
-            # Text report
-            text_report = calculator.generate_report(results)
-            st.download_button(
-                label="Download Text Report",
-                data=text_report,
-                file_name=f"stability_report_draft{draft:.2f}_kg{kg:.2f}.txt",
-                mime="text/plain",
-                use_container_width=True
-            )
+        render_results(engine, results, draft, kg)
 
     # Footer
     st.divider()
@@ -4,7 +4,23 @@ Performs stability calculations and IMO compliance checks
 """
 
 import numpy as np
-from datetime import datetime
+import time
+
+
+# Format used when displaying results['input']['timestamp']
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# IMO Intact Stability Code Requirements
+# (result key, requirement text, calculated value key, minimum value)
+IMO_CRITERIA = [
+    ('gm_criterion', 'GM ≥ 0.15 m', 'gm', 0.15),
+    ('area_0_30_criterion', 'Area 0-30° ≥ 0.055 m·rad', 'area_0_30', 0.055),
+    ('area_0_40_criterion', 'Area 0-40° ≥ 0.090 m·rad', 'area_0_40', 0.090),
+    ('area_30_40_criterion', 'Area 30-40° ≥ 0.030 m·rad', 'area_30_40', 0.030),
+    ('gz_30_criterion', 'GZ at 30° ≥ 0.20 m', 'gz_at_30', 0.20),
+    ('max_gz_angle_criterion', 'Angle of max GZ ≥ 25°', 'angle_at_max_gz', 25.0),
+]
+_IMO_LIMITS = np.array([limit for *_, limit in IMO_CRITERIA], dtype=np.float64)
 
 
 class StabilityCalculator:
@@ -35,126 +51,192 @@ class StabilityCalculator:
         
         # Calculate GZ curve
         gz_curve = self.interpolator.calculate_gz_curve(draft, kg)
+        gz_curve['_angle_index'] = self._build_angle_index(gz_curve)
         
         # Find key stability parameters
         max_gz, angle_at_max_gz = self.interpolator.find_max_gz(gz_curve)
         vanishing_angle = self.interpolator.find_vanishing_angle(gz_curve)
         
-        # Calculate areas under GZ curve (for IMO criteria)
-        area_0_30 = self.interpolator.calculate_gz_area(gz_curve, 0, 30)
-        area_0_40 = self.interpolator.calculate_gz_area(gz_curve, 0, 40)
-        area_30_40 = self.interpolator.calculate_gz_area(gz_curve, 30, 40)
+        # Calculate areas under GZ curve (for IMO criteria) from one cumulative integral
+        cum_area = self._precompute_cum_area(gz_curve)
+        area_0_30 = self._area_between(cum_area, 0, 30)
+        area_0_40 = self._area_between(cum_area, 0, 40)
+        area_30_40 = area_0_40 - area_0_30
         
         # Get GZ at 30 degrees
         gz_at_30 = self._get_gz_at_angle(gz_curve, 30)
         
+        stability = {
+            'displacement': properties['Displacement'],
+            'kb': properties['KB'],
+            'km': properties['KM'],
+            'gm': properties['KM'] - kg,
+            'max_gz': max_gz,
+            'angle_at_max_gz': angle_at_max_gz,
+            'vanishing_angle': vanishing_angle,
+            'gz_at_30': gz_at_30
+        }
+        
+        areas = {
+            'area_0_30': area_0_30,
+            'area_0_40': area_0_40,
+            'area_30_40': area_30_40
+        }
+        
         # Compile results
         results = {
             'input': {
                 'draft': draft,
                 'kg': kg,
-                'calculation_time': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                'timestamp': time.time()
             },
             'hydrostatic': properties,
-            'stability': {
-                'displacement': properties['Displacement'],
-                'kb': properties['KB'],
-                'km': properties['KM'],
-                'gm': properties['KM'] - kg,
-                'max_gz': max_gz,
-                'angle_at_max_gz': angle_at_max_gz,
-                'vanishing_angle': vanishing_angle,
-                'gz_at_30': gz_at_30
-            },
-            'areas': {
-                'area_0_30': area_0_30,
-                'area_0_40': area_0_40,
-                'area_30_40': area_30_40
-            },
+            'stability': stability,
+            'areas': areas,
             'gz_curve': gz_curve,
-            'compliance': self.check_imo_compliance(gz_curve, properties['KM'] - kg)
+            'compliance': self.check_imo_compliance({**stability, **areas})
         }
         
         return results
     
+    @staticmethod
+    def _build_angle_index(gz_curve):
+        """Map each heel angle of a GZ curve to its position"""
+        return {angle: idx for idx, angle in enumerate(gz_curve['heel_angles'])}
+    
     def _get_gz_at_angle(self, gz_curve, target_angle):
         """Get GZ value at specific angle (with interpolation if needed)"""
         heel_angles = gz_curve['heel_angles']
         gz_values = gz_curve['gz_values']
         
-        if target_angle in heel_angles:
-            idx = heel_angles.index(target_angle)
+        angle_index = gz_curve.get('_angle_index')
+        if angle_index is None:
+            angle_index = self._build_angle_index(gz_curve)
+        
+        idx = angle_index.get(target_angle)
+        if idx is not None:
             return gz_values[idx]
         
         # Interpolate
         return np.interp(target_angle, heel_angles, gz_values)
     
-    def check_imo_compliance(self, gz_curve, gm):
+    @staticmethod
+    def _precompute_cum_area(gz_curve):
+        """
+        Integrate the GZ curve once with the trapezoidal rule
+        
+        Args:
+            gz_curve: GZ curve dictionary (gz_values may be 2D, one curve per row)
+            
+        Returns:
+            Tuple of (heel angles in radians, cumulative area in m·rad from the first angle)
+        """
+        angles_rad = gz_curve.get('heel_angles_rad')
+        if angles_rad is None:
+            angles_rad = np.radians(gz_curve['heel_angles'])
+        gz_values = np.asarray(gz_curve['gz_values'], dtype=np.float64)
+        
+        cum_area = np.zeros_like(gz_values)
+        cum_area[..., 1:] = np.cumsum(
+            0.5 * (gz_values[..., :-1] + gz_values[..., 1:]) * np.diff(angles_rad), axis=-1
+        )
+        
+        return angles_rad, cum_area
+    
+    @staticmethod
+    def _interp_last_axis(x, xp, fp):
+        """Linear interpolation at scalar x along the last axis of fp (clamped like np.interp)"""
+        idx = int(np.clip(np.searchsorted(xp, x), 1, len(xp) - 1))
+        t = min(max((x - xp[idx - 1]) / (xp[idx] - xp[idx - 1]), 0.0), 1.0)
+        return fp[..., idx - 1] + t * (fp[..., idx] - fp[..., idx - 1])
+    
+    @classmethod
+    def _area_between(cls, cum_area, angle_start, angle_end):
+        """Area under GZ curve between two angles (degrees) from a cumulative integral"""
+        angles_rad, cum = cum_area
+        
+        if len(angles_rad) < 2:
+            return 0.0
+        
+        area_start = cls._interp_last_axis(np.radians(angle_start), angles_rad, cum)
+        area_end = cls._interp_last_axis(np.radians(angle_end), angles_rad, cum)
+        return area_end - area_start
+    
+    def calculate_stability_grid(self, drafts, kgs):
+        """
+        Calculate the IMO stability parameters over a grid of drafts and KGs
+        
+        Intended for sensitivity sweeps: KN depends only on draft, so each
+        draft's curve is interpolated once and the GZ curves for every KG are
+        evaluated together as one array.
+        
+        Args:
+            drafts: Sequence of drafts in meters
+            kgs: Sequence of KG values in meters
+            
+        Returns:
+            Dictionary of arrays shaped (len(drafts), len(kgs)) keyed like the
+            'stability' and 'areas' results (gm, max_gz, angle_at_max_gz, gz_at_30,
+            area_0_30, area_0_40, area_30_40), plus 'compliant', 'drafts' and 'kgs'
+        """
+        drafts = np.atleast_1d(np.asarray(drafts, dtype=np.float64))
+        kgs = np.atleast_1d(np.asarray(kgs, dtype=np.float64))
+        
+        keys = ('gm', 'max_gz', 'angle_at_max_gz', 'gz_at_30', 'area_0_30', 'area_0_40', 'area_30_40')
+        grid = {key: np.empty((len(drafts), len(kgs))) for key in keys}
+        
+        for i, draft in enumerate(drafts):
+            # KN interpolated once for this draft, GZ for all KGs at once
+            gz_curves = self.interpolator.calculate_gz_curves_batch(draft, kgs)
+            heel_angles = gz_curves['heel_angles']
+            gz_values = gz_curves['gz_values']
+            
+            max_idx = np.argmax(gz_values, axis=1)
+            cum_area = self._precompute_cum_area(gz_curves)
+            
+            grid['gm'][i] = gz_curves['gm']
+            grid['max_gz'][i] = gz_values[np.arange(len(kgs)), max_idx]
+            grid['angle_at_max_gz'][i] = heel_angles[max_idx]
+            grid['gz_at_30'][i] = self._interp_last_axis(30.0, heel_angles, gz_values)
+            grid['area_0_30'][i] = self._area_between(cum_area, 0, 30)
+            grid['area_0_40'][i] = self._area_between(cum_area, 0, 40)
+        
+        grid['area_30_40'] = grid['area_0_40'] - grid['area_0_30']
+        grid['compliant'] = np.all(
+            [grid[value_key] >= limit for _, _, value_key, limit in IMO_CRITERIA], axis=0
+        )
+        grid['drafts'] = drafts
+        grid['kgs'] = kgs
+        
+        return grid
+    
+    def check_imo_compliance(self, precomputed):
         """
         Check compliance with IMO Intact Stability Code
         
         Args:
-            gz_curve: GZ curve dictionary
-            gm: Metacentric height (GM) in meters
+            precomputed: Dictionary with the already calculated criterion values
+                (gm, max_gz, angle_at_max_gz, gz_at_30, area_0_30, area_0_40, area_30_40)
             
         Returns:
             Dictionary with compliance status for each criterion
         """
-        # Calculate required values
-        max_gz, angle_at_max_gz = self.interpolator.find_max_gz(gz_curve)
-        gz_at_30 = self._get_gz_at_angle(gz_curve, 30)
-        area_0_30 = self.interpolator.calculate_gz_area(gz_curve, 0, 30)
-        area_0_40 = self.interpolator.calculate_gz_area(gz_curve, 0, 40)
-        area_30_40 = self.interpolator.calculate_gz_area(gz_curve, 30, 40)
+        values = np.array([precomputed[value_key] for _, _, value_key, _ in IMO_CRITERIA], dtype=np.float64)
+        passes = values >= _IMO_LIMITS
         
-        # IMO Intact Stability Code Requirements
         compliance = {
-            'gm_criterion': {
-                'requirement': 'GM ≥ 0.15 m',
-                'value': gm,
-                'limit': 0.15,
-                'pass': gm >= 0.15,
-                'status': 'PASS' if gm >= 0.15 else 'FAIL'
-            },
-            'area_0_30_criterion': {
-                'requirement': 'Area 0-30° ≥ 0.055 m·rad',
-                'value': area_0_30,
-                'limit': 0.055,
-                'pass': area_0_30 >= 0.055,
-                'status': 'PASS' if area_0_30 >= 0.055 else 'FAIL'
-            },
-            'area_0_40_criterion': {
-                'requirement': 'Area 0-40° ≥ 0.090 m·rad',
-                'value': area_0_40,
-                'limit': 0.090,
-                'pass': area_0_40 >= 0.090,
-                'status': 'PASS' if area_0_40 >= 0.090 else 'FAIL'
-            },
-            'area_30_40_criterion': {
-                'requirement': 'Area 30-40° ≥ 0.030 m·rad',
-                'value': area_30_40,
-                'limit': 0.030,
-                'pass': area_30_40 >= 0.030,
-                'status': 'PASS' if area_30_40 >= 0.030 else 'FAIL'
-            },
-            'gz_30_criterion': {
-                'requirement': 'GZ at 30° ≥ 0.20 m',
-                'value': gz_at_30,
-                'limit': 0.20,
-                'pass': gz_at_30 >= 0.20,
-                'status': 'PASS' if gz_at_30 >= 0.20 else 'FAIL'
-            },
-            'max_gz_angle_criterion': {
-                'requirement': 'Angle of max GZ ≥ 25°',
-                'value': angle_at_max_gz,
-                'limit': 25.0,
-                'pass': angle_at_max_gz >= 25.0,
-                'status': 'PASS' if angle_at_max_gz >= 25.0 else 'FAIL'
+            key: {
+                'requirement': requirement,
+                'value': precomputed[value_key],
+                'limit': limit,
+                'pass': bool(passed),
+                'status': 'PASS' if passed else 'FAIL'
             }
+            for (key, requirement, value_key, limit), passed in zip(IMO_CRITERIA, passes)
         }
         
         # Overall compliance
-        all_pass = all(criterion['pass'] for criterion in compliance.values())
+        all_pass = bool(passes.all())
         compliance['overall'] = {
             'status': 'COMPLIANT' if all_pass else 'NON-COMPLIANT',
             'pass': all_pass
@@ -172,90 +254,88 @@ class StabilityCalculator:
         Returns:
             Formatted text report
         """
-        report = []
-        report.append("=" * 80)
-        report.append("STABILITY CALCULATION REPORT")
-        report.append("MV DEL MONTE - LOADICATOR")
-        report.append("=" * 80)
-        report.append("")
-        
-        # Input data
-        report.append("INPUT DATA:")
-        report.append(f"  Draft at Perpendiculars: {results['input']['draft']:.2f} m")
-        report.append(f"  KG (Vertical Center of Gravity): {results['input']['kg']:.2f} m")
-        report.append(f"  Calculation Time: {results['input']['calculation_time']}")
-        report.append("")
-        
-        # Calculated values
-        report.append("CALCULATED VALUES:")
-        report.append(f"  Displacement (Δ): {results['stability']['displacement']:,.0f} tonnes")
-        report.append(f"  KB (Center of Buoyancy): {results['stability']['kb']:.3f} m")
-        report.append(f"  KM (Transverse Metacenter): {results['stability']['km']:.3f} m")
-        report.append(f"  GM (Metacentric Height): {results['stability']['gm']:.3f} m")
-        report.append("")
-        
-        # Stability parameters
-        report.append("STABILITY PARAMETERS:")
-        report.append(f"  Maximum GZ: {results['stability']['max_gz']:.3f} m")
-        report.append(f"  Angle at Maximum GZ: {results['stability']['angle_at_max_gz']:.1f}°")
-        if results['stability']['vanishing_angle']:
-            report.append(f"  Angle of Vanishing Stability: {results['stability']['vanishing_angle']:.1f}°")
-        report.append(f"  GZ at 30°: {results['stability']['gz_at_30']:.3f} m")
-        report.append("")
-        
-        # Areas under GZ curve
-        report.append("AREAS UNDER GZ CURVE:")
-        report.append(f"  Area 0-30°: {results['areas']['area_0_30']:.4f} m·rad")
-        report.append(f"  Area 0-40°: {results['areas']['area_0_40']:.4f} m·rad")
-        report.append(f"  Area 30-40°: {results['areas']['area_30_40']:.4f} m·rad")
-        report.append("")
-        
-        # GZ curve data
-        report.append("GZ CURVE DATA:")
-        report.append("  Heel Angle (°) | KN (m)  | GZ (m)")
-        report.append("  " + "-" * 40)
-        
+        inputs = results['input']
+        stability = results['stability']
+        areas = results['areas']
+        compliance = results['compliance']
         gz_curve = results['gz_curve']
-        for angle, kn, gz in zip(gz_curve['heel_angles'], gz_curve['kn_values'], gz_curve['gz_values']):
-            report.append(f"       {angle:3d}       | {kn:7.3f} | {gz:7.3f}")
         
-        report.append("")
+        rule = "=" * 80
+        calculation_time = time.strftime(TIMESTAMP_FORMAT, time.localtime(inputs['timestamp']))
         
-        # IMO Compliance
-        report.append("=" * 80)
-        report.append("IMO INTACT STABILITY CODE COMPLIANCE CHECK")
-        report.append("=" * 80)
-        report.append("")
+        vanishing_line = ""
+        if stability['vanishing_angle']:
+            vanishing_line = f"  Angle of Vanishing Stability: {stability['vanishing_angle']:.1f}°\n"
         
-        compliance = results['compliance']
+        # GZ curve table rows, formatted column-wise
+        gz_rows = np.char.add(
+            np.char.add(
+                np.char.mod("       %3d       |", np.asarray(gz_curve['heel_angles'])),
+                np.char.mod(" %7.3f |", np.asarray(gz_curve['kn_values']))
+            ),
+            np.char.mod(" %7.3f", np.asarray(gz_curve['gz_values']))
+        )
+        gz_table = "".join(f"{row}\n" for row in gz_rows)
         
-        for key, criterion in compliance.items():
-            if key == 'overall':
-                continue
-            
-            report.append(f"  {criterion['requirement']}")
-            report.append(f"    Value: {criterion['value']:.4f}")
-            report.append(f"    Status: {criterion['status']}")
-            report.append("")
-        
-        # Overall compliance
-        report.append("-" * 80)
-        report.append(f"OVERALL COMPLIANCE: {compliance['overall']['status']}")
-        report.append("-" * 80)
-        report.append("")
+        criteria = "".join(
+            f"  {criterion['requirement']}\n"
+            f"    Value: {criterion['value']:.4f}\n"
+            f"    Status: {criterion['status']}\n"
+            f"\n"
+            for key, criterion in compliance.items()
+            if key != 'overall'
+        )
         
         if compliance['overall']['pass']:
-            report.append("✓ The vessel meets all IMO Intact Stability Code requirements.")
+            conclusion = "✓ The vessel meets all IMO Intact Stability Code requirements.\n"
         else:
-            report.append("✗ The vessel does NOT meet all IMO Intact Stability Code requirements.")
-            report.append("  Please review failed criteria and adjust loading condition.")
-        
-        report.append("")
-        report.append("=" * 80)
-        report.append("END OF REPORT")
-        report.append("=" * 80)
+            conclusion = (
+                "✗ The vessel does NOT meet all IMO Intact Stability Code requirements.\n"
+                "  Please review failed criteria and adjust loading condition.\n"
+            )
         
-        return "\n".join(report)
+        return f"""{rule}
+STABILITY CALCULATION REPORT
+MV DEL MONTE - LOADICATOR
+{rule}
+
+INPUT DATA:
+  Draft at Perpendiculars: {inputs['draft']:.2f} m
+  KG (Vertical Center of Gravity): {inputs['kg']:.2f} m
+  Calculation Time: {calculation_time}
+
+CALCULATED VALUES:
+  Displacement (Δ): {stability['displacement']:,.0f} tonnes
+  KB (Center of Buoyancy): {stability['kb']:.3f} m
+  KM (Transverse Metacenter): {stability['km']:.3f} m
+  GM (Metacentric Height): {stability['gm']:.3f} m
+
+STABILITY PARAMETERS:
+  Maximum GZ: {stability['max_gz']:.3f} m
+  Angle at Maximum GZ: {stability['angle_at_max_gz']:.1f}°
+{vanishing_line}  GZ at 30°: {stability['gz_at_30']:.3f} m
+
+AREAS UNDER GZ CURVE:
+  Area 0-30°: {areas['area_0_30']:.4f} m·rad
+  Area 0-40°: {areas['area_0_40']:.4f} m·rad
+  Area 30-40°: {areas['area_30_40']:.4f} m·rad
+
+GZ CURVE DATA:
+  Heel Angle (°) | KN (m)  | GZ (m)
+  {"-" * 40}
+{gz_table}
+{rule}
+IMO INTACT STABILITY CODE COMPLIANCE CHECK
+{rule}
+
+{criteria}{"-" * 80}
+OVERALL COMPLIANCE: {compliance['overall']['status']}
+{"-" * 80}
+
+{conclusion}
+{rule}
+END OF REPORT
+{rule}"""
 
 
 if __name__ == "__main__":
@@ -6,7 +6,25 @@ Loads and parses hydrostatic data and KN curves from CSV files or embedded data
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from io import StringIO
+import base64
+import textwrap
+from io import BytesIO
+
+
+# Hydrostatic columns retained after loading (Draft plus interpolated properties)
+HYDROSTATIC_COLUMNS = ['Draft', 'Displacement', 'TPC', 'MTC', 'LCB', 'LCF', 'KB', 'TKM']
+
+
+def _encode_arrays(**arrays):
+    """Serialize NumPy arrays to base64 text (compressed .npz archive)"""
+    buffer = BytesIO()
+    np.savez_compressed(buffer, **arrays)
+    return textwrap.fill(base64.b64encode(buffer.getvalue()).decode("ascii"), 100) + "\n"
+
+
+def _decode_arrays(text):
+    """Deserialize NumPy arrays written by _encode_arrays"""
+    return np.load(BytesIO(base64.b64decode(text)))
 
 
 class DataLoader:
@@ -18,12 +36,21 @@ class DataLoader:
 
         Args:
             data_dir: Directory containing the CSV files (ignored if use_embedded=True)
-            use_embedded: If True, load data from embedded_data.py instead of files
+            use_embedded: If True, load pre-parsed data from embedded_data.py instead of files
         """
         self.data_dir = Path(data_dir)
         self.use_embedded = use_embedded
         self.hydrostatic_data = None
+        self.draft_arr = None
+        self.disp_arr = None
+        self.kb_arr = None
+        self.tkm_arr = None
         self.kn_curves = None
+        self.kn_angles = None
+        self.kn_disps = None
+        self.kn_matrix = None
+        self.kn_disp_min = None
+        self.kn_disp_max = None
         
     def load_hydrostatic_data(self, filename="Hydrostatic Data.csv"):
         """
@@ -36,38 +63,50 @@ class DataLoader:
             pandas DataFrame with hydrostatic properties
         """
         if self.use_embedded:
+            # Stored already renamed and typed, so no CSV parsing is needed
             import embedded_data
-            df = pd.read_csv(StringIO(embedded_data.HYDROSTATIC_DATA))
+            arrays = _decode_arrays(embedded_data.HYDROSTATIC_NPZ)
+            df = pd.DataFrame({col: arrays[col] for col in HYDROSTATIC_COLUMNS if col in arrays})
         else:
             filepath = self.data_dir / filename
             df = pd.read_csv(filepath)
+            
+            # Clean column names (remove special characters)
+            df.columns = df.columns.str.strip()
+            
+            # Rename columns for easier access
+            column_mapping = {
+                'Draft (m)': 'Draft',
+                'Δ(tonne)': 'Displacement',
+                'Diff': 'Diff',
+                'TPC (tonnes)': 'TPC',
+                'MTC (t ‐ m)': 'MTC',
+                'LCB (m)': 'LCB',
+                'LCF (m)': 'LCF',
+                'KB (m)': 'KB',
+                'TKM (m)': 'TKM'
+            }
+            
+            df = df.rename(columns=column_mapping)
+            
+            # Keep only the properties the interpolator uses; drops Diff and the
+            # unnamed F/A marker columns so the cached frame stays small and numeric
+            df = df[[col for col in HYDROSTATIC_COLUMNS if col in df.columns]].copy()
         
-        # Clean column names (remove special characters)
-        df.columns = df.columns.str.strip()
-        
-        # Rename columns for easier access
-        column_mapping = {
-            'Draft (m)': 'Draft',
-            'Δ(tonne)': 'Displacement',
-            'Diff': 'Diff',
-            'TPC (tonnes)': 'TPC',
-            'MTC (t ‐ m)': 'MTC',
-            'LCB (m)': 'LCB',
-            'LCF (m)': 'LCF',
-            'KB (m)': 'KB',
-            'TKM (m)': 'TKM'
-        }
-        
-        df = df.rename(columns=column_mapping)
-        
-        # Remove any duplicate rows
-        df = df.drop_duplicates(subset=['Draft'])
-        
-        # Sort by draft
-        df = df.sort_values('Draft').reset_index(drop=True)
+        # Remove any duplicate rows and sort by draft, skipping the copies
+        # when the drafts are already strictly increasing (e.g. embedded data)
+        if not np.all(np.diff(df['Draft'].values) > 0):
+            df = df.drop_duplicates(subset=['Draft'])
+            df = df.sort_values('Draft').reset_index(drop=True)
         
         self.hydrostatic_data = df
         
+        # Contiguous float64 copies of the columns used on every interpolation
+        self.draft_arr, self.disp_arr, self.kb_arr, self.tkm_arr = [
+            np.ascontiguousarray(df[col].values, dtype=np.float64)
+            for col in ('Draft', 'Displacement', 'KB', 'TKM')
+        ]
+        
         print(f"✓ Loaded hydrostatic data: {len(df)} data points")
         print(f"  Draft range: {df['Draft'].min():.2f}m to {df['Draft'].max():.2f}m")
         print(f"  Displacement range: {df['Displacement'].min():.0f} to {df['Displacement'].max():.0f} tonnes")
@@ -85,60 +124,61 @@ class DataLoader:
             Dictionary with heel angles as keys and DataFrames as values
         """
         if self.use_embedded:
+            # Stored as the numeric X/Y table, so no CSV parsing is needed
             import embedded_data
-            df = pd.read_csv(StringIO(embedded_data.KN_CURVES_DATA))
+            arrays = _decode_arrays(embedded_data.KN_CURVES_NPZ)
+            heel_angles = arrays['angles'].tolist()
+            values = arrays['table']
         else:
             filepath = self.data_dir / filename
-            df = pd.read_csv(filepath)
+            # The row under the header labels each column pair "X"/"Y"; reading
+            # those labels as NaN lets the parser type every column as float64
+            df = pd.read_csv(filepath, na_values=['X', 'Y'])
+            
+            # Parse the header to get heel angles
+            # Format: "5 degrees", "10 degrees", etc.
+            header = df.columns.tolist()
+            
+            # Extract heel angles from header
+            heel_angles = []
+            for i in range(0, len(header), 2):
+                if i < len(header):
+                    col_name = header[i]
+                    # Extract number from column name (e.g., "5 degrees" -> 5)
+                    try:
+                        angle = float(col_name.split()[0])
+                        heel_angles.append(angle)
+                    except:
+                        pass
+            
+            # Coerce any remaining non-numeric columns, then cast the table once
+            text_cols = df.columns[df.dtypes == object]
+            if len(text_cols):
+                df[text_cols] = df[text_cols].apply(pd.to_numeric, errors='coerce')
+            values = df.to_numpy(dtype=np.float64)
         
-        # Parse the header to get heel angles
-        # Format: "5 degrees", "10 degrees", etc.
-        header = df.columns.tolist()
-        
-        # Extract heel angles from header
-        heel_angles = []
-        for i in range(0, len(header), 2):
-            if i < len(header):
-                col_name = header[i]
-                # Extract number from column name (e.g., "5 degrees" -> 5)
-                try:
-                    angle = float(col_name.split()[0])
-                    heel_angles.append(angle)
-                except:
-                    pass
+        # Split into X (displacement) / Y (KN) column pairs
+        n_curves = min(len(heel_angles), values.shape[1] // 2)
+        displacements = values[:, 0:2 * n_curves:2]
+        kn_values = values[:, 1:2 * n_curves:2]
+        valid = ~(np.isnan(displacements) | np.isnan(kn_values))
         
         # Parse data into dictionary of DataFrames
         kn_curves = {}
         
-        for idx, angle in enumerate(heel_angles):
-            x_col = idx * 2
-            y_col = idx * 2 + 1
+        for idx, angle in enumerate(heel_angles[:n_curves]):
+            x = displacements[valid[:, idx], idx]
+            y = kn_values[valid[:, idx], idx]
+            
+            # Sort by displacement (unless already in order)
+            if not np.all(np.diff(x) >= 0):
+                order = np.argsort(x, kind='stable')
+                x, y = x[order], y[order]
             
-            if y_col < len(header):
-                # Extract X (displacement) and Y (KN) columns
-                x_data = df.iloc[:, x_col].dropna()
-                y_data = df.iloc[:, y_col].dropna()
-                
-                # Ensure same length
-                min_len = min(len(x_data), len(y_data))
-                x_data = x_data.iloc[:min_len]
-                y_data = y_data.iloc[:min_len]
-                
-                # Create DataFrame for this heel angle
-                angle_df = pd.DataFrame({
-                    'Displacement': pd.to_numeric(x_data.values, errors='coerce'),
-                    'KN': pd.to_numeric(y_data.values, errors='coerce')
-                })
-                
-                # Remove any rows with invalid data
-                angle_df = angle_df.dropna()
-                
-                # Sort by displacement
-                angle_df = angle_df.sort_values('Displacement').reset_index(drop=True)
-                
-                kn_curves[angle] = angle_df
+            kn_curves[angle] = pd.DataFrame({'Displacement': x, 'KN': y})
         
         self.kn_curves = kn_curves
+        self._build_kn_matrix()
         
         print(f"✓ Loaded KN curves: {len(kn_curves)} heel angles")
         print(f"  Heel angles: {sorted(kn_curves.keys())}°")
@@ -151,21 +191,97 @@ class DataLoader:
         
         return kn_curves
     
+    def _build_kn_matrix(self):
+        """
+        Resample all KN curves onto a common displacement grid
+
+        Stores the curves as contiguous arrays (one row per heel angle) so the
+        KN values for every heel angle at a given displacement can be found
+        with a single vectorized lookup. Each curve's own displacement range is
+        kept so callers can still reject extrapolated values.
+        """
+        angles = sorted(self.kn_curves.keys())
+        curves = [self.kn_curves[angle] for angle in angles]
+        
+        # Union of all displacement points keeps every curve's breakpoints,
+        # so the resampled rows are identical to the original piecewise-linear curves
+        disps = np.unique(np.concatenate([df['Displacement'].values for df in curves]))
+        
+        self.kn_angles = np.array(angles, dtype=np.float64)
+        self.kn_disps = disps.astype(np.float64)
+        self.kn_matrix = np.vstack([
+            np.interp(self.kn_disps, df['Displacement'].values, df['KN'].values)
+            for df in curves
+        ])
+        self.kn_disp_min = np.array([df['Displacement'].min() for df in curves], dtype=np.float64)
+        self.kn_disp_max = np.array([df['Displacement'].max() for df in curves], dtype=np.float64)
+    
+    def get_kn_row(self, displacement):
+        """
+        Get KN values for all tabulated heel angles at given displacement
+
+        Args:
+            displacement: Displacement in tonnes
+
+        Returns:
+            Array of KN values in meters, one per angle in kn_angles
+        """
+        if self.kn_matrix is None:
+            raise ValueError("KN curves not loaded")
+        
+        disps = self.kn_disps
+        idx = min(max(int(np.searchsorted(disps, displacement)), 1), len(disps) - 1)
+        d0, d1 = disps[idx - 1], disps[idx]
+        t = min(max((displacement - d0) / (d1 - d0), 0.0), 1.0)
+        
+        return self.kn_matrix[:, idx - 1] + t * (self.kn_matrix[:, idx] - self.kn_matrix[:, idx - 1])
+    
+    def write_embedded_data(self, path="embedded_data.py"):
+        """
+        Write the loaded data to a Python module as base64-encoded NumPy archives
+
+        Regenerates embedded_data.py after the CSV files change, e.g.
+        DataLoader().load_hydrostatic_data(); ...load_kn_curves(); ...write_embedded_data()
+
+        Args:
+            path: Output module path
+        """
+        self.validate_data()
+        
+        df = self.hydrostatic_data
+        hydrostatic = {col: df[col].values for col in df.columns}
+        
+        # Pack the curves back into a NaN-padded X/Y table
+        angles = sorted(self.kn_curves.keys())
+        n_rows = max(len(self.kn_curves[angle]) for angle in angles)
+        table = np.full((n_rows, 2 * len(angles)), np.nan)
+        for idx, angle in enumerate(angles):
+            curve = self.kn_curves[angle]
+            table[:len(curve), 2 * idx] = curve['Displacement'].values
+            table[:len(curve), 2 * idx + 1] = curve['KN'].values
+        
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("# Embedded Data for Loadicator\n")
+            f.write("# Generated by DataLoader.write_embedded_data() from the CSV files - do not edit\n\n")
+            f.write(f'HYDROSTATIC_NPZ = """\n{_encode_arrays(**hydrostatic)}"""\n\n')
+            f.write(f'KN_CURVES_NPZ = """\n{_encode_arrays(angles=np.array(angles), table=table)}"""\n')
+        
+        print(f"✓ Wrote embedded data: {path}")
+    
     def get_draft_range(self):
         """Get the valid draft range from hydrostatic data"""
         if self.hydrostatic_data is None:
             return None, None
-        return self.hydrostatic_data['Draft'].min(), self.hydrostatic_data['Draft'].max()
+        # Drafts are sorted on load, so the range is the first and last entries
+        return self.draft_arr[0], self.draft_arr[-1]
     
     def get_displacement_range(self):
         """Get the valid displacement range from KN curves"""
         if self.kn_curves is None:
             return None, None
         
-        # Get range from first heel angle
-        first_angle = sorted(self.kn_curves.keys())[0]
-        df = self.kn_curves[first_angle]
-        return df['Displacement'].min(), df['Displacement'].max()
+        # Get range from first heel angle (kn_angles is sorted)
+        return self.kn_disp_min[0], self.kn_disp_max[0]
     
     def validate_data(self):
         """Validate that all required data is loaded"""
@@ -1,1388 +1,532 @@
-# Embedded CSV Data for Loadicator
+# Embedded Data for Loadicator
+# Generated by DataLoader.write_embedded_data() from the CSV files - do not edit
 
-HYDROSTATIC_DATA = """Draft (m),Δ(tonne),Diff,TPC (tonnes),MTC (t ‐ m),LCB (m),,LCF (m),,KB (m),TKM (m)
-2.00,10497,56,56.2,688.4,8.84,F,8.30,F,1.02,40.19
-2.01,10553,56,56.2,688.7,8.84,F,8.30,F,1.03,40.12
-2.02,10609,56,56.2,688.9,8.84,F,8.29,F,1.03,40.05
-2.03,10666,56,56.2,689.2,8.83,F,8.29,F,1.04,39.97
-2.04,10722,56,56.2,689.5,8.83,F,8.29,F,1.04,39.90
-2.05,10778,56,56.3,689.7,8.83,F,8.28,F,1.05,39.83
-2.06,10834,56,56.3,690.0,8.83,F,8.28,F,1.05,39.76
-2.07,10891,56,56.3,690.3,8.82,F,8.28,F,1.06,39.69
-2.08,10947,56,56.3,690.6,8.82,F,8.27,F,1.06,39.61
-2.09,11003,56,56.3,690.8,8.82,F,8.27,F,1.07,39.54
-2.10,11060,56,56.3,691.1,8.82,F,8.27,F,1.07,39.47
-2.11,11116,56,56.3,691.4,8.82,F,8.26,F,1.08,39.40
-2.12,11172,56,56.3,691.6,8.81,F,8.26,F,1.08,39.33
-2.13,11229,56,56.3,691.9,8.81,F,8.26,F,1.09,39.25
-2.14,11285,56,56.3,692.2,8.81,F,8.25,F,1.09,39.18
-2.15,11341,56,56.4,692.4,8.81,F,8.25,F,1.10,39.11
-2.16,11398,56,56.4,692.7,8.80,F,8.25,F,1.10,39.04
-2.17,11454,56,56.4,693.0,8.80,F,8.24,F,1.11,38.97
-2.18,11510,56,56.4,693.3,8.80,F,8.24,F,1.11,38.89
-2.19,11567,56,56.4,693.5,8.80,F,8.24,F,1.12,38.82
-2.20,11623,56,56.4,693.8,8.80,F,8.23,F,1.12,38.75
-2.21,11680,56,56.4,694.1,8.79,F,8.23,F,1.13,38.68
-2.22,11736,56,56.4,694.3,8.79,F,8.23,F,1.13,38.61
-2.23,11792,56,56.4,694.6,8.79,F,8.22,F,1.14,38.53
-2.24,11849,56,56.5,694.9,8.79,F,8.22,F,1.14,38.46
-2.25,11905,56,56.5,695.1,8.78,F,8.22,F,1.15,38.39
-2.26,11962,56,56.5,695.4,8.78,F,8.21,F,1.15,38.32
-2.27,12018,56,56.5,695.7,8.78,F,8.21,F,1.16,38.25
-2.28,12075,56,56.5,696.0,8.78,F,8.21,F,1.16,38.17
-2.29,12131,56,56.5,696.2,8.77,F,8.20,F,1.17,38.10
-2.30,12188,56,56.5,696.5,8.77,F,8.20,F,1.17,38.03
-2.31,12244,57,56.5,696.8,8.77,F,8.20,F,1.18,37.96
-2.32,12301,57,56.5,697.0,8.77,F,8.19,F,1.19,37.89
-2.33,12357,57,56.5,697.3,8.77,F,8.19,F,1.19,37.81
-2.34,12414,57,56.6,697.6,8.76,F,8.19,F,1.20,37.74
-2.35,12471,57,56.6,697.8,8.76,F,8.18,F,1.20,37.67
-2.36,12527,57,56.6,698.1,8.76,F,8.18,F,1.21,37.60
-2.37,12584,57,56.6,698.4,8.76,F,8.18,F,1.21,37.53
-2.38,12640,57,56.6,698.6,8.75,F,8.17,F,1.22,37.45
-2.39,12697,57,56.6,698.9,8.75,F,8.17,F,1.22,37.38
-2.40,12754,57,56.6,699.2,8.75,F,8.17,F,1.23,37.31
-2.41,12810,57,56.6,699.5,8.75,F,8.16,F,1.23,37.24
-2.42,12867,57,56.6,699.7,8.75,F,8.16,F,1.24,37.17
-2.43,12924,57,56.7,700.0,8.74,F,8.16,F,1.24,37.09
-2.44,12980,57,56.7,700.3,8.74,F,8.15,F,1.25,37.02
-2.45,13037,57,56.7,700.5,8.74,F,8.15,F,1.25,36.95
-2.46,13094,57,56.7,700.8,8.74,F,8.15,F,1.26,36.88
-2.47,13150,57,56.7,701.1,8.73,F,8.14,F,1.26,36.81
-2.48,13207,57,56.7,701.3,8.73,F,8.14,F,1.27,36.73
-2.49,13264,57,56.7,701.6,8.73,F,8.14,F,1.27,36.66
-2.50,13320,57,56.7,701.9,8.73,F,8.14,F,1.28,36.59
-2.50,13320,57,56.7,701.9,8.73,F,8.14,F,1.28,36.59
-2.51,13377,57,56.7,702.2,8.73,F,8.13,F,1.28,36.52
-2.52,13434,57,56.7,702.4,8.72,F,8.13,F,1.29,36.45
-2.53,13491,57,56.8,702.7,8.72,F,8.13,F,1.29,36.37
-2.54,13547,57,56.8,703.0,8.72,F,8.12,F,1.30,36.30
-2.55,13604,57,56.8,703.2,8.72,F,8.12,F,1.30,36.23
-2.56,13661,57,56.8,703.5,8.71,F,8.12,F,1.31,36.16
-2.57,13718,57,56.8,703.8,8.71,F,8.11,F,1.31,36.09
-2.58,13775,57,56.8,704.0,8.71,F,8.11,F,1.32,36.01
-2.59,13831,57,56.8,704.3,8.71,F,8.11,F,1.32,35.94
-2.60,13888,57,56.8,704.6,8.71,F,8.10,F,1.33,35.87
-2.61,13945,57,56.8,704.8,8.70,F,8.10,F,1.34,35.80
-2.62,14002,57,56.9,705.1,8.70,F,8.10,F,1.34,35.73
-2.63,14059,57,56.9,705.4,8.70,F,8.09,F,1.35,35.65
-2.64,14116,57,56.9,705.7,8.70,F,8.09,F,1.35,35.58
-2.65,14173,57,56.9,705.9,8.69,F,8.09,F,1.36,35.51
-2.66,14229,57,56.9,706.2,8.69,F,8.08,F,1.36,35.44
-2.67,14286,57,56.9,706.5,8.69,F,8.08,F,1.37,35.37
-2.68,14343,57,56.9,706.7,8.69,F,8.08,F,1.37,35.29
-2.69,14400,57,56.9,707.0,8.68,F,8.07,F,1.38,35.22
-2.70,14457,57,56.9,707.3,8.68,F,8.07,F,1.38,35.15
-2.71,14514,57,56.9,707.5,8.68,F,8.07,F,1.39,35.08
-2.72,14571,57,57.0,707.8,8.68,F,8.06,F,1.39,35.01
-2.73,14628,57,57.0,708.1,8.68,F,8.06,F,1.40,34.93
-2.74,14685,57,57.0,708.4,8.67,F,8.06,F,1.40,34.86
-2.75,14742,57,57.0,708.6,8.67,F,8.05,F,1.41,34.79
-2.76,14799,57,57.0,708.9,8.67,F,8.05,F,1.41,34.72
-2.77,14856,57,57.0,709.2,8.67,F,8.05,F,1.42,34.65
-2.78,14913,57,57.0,709.4,8.66,F,8.04,F,1.42,34.57
-2.79,14970,57,57.0,709.7,8.66,F,8.04,F,1.43,34.50
-2.80,15027,57,57.0,710.0,8.66,F,8.04,F,1.43,34.43
-2.81,15084,57,57.1,710.2,8.66,F,8.03,F,1.44,34.36
-2.82,15141,57,57.1,710.5,8.66,F,8.03,F,1.44,34.29
-2.83,15198,57,57.1,710.8,8.65,F,8.03,F,1.45,34.21
-2.84,15255,57,57.1,711.1,8.65,F,8.02,F,1.45,34.14
-2.85,15312,57,57.1,711.3,8.65,F,8.02,F,1.46,34.07
-2.86,15369,57,57.1,711.6,8.65,F,8.02,F,1.46,34.00
-2.87,15427,57,57.1,711.9,8.64,F,8.01,F,1.47,33.93
-2.88,15484,57,57.1,712.1,8.64,F,8.01,F,1.47,33.85
-2.89,15541,57,57.1,712.4,8.64,F,8.01,F,1.48,33.78
-2.90,15598,57,57.1,712.7,8.64,F,8.00,F,1.48,33.71
-2.91,15655,57,57.2,712.9,8.64,F,8.00,F,1.49,33.64
-2.92,15712,57,57.2,713.2,8.63,F,8.00,F,1.50,33.57
-2.93,15769,57,57.2,713.5,8.63,F,7.99,F,1.50,33.49
-2.94,15827,57,57.2,713.7,8.63,F,7.99,F,1.51,33.42
-2.95,15884,57,57.2,714.0,8.63,F,7.99,F,1.51,33.35
-2.96,15941,57,57.2,714.3,8.62,F,7.98,F,1.52,33.28
-2.97,15998,57,57.2,714.6,8.62,F,7.98,F,1.52,33.21
-2.98,16056,57,57.2,714.8,8.62,F,7.98,F,1.53,33.13
-2.99,16113,57,57.2,715.1,8.62,F,7.97,F,1.53,33.06
-3.00,16170,57,57.3,715.4,8.62,F,7.97,F,1.54,32.99
-3.00,16170,57,57.3,715.4,8.62,F,7.97,F,1.54,32.99
-3.01,16227,57,57.3,715.6,8.61,F,7.97,F,1.54,32.92
-3.02,16285,57,57.3,715.9,8.61,F,7.96,F,1.55,32.85
-3.03,16342,57,57.3,716.2,8.61,F,7.96,F,1.55,32.77
-3.04,16399,57,57.3,716.4,8.61,F,7.96,F,1.56,32.70
-3.05,16456,57,57.3,716.7,8.60,F,7.95,F,1.56,32.63
-3.06,16514,57,57.3,717.0,8.60,F,7.95,F,1.57,32.56
-3.07,16571,57,57.3,717.3,8.60,F,7.95,F,1.57,32.49
-3.08,16628,57,57.3,717.5,8.60,F,7.94,F,1.58,32.41
-3.09,16686,57,57.3,717.8,8.59,F,7.94,F,1.58,32.34
-3.10,16743,57,57.4,718.1,8.59,F,7.94,F,1.59,32.27
-3.11,16800,57,57.4,718.3,8.59,F,7.93,F,1.59,32.20
-3.12,16858,57,57.4,718.6,8.59,F,7.93,F,1.60,32.13
-3.13,16915,57,57.4,718.9,8.59,F,7.93,F,1.60,32.05
-3.14,16973,57,57.4,719.1,8.58,F,7.92,F,1.61,31.98
-3.15,17030,57,57.4,719.4,8.58,F,7.92,F,1.61,31.91
-3.16,17087,57,57.4,719.7,8.58,F,7.92,F,1.62,31.84
-3.17,17145,57,57.4,720.0,8.58,F,7.91,F,1.62,31.77
-3.18,17202,57,57.4,720.2,8.57,F,7.91,F,1.63,31.69
-3.19,17260,57,57.4,720.5,8.57,F,7.91,F,1.63,31.62
-3.20,17317,57,57.5,720.8,8.57,F,7.90,F,1.64,31.55
-3.21,17375,57,57.5,721.0,8.57,F,7.90,F,1.65,31.48
-3.22,17432,57,57.5,721.3,8.57,F,7.90,F,1.65,31.41
-3.23,17490,57,57.5,721.6,8.56,F,7.89,F,1.66,31.33
-3.24,17547,57,57.5,721.8,8.56,F,7.89,F,1.66,31.26
-3.25,17605,57,57.5,722.1,8.56,F,7.89,F,1.67,31.19
-3.26,17662,57,57.5,722.4,8.56,F,7.88,F,1.67,31.12
-3.27,17720,57,57.5,722.6,8.55,F,7.88,F,1.68,31.05
-3.28,17777,57,57.5,722.9,8.55,F,7.88,F,1.68,30.97
-3.29,17835,57,57.6,723.2,8.55,F,7.87,F,1.69,30.90
-3.30,17892,57,57.6,723.5,8.55,F,7.87,F,1.69,30.83
-3.31,17950,58,57.6,723.7,8.55,F,7.87,F,1.70,30.76
-3.32,18008,58,57.6,724.0,8.54,F,7.86,F,1.70,30.69
-3.33,18065,58,57.6,724.3,8.54,F,7.86,F,1.71,30.61
-3.34,18123,58,57.6,724.5,8.54,F,7.86,F,1.71,30.54
-3.35,18180,58,57.6,724.8,8.54,F,7.85,F,1.72,30.47
-3.36,18238,58,57.6,725.1,8.53,F,7.85,F,1.72,30.40
-3.37,18296,58,57.6,725.3,8.53,F,7.85,F,1.73,30.33
-3.38,18353,58,57.6,725.6,8.53,F,7.84,F,1.73,30.25
-3.39,18411,58,57.7,725.9,8.53,F,7.84,F,1.74,30.18
-3.40,18469,58,57.7,726.2,8.53,F,7.84,F,1.74,30.11
-3.41,18526,58,57.7,726.4,8.52,F,7.83,F,1.75,30.04
-3.42,18584,58,57.7,726.7,8.52,F,7.83,F,1.75,29.97
-3.43,18642,58,57.7,727.0,8.52,F,7.83,F,1.76,29.89
-3.44,18699,58,57.7,727.2,8.52,F,7.82,F,1.76,29.82
-3.45,18757,58,57.7,727.5,8.51,F,7.82,F,1.77,29.75
-3.46,18815,58,57.7,727.8,8.51,F,7.82,F,1.77,29.68
-3.47,18873,58,57.7,728.0,8.51,F,7.81,F,1.78,29.61
-3.48,18930,58,57.8,728.3,8.51,F,7.81,F,1.78,29.53
-3.49,18988,58,57.8,728.6,8.50,F,7.81,F,1.79,29.46
-3.50,19046,58,57.8,728.8,8.50,F,7.81,F,1.79,29.39
-3.50,19046,58,57.8,728.8,8.50,F,7.81,F,1.79,29.39
-3.51,19104,58,57.8,729.1,8.50,F,7.80,F,1.80,29.32
-3.52,19161,58,57.8,729.4,8.50,F,7.80,F,1.81,29.25
-3.53,19219,58,57.8,729.7,8.50,F,7.80,F,1.81,29.17
-3.54,19277,58,57.8,729.9,8.49,F,7.79,F,1.82,29.10
-3.55,19335,58,57.8,730.2,8.49,F,7.79,F,1.82,29.03
-3.56,19393,58,57.8,730.5,8.49,F,7.79,F,1.83,28.96
-3.57,19451,58,57.8,730.7,8.49,F,7.78,F,1.83,28.89
-3.58,19508,58,57.9,731.0,8.48,F,7.78,F,1.84,28.81
-3.59,19566,58,57.9,731.3,8.48,F,7.78,F,1.84,28.74
-3.60,19624,58,57.9,731.5,8.48,F,7.77,F,1.85,28.67
-3.61,19682,58,57.9,731.8,8.48,F,7.77,F,1.85,28.60
-3.62,19740,58,57.9,732.1,8.48,F,7.77,F,1.86,28.53
-3.63,19798,58,57.9,732.4,8.47,F,7.76,F,1.86,28.45
-3.64,19856,58,57.9,732.6,8.47,F,7.76,F,1.87,28.38
-3.65,19914,58,57.9,732.9,8.47,F,7.76,F,1.87,28.31
-3.66,19972,58,57.9,733.2,8.47,F,7.75,F,1.88,28.24
-3.67,20030,58,58.0,733.4,8.46,F,7.75,F,1.88,28.17
-3.68,20088,58,58.0,733.7,8.46,F,7.75,F,1.89,28.09
-3.69,20146,58,58.0,734.0,8.46,F,7.74,F,1.89,28.02
-3.70,20204,58,58.0,734.2,8.46,F,7.74,F,1.90,27.95
-3.71,20262,58,58.0,734.5,8.46,F,7.74,F,1.90,27.88
-3.72,20320,58,58.0,734.8,8.45,F,7.73,F,1.91,27.81
-3.73,20378,58,58.0,735.1,8.45,F,7.73,F,1.91,27.73
-3.74,20436,58,58.0,735.3,8.45,F,7.73,F,1.92,27.66
-3.75,20494,58,58.0,735.6,8.45,F,7.72,F,1.92,27.59
-3.76,20552,58,58.0,735.9,8.44,F,7.72,F,1.93,27.52
-3.77,20610,58,58.1,736.1,8.44,F,7.72,F,1.93,27.45
-3.78,20668,58,58.1,736.4,8.44,F,7.71,F,1.94,27.37
-3.79,20726,58,58.1,736.7,8.44,F,7.71,F,1.94,27.30
-3.80,20784,58,58.1,736.9,8.44,F,7.71,F,1.95,27.23
-3.81,20842,58,58.1,737.2,8.43,F,7.70,F,1.96,27.16
-3.82,20900,58,58.1,737.5,8.43,F,7.70,F,1.96,27.09
-3.83,20958,58,58.1,737.7,8.43,F,7.70,F,1.97,27.01
-3.84,21017,58,58.1,738.0,8.43,F,7.69,F,1.97,26.94
-3.85,21075,58,58.1,738.3,8.42,F,7.69,F,1.98,26.87
-3.86,21133,58,58.2,738.6,8.42,F,7.69,F,1.98,26.80
-3.87,21191,58,58.2,738.8,8.42,F,7.68,F,1.99,26.73
-3.88,21249,58,58.2,739.1,8.42,F,7.68,F,1.99,26.65
-3.89,21307,58,58.2,739.4,8.41,F,7.68,F,2.00,26.58
-3.90,21366,58,58.2,739.6,8.41,F,7.67,F,2.00,26.51
-3.91,21424,58,58.2,739.9,8.41,F,7.67,F,2.01,26.44
-3.92,21482,58,58.2,740.2,8.41,F,7.67,F,2.01,26.37
-3.93,21540,58,58.2,740.4,8.41,F,7.66,F,2.02,26.29
-3.94,21598,58,58.2,740.7,8.40,F,7.66,F,2.02,26.22
-3.95,21657,58,58.2,741.0,8.40,F,7.66,F,2.03,26.15
-3.96,21715,58,58.3,741.3,8.40,F,7.65,F,2.03,26.08
-3.97,21773,58,58.3,741.5,8.40,F,7.65,F,2.04,26.01
-3.98,21831,58,58.3,741.8,8.39,F,7.65,F,2.04,25.93
-3.99,21890,58,58.3,742.1,8.39,F,7.64,F,2.05,25.86
-4.00,21948,58,58.3,742.3,8.39,F,7.64,F,2.05,25.79
-4.00,21948,58,58.3,742.3,8.39,F,7.64,F,2.05,25.79
-4.01,22006,58,58.3,742.6,8.39,F,7.64,F,2.06,25.72
-4.02,22065,58,58.3,742.9,8.39,F,7.63,F,2.06,25.65
-4.03,22123,58,58.3,743.1,8.38,F,7.63,F,2.07,25.57
-4.04,22181,58,58.3,743.4,8.38,F,7.63,F,2.07,25.50
-4.05,22240,58,58.4,743.7,8.38,F,7.62,F,2.08,25.43
-4.06,22298,58,58.4,744.0,8.38,F,7.62,F,2.08,25.36
-4.07,22356,58,58.4,744.2,8.37,F,7.62,F,2.09,25.29
-4.08,22415,58,58.4,744.5,8.37,F,7.61,F,2.09,25.21
-4.09,22473,58,58.4,744.8,8.37,F,7.61,F,2.10,25.14
-4.10,22532,58,58.4,745.0,8.37,F,7.61,F,2.10,25.07
-4.11,22590,58,58.4,745.3,8.37,F,7.60,F,2.11,25.00
-4.12,22648,58,58.4,745.6,8.36,F,7.60,F,2.12,24.93
-4.13,22707,58,58.4,745.8,8.36,F,7.60,F,2.12,24.85
-4.14,22765,58,58.4,746.1,8.36,F,7.59,F,2.13,24.78
-4.15,22824,58,58.5,746.4,8.36,F,7.59,F,2.13,24.71
-4.16,22882,58,58.5,746.6,8.35,F,7.59,F,2.14,24.64
-4.17,22941,58,58.5,746.9,8.35,F,7.58,F,2.14,24.57
-4.18,22999,58,58.5,747.2,8.35,F,7.58,F,2.15,24.49
-4.19,23058,58,58.5,747.5,8.35,F,7.58,F,2.15,24.42
-4.20,23116,58,58.5,747.7,8.35,F,7.57,F,2.16,24.35
-4.21,23175,58,58.5,748.0,8.34,F,7.57,F,2.16,24.28
-4.22,23233,58,58.5,748.3,8.34,F,7.57,F,2.17,24.21
-4.23,23292,58,58.5,748.5,8.34,F,7.56,F,2.17,24.13
-4.24,23350,58,58.6,748.8,8.34,F,7.56,F,2.18,24.06
-4.25,23409,58,58.6,749.1,8.33,F,7.56,F,2.18,23.99
-4.26,23468,58,58.6,749.3,8.33,F,7.55,F,2.19,23.92
-4.27,23526,58,58.6,749.6,8.33,F,7.55,F,2.19,23.85
-4.28,23585,58,58.6,749.9,8.33,F,7.55,F,2.20,23.77
-4.29,23643,58,58.6,750.2,8.32,F,7.54,F,2.20,23.70
-4.30,23702,58,58.6,750.4,8.32,F,7.54,F,2.21,23.63
-4.31,23761,59,58.6,750.7,8.32,F,7.54,F,2.21,23.56
-4.32,23819,59,58.6,751.0,8.32,F,7.53,F,2.22,23.49
-4.33,23878,59,58.6,751.2,8.32,F,7.53,F,2.22,23.41
-4.34,23936,59,58.7,751.5,8.31,F,7.53,F,2.23,23.34
-4.35,23995,59,58.7,751.8,8.31,F,7.52,F,2.23,23.27
-4.36,24054,59,58.7,752.0,8.31,F,7.52,F,2.24,23.20
-4.37,24113,59,58.7,752.3,8.31,F,7.52,F,2.24,23.13
-4.38,24171,59,58.7,752.6,8.30,F,7.51,F,2.25,23.05
-4.39,24230,59,58.7,752.9,8.30,F,7.51,F,2.25,22.98
-4.40,24289,59,58.7,753.1,8.30,F,7.51,F,2.26,22.91
-4.41,24347,59,58.7,753.4,8.30,F,7.50,F,2.27,22.84
-4.42,24406,59,58.7,753.7,8.30,F,7.50,F,2.27,22.77
-4.43,24465,59,58.8,753.9,8.29,F,7.50,F,2.28,22.69
-4.44,24524,59,58.8,754.2,8.29,F,7.49,F,2.28,22.62
-4.45,24582,59,58.8,754.5,8.29,F,7.49,F,2.29,22.55
-4.46,24641,59,58.8,754.7,8.29,F,7.49,F,2.29,22.48
-4.47,24700,59,58.8,755.0,8.28,F,7.48,F,2.30,22.41
-4.48,24759,59,58.8,755.3,8.28,F,7.48,F,2.30,22.33
-4.49,24818,59,58.8,755.5,8.28,F,7.48,F,2.31,22.26
-4.50,24876,59,58.8,755.8,8.28,F,7.48,F,2.31,22.19
-4.50,24876,59,58.8,755.8,8.28,F,7.48,F,2.31,22.19
-4.51,24935,59,58.8,756.1,8.28,F,7.47,F,2.32,22.12
-4.52,24994,59,58.8,756.4,8.27,F,7.47,F,2.32,22.05
-4.53,25053,59,58.9,756.6,8.27,F,7.47,F,2.33,21.97
-4.54,25112,59,58.9,756.9,8.27,F,7.46,F,2.33,21.90
-4.55,25171,59,58.9,757.2,8.27,F,7.46,F,2.34,21.83
-4.56,25230,59,58.9,757.4,8.26,F,7.46,F,2.34,21.76
-4.57,25289,59,58.9,757.7,8.26,F,7.45,F,2.35,21.69
-4.58,25347,59,58.9,758.0,8.26,F,7.45,F,2.35,21.61
-4.59,25406,59,58.9,758.2,8.26,F,7.45,F,2.36,21.54
-4.60,25465,59,58.9,758.5,8.26,F,7.44,F,2.36,21.47
-4.61,25524,59,58.9,758.8,8.25,F,7.44,F,2.37,21.40
-4.62,25583,59,59.0,759.1,8.25,F,7.44,F,2.37,21.33
-4.63,25642,59,59.0,759.3,8.25,F,7.43,F,2.38,21.25
-4.64,25701,59,59.0,759.6,8.25,F,7.43,F,2.38,21.18
-4.65,25760,59,59.0,759.9,8.24,F,7.43,F,2.39,21.11
-4.66,25819,59,59.0,760.1,8.24,F,7.42,F,2.39,21.04
-4.67,25878,59,59.0,760.4,8.24,F,7.42,F,2.40,20.97
-4.68,25937,59,59.0,760.7,8.24,F,7.42,F,2.40,20.89
-4.69,25996,59,59.0,760.9,8.23,F,7.41,F,2.41,20.82
-4.70,26055,59,59.0,761.2,8.23,F,7.41,F,2.41,20.75
-4.71,26114,59,59.0,761.5,8.23,F,7.41,F,2.42,20.68
-4.72,26173,59,59.1,761.7,8.23,F,7.40,F,2.43,20.61
-4.73,26232,59,59.1,762.0,8.23,F,7.40,F,2.43,20.53
-4.74,26291,59,59.1,762.3,8.22,F,7.40,F,2.44,20.46
-4.75,26350,59,59.1,762.6,8.22,F,7.39,F,2.44,20.39
-4.76,26410,59,59.1,762.8,8.22,F,7.39,F,2.45,20.32
-4.77,26469,59,59.1,763.1,8.22,F,7.39,F,2.45,20.25
-4.78,26528,59,59.1,763.4,8.21,F,7.38,F,2.46,20.17
-4.79,26587,59,59.1,763.6,8.21,F,7.38,F,2.46,20.10
-4.80,26646,59,59.1,763.9,8.21,F,7.38,F,2.47,20.03
-4.81,26705,59,59.2,764.2,8.21,F,7.37,F,2.47,19.96
-4.82,26764,59,59.2,764.4,8.21,F,7.37,F,2.48,19.89
-4.83,26824,59,59.2,764.7,8.20,F,7.37,F,2.48,19.81
-4.84,26883,59,59.2,765.0,8.20,F,7.36,F,2.49,19.74
-4.85,26942,59,59.2,765.3,8.20,F,7.36,F,2.49,19.67
-4.86,27001,59,59.2,765.5,8.20,F,7.36,F,2.50,19.60
-4.87,27060,59,59.2,765.8,8.19,F,7.35,F,2.50,19.53
-4.88,27120,59,59.2,766.1,8.19,F,7.35,F,2.51,19.45
-4.89,27179,59,59.2,766.3,8.19,F,7.35,F,2.51,19.38
-4.90,27238,59,59.2,766.6,8.19,F,7.34,F,2.52,19.31
-4.91,27297,59,59.3,766.9,8.19,F,7.34,F,2.52,19.24
-4.92,27357,59,59.3,767.1,8.18,F,7.34,F,2.53,19.17
-4.93,27416,59,59.3,767.4,8.18,F,7.33,F,2.53,19.09
-4.94,27475,59,59.3,767.7,8.18,F,7.33,F,2.54,19.02
-4.95,27534,59,59.3,768.0,8.18,F,7.33,F,2.54,18.95
-4.96,27594,59,59.3,768.2,8.17,F,7.32,F,2.55,18.88
-4.97,27653,59,59.3,768.5,8.17,F,7.32,F,2.55,18.81
-4.98,27712,59,59.3,768.8,8.17,F,7.32,F,2.56,18.73
-4.99,27772,59,59.3,769.0,8.17,F,7.31,F,2.56,18.66
-5.00,27831,59,59.4,769.3,8.17,F,7.31,F,2.57,18.59
-5.00,27831,60,59.5,769.3,8.17,F,7.31,F,2.57,18.59
-5.01,27891,60,59.5,769.4,8.16,F,7.31,F,2.58,18.57
-5.02,27951,60,59.5,769.6,8.16,F,7.30,F,2.58,18.55
-5.03,28011,60,59.5,769.7,8.16,F,7.30,F,2.59,18.53
-5.04,28071,60,59.5,769.8,8.16,F,7.29,F,2.59,18.51
-5.05,28130,60,59.5,770.0,8.16,F,7.29,F,2.60,18.48
-5.06,28190,60,59.5,770.1,8.15,F,7.28,F,2.60,18.46
-5.07,28250,60,59.5,770.2,8.15,F,7.28,F,2.61,18.44
-5.08,28310,60,59.5,770.4,8.15,F,7.27,F,2.61,18.42
-5.09,28370,60,59.5,770.5,8.15,F,7.27,F,2.62,18.40
-5.10,28430,60,59.5,770.6,8.15,F,7.26,F,2.62,18.38
-5.11,28490,60,59.5,770.8,8.14,F,7.26,F,2.63,18.36
-5.12,28550,60,59.5,770.9,8.14,F,7.25,F,2.63,18.34
-5.13,28609,60,59.5,771.1,8.14,F,7.25,F,2.64,18.32
-5.14,28669,60,59.5,771.2,8.14,F,7.24,F,2.64,18.29
-5.15,28729,60,59.5,771.3,8.14,F,7.24,F,2.65,18.27
-5.16,28789,60,59.5,771.5,8.13,F,7.23,F,2.65,18.25
-5.17,28849,60,59.5,771.6,8.13,F,7.23,F,2.66,18.23
-5.18,28909,60,59.5,771.7,8.13,F,7.23,F,2.66,18.21
-5.19,28969,60,59.5,771.9,8.13,F,7.22,F,2.67,18.19
-5.20,29028,60,59.5,772.0,8.13,F,7.22,F,2.67,18.17
-5.21,29088,60,59.5,772.1,8.13,F,7.21,F,2.68,18.15
-5.22,29148,60,59.5,772.3,8.12,F,7.21,F,2.68,18.13
-5.23,29208,60,59.5,772.4,8.12,F,7.20,F,2.69,18.10
-5.24,29268,60,59.5,772.5,8.12,F,7.20,F,2.69,18.08
-5.25,29328,60,59.5,772.7,8.12,F,7.19,F,2.70,18.06
-5.26,29388,60,59.5,772.8,8.12,F,7.19,F,2.70,18.04
-5.27,29448,60,59.5,772.9,8.11,F,7.18,F,2.71,18.02
-5.28,29507,60,59.5,773.1,8.11,F,7.18,F,2.71,18.00
-5.29,29567,60,59.5,773.2,8.11,F,7.17,F,2.72,17.98
-5.30,29627,60,59.5,773.3,8.11,F,7.17,F,2.72,17.96
-5.31,29687,60,59.5,773.5,8.11,F,7.16,F,2.73,17.94
-5.32,29747,60,59.5,773.6,8.10,F,7.16,F,2.73,17.91
-5.33,29807,60,59.5,773.8,8.10,F,7.15,F,2.74,17.89
-5.34,29867,60,59.5,773.9,8.10,F,7.15,F,2.74,17.87
-5.35,29927,60,59.5,774.0,8.10,F,7.15,F,2.75,17.85
-5.36,29986,60,59.5,774.2,8.10,F,7.14,F,2.75,17.83
-5.37,30046,60,59.5,774.3,8.09,F,7.14,F,2.76,17.81
-5.38,30106,60,59.5,774.4,8.09,F,7.13,F,2.76,17.79
-5.39,30166,60,59.5,774.6,8.09,F,7.13,F,2.77,17.77
-5.40,30226,60,59.5,774.7,8.09,F,7.12,F,2.77,17.75
-5.41,30286,60,59.5,774.8,8.09,F,7.12,F,2.78,17.72
-5.42,30346,60,59.5,775.0,8.09,F,7.11,F,2.78,17.70
-5.43,30405,60,59.5,775.1,8.08,F,7.11,F,2.79,17.68
-5.44,30465,60,59.5,775.2,8.08,F,7.10,F,2.79,17.66
-5.45,30525,60,59.5,775.4,8.08,F,7.10,F,2.80,17.64
-5.46,30585,60,59.5,775.5,8.08,F,7.09,F,2.80,17.62
-5.47,30645,60,59.5,775.6,8.08,F,7.09,F,2.81,17.60
-5.48,30705,60,59.5,775.8,8.07,F,7.08,F,2.81,17.58
-5.49,30765,60,59.5,775.9,8.07,F,7.08,F,2.82,17.56
-5.50,30825,60,59.5,776.0,8.07,F,7.08,F,2.82,17.53
-5.50,30825,60,59.5,776.0,8.07,F,7.08,F,2.82,17.53
-5.51,30884,60,59.5,776.2,8.07,F,7.07,F,2.83,17.51
-5.52,30944,60,59.5,776.3,8.07,F,7.07,F,2.84,17.49
-5.53,31004,60,59.5,776.5,8.06,F,7.06,F,2.84,17.47
-5.54,31064,60,59.5,776.6,8.06,F,7.06,F,2.85,17.45
-5.55,31124,60,59.5,776.7,8.06,F,7.05,F,2.85,17.43
-5.56,31184,60,59.5,776.9,8.06,F,7.05,F,2.86,17.41
-5.57,31244,60,59.5,777.0,8.06,F,7.04,F,2.86,17.39
-5.58,31304,60,59.5,777.1,8.05,F,7.04,F,2.87,17.37
-5.59,31363,60,59.5,777.3,8.05,F,7.03,F,2.87,17.35
-5.60,31423,60,59.5,777.4,8.05,F,7.03,F,2.88,17.32
-5.61,31483,60,59.5,777.5,8.05,F,7.02,F,2.88,17.30
-5.62,31543,60,59.5,777.7,8.05,F,7.02,F,2.89,17.28
-5.63,31603,60,59.5,777.8,8.05,F,7.01,F,2.89,17.26
-5.64,31663,60,59.5,777.9,8.04,F,7.01,F,2.90,17.24
-5.65,31723,60,59.5,778.1,8.04,F,7.00,F,2.90,17.22
-5.66,31782,60,59.5,778.2,8.04,F,7.00,F,2.91,17.20
-5.67,31842,60,59.5,778.3,8.04,F,7.00,F,2.91,17.18
-5.68,31902,60,59.5,778.5,8.04,F,6.99,F,2.92,17.16
-5.69,31962,60,59.5,778.6,8.03,F,6.99,F,2.92,17.13
-5.70,32022,60,59.5,778.7,8.03,F,6.98,F,2.93,17.11
-5.71,32082,60,59.5,778.9,8.03,F,6.98,F,2.93,17.09
-5.72,32142,60,59.5,779.0,8.03,F,6.97,F,2.94,17.07
-5.73,32202,60,59.5,779.2,8.03,F,6.97,F,2.94,17.05
-5.74,32261,60,59.5,779.3,8.02,F,6.96,F,2.95,17.03
-5.75,32321,60,59.5,779.4,8.02,F,6.96,F,2.95,17.01
-5.76,32381,60,59.5,779.6,8.02,F,6.95,F,2.96,16.99
-5.77,32441,60,59.5,779.7,8.02,F,6.95,F,2.96,16.97
-5.78,32501,60,59.5,779.8,8.02,F,6.94,F,2.97,16.94
-5.79,32561,60,59.5,780.0,8.01,F,6.94,F,2.97,16.92
-5.80,32621,60,59.5,780.1,8.01,F,6.93,F,2.98,16.90
-5.81,32681,60,59.5,780.2,8.01,F,6.93,F,2.98,16.88
-5.82,32740,60,59.5,780.4,8.01,F,6.92,F,2.99,16.86
-5.83,32800,60,59.5,780.5,8.01,F,6.92,F,2.99,16.84
-5.84,32860,60,59.5,780.6,8.01,F,6.92,F,3.00,16.82
-5.85,32920,60,59.5,780.8,8.00,F,6.91,F,3.00,16.80
-5.86,32980,60,59.5,780.9,8.00,F,6.91,F,3.01,16.78
-5.87,33040,60,59.5,781.0,8.00,F,6.90,F,3.01,16.75
-5.88,33100,60,59.5,781.2,8.00,F,6.90,F,3.02,16.73
-5.89,33160,60,59.5,781.3,8.00,F,6.89,F,3.02,16.71
-5.90,33219,60,59.5,781.4,7.99,F,6.89,F,3.03,16.69
-5.91,33279,60,59.5,781.6,7.99,F,6.88,F,3.03,16.67
-5.92,33339,60,59.5,781.7,7.99,F,6.88,F,3.04,16.65
-5.93,33399,60,59.5,781.9,7.99,F,6.87,F,3.04,16.63
-5.94,33459,60,59.5,782.0,7.99,F,6.87,F,3.05,16.61
-5.95,33519,60,59.5,782.1,7.98,F,6.86,F,3.05,16.59
-5.96,33579,60,59.5,782.3,7.98,F,6.86,F,3.06,16.56
-5.97,33638,60,59.5,782.4,7.98,F,6.85,F,3.06,16.54
-5.98,33698,60,59.5,782.5,7.98,F,6.85,F,3.07,16.52
-5.99,33758,60,59.5,782.7,7.98,F,6.84,F,3.07,16.50
-6.00,33818,60,59.5,782.8,7.98,F,6.84,F,3.08,16.48
-6.00,33818,60,59.5,782.8,7.98,F,6.84,F,3.08,16.48
-6.01,33878,60,59.5,783.0,7.98,F,6.83,F,3.09,16.47
-6.02,33937,60,59.5,783.2,7.97,F,6.82,F,3.09,16.46
-6.03,33997,60,59.5,783.4,7.97,F,6.81,F,3.10,16.45
-6.04,34056,60,59.5,783.6,7.97,F,6.80,F,3.10,16.44
-6.05,34116,60,59.5,783.8,7.97,F,6.79,F,3.11,16.43
-6.06,34175,60,59.5,784.0,7.96,F,6.78,F,3.11,16.42
-6.07,34235,60,59.5,784.2,7.96,F,6.77,F,3.12,16.41
-6.08,34294,60,59.5,784.4,7.96,F,6.76,F,3.12,16.41
-6.09,34354,60,59.6,784.7,7.96,F,6.75,F,3.13,16.40
-6.10,34413,60,59.6,784.9,7.95,F,6.74,F,3.13,16.39
-6.11,34473,60,59.6,785.1,7.95,F,6.73,F,3.14,16.38
-6.12,34532,60,59.6,785.3,7.95,F,6.73,F,3.14,16.37
-6.13,34592,60,59.6,785.5,7.94,F,6.72,F,3.15,16.36
-6.14,34652,60,59.6,785.7,7.94,F,6.71,F,3.15,16.35
-6.15,34711,60,59.6,785.9,7.94,F,6.70,F,3.16,16.34
-6.16,34771,60,59.6,786.1,7.94,F,6.69,F,3.16,16.33
-6.17,34830,60,59.6,786.3,7.93,F,6.68,F,3.17,16.32
-6.18,34890,60,59.6,786.5,7.93,F,6.67,F,3.17,16.31
-6.19,34950,60,59.6,786.7,7.93,F,6.66,F,3.18,16.30
-6.20,35009,60,59.6,786.9,7.93,F,6.65,F,3.18,16.29
-6.21,35069,60,59.6,787.1,7.92,F,6.64,F,3.19,16.28
-6.22,35128,60,59.6,787.3,7.92,F,6.63,F,3.19,16.28
-6.23,35188,60,59.6,787.5,7.92,F,6.62,F,3.20,16.27
-6.24,35248,60,59.6,787.7,7.92,F,6.61,F,3.20,16.26
-6.25,35307,60,59.6,787.9,7.91,F,6.60,F,3.21,16.25
-6.26,35367,60,59.6,788.1,7.91,F,6.59,F,3.21,16.24
-6.27,35427,60,59.7,788.4,7.91,F,6.58,F,3.22,16.23
-6.28,35486,60,59.7,788.6,7.90,F,6.57,F,3.22,16.22
-6.29,35546,60,59.7,788.8,7.90,F,6.56,F,3.23,16.21
-6.30,35606,60,59.7,789.0,7.90,F,6.55,F,3.23,16.20
-6.31,35665,60,59.7,789.2,7.90,F,6.54,F,3.24,16.19
-6.32,35725,60,59.7,789.4,7.89,F,6.53,F,3.24,16.18
-6.33,35785,60,59.7,789.6,7.89,F,6.52,F,3.25,16.17
-6.34,35844,60,59.7,789.8,7.89,F,6.51,F,3.25,16.16
-6.35,35904,60,59.7,790.0,7.89,F,6.51,F,3.26,16.15
-6.36,35964,60,59.7,790.2,7.88,F,6.50,F,3.26,16.15
-6.37,36023,60,59.7,790.4,7.88,F,6.49,F,3.27,16.14
-6.38,36083,60,59.7,790.6,7.88,F,6.48,F,3.28,16.13
-6.39,36143,60,59.7,790.8,7.87,F,6.47,F,3.28,16.12
-6.40,36203,60,59.7,791.0,7.87,F,6.46,F,3.29,16.11
-6.41,36262,60,59.7,791.2,7.87,F,6.45,F,3.29,16.10
-6.42,36322,60,59.7,791.4,7.87,F,6.44,F,3.30,16.09
-6.43,36382,60,59.7,791.6,7.86,F,6.43,F,3.30,16.08
-6.44,36442,60,59.7,791.8,7.86,F,6.42,F,3.31,16.07
-6.45,36501,60,59.8,792.1,7.86,F,6.41,F,3.31,16.06
-6.46,36561,60,59.8,792.3,7.86,F,6.40,F,3.32,16.05
-6.47,36621,60,59.8,792.5,7.85,F,6.39,F,3.32,16.04
-6.48,36681,60,59.8,792.7,7.85,F,6.38,F,3.33,16.03
-6.49,36740,60,59.8,792.9,7.85,F,6.37,F,3.33,16.02
-6.50,36800,60,59.8,793.1,7.85,F,6.36,F,3.34,16.02
-6.50,36795,60,59.7,793.1,7.85,F,6.36,F,3.34,16.02
-6.51,36860,60,59.8,793.3,7.84,F,6.35,F,3.34,16.01
-6.52,36920,60,59.8,793.5,7.84,F,6.34,F,3.35,16.00
-6.53,36980,60,59.8,793.7,7.84,F,6.33,F,3.35,15.99
-6.54,37039,60,59.8,793.9,7.83,F,6.32,F,3.36,15.98
-6.55,37099,60,59.8,794.1,7.83,F,6.31,F,3.36,15.97
-6.56,37159,60,59.8,794.3,7.83,F,6.30,F,3.37,15.96
-6.57,37219,60,59.8,794.5,7.83,F,6.29,F,3.37,15.95
-6.58,37279,60,59.8,794.7,7.82,F,6.29,F,3.38,15.94
-6.59,37338,60,59.8,794.9,7.82,F,6.28,F,3.38,15.93
-6.60,37398,60,59.8,795.1,7.82,F,6.27,F,3.39,15.92
-6.61,37458,60,59.8,795.3,7.82,F,6.26,F,3.39,15.91
-6.62,37518,60,59.8,795.6,7.81,F,6.25,F,3.40,15.90
-6.63,37578,60,59.9,795.8,7.81,F,6.24,F,3.40,15.89
-6.64,37638,60,59.9,796.0,7.81,F,6.23,F,3.41,15.88
-6.65,37698,60,59.9,796.2,7.80,F,6.22,F,3.41,15.88
-6.66,37757,60,59.9,796.4,7.80,F,6.21,F,3.42,15.87
-6.67,37817,60,59.9,796.6,7.80,F,6.20,F,3.42,15.86
-6.68,37877,60,59.9,796.8,7.80,F,6.19,F,3.43,15.85
-6.69,37937,60,59.9,797.0,7.79,F,6.18,F,3.43,15.84
-6.70,37997,60,59.9,797.2,7.79,F,6.17,F,3.44,15.83
-6.71,38057,60,59.9,797.4,7.79,F,6.16,F,3.44,15.82
-6.72,38117,60,59.9,797.6,7.79,F,6.15,F,3.45,15.81
-6.73,38177,60,59.9,797.8,7.78,F,6.14,F,3.45,15.80
-6.74,38237,60,59.9,798.0,7.78,F,6.13,F,3.46,15.79
-6.75,38297,60,59.9,798.2,7.78,F,6.12,F,3.46,15.78
-6.76,38356,60,59.9,798.4,7.77,F,6.11,F,3.47,15.77
-6.77,38416,60,59.9,798.6,7.77,F,6.10,F,3.48,15.76
-6.78,38476,60,59.9,798.8,7.77,F,6.09,F,3.48,15.75
-6.79,38536,60,59.9,799.0,7.77,F,6.08,F,3.49,15.75
-6.80,38596,60,60.0,799.3,7.76,F,6.07,F,3.49,15.74
-6.81,38656,60,60.0,799.5,7.76,F,6.07,F,3.50,15.73
-6.82,38716,60,60.0,799.7,7.76,F,6.06,F,3.50,15.72
-6.83,38776,60,60.0,799.9,7.76,F,6.05,F,3.51,15.71
-6.84,38836,60,60.0,800.1,7.75,F,6.04,F,3.51,15.70
-6.85,38896,60,60.0,800.3,7.75,F,6.03,F,3.52,15.69
-6.86,38956,60,60.0,800.5,7.75,F,6.02,F,3.52,15.68
-6.87,39016,60,60.0,800.7,7.75,F,6.01,F,3.53,15.67
-6.88,39076,60,60.0,800.9,7.74,F,6.00,F,3.53,15.66
-6.89,39136,60,60.0,801.1,7.74,F,5.99,F,3.54,15.65
-6.90,39196,60,60.0,801.3,7.74,F,5.98,F,3.54,15.64
-6.91,39256,60,60.0,801.5,7.73,F,5.97,F,3.55,15.63
-6.92,39316,60,60.0,801.7,7.73,F,5.96,F,3.55,15.62
-6.93,39376,60,60.0,801.9,7.73,F,5.95,F,3.56,15.62
-6.94,39436,60,60.0,802.1,7.73,F,5.94,F,3.56,15.61
-6.95,39496,60,60.0,802.3,7.72,F,5.93,F,3.57,15.60
-6.96,39556,60,60.0,802.5,7.72,F,5.92,F,3.57,15.59
-6.97,39616,60,60.0,802.7,7.72,F,5.91,F,3.58,15.58
-6.98,39676,60,60.1,803.0,7.72,F,5.90,F,3.58,15.57
-6.99,39736,60,60.1,803.2,7.71,F,5.89,F,3.59,15.56
-7.00,39796,60,60.1,803.4,7.71,F,5.88,F,3.59,15.55
-7.00,39786,60,60.0,803.4,7.71,F,5.88,F,3.59,15.55
-7.01,39857,60,60.1,803.6,7.71,F,5.87,F,3.60,15.54
-7.02,39917,60,60.1,803.8,7.70,F,5.86,F,3.60,15.53
-7.03,39977,60,60.1,804.0,7.70,F,5.85,F,3.61,15.52
-7.04,40037,60,60.1,804.2,7.70,F,5.85,F,3.61,15.51
-7.05,40097,60,60.1,804.4,7.70,F,5.84,F,3.62,15.50
-7.06,40157,60,60.1,804.6,7.69,F,5.83,F,3.62,15.49
-7.07,40217,60,60.1,804.8,7.69,F,5.82,F,3.63,15.48
-7.08,40277,60,60.1,805.0,7.69,F,5.81,F,3.63,15.48
-7.09,40337,60,60.1,805.2,7.69,F,5.80,F,3.64,15.47
-7.10,40397,60,60.1,805.4,7.68,F,5.79,F,3.64,15.46
-7.11,40457,60,60.1,805.6,7.68,F,5.78,F,3.65,15.45
-7.12,40518,60,60.1,805.8,7.68,F,5.77,F,3.65,15.44
-7.13,40578,60,60.1,806.0,7.67,F,5.76,F,3.66,15.43
-7.14,40638,60,60.1,806.2,7.67,F,5.75,F,3.67,15.42
-7.15,40698,60,60.1,806.5,7.67,F,5.74,F,3.67,15.41
-7.16,40758,60,60.2,806.7,7.67,F,5.73,F,3.68,15.40
-7.17,40818,60,60.2,806.9,7.66,F,5.72,F,3.68,15.39
-7.18,40879,60,60.2,807.1,7.66,F,5.71,F,3.69,15.38
-7.19,40939,60,60.2,807.3,7.66,F,5.70,F,3.69,15.37
-7.20,40999,60,60.2,807.5,7.66,F,5.69,F,3.70,15.36
-7.21,41059,60,60.2,807.7,7.65,F,5.68,F,3.70,15.35
-7.22,41119,60,60.2,807.9,7.65,F,5.67,F,3.71,15.35
-7.23,41179,60,60.2,808.1,7.65,F,5.66,F,3.71,15.34
-7.24,41240,60,60.2,808.3,7.65,F,5.65,F,3.72,15.33
-7.25,41300,60,60.2,808.5,7.64,F,5.64,F,3.72,15.32
-7.26,41360,60,60.2,808.7,7.64,F,5.63,F,3.73,15.31
-7.27,41420,60,60.2,808.9,7.64,F,5.63,F,3.73,15.30
-7.28,41480,60,60.2,809.1,7.63,F,5.62,F,3.74,15.29
-7.29,41541,60,60.2,809.3,7.63,F,5.61,F,3.74,15.28
-7.30,41601,60,60.2,809.5,7.63,F,5.60,F,3.75,15.27
-7.31,41661,60,60.2,809.7,7.63,F,5.59,F,3.75,15.26
-7.32,41721,60,60.2,809.9,7.62,F,5.58,F,3.76,15.25
-7.33,41782,60,60.2,810.2,7.62,F,5.57,F,3.76,15.24
-7.34,41842,60,60.3,810.4,7.62,F,5.56,F,3.77,15.23
-7.35,41902,60,60.3,810.6,7.62,F,5.55,F,3.77,15.22
-7.36,41962,60,60.3,810.8,7.61,F,5.54,F,3.78,15.22
-7.37,42023,60,60.3,811.0,7.61,F,5.53,F,3.78,15.21
-7.38,42083,60,60.3,811.2,7.61,F,5.52,F,3.79,15.20
-7.39,42143,60,60.3,811.4,7.60,F,5.51,F,3.79,15.19
-7.40,42204,60,60.3,811.6,7.60,F,5.50,F,3.80,15.18
-7.41,42264,60,60.3,811.8,7.60,F,5.49,F,3.80,15.17
-7.42,42324,60,60.3,812.0,7.60,F,5.48,F,3.81,15.16
-7.43,42384,60,60.3,812.2,7.59,F,5.47,F,3.81,15.15
-7.44,42445,60,60.3,812.4,7.59,F,5.46,F,3.82,15.14
-7.45,42505,60,60.3,812.6,7.59,F,5.45,F,3.82,15.13
-7.46,42565,60,60.3,812.8,7.59,F,5.44,F,3.83,15.12
-7.47,42626,60,60.3,813.0,7.58,F,5.43,F,3.83,15.11
-7.48,42686,60,60.3,813.2,7.58,F,5.42,F,3.84,15.10
-7.49,42746,60,60.3,813.4,7.58,F,5.41,F,3.84,15.09
-7.50,42807,60,60.3,813.6,7.58,F,5.41,F,3.85,15.09
-7.50,42792,60,60.2,813.6,7.58,F,5.41,F,3.85,15.09
-7.51,42867,60,60.4,813.9,7.57,F,5.40,F,3.86,15.08
-7.52,42927,60,60.4,814.1,7.57,F,5.39,F,3.86,15.07
-7.53,42988,60,60.4,814.3,7.57,F,5.38,F,3.87,15.06
-7.54,43048,60,60.4,814.5,7.56,F,5.37,F,3.87,15.05
-7.55,43109,60,60.4,814.7,7.56,F,5.36,F,3.88,15.04
-7.56,43169,60,60.4,814.9,7.56,F,5.35,F,3.88,15.03
-7.57,43229,60,60.4,815.1,7.56,F,5.34,F,3.89,15.02
-7.58,43290,60,60.4,815.3,7.55,F,5.33,F,3.89,15.01
-7.59,43350,60,60.4,815.5,7.55,F,5.32,F,3.90,15.00
-7.60,43411,60,60.4,815.7,7.55,F,5.31,F,3.90,14.99
-7.61,43471,60,60.4,815.9,7.55,F,5.30,F,3.91,14.98
-7.62,43531,60,60.4,816.1,7.54,F,5.29,F,3.91,14.97
-7.63,43592,60,60.4,816.3,7.54,F,5.28,F,3.92,14.96
-7.64,43652,60,60.4,816.5,7.54,F,5.27,F,3.92,14.95
-7.65,43713,60,60.4,816.7,7.53,F,5.26,F,3.93,14.95
-7.66,43773,60,60.4,816.9,7.53,F,5.25,F,3.93,14.94
-7.67,43833,60,60.4,817.1,7.53,F,5.24,F,3.94,14.93
-7.68,43894,60,60.4,817.4,7.53,F,5.23,F,3.94,14.92
-7.69,43954,60,60.5,817.6,7.52,F,5.22,F,3.95,14.91
-7.70,44015,60,60.5,817.8,7.52,F,5.21,F,3.95,14.90
-7.71,44075,60,60.5,818.0,7.52,F,5.20,F,3.96,14.89
-7.72,44136,60,60.5,818.2,7.52,F,5.19,F,3.96,14.88
-7.73,44196,60,60.5,818.4,7.51,F,5.18,F,3.97,14.87
-7.74,44257,60,60.5,818.6,7.51,F,5.18,F,3.97,14.86
-7.75,44317,60,60.5,818.8,7.51,F,5.17,F,3.98,14.85
-7.76,44378,60,60.5,819.0,7.50,F,5.16,F,3.98,14.84
-7.77,44438,60,60.5,819.2,7.50,F,5.15,F,3.99,14.83
-7.78,44499,61,60.5,819.4,7.50,F,5.14,F,3.99,14.82
-7.79,44559,61,60.5,819.6,7.50,F,5.13,F,4.00,14.82
-7.80,44620,61,60.5,819.8,7.49,F,5.12,F,4.00,14.81
-7.81,44680,61,60.5,820.0,7.49,F,5.11,F,4.01,14.80
-7.82,44741,61,60.5,820.2,7.49,F,5.10,F,4.01,14.79
-7.83,44801,61,60.5,820.4,7.49,F,5.09,F,4.02,14.78
-7.84,44862,61,60.5,820.6,7.48,F,5.08,F,4.02,14.77
-7.85,44922,61,60.5,820.8,7.48,F,5.07,F,4.03,14.76
-7.86,44983,61,60.5,821.1,7.48,F,5.06,F,4.03,14.75
-7.87,45043,61,60.6,821.3,7.48,F,5.05,F,4.04,14.74
-7.88,45104,61,60.6,821.5,7.47,F,5.04,F,4.05,14.73
-7.89,45165,61,60.6,821.7,7.47,F,5.03,F,4.05,14.72
-7.90,45225,61,60.6,821.9,7.47,F,5.02,F,4.06,14.71
-7.91,45286,61,60.6,822.1,7.46,F,5.01,F,4.06,14.70
-7.92,45346,61,60.6,822.3,7.46,F,5.00,F,4.07,14.69
-7.93,45407,61,60.6,822.5,7.46,F,4.99,F,4.07,14.69
-7.94,45467,61,60.6,822.7,7.46,F,4.98,F,4.08,14.68
-7.95,45528,61,60.6,822.9,7.45,F,4.97,F,4.08,14.67
-7.96,45589,61,60.6,823.1,7.45,F,4.96,F,4.09,14.66
-7.97,45649,61,60.6,823.3,7.45,F,4.96,F,4.09,14.65
-7.98,45710,61,60.6,823.5,7.45,F,4.95,F,4.10,14.64
-7.99,45771,61,60.6,823.7,7.44,F,4.94,F,4.10,14.63
-8.00,45831,61,60.6,823.9,7.44,F,4.93,F,4.11,14.62
-8.00,45811,61,60.5,823.9,7.44,F,4.93,F,4.11,14.62
-8.01,45892,61,60.6,824.1,7.44,F,4.92,F,4.11,14.61
-8.02,45952,61,60.6,824.3,7.43,F,4.91,F,4.12,14.60
-8.03,46013,61,60.6,824.6,7.43,F,4.90,F,4.12,14.59
-8.04,46074,61,60.6,824.8,7.43,F,4.89,F,4.13,14.58
-8.05,46134,61,60.7,825.0,7.43,F,4.88,F,4.13,14.57
-8.06,46195,61,60.7,825.2,7.42,F,4.87,F,4.14,14.56
-8.07,46256,61,60.7,825.4,7.42,F,4.86,F,4.14,14.55
-8.08,46316,61,60.7,825.6,7.42,F,4.85,F,4.15,14.55
-8.09,46377,61,60.7,825.8,7.42,F,4.84,F,4.15,14.54
-8.10,46438,61,60.7,826.0,7.41,F,4.83,F,4.16,14.53
-8.11,46498,61,60.7,826.2,7.41,F,4.82,F,4.16,14.52
-8.12,46559,61,60.7,826.4,7.41,F,4.81,F,4.17,14.51
-8.13,46620,61,60.7,826.6,7.40,F,4.80,F,4.17,14.50
-8.14,46681,61,60.7,826.8,7.40,F,4.79,F,4.18,14.49
-8.15,46741,61,60.7,827.0,7.40,F,4.78,F,4.18,14.48
-8.16,46802,61,60.7,827.2,7.40,F,4.77,F,4.19,14.47
-8.17,46863,61,60.7,827.4,7.39,F,4.76,F,4.19,14.46
-8.18,46923,61,60.7,827.6,7.39,F,4.75,F,4.20,14.45
-8.19,46984,61,60.7,827.8,7.39,F,4.74,F,4.20,14.44
-8.20,47045,61,60.7,828.0,7.39,F,4.74,F,4.21,14.43
-8.21,47106,61,60.7,828.3,7.38,F,4.73,F,4.21,14.42
-8.22,47166,61,60.7,828.5,7.38,F,4.72,F,4.22,14.42
-8.23,47227,61,60.8,828.7,7.38,F,4.71,F,4.22,14.41
-8.24,47288,61,60.8,828.9,7.38,F,4.70,F,4.23,14.40
-8.25,47349,61,60.8,829.1,7.37,F,4.69,F,4.23,14.39
-8.26,47409,61,60.8,829.3,7.37,F,4.68,F,4.24,14.38
-8.27,47470,61,60.8,829.5,7.37,F,4.67,F,4.25,14.37
-8.28,47531,61,60.8,829.7,7.36,F,4.66,F,4.25,14.36
-8.29,47592,61,60.8,829.9,7.36,F,4.65,F,4.26,14.35
-8.30,47653,61,60.8,830.1,7.36,F,4.64,F,4.26,14.34
-8.31,47713,61,60.8,830.3,7.36,F,4.63,F,4.27,14.33
-8.32,47774,61,60.8,830.5,7.35,F,4.62,F,4.27,14.32
-8.33,47835,61,60.8,830.7,7.35,F,4.61,F,4.28,14.31
-8.34,47896,61,60.8,830.9,7.35,F,4.60,F,4.28,14.30
-8.35,47957,61,60.8,831.1,7.35,F,4.59,F,4.29,14.29
-8.36,48017,61,60.8,831.3,7.34,F,4.58,F,4.29,14.29
-8.37,48078,61,60.8,831.5,7.34,F,4.57,F,4.30,14.28
-8.38,48139,61,60.8,831.7,7.34,F,4.56,F,4.30,14.27
-8.39,48200,61,60.8,832.0,7.33,F,4.55,F,4.31,14.26
-8.40,48261,61,60.9,832.2,7.33,F,4.54,F,4.31,14.25
-8.41,48322,61,60.9,832.4,7.33,F,4.53,F,4.32,14.24
-8.42,48383,61,60.9,832.6,7.33,F,4.52,F,4.32,14.23
-8.43,48443,61,60.9,832.8,7.32,F,4.52,F,4.33,14.22
-8.44,48504,61,60.9,833.0,7.32,F,4.51,F,4.33,14.21
-8.45,48565,61,60.9,833.2,7.32,F,4.50,F,4.34,14.20
-8.46,48626,61,60.9,833.4,7.32,F,4.49,F,4.34,14.19
-8.47,48687,61,60.9,833.6,7.31,F,4.48,F,4.35,14.18
-8.48,48748,61,60.9,833.8,7.31,F,4.47,F,4.35,14.17
-8.49,48809,61,60.9,834.0,7.31,F,4.46,F,4.36,14.16
-8.50,48870,61,60.9,834.2,7.31,F,4.45,F,4.36,14.16
-8.50,48845,61,60.8,834.2,7.31,F,4.45,F,4.36,14.16
-8.51,48931,61,60.9,834.4,7.30,F,4.44,F,4.37,14.15
-8.52,48991,61,60.9,834.6,7.30,F,4.43,F,4.37,14.14
-8.53,49052,61,60.9,834.8,7.30,F,4.42,F,4.38,14.13
-8.54,49113,61,60.9,835.0,7.29,F,4.41,F,4.38,14.12
-8.55,49174,61,60.9,835.2,7.29,F,4.40,F,4.39,14.11
-8.56,49235,61,60.9,835.5,7.29,F,4.39,F,4.39,14.10
-8.57,49296,61,60.9,835.7,7.29,F,4.38,F,4.40,14.09
-8.58,49357,61,61.0,835.9,7.28,F,4.37,F,4.40,14.08
-8.59,49418,61,61.0,836.1,7.28,F,4.36,F,4.41,14.07
-8.60,49479,61,61.0,836.3,7.28,F,4.35,F,4.41,14.06
-8.61,49540,61,61.0,836.5,7.28,F,4.34,F,4.42,14.05
-8.62,49601,61,61.0,836.7,7.27,F,4.33,F,4.42,14.04
-8.63,49662,61,61.0,836.9,7.27,F,4.32,F,4.43,14.03
-8.64,49723,61,61.0,837.1,7.27,F,4.31,F,4.44,14.02
-8.65,49784,61,61.0,837.3,7.26,F,4.30,F,4.44,14.02
-8.66,49845,61,61.0,837.5,7.26,F,4.30,F,4.45,14.01
-8.67,49906,61,61.0,837.7,7.26,F,4.29,F,4.45,14.00
-8.68,49967,61,61.0,837.9,7.26,F,4.28,F,4.46,13.99
-8.69,50028,61,61.0,838.1,7.25,F,4.27,F,4.46,13.98
-8.70,50089,61,61.0,838.3,7.25,F,4.26,F,4.47,13.97
-8.71,50150,61,61.0,838.5,7.25,F,4.25,F,4.47,13.96
-8.72,50211,61,61.0,838.7,7.25,F,4.24,F,4.48,13.95
-8.73,50272,61,61.0,838.9,7.24,F,4.23,F,4.48,13.94
-8.74,50333,61,61.0,839.2,7.24,F,4.22,F,4.49,13.93
-8.75,50394,61,61.0,839.4,7.24,F,4.21,F,4.49,13.92
-8.76,50455,61,61.1,839.6,7.23,F,4.20,F,4.50,13.91
-8.77,50516,61,61.1,839.8,7.23,F,4.19,F,4.50,13.90
-8.78,50577,61,61.1,840.0,7.23,F,4.18,F,4.51,13.89
-8.79,50638,61,61.1,840.2,7.23,F,4.17,F,4.51,13.89
-8.80,50699,61,61.1,840.4,7.22,F,4.16,F,4.52,13.88
-8.81,50761,61,61.1,840.6,7.22,F,4.15,F,4.52,13.87
-8.82,50822,61,61.1,840.8,7.22,F,4.14,F,4.53,13.86
-8.83,50883,61,61.1,841.0,7.22,F,4.13,F,4.53,13.85
-8.84,50944,61,61.1,841.2,7.21,F,4.12,F,4.54,13.84
-8.85,51005,61,61.1,841.4,7.21,F,4.11,F,4.54,13.83
-8.86,51066,61,61.1,841.6,7.21,F,4.10,F,4.55,13.82
-8.87,51127,61,61.1,841.8,7.21,F,4.09,F,4.55,13.81
-8.88,51188,61,61.1,842.0,7.20,F,4.08,F,4.56,13.80
-8.89,51249,61,61.1,842.2,7.20,F,4.08,F,4.56,13.79
-8.90,51311,61,61.1,842.4,7.20,F,4.07,F,4.57,13.78
-8.91,51372,61,61.1,842.6,7.19,F,4.06,F,4.57,13.77
-8.92,51433,61,61.1,842.9,7.19,F,4.05,F,4.58,13.76
-8.93,51494,61,61.1,843.1,7.19,F,4.04,F,4.58,13.76
-8.94,51555,61,61.2,843.3,7.19,F,4.03,F,4.59,13.75
-8.95,51616,61,61.2,843.5,7.18,F,4.02,F,4.59,13.74
-8.96,51677,61,61.2,843.7,7.18,F,4.01,F,4.60,13.73
-8.97,51739,61,61.2,843.9,7.18,F,4.00,F,4.60,13.72
-8.98,51800,61,61.2,844.1,7.18,F,3.99,F,4.61,13.71
-8.99,51861,61,61.2,844.3,7.17,F,3.98,F,4.61,13.70
-9.00,51922,61,61.2,844.5,7.17,F,3.97,F,4.62,13.69
-9.00,51892,61,61.1,844.5,7.17,F,3.97,F,4.62,13.69
-9.01,51985,62,61.2,844.9,7.17,F,3.96,F,4.63,13.69
-9.02,52047,62,61.2,845.2,7.16,F,3.94,F,4.63,13.69
-9.03,52110,62,61.2,845.6,7.16,F,3.93,F,4.64,13.68
-9.04,52172,62,61.2,846.0,7.15,F,3.92,F,4.64,13.68
-9.05,52235,62,61.2,846.3,7.15,F,3.90,F,4.65,13.68
-9.06,52297,62,61.2,846.7,7.14,F,3.89,F,4.65,13.68
-9.07,52360,62,61.2,847.1,7.14,F,3.87,F,4.66,13.68
-9.08,52422,62,61.3,847.5,7.13,F,3.86,F,4.66,13.68
-9.09,52485,62,61.3,847.8,7.13,F,3.85,F,4.67,13.67
-9.10,52547,62,61.3,848.2,7.12,F,3.83,F,4.67,13.67
-9.11,52610,62,61.3,848.6,7.12,F,3.82,F,4.68,13.67
-9.12,52672,62,61.3,848.9,7.11,F,3.81,F,4.68,13.67
-9.13,52734,62,61.3,849.3,7.11,F,3.79,F,4.69,13.67
-9.14,52797,62,61.3,849.7,7.10,F,3.78,F,4.69,13.66
-9.15,52859,62,61.3,850.0,7.10,F,3.77,F,4.70,13.66
-9.16,52922,62,61.3,850.4,7.09,F,3.75,F,4.70,13.66
-9.17,52984,62,61.3,850.8,7.09,F,3.74,F,4.71,13.66
-9.18,53047,62,61.3,851.2,7.08,F,3.73,F,4.71,13.66
-9.19,53109,62,61.4,851.5,7.08,F,3.71,F,4.72,13.66
-9.20,53172,62,61.4,851.9,7.07,F,3.70,F,4.72,13.65
-9.21,53234,62,61.4,852.3,7.07,F,3.68,F,4.73,13.65
-9.22,53297,62,61.4,852.6,7.07,F,3.67,F,4.73,13.65
-9.23,53359,62,61.4,853.0,7.06,F,3.66,F,4.74,13.65
-9.24,53422,62,61.4,853.4,7.06,F,3.64,F,4.74,13.65
-9.25,53484,62,61.4,853.7,7.05,F,3.63,F,4.75,13.65
-9.26,53547,62,61.4,854.1,7.05,F,3.62,F,4.75,13.64
-9.27,53609,62,61.4,854.5,7.04,F,3.60,F,4.76,13.64
-9.28,53672,62,61.4,854.9,7.04,F,3.59,F,4.76,13.64
-9.29,53734,62,61.4,855.2,7.03,F,3.58,F,4.77,13.64
-9.30,53797,62,61.4,855.6,7.03,F,3.56,F,4.77,13.64
-9.31,53859,62,61.5,856.0,7.02,F,3.55,F,4.78,13.63
-9.32,53922,62,61.5,856.3,7.02,F,3.53,F,4.78,13.63
-9.33,53984,62,61.5,856.7,7.01,F,3.52,F,4.79,13.63
-9.34,54047,62,61.5,857.1,7.01,F,3.51,F,4.79,13.63
-9.35,54109,62,61.5,857.4,7.00,F,3.49,F,4.80,13.63
-9.36,54172,62,61.5,857.8,7.00,F,3.48,F,4.80,13.63
-9.37,54234,62,61.5,858.2,6.99,F,3.47,F,4.81,13.62
-9.38,54297,62,61.5,858.6,6.99,F,3.45,F,4.82,13.62
-9.39,54359,62,61.5,858.9,6.98,F,3.44,F,4.82,13.62
-9.40,54422,62,61.5,859.3,6.98,F,3.43,F,4.83,13.62
-9.41,54484,62,61.5,859.7,6.97,F,3.41,F,4.83,13.62
-9.42,54546,62,61.6,860.0,6.97,F,3.40,F,4.84,13.61
-9.43,54609,62,61.6,860.4,6.97,F,3.39,F,4.84,13.61
-9.44,54671,62,61.6,860.8,6.96,F,3.37,F,4.85,13.61
-9.45,54734,62,61.6,861.1,6.96,F,3.36,F,4.85,13.61
-9.46,54796,62,61.6,861.5,6.95,F,3.34,F,4.86,13.61
-9.47,54859,62,61.6,861.9,6.95,F,3.33,F,4.86,13.61
-9.48,54921,62,61.6,862.3,6.94,F,3.32,F,4.87,13.60
-9.49,54984,62,61.6,862.6,6.94,F,3.30,F,4.87,13.60
-9.50,55046,62,61.6,863.0,6.93,F,3.29,F,4.88,13.60
-9.50,55016,62,61.5,863.0,6.93,F,3.29,F,4.88,13.60
-9.51,55109,62,61.6,863.4,6.93,F,3.28,F,4.88,13.60
-9.52,55171,62,61.6,863.7,6.92,F,3.26,F,4.89,13.60
-9.53,55234,62,61.6,864.1,6.92,F,3.25,F,4.89,13.59
-9.54,55296,62,61.7,864.5,6.91,F,3.24,F,4.90,13.59
-9.55,55359,62,61.7,864.8,6.91,F,3.22,F,4.90,13.59
-9.56,55421,62,61.7,865.2,6.90,F,3.21,F,4.91,13.59
-9.57,55484,62,61.7,865.6,6.90,F,3.20,F,4.91,13.59
-9.58,55546,62,61.7,866.0,6.89,F,3.18,F,4.92,13.59
-9.59,55609,62,61.7,866.3,6.89,F,3.17,F,4.92,13.58
-9.60,55671,62,61.7,866.7,6.88,F,3.15,F,4.93,13.58
-9.61,55734,62,61.7,867.1,6.88,F,3.14,F,4.93,13.58
-9.62,55796,62,61.7,867.4,6.87,F,3.13,F,4.94,13.58
-9.63,55859,62,61.7,867.8,6.87,F,3.11,F,4.94,13.58
-9.64,55921,62,61.7,868.2,6.86,F,3.10,F,4.95,13.57
-9.65,55984,62,61.8,868.5,6.86,F,3.09,F,4.95,13.57
-9.66,56046,62,61.8,868.9,6.86,F,3.07,F,4.96,13.57
-9.67,56109,62,61.8,869.3,6.85,F,3.06,F,4.96,13.57
-9.68,56171,62,61.8,869.7,6.85,F,3.05,F,4.97,13.57
-9.69,56234,62,61.8,870.0,6.84,F,3.03,F,4.97,13.57
-9.70,56296,62,61.8,870.4,6.84,F,3.02,F,4.98,13.56
-9.71,56359,62,61.8,870.8,6.83,F,3.00,F,4.98,13.56
-9.72,56421,62,61.8,871.1,6.83,F,2.99,F,4.99,13.56
-9.73,56483,62,61.8,871.5,6.82,F,2.98,F,4.99,13.56
-9.74,56546,62,61.8,871.9,6.82,F,2.96,F,5.00,13.56
-9.75,56608,62,61.8,872.2,6.81,F,2.95,F,5.00,13.56
-9.76,56671,62,61.8,872.6,6.81,F,2.94,F,5.01,13.55
-9.77,56733,62,61.9,873.0,6.80,F,2.92,F,5.02,13.55
-9.78,56796,62,61.9,873.4,6.80,F,2.91,F,5.02,13.55
-9.79,56858,62,61.9,873.7,6.79,F,2.90,F,5.03,13.55
-9.80,56921,62,61.9,874.1,6.79,F,2.88,F,5.03,13.55
-9.81,56983,62,61.9,874.5,6.78,F,2.87,F,5.04,13.54
-9.82,57046,62,61.9,874.8,6.78,F,2.86,F,5.04,13.54
-9.83,57108,62,61.9,875.2,6.77,F,2.84,F,5.05,13.54
-9.84,57171,62,61.9,875.6,6.77,F,2.83,F,5.05,13.54
-9.85,57233,62,61.9,875.9,6.76,F,2.81,F,5.06,13.54
-9.86,57296,62,61.9,876.3,6.76,F,2.80,F,5.06,13.54
-9.87,57358,62,61.9,876.7,6.76,F,2.79,F,5.07,13.53
-9.88,57421,62,62.0,877.1,6.75,F,2.77,F,5.07,13.53
-9.89,57483,62,62.0,877.4,6.75,F,2.76,F,5.08,13.53
-9.90,57546,62,62.0,877.8,6.74,F,2.75,F,5.08,13.53
-9.91,57608,62,62.0,878.2,6.74,F,2.73,F,5.09,13.53
-9.92,57671,62,62.0,878.5,6.73,F,2.72,F,5.09,13.52
-9.93,57733,62,62.0,878.9,6.73,F,2.71,F,5.10,13.52
-9.94,57796,62,62.0,879.3,6.72,F,2.69,F,5.10,13.52
-9.95,57858,62,62.0,879.6,6.72,F,2.68,F,5.11,13.52
-9.96,57921,62,62.0,880.0,6.71,F,2.66,F,5.11,13.52
-9.97,57983,62,62.0,880.4,6.71,F,2.65,F,5.12,13.52
-9.98,58046,62,62.0,880.8,6.70,F,2.64,F,5.12,13.51
-9.99,58108,62,62.0,881.1,6.70,F,2.62,F,5.13,13.51
-10.00,58171,62,62.1,881.5,6.69,F,2.61,F,5.13,13.51
-10.00,58141,62,62.0,881.5,6.69,F,2.61,F,5.13,13.51
-10.01,58233,62,62.1,881.9,6.69,F,2.60,F,5.14,13.51
-10.02,58295,62,62.1,882.2,6.68,F,2.58,F,5.14,13.51
-10.03,58358,62,62.1,882.6,6.68,F,2.57,F,5.15,13.50
-10.04,58420,62,62.1,883.0,6.67,F,2.56,F,5.15,13.50
-10.05,58483,62,62.1,883.3,6.67,F,2.54,F,5.16,13.50
-10.06,58545,62,62.1,883.7,6.66,F,2.53,F,5.16,13.50
-10.07,58608,62,62.1,884.1,6.66,F,2.52,F,5.17,13.50
-10.08,58670,62,62.1,884.5,6.66,F,2.50,F,5.17,13.50
-10.09,58733,62,62.1,884.8,6.65,F,2.49,F,5.18,13.49
-10.10,58795,62,62.1,885.2,6.65,F,2.47,F,5.18,13.49
-10.11,58858,62,62.2,885.6,6.64,F,2.46,F,5.19,13.49
-10.12,58920,62,62.2,885.9,6.64,F,2.45,F,5.19,13.49
-10.13,58983,62,62.2,886.3,6.63,F,2.43,F,5.20,13.49
-10.14,59045,62,62.2,886.7,6.63,F,2.42,F,5.21,13.48
-10.15,59108,62,62.2,887.0,6.62,F,2.41,F,5.21,13.48
-10.16,59170,62,62.2,887.4,6.62,F,2.39,F,5.22,13.48
-10.17,59233,62,62.2,887.8,6.61,F,2.38,F,5.22,13.48
-10.18,59295,62,62.2,888.2,6.61,F,2.37,F,5.23,13.48
-10.19,59358,62,62.2,888.5,6.60,F,2.35,F,5.23,13.48
-10.20,59420,62,62.2,888.9,6.60,F,2.34,F,5.24,13.47
-10.21,59483,62,62.2,889.3,6.59,F,2.32,F,5.24,13.47
-10.22,59545,62,62.2,889.6,6.59,F,2.31,F,5.25,13.47
-10.23,59608,62,62.3,890.0,6.58,F,2.30,F,5.25,13.47
-10.24,59670,62,62.3,890.4,6.58,F,2.28,F,5.26,13.47
-10.25,59733,62,62.3,890.7,6.57,F,2.27,F,5.26,13.47
-10.26,59795,62,62.3,891.1,6.57,F,2.26,F,5.27,13.46
-10.27,59858,62,62.3,891.5,6.56,F,2.24,F,5.27,13.46
-10.28,59920,62,62.3,891.9,6.56,F,2.23,F,5.28,13.46
-10.29,59983,62,62.3,892.2,6.56,F,2.22,F,5.28,13.46
-10.30,60045,62,62.3,892.6,6.55,F,2.20,F,5.29,13.46
-10.31,60108,62,62.3,893.0,6.55,F,2.19,F,5.29,13.45
-10.32,60170,62,62.3,893.3,6.54,F,2.18,F,5.30,13.45
-10.33,60232,62,62.3,893.7,6.54,F,2.16,F,5.30,13.45
-10.34,60295,62,62.4,894.1,6.53,F,2.15,F,5.31,13.45
-10.35,60357,62,62.4,894.4,6.53,F,2.13,F,5.31,13.45
-10.36,60420,62,62.4,894.8,6.52,F,2.12,F,5.32,13.45
-10.37,60482,62,62.4,895.2,6.52,F,2.11,F,5.32,13.44
-10.38,60545,62,62.4,895.6,6.51,F,2.09,F,5.33,13.44
-10.39,60607,62,62.4,895.9,6.51,F,2.08,F,5.33,13.44
-10.40,60670,62,62.4,896.3,6.50,F,2.07,F,5.34,13.44
-10.41,60732,62,62.4,896.7,6.50,F,2.05,F,5.34,13.44
-10.42,60795,62,62.4,897.0,6.49,F,2.04,F,5.35,13.43
-10.43,60857,62,62.4,897.4,6.49,F,2.03,F,5.35,13.43
-10.44,60920,62,62.4,897.8,6.48,F,2.01,F,5.36,13.43
-10.45,60982,62,62.4,898.1,6.48,F,2.00,F,5.36,13.43
-10.46,61045,62,62.5,898.5,6.47,F,1.99,F,5.37,13.43
-10.47,61107,62,62.5,898.9,6.47,F,1.97,F,5.37,13.43
-10.48,61170,62,62.5,899.3,6.46,F,1.96,F,5.38,13.42
-10.49,61232,62,62.5,899.6,6.46,F,1.94,F,5.38,13.42
-10.50,61295,62,62.5,900.0,6.46,F,1.93,F,5.39,13.42
-10.50,61265,62,62.4,900.0,6.46,F,1.93,F,5.39,13.42
-10.51,61357,62,62.5,900.4,6.45,F,1.92,F,5.40,13.42
-10.52,61420,62,62.5,900.7,6.45,F,1.90,F,5.40,13.42
-10.53,61482,62,62.5,901.1,6.44,F,1.89,F,5.41,13.41
-10.54,61545,62,62.5,901.5,6.44,F,1.88,F,5.41,13.41
-10.55,61607,62,62.5,901.8,6.43,F,1.86,F,5.42,13.41
-10.56,61670,62,62.5,902.2,6.43,F,1.85,F,5.42,13.41
-10.57,61732,62,62.5,902.6,6.42,F,1.84,F,5.43,13.41
-10.58,61795,62,62.6,903.0,6.42,F,1.82,F,5.43,13.41
-10.59,61857,62,62.6,903.3,6.41,F,1.81,F,5.44,13.40
-10.60,61920,62,62.6,903.7,6.41,F,1.79,F,5.44,13.40
-10.61,61982,62,62.6,904.1,6.40,F,1.78,F,5.45,13.40
-10.62,62044,62,62.6,904.4,6.40,F,1.77,F,5.45,13.40
-10.63,62107,62,62.6,904.8,6.39,F,1.75,F,5.46,13.40
-10.64,62169,62,62.6,905.2,6.39,F,1.74,F,5.46,13.39
-10.65,62232,62,62.6,905.5,6.38,F,1.73,F,5.47,13.39
-10.66,62294,62,62.6,905.9,6.38,F,1.71,F,5.47,13.39
-10.67,62357,62,62.6,906.3,6.37,F,1.70,F,5.48,13.39
-10.68,62419,62,62.6,906.7,6.37,F,1.69,F,5.48,13.39
-10.69,62482,62,62.7,907.0,6.36,F,1.67,F,5.49,13.39
-10.70,62544,62,62.7,907.4,6.36,F,1.66,F,5.49,13.38
-10.71,62607,62,62.7,907.8,6.35,F,1.65,F,5.50,13.38
-10.72,62669,62,62.7,908.1,6.35,F,1.63,F,5.50,13.38
-10.73,62732,62,62.7,908.5,6.35,F,1.62,F,5.51,13.38
-10.74,62794,62,62.7,908.9,6.34,F,1.60,F,5.51,13.38
-10.75,62857,62,62.7,909.2,6.34,F,1.59,F,5.52,13.38
-10.76,62919,62,62.7,909.6,6.33,F,1.58,F,5.52,13.37
-10.77,62982,62,62.7,910.0,6.33,F,1.56,F,5.53,13.37
-10.78,63044,62,62.7,910.4,6.32,F,1.55,F,5.53,13.37
-10.79,63107,62,62.7,910.7,6.32,F,1.54,F,5.54,13.37
-10.80,63169,62,62.7,911.1,6.31,F,1.52,F,5.54,13.37
-10.81,63232,62,62.8,911.5,6.31,F,1.51,F,5.55,13.36
-10.82,63294,62,62.8,911.8,6.30,F,1.50,F,5.55,13.36
-10.83,63357,62,62.8,912.2,6.30,F,1.48,F,5.56,13.36
-10.84,63419,62,62.8,912.6,6.29,F,1.47,F,5.56,13.36
-10.85,63482,62,62.8,912.9,6.29,F,1.45,F,5.57,13.36
-10.86,63544,62,62.8,913.3,6.28,F,1.44,F,5.57,13.36
-10.87,63607,62,62.8,913.7,6.28,F,1.43,F,5.58,13.35
-10.88,63669,62,62.8,914.1,6.27,F,1.41,F,5.59,13.35
-10.89,63732,62,62.8,914.4,6.27,F,1.40,F,5.59,13.35
-10.90,63794,62,62.8,914.8,6.26,F,1.39,F,5.60,13.35
-10.91,63857,62,62.8,915.2,6.26,F,1.37,F,5.60,13.35
-10.92,63919,62,62.9,915.5,6.25,F,1.36,F,5.61,13.34
-10.93,63981,62,62.9,915.9,6.25,F,1.35,F,5.61,13.34
-10.94,64044,62,62.9,916.3,6.25,F,1.33,F,5.62,13.34
-10.95,64106,62,62.9,916.6,6.24,F,1.32,F,5.62,13.34
-10.96,64169,62,62.9,917.0,6.24,F,1.31,F,5.63,13.34
-10.97,64231,62,62.9,917.4,6.23,F,1.29,F,5.63,13.34
-10.98,64294,62,62.9,917.8,6.23,F,1.28,F,5.64,13.33
-10.99,64356,62,62.9,918.1,6.22,F,1.26,F,5.64,13.33
-11.00,64419,62,62.9,918.5,6.22,F,1.25,F,5.65,13.33
-11.00,64389,62,62.8,918.5,6.22,F,1.25,F,5.65,13.33
-11.01,64481,62,62.9,918.9,6.21,F,1.24,F,5.65,13.33
-11.02,64544,62,62.9,919.2,6.21,F,1.22,F,5.66,13.33
-11.03,64606,62,62.9,919.6,6.20,F,1.21,F,5.66,13.32
-11.04,64669,62,63.0,920.0,6.20,F,1.20,F,5.67,13.32
-11.05,64731,62,63.0,920.3,6.19,F,1.18,F,5.67,13.32
-11.06,64794,62,63.0,920.7,6.19,F,1.17,F,5.68,13.32
-11.07,64856,62,63.0,921.1,6.18,F,1.16,F,5.68,13.32
-11.08,64919,62,63.0,921.5,6.18,F,1.14,F,5.69,13.32
-11.09,64981,62,63.0,921.8,6.17,F,1.13,F,5.69,13.31
-11.10,65044,62,63.0,922.2,6.17,F,1.11,F,5.70,13.31
-11.11,65106,62,63.0,922.6,6.16,F,1.10,F,5.70,13.31
-11.12,65169,62,63.0,922.9,6.16,F,1.09,F,5.71,13.31
-11.13,65231,62,63.0,923.3,6.15,F,1.07,F,5.71,13.31
-11.14,65294,62,63.0,923.7,6.15,F,1.06,F,5.72,13.30
-11.15,65356,62,63.1,924.0,6.15,F,1.05,F,5.72,13.30
-11.16,65419,62,63.1,924.4,6.14,F,1.03,F,5.73,13.30
-11.17,65481,62,63.1,924.8,6.14,F,1.02,F,5.73,13.30
-11.18,65544,62,63.1,925.2,6.13,F,1.01,F,5.74,13.30
-11.19,65606,62,63.1,925.5,6.13,F,0.99,F,5.74,13.30
-11.20,65669,62,63.1,925.9,6.12,F,0.98,F,5.75,13.29
-11.21,65731,62,63.1,926.3,6.12,F,0.97,F,5.75,13.29
-11.22,65793,62,63.1,926.6,6.11,F,0.95,F,5.76,13.29
-11.23,65856,62,63.1,927.0,6.11,F,0.94,F,5.76,13.29
-11.24,65918,62,63.1,927.4,6.10,F,0.92,F,5.77,13.29
-11.25,65981,62,63.1,927.7,6.10,F,0.91,F,5.77,13.29
-11.26,66043,62,63.1,928.1,6.09,F,0.90,F,5.78,13.28
-11.27,66106,62,63.2,928.5,6.09,F,0.88,F,5.79,13.28
-11.28,66168,62,63.2,928.9,6.08,F,0.87,F,5.79,13.28
-11.29,66231,62,63.2,929.2,6.08,F,0.86,F,5.80,13.28
-11.30,66293,62,63.2,929.6,6.07,F,0.84,F,5.80,13.28
-11.31,66356,62,63.2,930.0,6.07,F,0.83,F,5.81,13.27
-11.32,66418,62,63.2,930.3,6.06,F,0.82,F,5.81,13.27
-11.33,66481,62,63.2,930.7,6.06,F,0.80,F,5.82,13.27
-11.34,66543,62,63.2,931.1,6.05,F,0.79,F,5.82,13.27
-11.35,66606,62,63.2,931.4,6.05,F,0.77,F,5.83,13.27
-11.36,66668,62,63.2,931.8,6.05,F,0.76,F,5.83,13.27
-11.37,66731,62,63.2,932.2,6.04,F,0.75,F,5.84,13.26
-11.38,66793,62,63.3,932.6,6.04,F,0.73,F,5.84,13.26
-11.39,66856,62,63.3,932.9,6.03,F,0.72,F,5.85,13.26
-11.40,66918,62,63.3,933.3,6.03,F,0.71,F,5.85,13.26
-11.41,66981,62,63.3,933.7,6.02,F,0.69,F,5.86,13.26
-11.42,67043,62,63.3,934.0,6.02,F,0.68,F,5.86,13.25
-11.43,67106,62,63.3,934.4,6.01,F,0.67,F,5.87,13.25
-11.44,67168,62,63.3,934.8,6.01,F,0.65,F,5.87,13.25
-11.45,67231,62,63.3,935.1,6.00,F,0.64,F,5.88,13.25
-11.46,67293,62,63.3,935.5,6.00,F,0.63,F,5.88,13.25
-11.47,67356,62,63.3,935.9,5.99,F,0.61,F,5.89,13.25
-11.48,67418,62,63.3,936.3,5.99,F,0.60,F,5.89,13.24
-11.49,67481,62,63.3,936.6,5.98,F,0.58,F,5.90,13.24
-11.50,67543,62,63.4,937.0,5.98,F,0.57,F,5.90,13.24
-11.50,67513,62,63.3,937.0,5.98,F,0.57,F,5.90,13.24
-11.51,67606,62,63.4,937.4,5.97,F,0.56,F,5.91,13.24
-11.52,67668,62,63.4,937.7,5.97,F,0.54,F,5.91,13.24
-11.53,67730,62,63.4,938.1,5.96,F,0.53,F,5.92,13.23
-11.54,67793,62,63.4,938.5,5.96,F,0.52,F,5.92,13.23
-11.55,67855,62,63.4,938.8,5.95,F,0.50,F,5.93,13.23
-11.56,67918,62,63.4,939.2,5.95,F,0.49,F,5.93,13.23
-11.57,67980,62,63.4,939.6,5.94,F,0.48,F,5.94,13.23
-11.58,68043,62,63.4,940.0,5.94,F,0.46,F,5.94,13.23
-11.59,68105,62,63.4,940.3,5.94,F,0.45,F,5.95,13.22
-11.60,68168,62,63.4,940.7,5.93,F,0.44,F,5.95,13.22
-11.61,68230,62,63.5,941.1,5.93,F,0.42,F,5.96,13.22
-11.62,68293,62,63.5,941.4,5.92,F,0.41,F,5.96,13.22
-11.63,68355,62,63.5,941.8,5.92,F,0.39,F,5.97,13.22
-11.64,68418,62,63.5,942.2,5.91,F,0.38,F,5.98,13.21
-11.65,68480,62,63.5,942.5,5.91,F,0.37,F,5.98,13.21
-11.66,68543,62,63.5,942.9,5.90,F,0.35,F,5.99,13.21
-11.67,68605,62,63.5,943.3,5.90,F,0.34,F,5.99,13.21
-11.68,68668,62,63.5,943.7,5.89,F,0.33,F,6.00,13.21
-11.69,68730,62,63.5,944.0,5.89,F,0.31,F,6.00,13.21
-11.70,68793,62,63.5,944.4,5.88,F,0.30,F,6.01,13.20
-11.71,68855,62,63.5,944.8,5.88,F,0.29,F,6.01,13.20
-11.72,68918,62,63.5,945.1,5.87,F,0.27,F,6.02,13.20
-11.73,68980,62,63.6,945.5,5.87,F,0.26,F,6.02,13.20
-11.74,69043,62,63.6,945.9,5.86,F,0.24,F,6.03,13.20
-11.75,69105,62,63.6,946.2,5.86,F,0.23,F,6.03,13.20
-11.76,69168,62,63.6,946.6,5.85,F,0.22,F,6.04,13.19
-11.77,69230,62,63.6,947.0,5.85,F,0.20,F,6.04,13.19
-11.78,69293,62,63.6,947.4,5.84,F,0.19,F,6.05,13.19
-11.79,69355,62,63.6,947.7,5.84,F,0.18,F,6.05,13.19
-11.80,69418,62,63.6,948.1,5.84,F,0.16,F,6.06,13.19
-11.81,69480,62,63.6,948.5,5.83,F,0.15,F,6.06,13.18
-11.82,69542,62,63.6,948.8,5.83,F,0.14,F,6.07,13.18
-11.83,69605,62,63.6,949.2,5.82,F,0.12,F,6.07,13.18
-11.84,69667,62,63.7,949.6,5.82,F,0.11,F,6.08,13.18
-11.85,69730,62,63.7,949.9,5.81,F,0.10,F,6.08,13.18
-11.86,69792,62,63.7,950.3,5.81,F,0.08,F,6.09,13.18
-11.87,69855,62,63.7,950.7,5.80,F,0.07,F,6.09,13.17
-11.88,69917,62,63.7,951.1,5.80,F,0.05,F,6.10,13.17
-11.89,69980,62,63.7,951.4,5.79,F,0.04,F,6.10,13.17
-11.90,70042,62,63.7,951.8,5.79,F,0.03,F,6.11,13.17
-11.91,70105,62,63.7,952.2,5.78,F,0.01,F,6.11,13.17
-11.92,70167,62,63.7,952.5,5.78,F,0.00,F,6.12,13.16
-11.93,70230,62,63.7,952.9,5.77,F,0.01,A,6.12,13.16
-11.94,70292,62,63.7,953.3,5.77,F,0.02,A,6.13,13.16
-11.95,70355,62,63.7,953.6,5.76,F,0.03,A,6.13,13.16
-11.96,70417,62,63.8,954.0,5.76,F,0.05,A,6.14,13.16
-11.97,70480,62,63.8,954.4,5.75,F,0.06,A,6.14,13.16
-11.98,70542,62,63.8,954.8,5.75,F,0.07,A,6.15,13.15
-11.99,70605,62,63.8,955.1,5.74,F,0.08,A,6.15,13.15
-12.00,70667,62,63.8,955.5,5.74,F,0.09,A,6.16,13.15
-12.00,70637,62,63.7,955.5,5.74,F,0.09,A,6.16,13.15
-12.01,70731,64,63.8,955.8,5.74,F,0.09,A,6.17,13.15
-12.02,70795,64,63.8,956.1,5.73,F,0.10,A,6.17,13.15
-12.03,70859,64,63.8,956.4,5.73,F,0.10,A,6.18,13.15
-12.04,70923,64,63.8,956.6,5.72,F,0.10,A,6.18,13.16
-12.05,70987,64,63.8,956.9,5.72,F,0.11,A,6.19,13.16
-12.06,71051,64,63.8,957.2,5.71,F,0.11,A,6.19,13.16
-12.07,71115,64,63.8,957.5,5.71,F,0.11,A,6.20,13.16
-12.08,71179,64,63.8,957.8,5.70,F,0.12,A,6.20,13.16
-12.09,71243,64,63.8,958.1,5.70,F,0.12,A,6.21,13.16
-12.10,71307,64,63.9,958.3,5.69,F,0.13,A,6.21,13.17
-12.11,71371,64,63.9,958.6,5.69,F,0.13,A,6.22,13.17
-12.12,71435,64,63.9,958.9,5.69,F,0.13,A,6.22,13.17
-12.13,71499,64,63.9,959.2,5.68,F,0.14,A,6.23,13.17
-12.14,71563,64,63.9,959.5,5.68,F,0.14,A,6.23,13.17
-12.15,71627,64,63.9,959.8,5.67,F,0.14,A,6.24,13.17
-12.16,71691,64,63.9,960.0,5.67,F,0.15,A,6.24,13.17
-12.17,71755,64,63.9,960.3,5.66,F,0.15,A,6.25,13.18
-12.18,71819,64,63.9,960.6,5.66,F,0.15,A,6.26,13.18
-12.19,71883,64,63.9,960.9,5.65,F,0.16,A,6.26,13.18
-12.20,71947,64,63.9,961.2,5.65,F,0.16,A,6.27,13.18
-12.21,72011,64,63.9,961.5,5.64,F,0.16,A,6.27,13.18
-12.22,72075,64,63.9,961.7,5.64,F,0.17,A,6.28,13.18
-12.23,72139,64,63.9,962.0,5.64,F,0.17,A,6.28,13.19
-12.24,72203,64,63.9,962.3,5.63,F,0.18,A,6.29,13.19
-12.25,72267,64,64.0,962.6,5.63,F,0.18,A,6.29,13.19
-12.26,72331,64,64.0,962.9,5.62,F,0.18,A,6.30,13.19
-12.27,72395,64,64.0,963.2,5.62,F,0.19,A,6.30,13.19
-12.28,72459,64,64.0,963.4,5.61,F,0.19,A,6.31,13.19
-12.29,72523,64,64.0,963.7,5.61,F,0.19,A,6.31,13.19
-12.30,72587,64,64.0,964.0,5.60,F,0.20,A,6.32,13.20
-12.31,72651,64,64.0,964.3,5.60,F,0.20,A,6.32,13.20
-12.32,72715,64,64.0,964.6,5.59,F,0.20,A,6.33,13.20
-12.33,72779,64,64.0,964.9,5.59,F,0.21,A,6.33,13.20
-12.34,72843,64,64.0,965.1,5.59,F,0.21,A,6.34,13.20
-12.35,72907,64,64.0,965.4,5.58,F,0.21,A,6.34,13.20
-12.36,72971,64,64.0,965.7,5.58,F,0.22,A,6.35,13.21
-12.37,73035,64,64.0,966.0,5.57,F,0.22,A,6.36,13.21
-12.38,73099,64,64.0,966.3,5.57,F,0.23,A,6.36,13.21
-12.39,73163,64,64.0,966.6,5.56,F,0.23,A,6.37,13.21
-12.40,73227,64,64.1,966.9,5.56,F,0.23,A,6.37,13.21
-12.41,73291,64,64.1,967.1,5.55,F,0.24,A,6.38,13.21
-12.42,73355,64,64.1,967.4,5.55,F,0.24,A,6.38,13.21
-12.43,73419,64,64.1,967.7,5.54,F,0.24,A,6.39,13.22
-12.44,73483,64,64.1,968.0,5.54,F,0.25,A,6.39,13.22
-12.45,73547,64,64.1,968.3,5.54,F,0.25,A,6.40,13.22
-12.46,73611,64,64.1,968.6,5.53,F,0.25,A,6.40,13.22
-12.47,73675,64,64.1,968.8,5.53,F,0.26,A,6.41,13.22
-12.48,73739,64,64.1,969.1,5.52,F,0.26,A,6.41,13.22
-12.49,73803,64,64.1,969.4,5.52,F,0.26,A,6.42,13.23
-12.50,73867,64,64.1,969.7,5.51,F,0.27,A,6.42,13.23
-12.50,73837,64,64.0,969.7,5.51,F,0.27,A,6.44,13.22
-12.51,73931,64,64.1,970.0,5.51,F,0.27,A,6.43,13.23
-12.52,73995,64,64.1,970.3,5.50,F,0.28,A,6.43,13.23
-12.53,74059,64,64.1,970.5,5.50,F,0.28,A,6.44,13.23
-12.54,74123,64,64.1,970.8,5.49,F,0.28,A,6.45,13.23
-12.55,74187,64,64.2,971.1,5.49,F,0.29,A,6.45,13.23
-12.56,74251,64,64.2,971.4,5.49,F,0.29,A,6.46,13.24
-12.57,74315,64,64.2,971.7,5.48,F,0.29,A,6.46,13.24
-12.58,74379,64,64.2,972.0,5.48,F,0.30,A,6.47,13.24
-12.59,74443,64,64.2,972.2,5.47,F,0.30,A,6.47,13.24
-12.60,74507,64,64.2,972.5,5.47,F,0.30,A,6.48,13.24
-12.61,74571,64,64.2,972.8,5.46,F,0.31,A,6.48,13.24
-12.62,74635,64,64.2,973.1,5.46,F,0.31,A,6.49,13.25
-12.63,74699,64,64.2,973.4,5.45,F,0.31,A,6.49,13.25
-12.64,74763,64,64.2,973.7,5.45,F,0.32,A,6.50,13.25
-12.65,74827,64,64.2,973.9,5.44,F,0.32,A,6.50,13.25
-12.66,74891,64,64.2,974.2,5.44,F,0.32,A,6.51,13.25
-12.67,74955,64,64.2,974.5,5.44,F,0.33,A,6.51,13.25
-12.68,75019,64,64.2,974.8,5.43,F,0.33,A,6.52,13.25
-12.69,75083,64,64.2,975.1,5.43,F,0.34,A,6.52,13.26
-12.70,75147,64,64.3,975.4,5.42,F,0.34,A,6.53,13.26
-12.71,75211,64,64.3,975.6,5.42,F,0.34,A,6.53,13.26
-12.72,75275,64,64.3,975.9,5.41,F,0.35,A,6.54,13.26
-12.73,75339,64,64.3,976.2,5.41,F,0.35,A,6.55,13.26
-12.74,75403,64,64.3,976.5,5.40,F,0.35,A,6.55,13.26
-12.75,75467,64,64.3,976.8,5.40,F,0.36,A,6.56,13.27
-12.76,75531,64,64.3,977.1,5.39,F,0.36,A,6.56,13.27
-12.77,75595,64,64.3,977.4,5.39,F,0.36,A,6.57,13.27
-12.78,75659,64,64.3,977.6,5.39,F,0.37,A,6.57,13.27
-12.79,75723,64,64.3,977.9,5.38,F,0.37,A,6.58,13.27
-12.80,75787,64,64.3,978.2,5.38,F,0.37,A,6.58,13.27
-12.81,75851,64,64.3,978.5,5.37,F,0.38,A,6.59,13.27
-12.82,75915,64,64.3,978.8,5.37,F,0.38,A,6.59,13.28
-12.83,75979,64,64.3,979.1,5.36,F,0.39,A,6.60,13.28
-12.84,76043,64,64.3,979.3,5.36,F,0.39,A,6.60,13.28
-12.85,76107,64,64.3,979.6,5.35,F,0.39,A,6.61,13.28
-12.86,76171,64,64.4,979.9,5.35,F,0.40,A,6.61,13.28
-12.87,76235,64,64.4,980.2,5.35,F,0.40,A,6.62,13.28
-12.88,76299,64,64.4,980.5,5.34,F,0.40,A,6.62,13.29
-12.89,76363,64,64.4,980.8,5.34,F,0.41,A,6.63,13.29
-12.90,76427,64,64.4,981.0,5.33,F,0.41,A,6.64,13.29
-12.91,76491,64,64.4,981.3,5.33,F,0.41,A,6.64,13.29
-12.92,76555,64,64.4,981.6,5.32,F,0.42,A,6.65,13.29
-12.93,76619,64,64.4,981.9,5.32,F,0.42,A,6.65,13.29
-12.94,76683,64,64.4,982.2,5.31,F,0.42,A,6.66,13.29
-12.95,76747,64,64.4,982.5,5.31,F,0.43,A,6.66,13.30
-12.96,76811,64,64.4,982.7,5.30,F,0.43,A,6.67,13.30
-12.97,76875,64,64.4,983.0,5.30,F,0.44,A,6.67,13.30
-12.98,76939,64,64.4,983.3,5.30,F,0.44,A,6.68,13.30
-12.99,77003,64,64.4,983.6,5.29,F,0.44,A,6.68,13.30
-13.00,77067,64,64.4,983.9,5.29,F,0.45,A,6.69,13.30
-13.00,77037,64,64.4,983.9,5.29,F,0.45,A,6.71,13.29
-13.01,77131,64,64.5,984.2,5.28,F,0.45,A,6.69,13.31
-13.02,77195,64,64.5,984.4,5.28,F,0.45,A,6.70,13.31
-13.03,77259,64,64.5,984.7,5.27,F,0.46,A,6.70,13.31
-13.04,77323,64,64.5,985.0,5.27,F,0.46,A,6.71,13.31
-13.05,77387,64,64.5,985.3,5.26,F,0.46,A,6.71,13.31
-13.06,77451,64,64.5,985.6,5.26,F,0.47,A,6.72,13.31
-13.07,77515,64,64.5,985.9,5.25,F,0.47,A,6.72,13.31
-13.08,77579,64,64.5,986.2,5.25,F,0.47,A,6.73,13.32
-13.09,77643,64,64.5,986.4,5.25,F,0.48,A,6.74,13.32
-13.10,77707,64,64.5,986.7,5.24,F,0.48,A,6.74,13.32
-13.11,77771,64,64.5,987.0,5.24,F,0.49,A,6.75,13.32
-13.12,77835,64,64.5,987.3,5.23,F,0.49,A,6.75,13.32
-13.13,77899,64,64.5,987.6,5.23,F,0.49,A,6.76,13.32
-13.14,77963,65,64.5,987.9,5.22,F,0.50,A,6.76,13.33
-13.15,78027,65,64.5,988.1,5.22,F,0.50,A,6.77,13.33
-13.16,78091,65,64.6,988.4,5.21,F,0.50,A,6.77,13.33
-13.17,78155,65,64.6,988.7,5.21,F,0.51,A,6.78,13.33
-13.18,78219,65,64.6,989.0,5.20,F,0.51,A,6.78,13.33
-13.19,78283,65,64.6,989.3,5.20,F,0.51,A,6.79,13.33
-13.20,78347,65,64.6,989.6,5.20,F,0.52,A,6.79,13.33
-13.21,78411,65,64.6,989.8,5.19,F,0.52,A,6.80,13.34
-13.22,78475,65,64.6,990.1,5.19,F,0.52,A,6.80,13.34
-13.23,78539,65,64.6,990.4,5.18,F,0.53,A,6.81,13.34
-13.24,78603,65,64.6,990.7,5.18,F,0.53,A,6.81,13.34
-13.25,78667,65,64.6,991.0,5.17,F,0.54,A,6.82,13.34
-13.26,78731,65,64.6,991.3,5.17,F,0.54,A,6.83,13.34
-13.27,78795,65,64.6,991.5,5.16,F,0.54,A,6.83,13.35
-13.28,78859,65,64.6,991.8,5.16,F,0.55,A,6.84,13.35
-13.29,78923,65,64.6,992.1,5.15,F,0.55,A,6.84,13.35
-13.30,78987,65,64.6,992.4,5.15,F,0.55,A,6.85,13.35
-13.31,79051,65,64.7,992.7,5.15,F,0.56,A,6.85,13.35
-13.32,79115,65,64.7,993.0,5.14,F,0.56,A,6.86,13.35
-13.33,79179,65,64.7,993.2,5.14,F,0.56,A,6.86,13.35
-13.34,79243,65,64.7,993.5,5.13,F,0.57,A,6.87,13.36
-13.35,79307,65,64.7,993.8,5.13,F,0.57,A,6.87,13.36
-13.36,79371,65,64.7,994.1,5.12,F,0.57,A,6.88,13.36
-13.37,79435,65,64.7,994.4,5.12,F,0.58,A,6.88,13.36
-13.38,79499,65,64.7,994.7,5.11,F,0.58,A,6.89,13.36
-13.39,79563,65,64.7,994.9,5.11,F,0.58,A,6.89,13.36
-13.40,79627,65,64.7,995.2,5.10,F,0.59,A,6.90,13.37
-13.41,79691,65,64.7,995.5,5.10,F,0.59,A,6.90,13.37
-13.42,79755,65,64.7,995.8,5.10,F,0.60,A,6.91,13.37
-13.43,79819,65,64.7,996.1,5.09,F,0.60,A,6.92,13.37
-13.44,79883,65,64.7,996.4,5.09,F,0.60,A,6.92,13.37
-13.45,79947,65,64.7,996.7,5.08,F,0.61,A,6.93,13.37
-13.46,80011,65,64.8,996.9,5.08,F,0.61,A,6.93,13.37
-13.47,80075,65,64.8,997.2,5.07,F,0.61,A,6.94,13.38
-13.48,80139,65,64.8,997.5,5.07,F,0.62,A,6.94,13.38
-13.49,80203,65,64.8,997.8,5.06,F,0.62,A,6.95,13.38
-13.50,80267,65,64.8,998.1,5.06,F,0.62,A,6.95,13.38
-13.50,80237,65,64.7,998.1,5.06,F,0.62,A,6.97,13.37
-13.51,80331,65,64.8,998.4,5.05,F,0.63,A,6.96,13.38
-13.52,80395,65,64.8,998.6,5.05,F,0.63,A,6.96,13.38
-13.53,80459,65,64.8,998.9,5.05,F,0.63,A,6.97,13.39
-13.54,80523,65,64.8,999.2,5.04,F,0.64,A,6.97,13.39
-13.55,80587,65,64.8,999.5,5.04,F,0.64,A,6.98,13.39
-13.56,80651,65,64.8,999.8,5.03,F,0.65,A,6.98,13.39
-13.57,80715,65,64.8,1000.1,5.03,F,0.65,A,6.99,13.39
-13.58,80779,65,64.8,1000.3,5.02,F,0.65,A,6.99,13.39
-13.59,80843,65,64.8,1000.6,5.02,F,0.66,A,7.00,13.39
-13.60,80907,65,64.8,1000.9,5.01,F,0.66,A,7.00,13.40
-13.61,80971,65,64.9,1001.2,5.01,F,0.66,A,7.01,13.40
-13.62,81035,65,64.9,1001.5,5.00,F,0.67,A,7.02,13.40
-13.63,81099,65,64.9,1001.8,5.00,F,0.67,A,7.02,13.40
-13.64,81163,65,64.9,1002.0,5.00,F,0.67,A,7.03,13.40
-13.65,81227,65,64.9,1002.3,4.99,F,0.68,A,7.03,13.40
-13.66,81291,65,64.9,1002.6,4.99,F,0.68,A,7.04,13.41
-13.67,81355,65,64.9,1002.9,4.98,F,0.68,A,7.04,13.41
-13.68,81419,65,64.9,1003.2,4.98,F,0.69,A,7.05,13.41
-13.69,81483,65,64.9,1003.5,4.97,F,0.69,A,7.05,13.41
-13.70,81547,65,64.9,1003.7,4.97,F,0.70,A,7.06,13.41
-13.71,81611,65,64.9,1004.0,4.96,F,0.70,A,7.06,13.41
-13.72,81675,65,64.9,1004.3,4.96,F,0.70,A,7.07,13.41
-13.73,81739,65,64.9,1004.6,4.95,F,0.71,A,7.07,13.42
-13.74,81803,65,64.9,1004.9,4.95,F,0.71,A,7.08,13.42
-13.75,81867,65,64.9,1005.2,4.95,F,0.71,A,7.08,13.42
-13.76,81931,65,65.0,1005.4,4.94,F,0.72,A,7.09,13.42
-13.77,81995,65,65.0,1005.7,4.94,F,0.72,A,7.09,13.42
-13.78,82059,65,65.0,1006.0,4.93,F,0.72,A,7.10,13.42
-13.79,82123,65,65.0,1006.3,4.93,F,0.73,A,7.11,13.43
-13.80,82187,65,65.0,1006.6,4.92,F,0.73,A,7.11,13.43
-13.81,82251,65,65.0,1006.9,4.92,F,0.73,A,7.12,13.43
-13.82,82315,65,65.0,1007.2,4.91,F,0.74,A,7.12,13.43
-13.83,82379,65,65.0,1007.4,4.91,F,0.74,A,7.13,13.43
-13.84,82443,65,65.0,1007.7,4.90,F,0.75,A,7.13,13.43
-13.85,82507,65,65.0,1008.0,4.90,F,0.75,A,7.14,13.43
-13.86,82571,65,65.0,1008.3,4.90,F,0.75,A,7.14,13.44
-13.87,82635,65,65.0,1008.6,4.89,F,0.76,A,7.15,13.44
-13.88,82699,65,65.0,1008.9,4.89,F,0.76,A,7.15,13.44
-13.89,82763,65,65.0,1009.1,4.88,F,0.76,A,7.16,13.44
-13.90,82827,65,65.0,1009.4,4.88,F,0.77,A,7.16,13.44
-13.91,82891,65,65.0,1009.7,4.87,F,0.77,A,7.17,13.44
-13.92,82955,65,65.1,1010.0,4.87,F,0.77,A,7.17,13.45
-13.93,83019,65,65.1,1010.3,4.86,F,0.78,A,7.18,13.45
-13.94,83083,65,65.1,1010.6,4.86,F,0.78,A,7.18,13.45
-13.95,83147,65,65.1,1010.8,4.85,F,0.78,A,7.19,13.45
-13.96,83211,65,65.1,1011.1,4.85,F,0.79,A,7.19,13.45
-13.97,83275,65,65.1,1011.4,4.85,F,0.79,A,7.20,13.45
-13.98,83339,65,65.1,1011.7,4.84,F,0.79,A,7.21,13.45
-13.99,83403,65,65.1,1012.0,4.84,F,0.80,A,7.21,13.46
-14.00,83467,65,65.1,1012.3,4.83,F,0.80,A,7.22,13.46"""
+HYDROSTATIC_NPZ = """
+UEsDBC0AAAAIAAAAIQDfVEO2//////////8JABQARHJhZnQubnB5AQAQAAgmAAAAAAAAbAoAAAAAAACd0blva2kZwGFnT5zF+74d
+r+fYvkIMNCMEkkUBFIAACSGkkdAVc0dIIGa4AxSMkGjcpHFBmlCkCUUqN2ncpDFFmlCkcpMmTRpTpAlFKm7i5y/g62x9Ou/7fL+/
+//jnP/rJL9dif459FX767stfvw+/FYTf/uzj8E0Qfvb5+z++f/v7X33+/tN3L/9/7+3vvnz34f8vf/P2i3cffkcffePrH73pvwn+
+Gvy/Jx5bnVF2+v37v2Rjo/4nk/lTFBt9J744/+I7sdHPZvXx8qex0WevJzb66vVibPRy65NJbPTPL15uxkav12ax0b9vXk5s9OFj
+Hy7GRv+NXj4YG71+Lr42arxcq6+Nvvl61kY/eL24Nnod+8na6A+vg9dGr9fGa6N/nL6ctdHretO10b9exs7XRq+fW6yN/vNybbk2
+WjHWOdY51jnWOdY51jnWOdY51jnWOdY51jnWOTY4Njg2ODY4Njg2ODY4Njg2ODY4Njg2ODY5Njk2OTY5Njk2OTY5Njk2OTY5Njk2
+OTY5tji2OLY4tji2OLY4tji2OLY4tji2OLY4tjm2ObY5tjm2ObY5tjm2ObY5tjm2ObY5tjl2OHY4djh2OHY4djh2OHY4djh2OHY4
+djh2OXY5djl2OXY5djl2OXY5djl2OXY5djl2OfY49jj2OPY49jj2OPY49jj2OPY49jj2OOIccY44R5wjzhHniHPEOeIccY44R5wj
+zrHPsc+xz7HPsc+xz7HPsc+xz7HPsc+xz3HAccBxwHHAccBxwHHAccBxwHHAccBxwHHAcchxyHHIcchxyHHIcchxyHHIcchxyHHI
+ccRxxHHEccRxxHHEccRxxHHEccRxxHHEccSR4EhwJDgSHAmOBEeCI8GR4EhwJDgSHElzkjxJ85JcSXOTfEnzk5xJeyR5k/ZJcift
+leRP2i/pHZL2THqPpH2T3iVp76T3Sdo/6Z2SHCmOFEeKI8WR4khxpDhSHCmOFEeKI8WR4khxpDhSHCmOFEeKI8WR4khxpDhSHCmO
+NEeaI82R5khzpDnSHGmONEeaI82R5khzpDnSHGmONEeaI82R5khzpDnSHGmONEeGI8OR4chwZDgyHBmODEeGI8OR4chwZDgyHBmO
+DEeGI8OR4chwZDgyHBmODEeGI8uR5chyZDmyHFmOLEeWI8uR5chyZDmyHFmOLEeWI8uR5chyZDmyHFmOLEeWI8uR48hx5DhyHDmO
+HEeOI8eR48hx5DhyHDmOHEeOI8eR48hx5DhyHDmOHEeOI8eR48hz5DnyHHmOPEeeI8+R58hz5DnyHHmOPEeeI8+R58hz5DnyHHmO
+PEeeI8+R58hzFDgKHAWOAkeBo8BR4ChwFDgKHAWOAkeBo8BR4ChwFDgKHAWOAkeBo8BR4ChwFDiKHEWOIkeRo8hR5ChyFDmKHEWO
+IkeRo8hR5ChyFDmKHEWOIkeRo8hR5ChyFDmKHCWOEkeJo8RR4ihxlDhKHCWOEkeJo8RR4ihxlDhKHCWOEkeJo8RR4ihxlDhKHCWO
+MkeZo8xR5ihzlDnKHGWOMkeZo8xR5ihzlDnKHGWOMkeZo8xR5ihzlDnKHGWOMkeFo8JR4ahwVDgqHBWOCkeFo8JR4ahwVDgqHBWO
+CkeFo8JR4ahwVDgqHBWOCkeFo8pR5ahyVDmqHFWOKkeVo8pR5ahyVDmqHFWOKkeVo8pR5ahyVDmqHFWOKkeVo8pR46hx1DhqHDWO
+GkeNo8ZR46hx1DhqHDWOGkeNo8ZR46hx1DhqHDWOGkeNo8ZR46hz1DnqHHWOOkedo85R56hz1DnqHHWOOkedo85R56hz1DnqHHWO
+Okedo85R56hzNDgaHA2OBkeDo8HR4GhwNDgaHA2OBkeDo8HR4GhwNDgaHA2OBkeDo8HR4GhwNDiC1ZytgCdYzUsEXMFqbingC1bz
+2wFnsNrjawFvsNrn44A7WO313YA/WO33w8A7BKs9fxF4j2C179vAuwSrvX8beJ9gtf+fAu8UrBx/4xhzHHNMOE44TjnOOM45Ljim
+HJccM44rjjnHNccNxy3HguOO457jgWPJ8cjxxPHMEWvq0dSjqUdTj6YeTT2aejT1aOrR1KOpR1OPph5NPZp6NPVo6tHUo6lHU4+m
+Hk09mno09WjqwTHmOOaYcJxwnHKccZxzXHBMOS45ZhxXHHOOa44bjluOBccdxz3HA8eS45HjieOZI9bSo6VHS4+WHi09Wnq09Gjp
+0dKjpUdLj5YeLT1aerT0aOnR0qOlR0uPlh4tPVp6tPRo6dHSg2PMccwx4TjhOOU44zjnuOCYclxyzDiuOOYc1xw3HLccC447jnuO
+B44lxyPHE8czR6ytR1uPth5tPdp6tPVo69HWo61HW4+2Hm092nq09Wjr0dajrUdbj7YebT3aerT1aOvR1qOtB8eY45hjwnHCccpx
+xnHOccEx5bjkmHFcccw5rjluOG45Fhx3HPccDxxLjkeOJ45njlhHj44eHT06enT06OjR0aOjR0ePjh4dPTp6dPTo6NHRo6NHR4+O
+Hh09Onp09Ojo0dGjo0dHD44xxzHHhOOE45TjjOOc44JjynHJMeO44phzXHPccNxyLDjuOO45HjiWHI8cTxzPHLGuHl09unp09ejq
+0dWjq0dXj64eXT26enT16OrR1aOrR1ePrh5dPbp6dPXo6tHVo6tHV4+uHhxjjmOOCccJxynHGcc5xwXHlOOSY8ZxxTHnuOa44bjl
+WHDccdxzPHAsOR45njieOWI9PXp69PTo6dHTo6dHT4+eHj09enr09Ojp0dOjp0dPj54ePT16evT06OnR06OnR0+Pnh49PTjGHMcc
+E44TjlOOM45zjguOKcclx4zjimPOcc1xw3HLseC447jneOBYcjxyPHE8c8RCPUI9Qj1CPUI9Qj1CPUI9Qj1CPUI9Qj1CPUI9Qj1C
+PUI9Qj1CPUI9Qj1CPUI9Qj1CPTjGHMccE44TjlOOM45zjguOKcclx4zjimPOcc1xw3HLseC447jneOBYcjxyPHE8c8QiPSI9Ij0i
+PSI9Ij0iPSI9Ij0iPSI9Ij0iPSI9Ij0iPSI9Ij0iPSI9Ij0iPSI9Ij0iPTjGHMccE44TjlOOM45zjguOKcclx4zjimPOcc1xw3HL
+seC447jneOBYcjxyPHE8c8T6evT16OvR16OvR1+Pvh59Pfp69PXo69HXo69HX4++Hn09+nr09ejr0dejr0dfj74efT36enCMOY45
+JhwnHKccZxznHBccU45LjhnHFcec45rjhuOWY8Fxx3HP8cCx5HjkeOJ45ogN9BjoMdBjoMdAj4EeAz0Gegz0GOgx0GOgx0CPgR4D
+PQZ6DPQY6DHQY6DHQI+BHgM9BnoM9OAYcxxzTDhOOE45zjjOOS44phyXHDOOK445xzXHDcctx4LjjuOe44FjyfHI8cTxzBEb6jHU
+Y6jHUI+hHkM9hnoM9RjqMdRjqMdQj6EeQz2Gegz1GOox1GOox1CPoR5DPYZ6DPUY6sEx5jjmmHCccJxynHGcc1xwTDkuOWYcVxxz
+jmuOG45bjgXHHcc9xwPHkuOR44njmSP2ZvQ/UEsDBC0AAAAIAAAAIQAZqCtQ//////////8QABQARGlzcGxhY2VtZW50Lm5weQEA
+EAAIJgAAAAAAAAwJAAAAAAAAnc/531Bj+sDxIiknSUiSJklPm+pJ06JFu1BonWwt2rVNC1pFkswhNVRCWhQS2icJSRrqtKkGlUiT
+LE+JEFLMfOd6/wXf88v7de7P63Xf1/X4DR3b3HRz/nx35xud07PXsB5Dc64qm9OgX92cqmVzeg8eOnxo90FdBw/t2ev/zlt2HzCs
+13/Ph/Xt/tde//2vmFuzRm7VSlXLji37//3Oyl8p3/++ehzCl3iApSqH7ZhyPX9jrSrhAM7nPl5QNWzDiXyLx1n9irAP5/BjFqsW
+Xsv7+TqPsUr1sAef4S6eXSNswXu5ikdZMTfsxpncwbNqhs04hit4hBWuDLtwBrezUK2wCUdxOfNY/s/h7ZzObTyzdtiYI7mMeSxf
+xz2cxq08s657OJLLmMfy9dzD6dzGQlfZi6O4nId5ef2wC2dwOws3CJtxDFfyW+Y0DLtxJneySKOwBe/la/yela8Oe3AWP+Q5jcNW
+HM81/JHVmoR9OId7eF7TsA0nci1/Zc1m4QAu4Gcs2Txsx5Qb+DvrtgiHcBEPskzLsDOnMmOBa8JGHMGlzOPlrcIufJI7mFwbtuA4
+ruYxVr0u7M053M3zrg/b8CGu42+s1TocxBd5gKXbhJ04hZtY4AZ7cwSX8TAr3Bh241PcxaI3ha04nm/wOGu0De/kfH7Ki9qF7fko
+32P+9mF93s0l/IblO4RdOJM7eXbH8BqO5xs8ztxOYX8u4H6W+kvYgY9xIwt0DhtxBJfzCCveHN7BWfyIxW8JW/MhruNJ1r41HMKX
+eYiX3hbeyun8gMntYUvexzU8ztwuYX8+z895cdewE6dyMwt2C5twDFfxGKt2D/twHvex5B1he07mRp7eI2zEkVzBo6zcM+zFOdzL
+Er3CtnyE7/G03mFDjuByfsvKfbzDOdzLEn29w0f4Pk/vZx+O5Ap+xyp3hr05l/tYsn/YnpO5iWcMCBtzDFfxB1YfGPbnCzzAMoPC
+WzidO1h0cHgdJ3IdT7HeX8O7uJRHWGlI2JNz+AlLDg07cAo3s9CwsBnHcQ1/5pXDw8FcxC9Z7q6wC5/ihyx+d3gD/8YNzH9P2JAj
+uZLf84oRYT/O536WHhl25hPcziKjwlZ8gGv5G+uMDodxMfNYYUx4B5/lHpYYG7bjZG7iGfeGTTiWq/kTc8eFA7mQB1n2vvA2Psld
+LHZ/2JqTuJ5/sP748B4u51FWeSDszXn8lKUmhJ04lVtY6MGwOcdxDY+z5kT7ciEPsuxD9uUM7mTRSeF1nMh1PMW6D4fDuYR5zPlb
+2IPPcg9LpGFbPsqNLPBI2JhjuIo/sPqjYX8+zwMsMzm8hdP4Ac9+LLyWE/g2T7LuFPtyMfOYM9W+nM09LPH3sB0ncxMLPh425Viu
+5k/MfSIcyIX8gpdOC2/nTO5iselha07iu8w3I2jAEVzB71j1ybAv53M/S88MO/MJbmeRp8JWnMC3eZJ1nw6HcymPsNIzYS/O5T5e
+NCvsyKncwsLPhi05nm/xBGvPDodyMfOYMyfswdncy5Jzww6cws0sNC9swfv5Jn9l7efMwVf5DXPmm4Oz+QlLLjAHp3ALCz9vDo7n
+WzzBOi+Ew7iYh1nxxbAX53IfSy0MO/FxbmPyUtiKE7iOp1hvUXg3l/Eoq7wc9uV8fs5LXglv4XTu5Dmvhq05iRuYf3HYiKO4ij+w
+xpJwIBfyEMstDbvyaX7MC5aFbTmZGc9cHjbnfXyTJ1h7RTiMS3iYlVaGvTmPn7H0P8KbOY07eM6q8HpO4gae9lrYiKP5Gn9i7upw
+EBfxK17+etidz3IvS64JO3IqtzJ5I2zFB/kO/2D9N8MRXMljrP5WOIALeYiXrQ278hnuZom3w/acwi08a114DSdwHX9n/XfMyZU8
+xurrzcmFPMTL3g27cRb38MINYQdO5VYm/wyv5USuZ773goYcxVX8kbnvh4P5Mr9mhY1hD87hPl68KezMadzBc7PwRk7mZiab7cFJ
+/CfP2BI243i+zd/ZcGs4mq/zF9bZFt7FFTzG3O3hYL7Kw6zyQdiPL/IQL98R9uA87uefdoa38xnu4UW7wr9wOnex+L/CtnyMW1nk
+w/B6Psz3WfCjsAUf4DvM93FwNcfyDZ5gvd3hPfwHf+SVe8IhXMJvecXesD9f4lfM+STsxed4gGX3hV05i5+w1KfhzZzBD3n+Z2F7
+TuV2Ft0ftmHKTSz0eXgNH+S7PO1A2ITj+BZPsv6/w5FcxeOsdTAcxqX8jtW+CAdyEb9hxUNhHy7gQZb7MuzO2fyUpb8Kb+VMfswS
+X4cd+Th3sNg34Y18lJt5Vl7Yig9xAwscDpvyfq7l72xwJBzN1fyFtb8N7+JyHmONo+FgvsLDrPxd2I8v8BDLfx/24FzuZ5lj4W18
+mrtZ8oewE6dxJ4v/GN7Ex7iFRX4Kr+PDfI8Fj4fN+QDXMd/PQSOO5RqeYN1fwnu4kj+y5q/hEC7mEVY9Ed7JhfySFX4Le/I5fs6y
+J8MunMW9LHUq7MwZ/BfP/z1sx6ncxqJ/hK2ZciML5cv/P1vyQa5n/vxhY97LN/kbrzotHMFV/Im1Tg+HcimPslqBcAAX8WtWPCPs
+zQX8N8sVDLtxNvex9JnhLZzJj1iiUNiBf+cHPKdweAMfYcbCZ4WtOJEbeHoSNuV9XMtTbFAkHMXV/Jm1zw6Hczm/Z42i4SC+wjxW
+Pifsy+f5BS8rFt7BOfyMl5wb3sanuJsXFg878Qnu5LnnhTdxMrcwOT+8nikzJhfoTJkxKaEzZcbkQp0pMyYldabMmFykM2XGpJTO
+lBmTi3WmzJiU1pkyY3KJzpQZkzI6U2ZM/qQzZcakrM6UGZNLdabMmJTTmTJjcpnOlBmT8jpTZkwu15kyY1JBZ8qMSY7OlBmTijpT
+Zkwq6UyZMamsM2XGpIrOlBmTqjpTZkyu0JkyY1JNZ8qMSXWdKTMmNXSmzJjk6kyZMampM2XG5EqdKTMmtXSmzJj8WWfKjEltnSkz
+JnV0psyY1NWZMmNST2fKjMlVOlNmTOrrTJkxaaAzZcakoc6UGZNGOlNmTK7WmTJj0lhnyoxJE50pMyZNdabMmDTTmTJj0lxnyoxJ
+C50pMyYtw/8AUEsDBC0AAAAIAAAAIQDRDYJF//////////8HABQAVFBDLm5weQEAEAAIJgAAAAAAANoBAAAAAAAA7dcxTsNAEAXQ
+paFAdFR0rmKQXABpAFG4SpWENBSpUERsUSCCbESDkHIAOqpwgFwgF/ABwgG4QC6QC+D8T4/EzKy3yDZPduc/q5nxR/+mNxjuuBf3
+Go+z8q6IL6P4Kj+PkyjOJ8VzMXq8nRTjbPO+M3oos/p9eT96yurno9Ozk9PkOIneov+evc9ZfQ676V/mm9PSs40j121OqufXsj5d
+uchtqCdyy+UitlJP5DaVi9ze9URuM7mIba4nclvoifwquchtqSfy+5aL3FZ6Ire1XOTmemoit3257Nd6sl/LZb/Wk/1aLvu1nuzX
+ctmv9WS/lst+rSf7tVz2az3Zr+WyT/9+b7V161YLuXeEI/eXcOT+E47co5oX98f1g5F7XDhyDwxH7pPNyz00HHF90nDkPhyO3KvD
+Efcob15cnzIccX+m4cj/i3Dk/4k/cU3m+qLeCztRv0pf7nd2cl/TF7mv7ETua32Ru7s2k3uOvtxX7ETuLX25T9iJ2FM7Oe/15dy2
+k/NYX85VO5H7VF/OOzs53/TlfLOT801f5F7ZyfmmL+ebnZxv/uTc8y/q5AbexXfv+pdz2r/I+6A5uT/4F+WO/It6t/yLeif+RZ3b
+/kWdL/yLOqfNiXp35P4AUEsDBC0AAAAIAAAAIQAell0v//////////8HABQATVRDLm5weQEAEAAIJgAAAAAAAEkKAAAAAAAAndj7
+Y8+FHsfxdY5zjoqSJmRpQkOjucRiMlouubS0XEKGYSJmJsolwja7GFkaJmLHcSuXCJEQkUaESEsrEhJCtUSdnO/jLzjf356f5/P1
+7hfbPt9mdnq6Y2z3m4JeCBoTltB/RL/ksKahYVEDIsPCQ8MGDEtOSe4ztPew5IT+N5637jNkRP+/no9I7JPU/y+uVb9BRP3w2uGh
+40L/388tDW98Jk2JnjP7r8+UKdH/4zQ8dUp00I1PFs7G06dED7jxeXVK9N7Cvz65eBbOc2cuzsfz3XkTL8L/dneJO8vwCvy2O6vw
+GrzWnfV4A97k7vvubMXb8A53PsK78R53CvE+vN/dg/gQPuLuF+4U4a9wsTvf4pP4lDun8Vl8zt0L7vyEL+Of3SnBv+Fr7vyBg1ID
+/LfUwN1S+J+4dGrg7q2pgTtl8e34jtTAnWBcAVdy524cgqu6G+pOdVwDh7lTGz+A67oTgevjRu42dicSN8VR7rTA0fhRdx7DbXA7
+dzvgjjjW3c7uxOEuuJs7PXBP3NudPrgf7u9uojvP4SF4qDtJOBmnuDMKj8Zj3B3nzgQ8EU92JxWn4wx3svA0PN3dmTgXv+7ubHfy
+8Ty8wJ2FuAAvdmcJXoZXuLvSndX4HbzOnQ14I97szha8FW93dwf+CO929xN39uJP8QF3DuHD+Kg7x3ARPu5usTsn8En8vTtn8A/4
+R3cu4p/wFXd/cacEX8XX3PkTB6UF+O9pgTv/wP/CN6cF7pbBZXG5tMDd8mmBO8H4LlzJnSo4BN/rTjVcHdd0t5Y7dXA4rudOBG6A
+G7nTBEfiZu42dycat8Qx7rTGbfHj7nTAnXCsu0/hONzV3e7u9MS9cLw7fXECHuBOIn4OD3F3mDvD8Qg80p3R+EU81p3xeAJ+xd3J
+7qThdJzpTjbOwTPcycWv4Tx35+B8/Ia7C9xZhAvwf9xZipfjt9xZhVfjte6+684G/B7e7M4HeCv+0J2deBf+2N1CvBfvd/czdw7h
+z/FRd77ERfhrd77BJ/B37p525yw+h8+7cxFfwlfc+RWX4N/dve5OUHqAb0oPcKl0f2dxaXxLur+36YF7ZezK8rfpy/Hl+Dvs7uSD
++WC7u/iKnleyq8zfbRfCh/D32N3Lh/Khdvfx1fkadjX5+/kwu1p8bb6OXTgf7nk9uwf5CLv6fAO+oV0j/iG+sV0kH8k/bNeMj+Kj
+7B7hW/DRdi35Vp7H2MXwj9m14dvybe0e59vzHew68p34J+xi+Sf5znZxfBz/tF1Xvpvn3e2e4XvY9eR78c/axfPxfB+7fnwCn2A3
+gB/IJ9oN4p/jB9sN4Z/3fJhdEp9kl8yP4FPsRvIveD7a8xf1Y9wZqxuvm6CbqJuEp+A0u3S7DLssXbYuRzdd96ouV/ea7nVdnm6O
+Ll83TzdftwAvwgV2i+2W2C3VLdet0L2tW6VbrXtHt1b3rm6DbqNuk26zbgveirfb7bDbabdLt1u3R1eo26v7VLdf95nukO6w7oju
+qO4YLsLH7YrtvrE7oTupO6U7rTuj+0F3Tnded1H3k+6y7oruF10Jvoqv2V23+9MuaKrvU1MDXamp3s+mej+b6nuV7hZdGV1Z3e26
+crryumBdBVwJV7arYhdiV1UXqqumq66robtfV0tXW/eALlxXTxehq48b4YfsmthF2jXVRema61roonWtdDG6x3RtdG11j+s66Drq
+nsBP4qfs4uy62HXTddf10PXUPauL1/XR9dMl6AboEnWDdIN1Q/AwnGSXbJdiN1I3Sjda95JurG6c7mXdBN0rusm6Kbo0XTrOxFl2
+0+ym283QzdTl6mbp8nSzdXN1+bo3dAt0b+oW6Qp0i/ESvMxuhd1bdit1q3RrdGt163TrdRt07+k2697XfaDbqtuOd+CP7HbbfWz3
+ia5Qt0+3X3dAd1B3SPe57qjuC92XuiLdcV0x/haftPvO7nu707qzunO6H3UXdBd1l3RXdD/rftWV6K7qrumu46AM768Zvndm+P9F
+Gd5jMwJdad3Nult1ZXS36crp7tDdqQvW3aWrpKuMQ/A9dvfahdrdp6uhq6kL09XS1dGF6+rqHtRF6BroGuke0jXBD+NmdlF2j9hF
+61rqHtXF6Frr2ura6drrOug66WJ1T+qe0sXhrrib3TN2Pe166Xrr4nV9dQn8QP0g3RA+SZ/Mj+RH82P58fxEfrK7aXwGn203nZ/J
+z+Jn8/n8fH6huwX8En653Vv8Kn4tv57fyG/mt7q7nd/J77b7hN/HH+AP8Uf4Y/xX7hbzJ/hTdqf5c/wF/hJ/hS/hf3f3Oh+UGfCl
+Mv38Zfq5y/Tzxpfjy/MV+EqZ3hf4qnw1uxp8GF+Hr8tH8A35xu5G8lF8C7uWfAzflm/Pd+Rj+Th3u/Dd+Z52vfm+fH8+kR/MD+WH
+u5vCj+JfshvLT+An8al8Op/F57g7g8/l8+zm8PP4BXwBv5hfyq9wdyW/hl9nt4HfxG/ht/E7+F38HncL+f38QbvD/FG+iP+a/4Y/
+yZ929yz/I3/R7jL/C/8bf43/k/9blvfhrMDd0ln+TmT5+5DlvZcP5ivyd/MhfChf3d2afC0+3K4eX59vxEfyTfnmfLS7j/Kt+XZ2
+Hfgn+M7803w3vgf/rLvxfAI/0G4QP4RP4kfwI/nR/Fh3x/MT+cl2aXwGn81P52fys/jZ7ubz8/mFdgX8En45/za/il/Lr3d3I7+Z
+32q3nd/J7+YL+X38Af6Qu0f4Y/xXdsX8Cf4Uf4Y/x1/gL7l7hS/hf7e7zgdlB3ypbN/fsv2ezfZ7li+X7fcsX4GvZFeFr8pX42vw
+YXwdvq67EXxDvrFdJB/Ft+Bb8TF8W769ux35WD7Orgvfne/Jx/N9+f58oruD+aH8cLsUfhT/Ej+On8BP4lPdTeez+By7GXwun8fP
+5efxC/gCdxfzS/kVdiv5Nfw6fgO/id/Cb3N3B7+L32NXyO/nD/Kf80f5Is+Pe16sP4FP4u/9d8/YnbM7r7uIL+Erdr/a/WZ3TfcH
+Dprm9/A07+/T/Lue5t/1tEBXBpfF5ezK2wXbVdRVxlXwPXahdvfZ1dCF4Vr4Abu6dhF2DXSNdE1wJG5m19wu2q6VLga3xm3t2tt1
+tIvVdcZxuItdN7sedr108bgPTrAbYJdoN1j3PB6Gh9ul2L1gN1o3Bo/FL9tNtJtsl6pL12XiLJxjN8Mu126WLg/Pwfl28+3etCvQ
+LcZL8DK7FXYr7Vbr1uJ1eIPde3ab7T7QbcMf4p12u+322BXqPtUdwAfxYbujdsfsinRf42J8wu47u9N2Z3Xn8Hl80e6y3c92Jbqr
++Br+wy4ox/foHO9DOYGuNL4Zl8nxXpTjvcjuTl0FXBFXtguxq2oXqquuq4nDcG27cLt6dhG6hrgRbmL3sF2U3SO6aNwKx9i1sWtn
+10HXCcfiznZxdl3tuut64l443q6vXYLdQN0gPBg/b5dkl2yXohulexGPwePsJti9YjdZl4bTcaZdtt10u1d1uXgWzrObazfPboFu
+YU70fwFQSwMELQAAAAgAAAAhAE/FDVD//////////wcAFABMQ0IubnB5AQAQAAgmAAAAAAAAwwQAAAAAAACd1T1onXUYhvE4uGRx
+aPyoH+kRh5NCEKtLEQPFwTqoWEFECEiwCYJiY6IOFsGli0sHXXRw0cGpi0sXlzi41MGpi0sXlzi41MHJ8/4vOBf4cPNEs/xop5dz
+3e/7fPHK6y+/+uY9Kx+vXJ1f3j18+2D+7Gz+3N75+eZsvnfl4MODnfffunJweXf6/xd23jvcXfz/4Ts7+7uLf2+ce/qpc5tnN2ef
+zv7v3+qNi3c+Wbvx+IV/e3b7+tHd77Pf7W+t3v6298y140s3v8l+/dX017s2PdiX2cVTbWxfzy4eZn/r897psdavZVemv896r44H
+y/61eKqjj3o/mH7G/ewf02O927s3/rJT9Ys72e3xQ/ZOP+PqG9nXFo9zfKn3l1uLv5eyL44H6/1pyv98dvyMW73jsc5nnxl/2fFe
+Pdk73q+N7Hivnugd79d6drxXp3vHXNeyI/t9veNnXM2Ox7o3O96rld7xfv09i4736m7veL/+zI736rh3vF6/Z8dM7/SO/L9lx894
+Ozveq197x/t1Kzveq597x/t1lB3v1Y+94/26mR2v1w+93LUsdy3LPevlrmW5Z73ctSx3rZe7luWu9XLXsty1LPesl7uW5Z71ctey
+3LVe7lqWu9bLXevlvvVy33q5cyeXe9fL3evl/vVy/04u97CXe9jLXezlLp5c7mQvd7KXe9nL3Ty53M9e7uOZVu7ff5d7l+WeZblT
+Ve5OlnuS5U5k+f5X+Z5n+U5n+f5W+a5m+V5m+Q5m+b5V+U5l+e5k+X5U+Q5keZ+zvJ9V3q8s70uW3WfZ+3qRPWfZc5Y9V9lzlj1n
+2XOVHWfZc5Y9Z9lzlT1n2XOWPVfZcZY9Z9lzlj1X2XOWPWfZc5U9Z9lzlj1X2XGWPT8WZc9Z9lxlz1n2nGXPVfacZc9Z9lxlx1n2
+nGXPWfZcZc9Z9pxlz1V2nGXPWfacZc9V9pxlz1n2XGXPWfacZc+PFtlxlj1n2XOWPVfZc5Y9Z9lzlT0r+1X2quxT2aWyQ2V3yt6U
+fSl7qrIjZT/KXpR9KLtQdqB0V3o/spS+Ss8qHZV+Si+lj9JF6aJ0UbooXZQuSpcqfZQ+Sh+li9JF6aJ0UbooXZQuVfoofR5eSh+l
+i9JF6aJ0UbooXZQuVfoofZQ+Sh+li9JF6aJ0UbooXar0UfoofZQ+Sheli9Ll9FK6KF2ULlX6KH2UPkofpYvSRemidFG6KF2ULlX6
+KH2UPkoXpYvSRemidFG6KF2q9HloKX2UPkoXpYvSRemidFG6KF2q9FH6KH2UPkoXpYvSRemidFG6VOmj9FH6KH2ULkqXB5fSRemi
+dFG6KF2q9FH6KH2ULkoXpYvSRemidFG6VOmj9FH6KF2ULkoXpYvSRemidHmgSB+lj9JH6aN0qdJH6aP0Ufoofap0UjopnZROSp8q
+nZROSielk9KpSi+ll9JL6aV0ur9IL6WX0kvppXSq0kvppfRSeimdqvRSeim9lF5Veim9lF5KL6VXlV5KL6WX0kvpVaXX2lJ6Kb2U
+XkqvKr2UXkovpZfSq0ovpZfSS+mldKrSS+ml9FJ6KZ2q9FJ6KY+p9FI6Vel1aim9lF5KL6VTlV5KL6WX0kvpVKWX0kvppfRSOlXp
+pfQ6deEfUEsDBC0AAAAIAAAAIQCJpXUz//////////8HABQATENGLm5weQEAEAAIJgAAAAAAAAkJAAAAAAAAnZZNaGVnGcfvTW5u
+kpuv8/0VbQMu0sIgVjdFHI64UBcqVhARCjLYGQTF1hl10SK4sBs3XdiNLty0GzcDgmAFEZ0qfjCVaq1Ta62TdqadTqadTCbJZCaZ
+jMn5/9688D7Mxrv5kUty3v/v/zznnPzoc1/87Oe/3O99t/fE8iPHT3315PJHl5Y/duLB5SNLyycePfntk8e++ZVHTz5y/OD7Tx77
+xqnj+9+f+tqxx47v/3zfAx/+0ANH7j+y9L2l//cz+smPDz5LH3fMTn9q5fGnLZ86s3nfw09Zjs4989jRH1o+ufrQc/c8adk7+Hzf
+8onuIMut/VPOfMfyW0cPTrK8cnDM1y1PdB/Llcf3Dzpm+XAnaHmgN/qS5Rf2j1l9yPKFs/ufz1h+ujvo7nz+oN5PWHaaRy274x60
+/Ej3sTxoN/ug5f2dqOWz+5rnPmB5bzdYy26fasturJllV++CZac3suyOmbDs9qln2e3N5r2G3X6sWnZjWLHsjj9n2c31rGU3tzOW
+3Xyes+zqOG3Z9f2Mpe5bS92flroPLXW/Weq+stT9Y6n7xFL3g6X23VJ7fXdqjy21r5baS0vtn6X2zFL7ZKl9usdQ+2SpfbLUPllq
+nyy1T5baJ0vtk6X2yVL7ZKl9stQ+WWqfLLVPltonS+2TpfbJUvtkqT2y1B5Zao8stUeW2iNL7ZGl9shSe/R+Q+3R3al9stQ+WWqf
+LLVPltonS+2TpfbJUvtkqX2y1D5Zap8stU+W2idL7ZOl9slS+2SpfbLUPnlqjzy1P57aG0/ti6f2xFP78b5Dah8stQ+e2gNPzd9T
+c/fUvD01Z0/N11NztdRcPTVPT83RU/Pz1Nw8NS9PzclSc/LUfDw1H0/Nx1Pz8dR8PDUfT83HUnNaPKTm46n5eGo+npqPp+bjqfl4
+aj6WmpOn5uOp+XhqPp6aj6fm46n5eGo+nprLIvNYZA6L9L9I74v0vUjPi/S7SJ+ux4b+PNVfQ28NfTX01NBPQx8NPTT4N3g3+DZ4
+Nvg1eDX4NPg0+DT4NPg0+DT4NPg0+HjKq8GrxqfGp8anxqfGp8anxqfGp8anxqfGp8anxqfGp8anxqfGp8anxqfGx1NeNV41PjU+
+NT4VPhU+FT4VPhU+FT4VPhU+FT4VPhU+FT4VPhU+FT4VPhU+nvKq8KrwqfCp8KnwqfCp8CnxKfEp8SnxKfEp8SnxKfEp8SnxKfEp
+8SnxKfHxlFeJV4lPiU+JT4lPiU+JT4lPiU+JT4FPgU+BT4FPgU+BT4FPgU+BT4FPgY+nvAq8CnwKfAp8CnwKfAp8CnwKfAp8CnwK
+fAp8cnxyfHJ8cnxyfHJ8cnxyfDzlleOV45Pjk+OT45Pjk+OT45Pjk+OT45Pjk+OT45Pjk+OT4ZPhk+GT4ZPhk+HjKa8MnwyfDJ8M
+nwyfDJ8MnwyfDJ8MnwyfDJ8MnwyfDJ8MnwyfDJ8UnxSfFB9PeaV4pfik+KT4pPik+KT4pPik+KT4pPik+KT4pPik+KT4pPik+KT4
+pPik+CSHlFeCV4JPgk+CT4JPgk+CT4JPgk+CT4JPgk+CT4JPgk+CT4JPgk+CT4JPgo+nvBK8nE+MT4xPjE+MT4xPjE+MT4xPjE+M
+T4xPjE+MT4xPjE+MT4xPjE+Mj6e8YrxifGJ8YnxifCJ8InwifCJ8InwifCJ8InwifCJ8InwifCJ8InwifCJ8POUV4RXhE+ET4RPh
+E+ET4eM8Fsi/QO4F8i6Qa4E8C+RY4JwFrr9AL/P0MU8P8/jO4zmP3zz558k9T955cs2Ta45cc+SZo7c58syRZ44e5sgzh+ccuWbJ
+M8s8Zsk1S55Zep4lzyx5Zultljwz5JmhpxnyzNDTDLlmyDNDTzPkmiHPiJ5G5BmRZ0RPI/KM6GlErhF5RvQ0Itc0eabpaZpc0+SZ
+pqdp8kyTZ5qepskzRU9T5JoizxQ9TZFrijxT9DRFninyTNLTJHkmyTNJT5PkmaSnSXJNkmeSnobkGpJnSE9D8gzJM6SnIXmG9DQk
+15A8E/Q0Qa4J8kzQ0wR5JsgzQU8T5BmQZ0BPA/IM6GlArgF5BvQ0INeAPAN6GifPOHnG6WmcPOP0NE6ucfKM09M4ucbIM0ZPY+QZ
+I88YPY2RZ4w8Y/Q0Rp4+PfXJ1SdPn5765OqTp09PffL0ydOjpx55evTUI1ePPD166pGrR54ePfXIc6fV+Xda9XGn1Xl3Wp2z1+qc
+vVbX3Wt1vb1W19tr5XO7lc/tVh63W/V5u1Xu3VY5d1v1ttsq326rOLut8uy0mtcOeXZa9bBDrh3y3Grle4tct8hzq1XfN8lzkzw3
+W/V6kzzbrea6Ta5t8my3mt82ubbJc4OebpDnBnlu0NMWebbIs0VPW+TZpKdNcm2SZ5OeNsm1QZ4NetogzwZ5NujpOnmu09N1cl0n
+zzo9rZNrnTzr9LROnmvkuUZP18hzjTxr9LRGnjV6WiPXGv1cJcdVerlKD+9x3ntc/12u/y7XvcJ1ruC1itcqHpfJf5n8l8n7Dv29
+Q1+XyHWJni6R523yvE0fb5HnLfwvkusieS7geYFcF8jzJv2+SZ43yPMG810hzwq9nSfXefKcJ89/yfE65/6Hc1/jvNfwfpXrv8r1
+XsHvFfo+R7//xONlen2ZHl8i70vk/Tv5/kauF8nxV3K8wPln6ffPnPcn+vsjvfye6z6P9++4zm/4+1/z97/i93/B7/2c73/G98/y
+dz/l5x/QU6/nfhafPvw99/f6+fThdd05yvnLQ7ocIV3OkM7DUT391tB5h3S9hHS9hdTc/nBI13NIN4eQbk4htT9/MXTzdXRzD+n2
+IqSm86Kh26eQbt8c1ZOl28+Qbn9Duv0OqV7/YejuC0d3v4R091NIzeGcobsPQ7r71NHdvyE1r38Zuvs+pHsuhNTz6d+HdM+RkO45
+E9I9h0LqOfm6oXt+ObrnWkj33AupXizd8zKke546uudsSPVn6Z7PId3zO6R7vofUMZ7ufRDSvS9Cam0s3XsmpHsPObr3U0jt9UVD
+914L6d57Id170VH7b+neoyHdezakew+H1P3i6d7bId17PaR774fUnli6/xdCuv8nHP8HUEsDBC0AAAAIAAAAIQAGn/54////////
+//8GABQAS0IubnB5AQAQAAgmAAAAAAAApgUAAAAAAACd0j1sllUYgOGiiFoEQctfaZCtkDCILsZIYFIXjZg4mJgYIhAHIwjGAeLI
+7OCkq87OzLrqzMysg6IVRfxpv+tw7t13udIv6cl57ud8/vpbr73x9ralT5aur5+/cPW9K+svHl1/6eIL6yeOrl+8dOXjK+c+fPfS
+lfMXtn5/+dwHVy9s/n71/XOXL2z+fezkc8+ePHH8xNFPj/7fb/nNm0du/Hj259PXV7555fa1/PryqeVbX+UP3299+fuxdz77diOf
+2Tzl5pFfpq/evrZ5Un60dczl/PKLrS+/29g6KH86u3WxXFxr5c50ccypvLj4cvNSmwflYsybubjW7TunF/++/Ov0+cWX7ywOyMV4
+N3JxnW9yccytXFp8v02PLw5K/VP/1D/1T/1T/42p/huje+qeuqfuqfvvU91T99Q9dU/9U/+7U/1T/9Q/9U/9747uf0x1T91T99Q9
+dU/dU/c/p/qn/ql/6p/6p/73pvrfG91T99Q9dU/d/5rqnrqn7ql76p/635/qn/qn/ql/6n9/dE/d/57qnrqn7ql76p66/zPVP/VP
+/VP/1D/1/3eq/7+je+qeuqfuqfvSmQe6f9pDmiftJc2X9pTmTXtL86d9ph5LZ+w1ddk2tefUK+099UvvIPVM7yL1Te8k9U7vJuV/
+aKr/Q6N76p66p+6pe+qeuqfuqXvqn/qn/g9P9U/9U//U/+HRPXVP3VP31D11T91T9+1T/VP/1D/1T/1T/9R/++ieuqfuqXvqnro/
+MtU9dU/dU//UP/VP/VP/1D/1T/1T/x1T/VP/1D/1T/1T/7SHtIcdo3/qn/qn/qn/o1P9U//UP/VP/VP/1D/1T/1T/9Q/9X9sqn/q
+n/qn/ql/6p/6pz08Nvqn/ql/6p/6Pz7VP/VP/VP/1D/1T/1T/9Q/9U/9U//lqf6p//Lonrqn7ql76p76p/6pf+qf+qdr7Zzqn/qn
+/ql/6p/6p/6pf+q/c3RP3VP3J6a6p/6pf+qf+qf+qX/qn/qn/ql/6p/675rqn/qn/rtG99Q9dU/dU/fUP/VP/VP/3VP9U//UP/VP
+/VP/1D/1T/1T/92je+qeuj851T11T/1T/9Q/9U/9U//UP/VP/VP/PVNzpH2kudJ+9oz50p7SvGlvaf60x9Qj7TX1SXtOvdLeU7/0
+DlLP9D5S3/ReUu/0fh503zvVPXVP3VP/1D/1T/1T/9Q/9U/9U//UP/VP/VP/1D/13zu6p+6pe+qeuqf+qf9TU/1T/9Q/9U/9U//U
+P/VP/VP/1D/1f2p0T91T99Q9dU/9U//UP/VP/VP/1D/1f3qqf+qf+qf+qX/q//Tonrqn7ql76p76p/6pf+qf+qf+qX/qn/qn/ql/
+6p/6p/4rU/1XRvfUPXVP3VP/1D/1T/1T/9Q/9U/9U//UP/VP/VP/1D/1XxndU/fUPXVP3fdN9U/jpf6pf+qf+qf+qX/qn/qn/ql/
+6p/67xvdU/fUPXVP3VP/1D/1T/1T/9R//1T/1D/1T/1T/9Q/9U/994/uqXvqnrqn7ql/6p/6p/6pf+qf+qf+qX/qn/qn/gem+qf+
+qf+B0T11T91T99Q/9U/9U//UP/VP/VP/1D/1T/1T/9Q/9U/9D4zuqXvqfnCqe+qe+qf+qX/qn/qn/ql/6p/6p/6pf+qf+qf+B0f3
+1D11T91T99Q/9U/9U/9Do3vqnrqn7ql76p66p+6pe+p+aPROvVPv1Dv1Tt1T99Q9dT80eqfeqXfqnXqn7qtT3VP31D11Xx29U+/U
+O/VOvVP31D11T91XR+/UO/VOvVPv1D11T91T99R9dfROvQ9P9U69U+/UPXVP3VP3w6N36p16p96pd+qeuqfuqfvh0Tv1Tr1T79Q7
+9U7dU/fUfW2q+9ronXqn3ql36p26p+6pe+q+Nnqn3ql36p16p+6pe+qeuqfua6N36r125j9QSwMELQAAAAgAAAAhAMYbVVv/////
+/////wcAFABUS00ubnB5AQAQAAgmAAAAAAAACAkAAAAAAACdlm1oZGcZhqcrcWUMxIXIGllj1uBm6vmej8z3zDtnVlPW2G10JSzE
+1XGbMZCyTTdG19RKFYqg4iqtlC2lWFZrsVILIqyioi2iSFVEZVVUKIKKLVVZVpdgwZne13Ag/jjvmD83E7if99znep7nPfff+u53
+3Hb6psyHMncv3L6+ffb8Qm1uodGvLLhzC/07z3/wfO/ce+88f/v68P9v692xvT74//ZGb2t98DsX5cPIvdmdu2fu//3LXpm97/mV
+1x03F5++nlubOm76w79XHjdrw3/8p2sKw79rXZO9enmr+beueW53+sml57rmZd9vumbwY3f6Z10z+HVl9odd+b6D7xv4vto1meHf
+F7tm+DP7IL7P4rsP30e75p3Dwnd1zc3Df2zgex++VXy3ds2XBj+vdrvm7uHj1PBF+HL45rrmX7nBP17bNT99dvA3ie8V+PZi+f4Z
+m1uGwf4SmzcOH+iPsXy/juV7Npbvmdg8dGnw963Y3DX4efkpfF/B9wi+L8TmhWGsT8fmmcFrvfgJfB/Bt4XvA7F5+ed7YjN8nN1T
++N6OL8ZXjcUniMXnGL434JvG9+pYfG6KxedGR76/d+T7c0e+P3TE55cd8flJR74fdOS7gu/rHfH5ckd8HsZ3P75P4ft4R3w+3BGf
+c/jW8a3he1dHfG7piI/BV8bn43tzR3xe3xGfQ/hehS+D799GfF4w4vMnI9/vjHy/MPL92IjP94z4fBPf1/BdxveQEZ/PGfH5JL6P
+4dvBd4cRn/cb8TmN7zZ8S/haRnyKRnwcfG/CN4PvNYa54zn22nruv7aV82qb+WrTd236ra3n+Uxbvl18G236qU0f4QvxzeKbbNMn
+LfqjJd+vWvI93eK8FvxbcG/JdwFfH9+pFlxb8MR3BF8W340mvJpwasr3/aZ8TzY5rwmHJu8f31l8K/hMk/fb5L3iO4jveoPzGurr
+nzc0B99tyPdEQ75LDc5rqF+3G+rvHr6T+Jr4nIb4HG6IzwS+a3X2ZJ3z6uLz7br4PF5nD9bZf3XOq4vPmbr4LOOr4cvhO1wXnwN1
+8flHjb1VY1/VOK8mPo/VxOeBGvuoxh7Cd6YmPidq4lPBdwzfNL4DNfF5sSo+v6+yP6rsjSrnVcXn81XxubfKXsC3hu9EVXxKVfGZ
+x3cIXwbfixXx+W1FfH5UYY4rzG+F8yric09FfDbxnca3hK9UEZ+jFe49fC+V5Xu+zHll5q7MfVaW79GyfBfLnFdm7srcU/jeiq+A
+72iZuSsz54vM+SJzvsh5i8zdInO+yJwvMuf4NhaZu0XmHF+Ibxbf5CJzV2LOS8x5iTkvcV6JuSsx5yXmHF8f36kSc1dizvEdwZfF
+d6PI3BWZ8yJzXmTOi5xXZO6KzDm+s/hW8Jkic1dkzvEdxHe9wHkF5q7AnBeY8wJzXuC8AnNXYM7xncTXxOcUmLsCc47vWp45z3Ne
+nrnLM+d55jxPf+bhmOf8PPOIbzdP/jzzmaeP87x/zuvlmSPqr1J/Jc9c5em/PO+N+jXql6gfUt+h/jHqH83zfvPMP/mmqJ+l/gT1
+M9Tfi+AQsZci+juCS8SeipiviD6MeH8R+yRiDiL6JWK/RMxhRP9Q/3HqX6b+I9S/RP0HqH8x4r1HvPeI+aX+BepvU/8c9Teof5b6
+Z6h/OuK9R+xr6i9RP6Z+k/oV6heo71M/F/HeI+Yoot+of4j6k9Q/SP0D1H8pZN5C3nvIHguZ95A+DdnbIfsmZC5D7o2Q/Rry3kP6
+OWTfUv8p6j9B/ceo/yj1H6b+gyHvPWSfhNx31L+X+rs8/wXO2QnhwHlbITw4dzOES6KajxBOPE8vhBfPtRbCjedbDdlnvIcVnvck
+72OZ5z7Be1lKVPMVwpk8JoQ3uWrkqpCrRK4CuUJy+eRyyJMjz7FEdT+S6yi5Zsl1hFwz5DpMrmlyHSLXFLkmyZUlz0HyTCSq/iJX
+hjx7AfMd0GcBfRbQZwF9FtBnAX0W0GcBfRbQZwH3T6La1wHzHjDvAfMeMO8B8x4w7wHzHjDvAX0X0HcBfRfQd4mq/8i1Q64tcm2S
+q0+uHrnWyLVKrhVyLZNriTwxeZqJqh/IVSCXT64cuebJNUuuGXJNk2uKXFlyTZAnQ549H06JipcPLx9ePrx8ePnw8uHlw8uHlw8n
+H04+nHw4JSpePrx8ePnw8uHlw8uHlw8vH14+nHw4kWeHPFuJihe5+uTqkWuNXKvkWiHXMrmWyBWTq0muCnkK5PETFS9yzZNrllwz
+5Jom1xS5suSaIFeGXHsenDw4eXDy4JSoeHnw8uDlwcuDlwcvD14evDx4eXDy4OTByYNTouLlwcuDlwcvD14evDx4efAi1w65tsi1
+SZ4+eXqJihe5Vsm1Qq5lci2RKyZXk1wVchXI5ZMrR5558sySZyZR8SLXFLmy5JogV4Zcey68XHi58HLh5MLJhZMLp0TFy4WXCy8X
+Xi68XHi58HLh5cLLhZMLJxdOLpwSFS8XXi68XHi58CLXDrm2yLVJrj65euRaI88qeVYSFS9yLZErJleTXBVyFcjlkytHrnlyzZJr
+hjzT5JkiTzZR8SJXhlx7DrwceDnwcuDlwMuBlwMnB04OnBw4JSpeDrwceDnwcuDlwMuBlwMvB14OnBw4OXBy4JSoeDnwItcOubbI
+tUmuPrl6/6viZ6/inK7ib6/qE3tVP6Wr+s1e1Zfpqr61V/V3uqr/7VVzkq6aI3vVvNmr5jJdNbf2qvlOV829vWo/pKv2h71qz7wl
+VbWH7FX7yl6119JVe89etR/TVfvTXrVn01V72F61r9NVe9xete/tVfdCuuresFfdL+mq+8dedU+lq+4xe9V9l666D+1V96a96n5N
+V92/9qr7OV11f9ur7vl01XeAvep7IV31PWGv+u6wV32PpKu+Q+xV3yPpqu8Qe9V3iL2OW9/2uffruO/H9r3v13H5jts/I7Xtz5GO
+2/8jtZ2vkY47vyO13Q8jHXf/jNR2v4103P050nH3tO3+36/j3jO299d+HfeetL1/9+u497zt98N+Hfc7ZdzvoJHafmeNdNzvuJHa
+fieOdNzv0JHafueOdNzv6JHu/x7/L1BLAQItAy0AAAAIAAAAIQDfVEO2bAoAAAgmAAAJAAAAAAAAAAAAAACAAQAAAABEcmFmdC5u
+cHlQSwECLQMtAAAACAAAACEAGagrUAwJAAAIJgAAEAAAAAAAAAAAAAAAgAGnCgAARGlzcGxhY2VtZW50Lm5weVBLAQItAy0AAAAI
+AAAAIQDRDYJF2gEAAAgmAAAHAAAAAAAAAAAAAACAAfUTAABUUEMubnB5UEsBAi0DLQAAAAgAAAAhAB6WXS9JCgAACCYAAAcAAAAA
+AAAAAAAAAIABCBYAAE1UQy5ucHlQSwECLQMtAAAACAAAACEAT8UNUMMEAAAIJgAABwAAAAAAAAAAAAAAgAGKIAAATENCLm5weVBL
+AQItAy0AAAAIAAAAIQCJpXUzCQkAAAgmAAAHAAAAAAAAAAAAAACAAYYlAABMQ0YubnB5UEsBAi0DLQAAAAgAAAAhAAaf/nimBQAA
+CCYAAAYAAAAAAAAAAAAAAIAByC4AAEtCLm5weVBLAQItAy0AAAAIAAAAIQDGG1VbCAkAAAgmAAAHAAAAAAAAAAAAAACAAaY0AABU
+S00ubnB5UEsFBgAAAAAIAAgAsgEAAOc9AAAAAA==
+"""
 
-KN_CURVES_DATA = """5 degrees,,10 degrees,,12 degrees,,15 degrees,,20 degrees,,25 degrees,,30 degrees,,35 degrees,,40 degrees,,50 degrees,,60 degrees,,75 degrees,,90 degrees,
-X,Y,X,Y,X,Y,X,Y,X,Y,X,Y,X,Y,X,Y,X,Y,X,Y,X,Y,X,Y,X,Y
-4034.1097176994117,6.955709655135765,4720.230259359341,9.095075898471402,4994.678476023313,9.441112705244697,5989.553261430214,9.744631607536117,9111.401725982898,9.600800412506665,8390.97515723997,10.437547159785321,9722.049008060232,10.656030253112988,8356.669130156974,11.078530402059812,7053.0401010031055,11.366703057999086,5200.51463852129,11.055568437443135,4583.006151027355,10.102154863752183,4171.333826031398,9.096338806525319,6161.083396845195,9.881637996415613
-4171.333826031398,6.8073179588005015,5028.984503106309,8.938475299785676,5303.4327197702805,9.26367412366934,6366.919559343172,9.583821315337335,9728.910213476833,9.460477295404761,9077.095698899899,10.292944187611809,10483.642809302757,10.551553314107114,10963.92718846471,10.8265228403918,7807.77269682903,11.298965262379895,5680.799017683243,11.083314144688286,5474.962855185266,10.340303239633702,4514.394096861361,9.544671165665903,6915.81599267112,9.848343147721433
-4336.0027560297785,6.641245549710398,5303.4327197702805,8.785347698248223,5577.880936434252,9.11370379226668,6675.673803090143,9.437323981082946,10346.418700970771,9.322960640644894,9797.522267642828,10.158329670046552,11238.375405128681,10.452242817139993,11718.659784290634,10.765673634157611,8356.669130156974,11.255911578723628,6435.531613509167,11.116991692792743,6065.0265210128055,10.47796021751067,5097.5965572723035,9.804619740097182,7567.630507248054,9.819353667392882
-4480.088069778365,6.482119134916838,5577.880936434252,8.635377366845562,5852.329153098224,8.968469366066207,6984.428046837111,9.287037922666807,10963.92718846471,9.186145601470537,10552.254863468752,10.028020520846917,11993.108000954606,10.35178422194204,12473.392380116558,10.703676329692588,11032.5392426307,11.089628684957873,8356.669130156974,11.160045376449009,6709.979830173139,10.620247858252,5886.635180181223,10.066973853678778,9385.84994264687,9.771420566255571
-4617.312178110351,6.341620613918556,5852.329153098224,8.488564305577695,6126.7773697622,8.837442655472305,7327.488317667077,9.12664859981933,11615.741703041644,9.045822484368633,11204.069378045686,9.919596994172554,12953.67675927851,10.223484244646366,13228.124975942483,10.642253074342982,13433.961138440456,10.96486867720727,8836.953509318922,11.167508014949428,7405.902093856785,10.762475360514575,6435.531613509167,10.223133436853612,10140.58253847279,9.765680075101402
-4754.536286442337,6.20270072798767,6126.7773697622,8.34490851444462,6435.531613509167,8.692208229271834,7670.54858849704,8.978888357511025,12267.556217618578,8.909709060779784,13090.900867610493,9.610686813938845,14188.69373426638,10.074518499195687,13982.8575717684,10.584274113685877,14188.69373426638,10.926981435589756,12336.168271784569,11.243856547299874,8123.388145992598,10.88840533503374,7121.652155169097,10.406956720257106,10895.315134298715,9.765680075101402
-4898.621600190923,6.053993304638928,6401.2255864261715,8.207567263581131,6778.591884339134,8.534344722532191,8013.608859327007,8.845020103795807,12919.370732195508,8.773665798749489,13845.633463436418,9.493580794393802,14943.426330092305,9.982670640728983,14737.590167594324,10.528017300375023,14943.426330092305,10.89081634131849,13090.900867610493,11.262226118993215,8596.81131973795,10.952813645783515,7773.466669746031,10.551840338664823,11478.517594709658,9.765680075101402
-5097.5965572723035,5.879080539171403,6675.673803090143,8.071804647785038,7121.652155169097,8.376481215792548,8390.97515723997,8.704837309811005,13605.491273855441,8.63222009671077,14600.366059262342,9.377048823964174,15526.628790503244,9.911966924680138,15492.322763420249,10.470612388833334,15698.15892591823,10.85465124704723,13845.633463436418,11.277725445109471,9557.380078061851,11.06963264077085,8425.281184322965,10.672869027165216,13090.900867610493,9.765680075101402
-5303.4327197702805,5.703325835001269,6950.122019754115,7.939199302123738,7464.712425999063,8.231246789592078,8802.647482235927,8.568022270636648,14291.611815515374,8.497720388968593,15355.098655088266,9.262239000880797,17687.90849673203,9.658332890518446,16247.055359246173,10.414929624637896,16452.891521744154,10.820208300122214,14600.366059262342,11.29609501680281,12679.228542614532,11.370147352691587,9523.074050978856,10.825374742160967,13845.633463436418,9.773142713601823
-5509.268882268261,5.539147787992041,7258.876263501083,7.793017694882829,7842.078723912025,8.07969782312202,9248.625834314884,8.429703769493342,14977.7323571753,8.361957773172502,16109.83125091419,9.14972537425909,18442.641092557955,9.575095768782997,17001.787955072097,10.360394958673293,17207.624117570078,10.785765353197203,15355.098655088266,11.311020293803649,13433.961138440456,11.435588951849113,10963.92718846471,10.957980087822266,14600.366059262342,9.778309155640574
-5749.4110718492375,5.396018208548098,7601.936534331049,7.640205820358856,8219.445021824988,7.935726304975466,9728.910213476833,8.291685960743827,15663.852898835234,8.228720973484242,16864.563846740115,9.040081993214464,19197.37368838388,9.494154843509218,17756.52055089802,10.306434341824106,17962.356713396002,10.75304455361844,16109.83125091419,11.325371521689071,14188.69373426638,11.49873435454497,11615.741703041644,11.001751332872804,15355.098655088266,9.778309155640574
-5955.2472343472145,5.26130801613027,7944.996805161016,7.491182669996633,8596.81131973795,7.8018580512602504,10243.50061972178,8.152315036222257,16384.279467578162,8.092326903661192,17619.296442566032,8.930438612169839,19952.106284209796,9.415510114697105,18511.253146723946,10.25247372497492,18717.089309221927,10.72032375403968,16864.563846740115,11.339722749574493,14943.426330092305,11.559009511663742,13090.900867610493,11.085993040560231,15938.301115499205,9.778309155640574
-6195.389423928191,5.115021166551534,8288.057075990979,7.347211151850079,9008.483644733908,7.665043012085892,10792.397053049724,8.011816515223975,17139.012063404087,7.947092477460721,18374.029038391956,8.822517378471467,20706.83888003572,9.341457778808326,19265.98574254987,10.19851310812573,19471.82190504785,10.688177003576332,17619.296442566032,11.354073977459915,15698.15892591823,11.617562521436263,13845.633463436418,11.121584085716078,17619.296442566032,9.786919892371827
-6469.837640592163,4.9603149299466835,8631.117346820945,7.210817082027029,9454.46199681286,7.52221412503574,11341.293486377672,7.875264581894184,17893.74465923001,7.808172591529836,19128.76163421788,8.71861448858101,21461.571475861645,9.269701639381218,20020.718338375795,10.144552491276546,20226.554500873768,10.656604302228402,18374.029038391956,11.36612900888367,16452.891521744154,11.670375040054617,14600.366059262342,11.156027032641092,18374.029038391956,9.790938236179745
-6744.2858572561345,4.821395044015798,8974.177617650908,7.076948828311812,9934.746375974813,7.376979698835269,11890.189919705615,7.740291283631789,18648.47725505593,7.677863442330203,19883.494230043805,8.615859696921389,22216.30407168757,9.200241696415775,20775.45093420172,10.092314021773609,20981.287096699692,10.626753748226726,19128.76163421788,11.378758089422842,17207.624117570078,11.720317313095887,15355.098655088266,11.18185924283485,19128.76163421788,9.790938236179745
-7053.0401010031055,4.674897709761412,9351.54391556387,6.936766034327009,10415.030755136766,7.237157735723015,12473.392380116558,7.597687915876978,19403.209850881853,7.548128342245988,20638.22682586973,8.517123249069684,22971.036667513494,9.1365222446045,21530.183530027636,10.03892745403984,21736.019692525617,10.596329145109632,19883.494230043805,11.390813120846595,17962.356713396002,11.76738934056007,16109.83125091419,11.210561698605694,19883.494230043805,9.790938236179745
-7396.1003718330685,4.527137467453105,9763.216240559832,6.795741301639595,10895.315134298715,7.1009440813362374,13056.594840527498,7.46166219423632,20157.942446707777,7.425855880662192,21392.959421695654,8.418960850333399,23725.769263339418,9.075673038370311,22284.91612585356,9.986688984536903,22490.75228835154,10.56705264022337,20638.22682586973,11.39942385757785,18717.089309221927,11.811591122447169,16864.563846740115,11.232949614106953,20638.22682586973,9.790938236179745
-7739.160642663035,4.392006305683971,10174.88856555579,6.657873839086973,11375.599513460667,6.968338735674937,13639.797300938437,7.326162684284794,20912.6750425337,7.3104720084634,22147.69201752158,8.32481679540503,24480.501859165342,9.016545979482371,23039.648721679485,9.934450515033966,23245.484884177466,10.537776135337108,21392.959421695654,11.409756741655352,19471.82190504785,11.848330265833852,17619.296442566032,11.255337529608212,21392.959421695654,9.790938236179745
-8116.526940575997,4.256243689887878,10586.560890551747,6.5200063765343526,11855.88389262262,6.835733390013637,14257.305788432379,7.18513795159738,21667.407638359626,7.201976725649608,22902.424613347503,8.232968936938327,25235.234454991267,8.956844871479017,23794.38131750541,9.883360143761864,24000.21748000339,10.509647728681681,22147.69201752158,11.420663674848274,20226.554500873768,11.877032721604696,18374.029038391956,11.277151395994053,22147.69201752158,9.790938236179745
-8528.199265571955,4.117323803956992,11032.5392426307,6.377478181877988,12336.168271784569,6.703128044352338,14874.814275926314,7.049726143594041,22422.14023418555,7.09864788487457,23657.157209173427,8.142269176702461,25989.96705081719,8.901736156398997,24308.971723750357,9.847769098606017,24754.950075829314,10.484389567603339,22902.424613347503,11.431570608041195,20981.287096699692,11.901142784452205,19128.76163421788,11.298391213264477,22902.424613347503,9.790938236179745
-8974.177617650908,3.9788549566167912,11512.823621792653,6.23043960131478,12816.452650946521,6.570522698691038,15492.322763420249,6.913612720005194,23176.872830011474,6.999911437022865,24411.88980499935,8.056161809389929,26744.699646643116,8.84777553954981,26676.087592477117,9.69622013213596,25509.68267165524,10.457983308294164,23657.157209173427,11.440181344772448,21736.019692525617,11.919512356145544,19883.494230043805,11.31446458849615,23657.157209173427,9.788067990602661
-9454.46199681286,3.841739225048645,11993.108000954606,6.086107252295678,13331.04305719147,6.433970765361247,16109.83125091419,6.7810073743438934,23931.6054258374,6.904045234748246,25166.62240082527,7.97120254030823,27499.432242469033,8.793240873585205,27430.82018830304,9.651444301133443,26264.415267481163,10.434447294562071,24411.88980499935,11.445921835926615,22490.75228835154,11.93271548580013,20638.22682586973,11.330537963727823,24240.359669584366,9.78462369591016
-9969.052403057809,3.7053000513665264,12473.392380116558,5.944481134820684,13879.939490519413,6.2911042917618705,16761.64576549112,6.646297181926066,24686.338021663323,6.8150676218586295,25921.354996651193,7.889687565919033,28254.164838294957,8.742150502313104,28185.552784128966,9.608964666592595,27019.147863307087,10.409763182599145,25166.62240082527,11.456828769119538,23245.484884177466,11.937881927838884,21392.959421695654,11.343741093382413,26676.087592477117,9.790938236179745
-10552.254863468752,3.5619950680262065,12953.67675927851,5.807365403252538,14428.835923847357,6.147448500628796,17413.46028006806,6.512288605093747,25441.070617489248,6.727238107199847,26676.087592477117,7.810468787991502,29008.89743412088,8.691634180156417,28940.28537995489,9.568207179397996,27773.880459133004,10.386227168867052,25921.354996651193,11.461995211158289,24000.21748000339,11.94419646810847,22147.69201752158,11.354073977459915,27430.82018830304,9.790938236179745
-11169.763350962687,3.4195671041677738,13433.961138440456,5.673857980409869,14977.7323571753,6.006160662096816,18099.580821727985,6.374771950333882,26195.803213315165,6.642852887233566,27430.82018830304,7.7341202556410575,29763.630029946806,8.642840005345983,29695.017975780815,9.528597790434231,28528.61305495893,10.363265204250379,26676.087592477117,11.470605947889542,24754.950075829314,11.94419646810847,22902.424613347503,11.356944223037,28185.552784128966,9.790938236179745
-11787.271838456625,3.2862601429209626,13914.245517602409,5.542154711929937,15526.628790503244,5.865662141098534,18820.007390470913,6.237114972456913,26950.53580914109,6.561337912844367,28185.552784128966,7.662364116213947,30518.36262577273,8.59347178142013,30449.75057160674,9.494154843509218,29283.345650784853,10.340877288749118,27430.82018830304,11.470605947889542,25509.68267165524,11.937881927838884,23657.157209173427,11.36612900888367,28940.28537995489,9.790938236179745
-12439.086353033563,3.151830596737339,14428.835923847357,5.4054900189524755,16109.83125091419,5.718059762296969,19540.433959213842,6.105542915203364,27705.268404967013,6.481545085801422,28940.28537995489,7.590033927671421,31273.095221598654,8.546973803071362,31204.483167432663,9.459711896584205,30038.078246610778,10.319637471478693,28185.552784128966,11.470605947889542,26264.415267481163,11.937881927838884,24411.88980499935,11.369573303576171,29695.017975780815,9.790938236179745
-13125.206894693489,3.0179623430221234,14977.7323571753,5.264991497954194,16727.339738408125,5.56861564258344,20295.166555039767,5.976381864234565,28460.001000792938,6.401752258758474,29695.017975780815,7.5228701811676455,32027.82781742458,8.502772021184262,31959.215763258588,9.427565146120859,30792.810842436702,10.300693850669937,28940.28537995489,11.470605947889542,27019.147863307087,11.928697141992213,25166.62240082527,11.369573303576171,30449.75057160674,9.790938236179745
-13845.633463436418,2.883979279483821,15526.628790503244,5.124492976955912,17344.84822590206,5.424784447553989,21049.89915086569,5.849517009727434,29214.733596618862,6.323681579061779,30449.75057160674,7.458576680240954,32782.5604132505,8.457996190181746,32713.948359084505,9.400010788580849,31547.543438262626,10.284046426322845,29695.017975780815,11.470031898774124,27773.880459133004,11.922956650838046,25921.354996651193,11.368425205345336,31204.483167432663,9.790938236179745
-14600.366059262342,2.7502258355916887,16109.83125091419,4.980661781926459,17962.356713396002,5.285162946037593,21804.631746691615,5.730114793720723,29969.466192444786,6.244462801134249,31204.483167432663,7.395431277545098,33537.29300907643,8.41666465387173,33468.68095491043,9.373030480156254,32302.27603408855,10.267399001975757,30449.75057160674,11.460847112927455,28528.61305495893,11.912623766760541,26676.087592477117,11.363258763306586,31959.215763258588,9.790938236179745
-15355.098655088266,2.622212882853722,16693.03371132513,4.841917299891952,18614.171227972933,5.147856775953379,22559.364342517532,5.613582823291097,30724.19878827071,6.1669661705529695,31959.215763258588,7.336878267772574,34292.02560490235,8.376481215792548,34223.41355073635,9.347198269962496,33057.008629914475,10.254769921436587,31204.483167432663,11.456254720004122,29283.345650784853,11.902290882683037,27430.82018830304,11.359240419498667,32713.948359084505,9.790938236179745
-16109.83125091419,2.4947739792311765,17276.23617173607,4.707733319163255,19300.291769632866,5.011462706130327,23314.096938343457,5.504513491361889,31478.931384096635,6.088321441740858,32713.948359084505,7.2823436018079715,35046.75820072827,8.336297777713368,34978.14614656228,9.323662256230405,33811.7412257404,10.241566791781997,31959.215763258588,11.4453477868112,30038.078246610778,11.892532047720952,28185.552784128966,11.350629682767414,33468.68095491043,9.790938236179745
-16864.563846740115,2.3799641561477998,17893.74465923001,4.5702166644033895,20020.718338375795,4.87822590644207,24068.82953416938,5.3977403558943475,32233.66397992256,6.01025076204416,33468.68095491043,7.228382984958785,35801.49079655419,8.297836486980435,35732.8787423882,9.300700291613728,34566.473821566324,10.229511760358243,32713.948359084505,11.433866804502863,30792.810842436702,11.881051065412613,28940.28537995489,11.34948158453658,34223.41355073635,9.790938236179745
-17619.296442566032,2.289264395911932,18511.253146723946,4.440417781084127,20775.45093420172,4.746194609896186,24823.562129995305,5.296133662465561,32988.396575748484,5.933902229693716,34223.41355073635,7.1772926136866815,36556.22339238012,8.259375196247506,36487.61133821413,9.278312376112469,35321.20641739224,10.217456728934488,33468.68095491043,11.420089625732857,31547.543438262626,11.868421984873441,29695.017975780815,11.344315142497829,34978.14614656228,9.790938236179745
-18374.029038391956,2.2312854352548275,19197.37368838388,4.303602741909771,21530.183530027636,4.628514541235727,25578.29472582123,5.197397214613856,33743.1291715744,5.860997992035772,34978.14614656228,7.12792438976083,37310.95598820604,8.220913905514573,37242.34393404005,9.255924460611212,36075.939013218165,10.204253599279902,34223.41355073635,11.4045902996166,32302.27603408855,11.851774560526351,30449.75057160674,11.335704405766576,35732.8787423882,9.790938236179745
-19128.76163421788,2.181343162213558,19952.106284209796,4.162386659517217,22284.91612585356,4.519445209306518,26333.027321647154,5.105549356147154,34497.861767400325,5.787519705262412,35732.8787423882,7.0791302149503945,38065.68858403197,8.181878565666226,37997.076529865975,9.231814397763703,36830.67160904409,10.190476420509896,34978.14614656228,11.389090973500345,33057.008629914475,11.834553087063846,31204.483167432663,11.329389865496989,36487.61133821413,9.790938236179745
-19883.494230043805,2.1336970856339583,20706.83888003572,4.033225608548419,23039.648721679485,4.422430908801067,27087.75991747308,5.013127448565037,35252.59436322625,5.718059762296969,36487.61133821413,7.031484138370795,38820.42117985789,8.145139422279545,38751.8091256919,9.207130285800776,37585.404204870014,10.176125192624474,35732.8787423882,11.369573303576171,33811.7412257404,11.81733161360134,31959.215763258588,11.318482932304068,37242.34393404005,9.790938236179745
-20638.22682586973,2.0871991072851905,21461.571475861645,3.916119589003374,23794.38131750541,4.3340273450268665,27842.492513299003,4.927594130367924,36007.326959052174,5.648599819331526,37242.34393404005,6.984986160022027,39575.153775683815,8.107826229777448,39506.541721517824,9.181298075607017,38340.13680069594,10.158329670046552,36487.61133821413,11.350629682767414,34566.473821566324,11.796091796330913,32713.948359084505,11.307575999111148,37997.076529865975,9.790938236179745
-21392.959421695654,2.0429973253980904,22216.30407168757,3.8139388464591715,24549.113913331334,4.252512370637669,28597.225109124927,4.843782959517057,36762.0595548781,5.583732269289419,37997.076529865975,6.940784378134927,40329.88637150974,8.071661135506185,40261.27431734374,9.153743718067005,39094.86939652186,10.13996009835321,37242.34393404005,11.328241767266157,35321.20641739224,11.77485197906049,33468.68095491043,11.29609501680281,38751.8091256919,9.790938236179745
-22147.69201752158,1.9982214943955743,22971.036667513494,3.720942889761634,25303.846509157258,4.177311936518057,29351.95770495085,4.7651382307049435,37516.79215070402,5.520586866593561,38751.8091256919,6.894286399786159,41084.618967335664,8.037218188581171,41016.006913169665,9.12733745875783,39849.60199234779,10.118720281082787,37997.076529865975,11.304131704418648,36075.939013218165,11.751315965328399,34223.41355073635,11.283465936263639,39506.541721517824,9.790938236179745
-22902.424613347503,1.9563159089701418,23725.769263339418,3.637705768026187,26058.579104983182,4.104407698860113,30106.69030077677,4.688789698354499,38271.52474652995,5.461459807705621,39506.541721517824,6.850084617899059,41839.35156316159,8.001053094309908,41770.73950899559,9.100931199448654,40604.33458817371,10.09575831646611,38751.8091256919,11.280595690686555,36830.67160904409,11.728354000711722,34978.14614656228,11.269114708378215,40261.27431734374,9.790938236179745
-23657.157209173427,1.9149843726601237,24480.501859165342,3.5648015303682445,26813.311700809107,4.037818001471756,30861.422896602693,4.6141633133503035,39026.25734235587,5.4040548961639345,40261.27431734374,6.804160688665709,42594.084158987505,7.964313950923227,42525.472104821514,9.074524940139476,41359.067183999636,10.070500155387766,39506.541721517824,11.254763480492795,37585.404204870014,11.70309583963338,35732.8787423882,11.255337529608212,41016.006913169665,9.790938236179745
-24411.88980499935,1.8736528363501073,25235.234454991267,3.500508029441555,27568.04429663503,3.9735245005450626,31616.155492428617,4.546999566846528,39780.989938181796,5.3518164266609975,41016.006913169665,6.759958906778609,43348.81675481343,7.929871003998214,43280.20470064744,9.046970582599467,42113.79977982556,10.043519846963173,40261.27431734374,11.2277831720682,38340.13680069594,11.677837678555036,36487.61133821413,11.23869010526112,41770.73950899559,9.790938236179745
-25166.62240082527,1.834043447386346,25989.96705081719,3.440232872322781,28322.776892460955,3.910379097849205,32370.88808825454,4.485002262381505,40535.72253400772,5.300152006273478,41770.73950899559,6.713460928429843,44103.549350639354,7.896002106188618,44034.93729647336,9.018268126828623,42868.532375651484,10.015965489423163,40947.394859003674,11.203290409810414,39094.86939652186,11.64970927189961,37242.34393404005,11.223764828260283,42525.472104821514,9.790938236179745
-25921.354996651193,1.796730254884249,26744.699646643116,3.382827960781091,29077.50948828688,3.848381793384185,33125.620684080466,4.4270233017244,41290.45512983364,5.253079978809293,42525.472104821514,6.668111048311909,44858.28194646528,7.8615591592636065,44789.66989229929,8.990139720173195,43623.2649714774,9.985540886306069,46642.195354781106,10.932721926743923,39849.60199234779,11.622728963475016,37997.076529865975,11.208265502144027,43280.20470064744,9.790938236179745
-26676.087592477117,1.7599911114975662,27499.432242469033,3.3300154421627397,29832.242084112797,3.7858104398037433,33880.35327990639,4.374784832221465,42045.18772565956,5.208304147806777,43280.20470064744,6.623335217309391,45613.01454229121,7.828264310569427,45544.402488125204,8.962585362633185,44377.997567303326,9.955116283188975,47396.92795060702,10.894260636010994,40604.33458817371,11.595748655050423,38751.8091256919,11.191618077796937,44034.93729647336,9.790938236179745
-27430.82018830304,1.724400066341719,28254.164838294957,3.2772029235443867,30586.97467993872,3.724961233569555,34635.085875732315,4.324842559180196,42799.920321485486,5.166972611496762,44034.93729647336,6.579707484537709,46367.74713811713,7.794969461875247,46299.135083951136,8.934456955977756,45132.73016312926,9.924117630956463,48151.66054643294,10.85465124704723,41359.067183999636,11.565898101048745,39506.541721517824,11.174970653449847,44789.66989229929,9.790938236179745
-28185.552784128966,1.691105217647543,29008.89743412088,3.2261125522722853,31341.707275764646,3.665834174681615,35389.81847155824,4.278344580831428,43554.65291731141,5.129659418994663,44789.66989229929,6.537801899112274,47122.479733943044,7.761674613181068,47053.86767977705,8.906328549322332,45887.462758955175,9.890822782262283,48906.39314225887,10.816189956314297,42113.79977982556,11.534899448816233,40089.74418192876,11.164350744814636,45475.79043395921,9.80146246996239
-28940.28537995489,1.6578103689533634,29763.630029946806,3.175022181000182,32096.43987159057,3.6090033122553447,36144.55106738416,4.236438995405997,44309.385513137335,5.0934943247234,45544.402488125204,6.49647036280226,47877.212329768976,7.728953813602306,47808.600275602985,8.87705204443607,46470.66521936612,9.864607872658246,49661.12573808479,10.780024862043033,42868.532375651484,11.50447484569914,47328.31589644103,10.983812298016026,50141.41011724674,9.81619639725809
-29695.017975780815,1.6273857658362658,30518.36262577273,3.1233577606126612,32851.172467416494,3.55619079363699,36899.28366321009,4.194533409980561,45064.11810896325,5.059625426913804,46299.135083951136,6.457435022953911,48631.94492559489,7.695084915792709,48563.3328714289,8.846053392203558,51033.366821404656,9.653166448479695,50415.85833391072,10.741563571310103,43623.2649714774,11.47290214435121,48083.04849226695,10.966016775438103,50896.14271307267,9.81619639725809
-30449.75057160674,1.5975352118345896,31273.095221598654,3.0745635858022275,33605.90506324242,3.50682256971114,37654.016259036005,4.153775922785966,45818.85070478918,5.029774872912126,47053.86767977705,6.418973732220982,49386.677521420825,7.662938165329365,49318.06546725483,8.81620283820188,51788.09941723057,9.614705157746762,51170.59092973664,10.704250378808005,44377.997567303326,11.440755393887864,48837.78108809288,10.947073154629345,51650.87530889859,9.81619639725809
-31204.483167432663,1.5682587069483311,32027.82781742458,3.0280656074534598,34360.63765906834,3.458028394900703,38408.74885486193,4.115314632053034,46573.5833006151,4.999924318910448,47808.600275602985,6.382234588834301,50141.41011724674,7.631365463981435,50072.79806308075,8.784056087738534,52542.832013056504,9.575095768782997,51925.32352556257,10.665789088075073,45132.73016312926,11.407460545193686,49592.5136839188,10.930425730282256,52405.60790472452,9.81619639725809
-31959.215763258588,1.5424264967545689,32782.5604132505,2.9838638255663597,35115.37025489427,3.415548760359856,39163.481450687854,4.076853341320103,47328.31589644103,4.97236996137044,48563.3328714289,6.346069494563038,50896.14271307267,7.599792762633507,50827.53065890668,8.752483386390606,53297.56460888242,9.533764232472983,52680.05612138849,10.628475895572977,45887.462758955175,11.371295450922421,50347.24627974473,10.91320425681975,53160.34050055044,9.81619639725809
-32713.948359084505,1.5165942865608102,33537.29300907643,2.9448284857180127,35870.10285072019,3.371921027588172,39918.21404651378,4.038105026029463,48083.04849226695,4.946537751176679,49318.06546725483,6.31220059675344,51650.87530889859,7.5682200612855794,51582.2632547326,8.71861448858101,54052.29720470835,9.49185864704755,53434.78871721442,10.591162703070879,46642.195354781106,11.336278454881992,51101.97887557065,10.897130881588078,53915.073096376356,9.815048299027254
-33468.68095491043,1.4942063710595512,34292.02560490235,2.9098114896775833,36624.835446546116,3.3323116386244056,40672.9466423397,4.003375054546742,48837.78108809288,4.92242768832917,50072.79806308075,6.278331698943845,52405.60790472452,7.537221409053066,52336.99585055852,8.685893689002247,54807.02980053427,9.448804963391284,54189.521313040335,10.55270141233795,47396.92795060702,11.301835507956978,51856.71147139658,10.881057506356406,54669.80569220229,9.809881856988502
-34223.41355073635,1.47411465201996,35046.75820072827,2.8782387883296536,37379.56804237203,3.2938503478914747,41427.67923816563,3.969506156737145,49592.5136839188,4.898891674597079,50827.53065890668,6.245036850249667,53160.34050055044,7.505648707705138,53091.72844638445,8.649728594730984,55561.7623963602,9.405751279735018,54944.25390886625,10.514814170720435,48151.66054643294,11.2685406592628,52611.444067222496,10.863836032893898,55424.538288028205,9.807011611411419
-34978.14614656228,1.4557450803266185,35801.49079655419,2.8478141852125596,38134.30063819796,3.2565371553893776,42182.41183399155,3.937359406273801,50347.24627974473,4.87822590644207,51582.2632547326,6.215186296247989,53915.073096376356,7.474650055472628,53846.461042210365,8.614711598690555,56316.49499218612,9.363271645194168,55698.986504692184,10.475778830872086,48906.39314225887,11.234097712337785,53366.17666304841,10.847188608546809,56179.27088385414,9.803567316718917
-35732.8787423882,1.4385236068641163,36556.22339238012,2.822556024134215,38889.03323402388,3.220946110233532,42937.144429817476,3.907508852272123,51101.97887557065,4.859282285633313,52336.99585055852,6.184761693130893,54669.80569220229,7.444225452355532,54601.1936380363,8.580268651765541,57071.22758801205,9.320792010653319,56453.7191005181,10.437891589254573,49661.12573808479,11.203673109220691,54120.909258874344,10.831115233315135,56934.003479680054,9.803567316718917
-36487.61133821413,1.4241723789786924,37310.95598820604,2.7984459612867063,39643.765829849806,3.1859291141931028,43691.8770256434,3.8793804456166967,51856.71147139658,4.844357008632473,53091.72844638445,6.154911139129215,55424.538288028205,7.414374898353856,55355.926233862214,8.542955459263444,57825.96018383797,9.278312376112469,57208.45169634403,10.39943029852164,50415.85833391072,11.17439660433443,54875.64185470026,10.813893759852629,57688.736075505985,9.803567316718917
-37242.34393404005,1.4098211510932686,38065.68858403197,2.7754839966700313,40398.49842567573,3.153782363729757,44446.609621469324,3.8524001371921024,52611.444067222496,4.831153878977885,53846.461042210365,6.129078928935455,56179.27088385414,7.385098393467594,56110.658829688145,8.505642266761347,58580.692779663885,9.236406790687038,57963.18429216995,10.360394958673293,51170.59092973664,11.144546050332753,55630.37445052619,10.796098237274705,58443.4686713319,9.803567316718917
-37997.076529865975,1.397192070554098,38820.42117985789,2.7525220320533563,41153.231021501655,3.1210615641509936,45201.34221729525,3.826567926998342,53366.17666304841,4.81909884755413,54601.1936380363,6.103246718741696,56934.003479680054,7.355821888581332,56865.39142551406,8.46832907425925,59335.425375489816,9.19335310703077,58717.91688799588,10.32021152059411,51925.32352556257,11.116417643677327,56385.10704635211,10.78059891115845,59198.201267157834,9.803567316718917
-38751.8091256919,1.3851370391303455,39575.153775683815,2.7289860183212635,41907.96361732758,3.0912110101493155,45956.074813121166,3.8018838150354153,54120.909258874344,4.811062159938295,55355.926233862214,6.080858803240439,57688.736075505985,7.3259713345796555,57620.124021339994,8.431015881757153,60090.15797131573,9.150299423374506,59472.6494838218,10.280602131630346,52680.05612138849,11.090585433483566,57139.83964217804,10.763377437695944,59952.93386298375,9.803567316718917
-39506.541721517824,1.3725079585911715,40329.88637150974,2.708320250166256,42662.696213153504,3.063656652609305,46710.8074089471,3.7783478013033243,54875.64185470026,4.802451423207042,56110.658829688145,6.05847088773918,58443.4686713319,7.297842927924227,58374.85661716591,8.394276738370472,60844.890567141665,9.107819788833655,60227.38207964773,10.240992742666581,53434.78871721442,11.064753223289806,57894.57223800396,10.745007866002602,60707.66645880968,9.801845169372667
-40261.27431734374,1.361026976282833,41084.618967335664,2.685932334664999,43417.42880897943,3.0372503933001305,47465.540004773015,3.757682033148317,55630.37445052619,4.796710932052871,56865.39142551406,6.037805119584172,59198.201267157834,7.269140472153383,59129.58921299183,8.355815447637541,61599.62316296758,9.06476610517739,60982.11467547365,10.201383353702816,54189.521313040335,11.038921013096047,58649.30483382989,10.728360441655514,61462.3990546356,9.802419218488083
-41016.006913169665,1.350120043089916,41839.35156316159,2.664692517394574,44172.16140480535,3.01314033045262,48220.272600598946,3.735868166762474,56385.10704635211,4.78982234266787,57620.124021339994,6.019435547890831,59952.93386298375,7.241012065497957,59884.32180881776,8.31735415690461,62354.355758793514,9.021712421521125,61736.84727129958,10.161773964739051,54944.25390886625,11.01251475378687,59404.03742965581,10.709416820846757,62217.13165046152,9.803567316718917
-41770.73950899559,1.3380650116661599,42594.084158987505,2.644026749239565,44926.89400063127,2.989030267605113,48975.00519642486,3.714054300376633,57139.83964217804,4.789248293552454,58374.85661716591,6.000491927082074,60707.66645880968,7.213457707957945,60639.05440464368,8.279466915287095,63109.08835461943,8.97808468874944,62491.579867125496,10.121016477544453,55698.986504692184,10.984386347131444,60158.770025481725,10.692769396499667,62971.86424628745,9.803567316718917
-42525.472104821514,1.3265840293578215,43348.81675481343,2.6227869319691415,45681.6265964572,2.966642352103854,49729.73779225078,3.6951106795678754,57894.57223800396,4.778341360359532,59129.58921299183,5.983844502734984,61462.3990546356,7.184755252187102,61393.78700046961,8.240431575438748,63863.82095044536,8.935605054208592,63246.31246295141,10.081407088580688,56453.7191005181,10.956257940476016,60913.502621307656,10.673251726575494,63726.596842113366,9.802993267603501
-43280.20470064744,1.3145289979340653,44103.549350639354,2.6032692620449662,46436.35919228312,2.9459765839488448,50484.47038807671,3.675018960528286,58649.30483382989,4.777193262128698,59884.32180881776,5.968919225734146,62217.13165046152,7.157774943762508,62148.519596295526,8.201970284705816,64618.55354627128,8.893125419667742,64001.045058777345,10.04064960138609,57208.45169634403,10.926981435589756,61668.23521713357,10.656030253112988,64481.3294379393,9.797252776449332
-44034.93729647336,1.3030480156257305,44858.28194646528,2.5837515921207928,47191.09178810905,2.9264589140246713,51239.20298390263,3.6549272414886964,59404.03742965581,4.772600869205364,60639.05440464368,5.95341989961789,62971.86424628745,7.12964653710708,62903.25219212146,8.163508993972885,65373.2861420972,8.850645785126892,64755.77765460326,10.000466163306907,57963.18429216995,10.89827897981891,62422.967812959505,10.637660681419646,65236.062033765214,9.797252776449332
-44789.66989229929,1.2921410824328063,45613.01454229121,2.5636598730812015,47945.82438393497,2.906941244100498,51993.93557972856,3.6342614733336873,60158.770025481725,4.764564181589527,61393.78700046961,5.939642720847884,63726.596842113366,7.102666228682487,63657.984787947375,8.125621752355372,66128.01873792312,8.808740199701461,65510.51025042919,9.960282725227724,58717.91688799588,10.867854376701816,62937.558219204446,10.626036186832454,65990.79462959114,9.79380848175683
-45544.402488125204,1.2818081983553036,46367.74713811713,2.544716252272446,48700.556979760884,2.8902938197534063,52748.66817555448,3.61531785252493,60913.502621307656,4.762842034243276,62148.519596295526,5.926439591193297,64481.3294379393,7.075685920257895,64412.717383773306,8.08716046162244,66882.75133374904,8.76626056516061,66265.2428462551,9.91895118891771,59472.6494838218,10.836281675353888,71548.37101703658,10.409189133483729,66505.38503583608,9.790938236179745
-46299.135083951136,1.270901265162383,47122.479733943044,2.5257726314636884,49455.289575586816,2.8747944936371503,53503.40077138041,3.598096379062424,61668.23521713357,4.754231297512025,62903.25219212146,5.913810510654125,65236.062033765214,7.0492796609487165,65167.44997959922,8.046977023543258,67637.48392957498,8.723780930619762,66745.52722541706,9.891970880493117,60227.38207964773,10.805283023121376,72303.1036128625,10.390245512674971,70313.35404204871,9.790938236179745
-47053.86767977705,1.2617164793157158,47877.212329768976,2.507977108885763,50210.02217141273,2.859869216636314,54258.13336720633,3.583171102061584,62422.967812959505,4.751935101050355,63657.984787947375,5.901755479230371,65990.79462959114,7.021725303408708,65922.18257542516,8.008515732810327,68392.2165254009,8.68187534519433,70587.80225871268,9.683017002481373,60982.11467547365,10.773710321773448,73057.83620868842,10.370727842750796,71068.08663787463,9.790938236179745
-47808.600275602985,1.2525316934690451,48631.94492559489,2.4896075371924233,50964.754767238664,2.84551798875089,55012.86596303226,3.568819874176162,63177.70040878542,4.7496389045886875,64412.717383773306,5.890274496922032,66745.52722541706,6.99531904409953,66676.91517125108,7.968332294731145,69146.94912122682,8.638821661538064,71342.5348545386,9.642259515286774,61736.84727129958,10.74213762042552,73812.56880451436,10.352358271057458,71822.81923370055,9.790938236179745
-48563.3328714289,1.2433469076223744,49386.677521420825,2.4723860637299175,51719.48736306458,2.8328889082117197,55767.598558858175,3.55619079363699,63932.433004611354,4.740454118742017,65167.44997959922,5.879367563729112,67500.259821243,6.968338735674937,67431.647767077,7.929296954882798,69901.68171705274,8.596916076112631,72097.26745036451,9.602076077207592,62491.579867125496,10.709990869962173,74567.30140034028,10.331692502902449,72577.55182952646,9.790938236179745
-49318.06546725483,1.2358842691219536,50141.41011724674,2.4557386393828295,52474.21995889051,2.821407925903383,56522.33115468409,3.546431958674903,64687.16560043727,4.739306020511185,65922.18257542516,5.869034679651609,68254.99241706892,6.940784378134927,68186.38036290291,7.888539467688199,70656.41431287868,8.554436441571783,72852.00004619046,9.560744540897575,63246.31246295141,10.677844119498829,75322.0339961662,10.312748882093693,73332.28442535241,9.790938236179745
-50072.79806308075,1.2266994832752829,50896.14271307267,2.439665264151156,53228.95255471643,2.8105009927104607,57277.063750510024,3.5378212219436485,65441.8981962632,4.739306020511185,66676.91517125108,5.859849893804938,69009.72501289484,6.914952167941166,68941.11295872883,7.850078176955268,71411.1469087046,8.511956807030932,73606.73264201637,9.51941300458756,63726.596842113366,10.658135099869515,76076.76659199211,10.292657163054102,74087.01702117833,9.785771794140993
-50827.53065890668,1.2203849430056977,51650.87530889859,2.4230178398040643,53983.68515054236,2.80131620686379,58031.79634633594,3.5269142887507297,66196.63079208913,4.737009824049515,67431.647767077,5.850091058842851,69764.45760872075,6.887397810401158,69695.84555455478,7.811042837106919,72165.87950453052,8.4700512216055,74361.46523784229,9.477507419162128,70450.5781503807,10.356950663980792,76831.49918781806,10.274861640476178,74841.74961700424,9.78462369591016
-51582.2632547326,1.2134963536206946,52405.60790472452,2.408092562803228,54738.41774636828,2.7944276174787888,58786.52894216187,3.524044043173646,66951.36338791504,4.728399087318264,68186.38036290291,5.838610076534513,70519.19020454667,6.8609915510919794,70450.5781503807,7.771433448143155,72920.61210035643,8.428145636180068,75116.19783366821,9.436175882852112,71205.31074620661,10.323081766171196,77586.23178364398,10.25419587232117,75596.48221283016,9.78462369591016
-52336.99585055852,1.2054596660048595,53160.34050055044,2.392019187571556,55493.15034219421,2.785242831632118,59541.26153798779,3.517155453788643,67706.09598374096,4.7266769399720125,68941.11295872883,5.828851241572426,71273.92280037262,6.834585291782803,71205.31074620661,7.732398108294808,73675.34469618235,8.386240050754635,75870.93042949415,9.394844346542097,71960.04334203253,10.288064770130767,78340.9643794699,10.235252251512412,76351.2148086561,9.781753450333076
-53091.72844638445,1.2008672730815242,53915.073096376356,2.378242008801548,56247.88293802013,2.7817985369396165,60295.99413381372,3.514285208211559,68460.82857956688,4.7266769399720125,69695.84555455478,5.820240504841173,72028.65539619853,6.807030934242794,71960.04334203253,7.692788719331043,74430.0772920083,8.344334465329204,76625.66302532007,9.354086859347499,72714.77593785847,10.251899675859502,79095.69697529581,10.214586483357404,77105.94740448202,9.778309155640574
-53846.461042210365,1.1951267819273532,54669.80569220229,2.364464830031544,57002.615533846045,2.7760580457854473,61050.72672963964,3.514285208211559,69215.56117539282,4.7266769399720125,70450.5781503807,5.811055718994503,72783.38799202445,6.7800506258182,72714.77593785847,7.654901477713528,75184.80988783421,8.303576978134604,77380.39562114599,9.312181273922066,73469.50853368439,10.216882679819072,79850.42957112173,10.196216911664065,77860.68000030794,9.778309155640574
-54601.1936380363,1.1905343890040214,55424.538288028205,2.3512617003769574,57757.34812967198,2.769169456400446,61805.45932546557,3.514285208211559,69970.29377121874,4.719788350587011,71205.31074620661,5.799574736686166,73538.12058785037,6.7536443665090236,73469.50853368439,7.615292088749763,75939.54248366013,8.261097343593756,78135.1282169719,9.271423786727468,74224.24112951031,10.179569487316975,80605.16216694767,10.176125192624474,78615.41259613386,9.778309155640574
-55355.926233862214,1.1865160451961039,56179.27088385414,2.339206668953201,58512.08072549789,2.769169456400446,62560.19192129149,3.512563060865306,70725.02636704466,4.714047859432842,71960.04334203253,5.7886678034932455,74292.85318367631,6.725515959853595,74224.24112951031,7.5762567489014145,76694.27507948605,8.220339856399157,78889.86081279782,9.230092250417453,74978.97372533623,10.14340439304571,81359.89476277359,10.157181571815716,79370.14519195977,9.778309155640574
-56110.658829688145,1.179053406695683,56934.003479680054,2.3271516375294468,59266.813321323825,2.769169456400446,63314.92451711742,3.5039523241340547,71479.75896287058,4.714047859432842,72714.77593785847,5.777760870300325,75047.58577950223,6.697961602313587,74978.97372533623,7.538369507283901,77449.007675312,8.17900832008914,79644.59340862377,9.189334763222853,75733.70632116214,10.105517151428197,82114.62735859951,10.13823795100696,80124.87778778572,9.778309155640574
-56865.39142551406,1.1779053084648474,57688.736075505985,2.316818753451944,60021.54591714974,2.769169456400446,64069.657112943336,3.501656127672387,72234.49155869652,4.711751662971173,73469.50853368439,5.766853937107403,75802.31837532815,6.670407244773575,75733.70632116214,7.4999082165509705,78203.74027113791,8.137102734663708,80399.32600444969,9.149151325143672,76488.43891698809,10.067629909810682,82869.35995442542,10.119294330198201,80536.55011278167,9.778309155640574
-57620.124021339994,1.1773312593494332,58443.4686713319,2.3064858693744377,60776.278512975674,2.769169456400446,64824.38970876925,3.501656127672387,72989.22415452244,4.704289024470755,74224.24112951031,5.755372954799066,76557.05097115407,6.642852887233566,76488.43891698809,7.461446925818038,78958.47286696383,8.095771198353694,81154.0586002756,9.110115985295325,77243.171512814,10.030316717308587,83624.09255025137,10.099776660274028,84035.76487524732,9.772568664486405
-58374.85661716591,1.1715907681952622,59198.201267157834,2.2990232308740186,61531.01110880159,2.769169456400446,65579.12230459519,3.501656127672387,73743.95675034836,4.70141877889367,74978.97372533623,5.7427438742598955,77311.78356697998,6.614724480578138,77243.171512814,7.4247077824313585,79713.20546278975,8.055587760274513,81908.79119610152,9.071080645446976,77997.90410863992,9.991855426575654,84378.82514607729,10.080258990349854,84790.49747107323,9.77199461537099
-59129.58921299183,1.1715907681952622,59952.93386298375,2.289838445027348,62285.74370462752,2.769169456400446,66333.85490042111,3.509692815288224,74498.68934617427,4.696826385970336,75733.70632116214,5.7295407446053055,78066.51616280593,6.58659607392271,77997.90410863992,7.38739458992926,80467.93805861566,8.014830273079912,82663.52379192747,9.032045305598627,78752.63670446584,9.953394135842723,85133.5577419032,10.061315369541097,85545.23006689915,9.77199461537099
-59884.32180881776,1.1681464735027625,60707.66645880968,2.2835239047577627,63040.47630045344,2.769169456400446,67088.58749624703,3.514285208211559,75253.42194200019,4.688789698354499,76488.43891698809,5.715763565835301,78821.24875863185,6.559041716382701,78752.63670446584,7.350081397427164,81222.67065444161,7.97464683500073,83418.25638775338,8.993584014865696,79507.36930029179,9.91321069776354,85888.29033772912,10.04237174873234,86299.9626627251,9.77199461537099
-60639.05440464368,1.165276227925677,61462.3990546356,2.2766353153727614,63795.20889627936,2.769169456400446,67843.32009207294,3.514285208211559,76008.15453782614,4.685345403661998,77243.171512814,5.701412337949877,79575.98135445776,6.530339260611857,79507.36930029179,7.313342254040483,81977.40325026753,7.934463396921549,84172.9889835793,8.953400576786514,80262.1018961177,9.875323456146027,86643.02293355504,10.023428127923584,87054.69525855102,9.766828173332238
-61393.78700046961,1.165276227925677,62217.13165046152,2.274339118911092,64549.94149210529,2.769169456400446,68598.05268789889,3.514285208211559,76762.88713365205,4.676734666930743,77997.90410863992,5.685338962718205,80330.71395028368,6.500488706610179,80262.1018961177,7.276029061538386,82732.13584609344,7.894854007957784,84927.72157940522,8.915513335169,80708.08024819664,9.85092636874081,87397.75552938099,10.003336408883992,87809.42785437693,9.765680075101402
-62148.519596295526,1.1624059823485915,62971.86424628745,2.2703207751031744,65304.674087931206,2.7737618493237797,69352.7852837248,3.514285208211559,77517.61972947797,4.66869797931491,78752.63670446584,5.668691538371117,81085.44654610963,6.471212201723917,81016.83449194362,7.240438016382539,83486.86844191936,7.854670569878602,85682.45417523116,8.876477995320654,84172.9889835793,9.674406265750118,88152.4881252069,9.985540886306069,88564.16045020285,9.765680075101402
-62903.25219212146,1.1589616876560918,63726.596842113366,2.265728382179841,66059.40668375714,2.778928291362533,70107.51787955072,3.514285208211559,78272.35232530389,4.661235340814487,79507.36930029179,5.650896015793192,81840.17914193554,6.441935696837657,81771.56708776954,7.203698872995858,84241.6010377453,7.815635230030255,86437.18677105708,8.838016704587721,84927.72157940522,9.638241171478855,88907.22072103282,9.965449167266478,89318.8930460288,9.765680075101402
-63657.984787947375,1.1589616876560918,64481.3294379393,2.264006234833589,66814.13927958306,2.7817985369396165,70862.25047537664,3.514285208211559,79027.08492112983,4.651476505852401,80262.1018961177,5.6313783458690185,82594.91173776146,6.412085142835979,82526.29968359545,7.166959729609179,84996.33363357122,7.775451791951072,87191.919366883,8.798407315623956,85682.45417523116,9.60035392986134,89661.95331685874,9.947653644688554,90073.62564185471,9.765680075101402
-64412.717383773306,1.1589616876560918,65236.062033765214,2.264006234833589,67568.87187540898,2.7817985369396165,71616.98307120256,3.514285208211559,79781.81751695575,4.639995523544066,81016.83449194362,5.611286626829427,83349.64433358738,6.381660539718883,83281.0322794214,7.132516782684165,85751.06622939714,7.736416452102725,87946.65196270891,8.759946024891025,86437.18677105708,9.563040737359245,90416.68591268468,9.927561925648964,90828.35823768063,9.765680075101402
-65167.44997959922,1.1589616876560918,65990.79462959114,2.264006234833589,68323.6044712349,2.7817985369396165,72371.7156670285,3.5154333064423913,80536.55011278167,4.628514541235727,81771.56708776954,5.589472760443588,84104.3769294133,6.350661887486373,84035.76487524732,7.096351688412902,86505.79882522306,7.697955161369794,88701.38455853483,8.720910685042677,87191.919366883,9.524579446626312,91171.4185085106,9.909766403071039,91583.09083350655,9.765680075101402
-65922.18257542516,1.1589616876560918,66745.52722541706,2.264006234833589,69078.33706706084,2.785816880747534,73126.44826285442,3.5205997484811444,81291.28270860758,4.617033558927387,82526.29968359545,5.566510795826911,84859.10952523924,6.320237284369277,84790.49747107323,7.060760643257055,87260.531421049,7.6583457724060295,89456.11715436078,8.68187534519433,87946.65196270891,9.488414352355049,91926.15110433652,9.88967468403145,92337.82342933246,9.765680075101402
-66676.91517125108,1.1589616876560918,67500.259821243,2.2674505295260907,69833.06966288676,2.792705470132537,73881.18085868034,3.5205997484811444,82046.01530443353,4.603830429272801,83281.0322794214,5.543548831210236,85613.84212106516,6.2886645830213475,85545.23006689915,7.025169598101208,88015.26401687492,7.619310432557681,90210.8497501867,8.642265956230565,88701.38455853483,9.452249258083784,92680.88370016243,9.871879161453526,93092.55602515841,9.765680075101402
-67431.647767077,1.1589616876560918,68254.99241706892,2.2703207751031744,70587.80225871268,2.7944276174787888,74635.91345450626,3.5205997484811444,82800.74790025945,4.5912013487336285,84035.76487524732,5.520012817478145,86368.57471689107,6.257665930788837,86299.9626627251,6.990152602060778,88769.99661270084,7.580275092709334,90965.58234601261,8.603804665497634,89456.11715436078,9.414936065581688,93435.61629598835,9.851787442413936,93847.28862098433,9.759939583947233
-68186.38036290291,1.1589616876560918,69009.72501289484,2.2703207751031744,71342.5348545386,2.7944276174787888,75390.6460503322,3.5205997484811444,83555.48049608537,4.577424169963624,84790.49747107323,5.497050852861468,87123.30731271699,6.2266672785563255,87054.69525855102,6.955709655135765,89524.72920852675,7.541239752860985,91720.31494183853,8.565343374764703,90210.8497501867,9.37762287307959,94190.3488918143,9.834565968951429,94464.79710847826,9.759365534831817
-68941.11295872883,1.1589616876560918,69764.45760872075,2.2703207751031744,72097.26745036451,2.7967238139404564,76145.37864615812,3.5205997484811444,84310.21309191128,4.564795089424454,85545.23006689915,5.474088888244793,87878.03990854294,6.195668626323815,87809.42785437693,6.921266708210753,90279.46180435267,7.503352511243472,92475.04753766448,8.52515993668552,90965.58234601261,9.34088372969291,94670.63327097625,9.822510937527674,100022.3734959237,9.753050994562232
-69695.84555455478,1.1589616876560918,70519.19020454667,2.2754872171419276,72852.00004619046,2.800742157748374,76900.11124198404,3.5205997484811444,85064.9456877372,4.552166008885282,86299.9626627251,5.448830727166451,88632.77250436886,6.16524402320672,88564.16045020285,6.886249712170322,91034.19440017862,7.464891220510541,93229.78013349039,8.487272695068006,91720.31494183853,9.302996488075395,100365.43376675367,9.680720806019703,100777.10609174962,9.753050994562232
-70450.5781503807,1.1589616876560918,71273.92280037262,2.278931511834429,73606.73264201637,2.806482648902543,77654.84383780995,3.5205997484811444,85819.67828356315,4.537240731884442,87054.69525855102,5.423572566088106,89387.50510019477,6.134245370974208,89318.8930460288,6.851232716129893,91788.92699600453,7.426429929777608,93984.51272931631,8.447663306104241,92475.04753766448,9.266257344688716,101120.16636257959,9.658332890518446,101531.83868757554,9.753050994562232
-71205.31074620661,1.1589616876560918,72028.65539619853,2.2829498556423466,74361.46523784229,2.807056698017959,78409.5764336359,3.5154333064423913,86574.41087938906,4.521741405768186,87809.42785437693,5.396592257663514,90142.23769602069,6.103246718741696,90073.62564185471,6.8150676218586295,92543.65959183045,7.3879686390446775,94739.24532514223,8.408627966255894,93229.78013349039,9.228370103071201,101874.89895840551,9.635944975017187,102286.57128340146,9.753050994562232
-71960.04334203253,1.1589616876560918,72783.38799202445,2.2835239047577627,75116.19783366821,2.807056698017959,79164.30902946182,3.514285208211559,87329.14347521498,4.50624207965193,88564.16045020285,5.370760047469755,90896.97029184664,6.073396164740018,90828.35823768063,6.78177277316445,93298.39218765637,7.349507348311747,95493.97792096814,8.370166675522963,93984.51272931631,9.191056910569104,102629.63155423143,9.61700135420843,103041.3038792274,9.752476945446816
-72714.77593785847,1.1589616876560918,73538.12058785037,2.289264395911932,75870.93042949415,2.807056698017959,79919.04162528773,3.514285208211559,88083.8760710409,4.49131680265109,89318.8930460288,5.3443537881605785,91651.70288767255,6.04182346339209,91583.09083350655,6.747329826239438,94053.12478348232,7.311620106694232,96248.71051679409,8.331131335674614,94739.24532514223,9.153743718067005,103384.36415005737,9.594613438707173,103796.03647505332,9.746736454292646
-73469.50853368439,1.1589616876560918,74292.85318367631,2.2938567888352654,76625.66302532007,2.8093528944796287,80673.77422111365,3.514285208211559,88838.60866686684,4.4758174765348375,90073.62564185471,5.317947528851402,92406.43548349847,6.011398860274996,92337.82342933246,6.712312830199007,94807.85737930823,7.273732865076717,97003.44311262,8.29152194671085,95493.97792096814,9.11815267291116,104139.09674588329,9.571651474090496,104550.76907087924,9.746736454292646
-74224.24112951031,1.1589616876560918,75047.58577950223,2.295578936181519,77380.39562114599,2.813371238287546,81428.50681693957,3.5108409135190577,89593.34126269276,4.458596003072328,90828.35823768063,5.2915412695422255,93161.16807932439,5.980400208042482,93092.55602515841,6.6778698832739956,95562.58997513415,7.235271574343788,97758.17570844592,8.253060655977919,96248.71051679409,9.080839480409063,104893.8293417092,9.549837607704655,105305.50166670515,9.746736454292646
-74978.97372533623,1.1589616876560918,75802.31837532815,2.3007453782202703,78135.1282169719,2.813371238287546,82183.23941276551,3.501656127672387,90348.07385851868,4.444818824302326,91583.09083350655,5.263412862886797,93915.9006751503,5.948253457579138,93847.28862098433,6.643426936348982,96317.32257096007,7.197384332726273,98512.90830427184,8.21402531612957,97003.44311262,9.045822484368633,105648.56193753512,9.52687564308798,106060.2342625311,9.746736454292646
-75733.70632116214,1.1589616876560918,76557.05097115407,2.301893476451104,78889.86081279782,2.813371238287546,82937.97200859143,3.501656127672387,91102.8064543446,4.425301154378152,92337.82342933246,5.234710407115953,94670.63327097625,5.9166807562312105,94602.02121681024,6.608409940308553,97072.05516678598,7.159497091108758,99267.64090009779,8.174415927165805,97758.17570844592,9.010805488328204,106403.29453336104,9.505061776702139,106814.96685835702,9.746736454292646
-76488.43891698809,1.1589616876560918,77311.78356697998,2.3082080167206893,79644.59340862377,2.8191117294417154,83692.70460441735,3.501656127672387,91857.53905017051,4.406357533569395,93092.55602515841,5.206007951345111,95425.36586680217,5.885682103998697,95356.75381263616,6.573392944268123,97826.78776261193,7.122183898606661,100022.3734959237,8.136528685548292,98512.90830427184,8.976936590518607,107158.02712918699,9.481525762970046,107569.69945418293,9.744440257830979
-77243.171512814,1.1606838350023452,78066.51616280593,2.3082080167206893,80399.32600444969,2.8196857785571314,84447.43720024326,3.4993599312107193,92612.27164599646,4.388562010991469,93847.28862098433,5.177879544689683,96180.09846262808,5.853535353535353,96111.48640846211,6.53894999734311,98581.52035843785,7.084296656989146,100777.10609174962,8.099215493046193,99267.64090009779,8.944789840055261,107912.7597250129,9.457989749237955,108324.43205000885,9.74042191402306
-77997.90410863992,1.1704426699644301,78821.24875863185,2.312800409644023,81154.0586002756,2.8196857785571314,85202.16979606921,3.491323243594884,93367.00424182237,4.369044341067296,94602.02121681024,5.149751138034254,96934.831058454,5.821962652187423,96866.21900428802,6.504507050418097,99336.25295426376,7.046409415371633,101531.83868757554,8.061902300544098,100022.3734959237,8.9120690404765,108667.49232083882,9.435601833736696,109079.16464583477,9.74042191402306
-78752.63670446584,1.1715907681952622,79575.98135445776,2.3145225569902745,81908.79119610152,2.8196857785571314,85956.90239189513,3.4890270471332148,94121.73683764829,4.352396916720204,95356.75381263616,5.11932653491716,97689.56365427995,5.788093754377828,97620.95160011394,6.469490054377667,100090.98555008968,7.009096222869536,102286.57128340146,8.025163157157417,100777.10609174962,8.881644437359405,109422.22491666474,9.41436201646627,109696.67313332873,9.74132399120443
-79507.36930029179,1.1715907681952622,80330.71395028368,2.31739280256736,82663.52379192747,2.8196857785571314,86711.63498772105,3.4890270471332148,94876.46943347421,4.331731148565199,96111.48640846211,5.091198128261734,98444.29625010586,5.755947003914482,98375.68419593986,6.434473058337238,100845.71814591563,6.9729311285982725,103041.3038792274,7.987275915539902,101531.83868757554,8.852941981588561,109936.81532290971,9.399436739465433,99116.60777385157,9.756097560975608
-80262.1018961177,1.1715907681952622,81085.44654610963,2.3219851954906936,83418.25638775338,2.8196857785571314,87466.36758354696,3.485582752440715,95631.20202930016,4.312213478641025,96866.21900428802,5.061347574260056,99199.02884593178,5.72322620433572,99130.41679176578,6.401752258758474,101600.45074174154,6.936191985211591,103796.03647505332,7.950536772153221,102286.57128340146,8.824813574933133,4240.282685512368,9.365853658536585,98409.89399293286,9.756097560975608
-81016.83449194362,1.1715907681952622,81840.17914193554,2.3271516375294468,84172.9889835793,2.8196857785571314,88221.10017937288,3.4769720157094604,96385.93462512607,4.2909736613706,97620.95160011394,5.03092297114296,99953.7614417577,5.689357306526125,99885.14938759172,6.368457410064295,102355.18333756746,6.900600940055744,104550.76907087924,7.913797628766542,103041.3038792274,8.79783326650854,4063.604240282686,9.235772357723576,97703.18021201412,9.756097560975608
-81771.56708776954,1.1715907681952622,82594.91173776146,2.3300218831065305,84927.72157940522,2.8196857785571314,88975.83277519883,3.4763979665940443,97140.66722095199,4.269733844100175,98375.68419593986,5.0016464662567,100708.49403758362,5.654914359601111,100639.88198341764,6.333440414023865,103109.91593339338,6.865583944015315,105305.50166670515,7.875910387149027,103796.03647505332,8.773149154545614,4770.318021201412,9.658536585365853,96819.78798586573,9.756097560975608
-82526.29968359545,1.1715907681952622,83349.64433358738,2.333466177799032,85682.45417523116,2.8196857785571314,89730.56537102474,3.4741017701323766,97895.3998167779,4.249642125060584,99130.41679176578,4.97236996137044,101463.22663340956,5.620471412676098,101394.61457924356,6.298423417983436,103864.6485292193,6.829418849744052,106060.2342625311,7.83859719464693,104550.76907087924,8.749613140813521,5477.031802120138,9.95121951219512,96113.07420494698,9.756097560975608
-83281.0322794214,1.1715907681952622,84104.3769294133,2.338632619837785,86437.18677105708,2.8196857785571314,90485.29796685066,3.464916984285706,98650.13241260382,4.227828258674743,99885.14938759172,4.941945358253344,102217.95922923548,5.5854544166356686,102149.34717506947,6.262832372827589,104619.38112504524,6.794975902819038,106814.96685835702,7.8018580512602504,105305.50166670515,8.728373323543098,10070.671378091873,10.89430894308943,95406.36042402827,9.756097560975608
-84035.76487524732,1.1715907681952622,84859.10952523924,2.3426509636457027,87191.919366883,2.8196857785571314,91240.03056267658,3.463768886054872,99404.86500842977,4.2065884414043175,100639.88198341764,4.91094670602083,102972.6918250614,5.550437420595239,102904.07977089542,6.227815376787159,105374.11372087116,6.761681054124859,107569.69945418293,7.764544858758152,106060.2342625311,8.70942970273434,12367.491166077736,11.056910569105689,95053.0035335689,9.756097560975608
-84790.49747107323,1.180775554041933,85613.84212106516,2.346095258338204,87946.65196270891,2.8196857785571314,91994.76315850252,3.456880296669871,100159.59760425569,4.184200525903059,101394.61457924356,4.879948053788322,103727.42442088731,5.515994473670226,103658.81236672134,6.193372429862146,106128.84631669708,6.728386205430681,108324.43205000885,7.727805715371472,106814.96685835702,8.691060131040999,40812.72084805654,11.154471544715445,83392.22614840989,9.78861788617886
-85545.23006689915,1.1842198487344362,86368.57471689107,2.349539553030704,88701.38455853483,2.8196857785571314,92749.49575432844,3.4511398055157017,100914.3302000816,4.158942364824716,102149.34717506947,4.8472272542095585,104482.15701671326,5.478681281168129,104413.54496254725,6.158355433821717,106883.578912523,6.695091356736501,109079.16464583477,7.689918473753957,107569.69945418293,8.675560804924743,41519.434628975265,11.121951219512194,82862.19081272086,9.78861788617886
-86299.9626627251,1.1842198487344362,87123.30731271699,2.3524097986077894,89456.11715436078,2.8196857785571314,93504.22835015436,3.4442512161306986,101669.06279590752,4.131962056400125,102904.07977089542,4.813358356399961,105236.88961253918,5.441942137781448,105168.27755837317,6.122190339550453,107638.31150834894,6.66237055715774,109765.28518749471,7.656623625059778,108324.43205000885,8.662357675270156,42402.82685512367,11.121951219512194,81095.40636042404,9.756097560975608
-87054.69525855102,1.1842198487344362,87878.03990854294,2.356428142415707,90210.8497501867,2.8196857785571314,94258.96094598027,3.4385107249765294,102423.79539173347,4.103259600629281,103658.81236672134,4.778341360359532,105991.6222083651,5.405202994394768,105923.01015419909,6.08774739262544,108393.04410417486,6.631371904925228,69611.3074204947,9.723577235772357,109079.16464583477,8.652024791192652,43286.21908127209,11.089430894308942,81802.12014134275,9.78861788617886
-87809.42785437693,1.1842198487344362,88632.77250436886,2.3587243388773746,90965.58234601261,2.8196857785571314,95013.69354180619,3.4298999882452765,103178.52798755938,4.071686899281351,104413.54496254725,4.7421762660882685,106746.35480419101,5.3673157527772535,106677.74275002503,6.051008249238761,109147.77670000077,6.5997992035773,68904.59363957596,9.78861788617886,109696.67313332873,8.643496061477887,43992.93286219081,11.056910569105689,82332.1554770318,9.756097560975608
-88564.16045020285,1.1842198487344362,89387.50510019477,2.3604464862236263,91720.31494183853,2.8196857785571314,95768.42613763214,3.4241594970911073,103933.2605833853,4.040114197933423,105168.27755837317,4.706585220932423,107501.08740001693,5.327132314698071,107432.47534585095,6.016565302313747,109730.97916041172,6.576837238960623,68021.20141342757,9.821138211382113,82155.47703180212,9.78861788617886,44876.32508833922,11.056910569105689,69787.98586572439,9.78861788617886
-89318.8930460288,1.1842198487344362,90142.23769602069,2.36503887914696,92475.04753766448,2.8196857785571314,96523.15873345805,3.4132525638981868,104687.99317921122,4.004523152777574,105923.01015419909,4.6669758319686565,108255.81999584287,5.28694887661889,108187.20794167687,5.979826158927066,50176.67844522968,9.691056910569104,67314.48763250883,9.853658536585366,81448.7632508834,9.821138211382113,45583.03886925795,11.024390243902438,69081.27208480565,9.78861788617886
-90073.62564185471,1.1842198487344362,90896.97029184664,2.3656129282623777,93229.78013349039,2.8196857785571314,97277.89132928397,3.404067778051516,105442.72577503714,3.968932107621729,106677.74275002503,4.626792393889474,109010.55259166879,5.247339487655125,108941.94053750279,5.943661064655803,49469.96466431095,9.723577235772357,46113.07420494699,10.959349593495933,83392.22614840989,9.723577235772357,46113.07420494699,11.024390243902438,68374.55830388694,9.78861788617886
-90828.35823768063,1.1842198487344362,91651.70288767255,2.371353419416547,93984.51272931631,2.8093528944796287,98032.62392510989,3.3937348939740133,106197.45837086308,3.9281746204271304,107432.47534585095,4.586034906694875,109730.97916041172,5.208476362541402,109696.67313332873,5.90921811773079,48586.57243816254,9.756097560975608,45229.68197879858,10.991869918699187,82685.51236749114,9.756097560975608,46643.10954063603,10.991869918699187,67844.52296819788,9.78861788617886
-91583.09083350655,1.1842198487344362,92406.43548349847,2.371353419416547,94739.24532514223,2.807056698017959,98787.35652093583,3.3834020098965105,106952.190966689,3.886843084117114,108187.20794167687,4.543555272154027,16961.130742049463,9.723577235772357,25088.339222614843,9.78861788617886,47703.18021201413,9.821138211382113,44522.968197879854,11.056910569105689,69787.98586572439,10.373983739837398,63604.24028268552,10.60162601626016,67137.80918727914,9.78861788617886
-92337.82342933246,1.1842198487344362,93161.16807932439,2.3742236649936306,95493.97792096814,2.807056698017959,99542.08911676175,3.371921027588172,107706.92356251492,3.8426413022300157,108941.94053750279,4.498205392036095,16254.416961130737,9.821138211382113,25971.731448763254,9.723577235772357,46996.4664310954,9.853658536585366,43639.57597173145,11.089430894308942,68374.55830388694,10.439024390243901,64310.954063604244,10.60162601626016,49469.96466431095,9.821138211382113
-93092.55602515841,1.1870900943115181,93915.9006751503,2.377667959686132,96248.71051679409,2.8041864524408755,100296.82171258767,3.3569957505873322,108461.65615834083,3.796143323881246,109628.06107916273,4.457256555136357,13604.24028268551,10.146341463414632,25618.37455830389,9.756097560975608,48233.215547703185,9.78861788617886,42756.18374558304,11.121951219512194,67314.48763250883,10.504065040650406,65017.66784452297,10.569105691056908,48763.250883392226,9.821138211382113
-93847.28862098433,1.1905343890040214,94670.63327097625,2.377667959686132,97003.44311262,2.7961497648250404,101051.55430841359,3.3420704735864923,109216.38875416678,3.74792319818623,12367.491166077736,9.723577235772357,12367.491166077736,10.308943089430894,10247.349823321554,10.89430894308943,49116.607773851596,9.756097560975608,42049.469964664306,11.154471544715445,64840.989399293285,10.60162601626016,65724.38162544169,10.569105691056908,47703.18021201413,9.821138211382113
-94602.02121681024,1.1905343890040214,95425.36586680217,2.377667959686132,97758.17570844592,2.7909833227862872,101806.2869042395,3.322552803662319,109833.89724166071,3.7064276478432383,11660.77738515901,9.821138211382113,8657.243816254417,10.796747967479673,9540.636042402828,10.959349593495933,12720.8480565371,10.991869918699187,41519.434628975265,11.186991869918698,64310.954063604244,10.634146341463413,66431.09540636043,10.536585365853657,48233.215547703185,9.821138211382113
-95356.75381263616,1.1905343890040214,96180.09846262808,2.377667959686132,98512.90830427184,2.7817985369396165,102561.01950006545,3.3024610846227294,8480.565371024735,9.756097560975608,7773.851590106009,10.569105691056908,8127.208480565372,10.89430894308943,9010.60070671378,10.991869918699187,12014.134275618373,11.024390243902438,11660.77738515901,11.21951219512195,12190.812720848055,11.317073170731707,67314.48763250883,10.536585365853657,47349.82332155477,9.821138211382113
-96111.48640846211,1.1968489292736066,96934.831058454,2.377667959686132,99267.64090009779,2.7731878002083636,103315.75209589137,3.2777769726598027,7950.530035335691,9.91869918699187,7243.816254416961,10.73170731707317,7773.851590106009,10.959349593495933,7773.851590106009,11.154471544715445,11660.77738515901,11.056910569105689,10600.706713780917,11.21951219512195,11484.098939929328,11.284552845528452,68197.87985865722,10.504065040650406,46819.78798586572,9.78861788617886
-96866.21900428802,1.1968489292736066,97689.56365427995,2.3747977141090466,100022.3734959237,2.7651511125925285,104070.48469171728,3.2502226151197924,7420.494699646646,10.081300813008127,6713.780918727916,10.89430894308943,7243.816254416961,11.024390243902438,7243.816254416961,11.21951219512195,10247.349823321554,11.121951219512194,9717.31448763251,11.21951219512195,10777.385159010599,11.21951219512195,68904.59363957596,10.471544715447152,46466.43109540636,9.78861788617886
-97620.95160011394,1.1922565363502713,98444.29625010586,2.371353419416547,100777.10609174962,2.7519479829379403,104825.2172875432,3.222668257579784,6890.459363957598,10.27642276422764,6007.06713780919,11.089430894308942,6890.459363957598,11.121951219512194,6713.780918727916,11.317073170731707,9540.636042402828,11.186991869918698,9363.957597173146,11.186991869918698,10247.349823321554,11.121951219512194,69611.3074204947,10.471544715447152,45936.39575971731,9.78861788617886
-98375.68419593986,1.1905343890040214,99199.02884593178,2.36503887914696,101531.83868757554,2.7381708041679342,105579.94988336915,3.1905215071164363,6360.424028268553,10.439024390243901,5477.031802120138,11.252032520325201,6360.424028268553,11.21951219512195,6007.06713780919,11.414634146341463,8833.922261484098,11.21951219512195,11130.742049469965,11.21951219512195,9010.60070671378,10.991869918699187,70318.02120141344,10.471544715447152,26148.40989399293,9.78861788617886
-99130.41679176578,1.1905343890040214,99953.7614417577,2.3633167318007082,102286.57128340146,2.7215233798208445,106334.68247919506,3.154930461960589,5830.388692579509,10.634146341463413,4770.318021201412,11.479674796747965,6007.06713780919,11.317073170731707,5477.031802120138,11.54471544715447,6360.424028268553,11.414634146341463,10070.671378091873,11.186991869918698,7773.851590106009,10.829268292682926,70848.05653710247,10.439024390243901,25265.017667844528,9.78861788617886
-99885.14938759172,1.1905343890040214,100708.49403758362,2.356428142415707,103041.3038792274,2.701431660781255,107089.41507502098,3.115321072996826,5300.353356890457,10.796747967479673,4240.282685512368,11.674796747967479,5653.7102473498235,11.414634146341463,4946.996466431094,11.674796747967479,5653.7102473498235,11.512195121951217,7773.851590106009,11.154471544715445,7067.137809187279,10.699186991869917,95406.36042402827,9.821138211382113,24734.98233215548,9.78861788617886
-100639.88198341764,1.1905343890040214,101463.22663340956,2.3466693074536202,103796.03647505332,2.678469696164578,107844.1476708469,3.07226738934056,4946.996466431094,10.991869918699187,,,5300.353356890457,11.54471544715447,4416.961130742049,11.86991869918699,4593.639575971731,11.609756097560973,7420.494699646646,11.154471544715445,6360.424028268553,10.569105691056908,95936.39575971733,9.78861788617886,25795.05300353357,9.78861788617886
-101394.61457924356,1.1905343890040214,102217.95922923548,2.334040226914448,104550.76907087924,2.6532115350862355,108598.88026667284,3.0274915583380437,4416.961130742049,11.186991869918698,,,4946.996466431094,11.642276422764226,4593.639575971731,11.772357723577233,5123.674911660775,11.54471544715447,7067.137809187279,11.121951219512194,5830.388692579509,10.406504065040648,96643.10954063604,9.78861788617886,16961.130742049463,9.78861788617886
-102149.34717506947,1.1905343890040214,102972.6918250614,2.318540900798192,105305.50166670515,2.6250831284308074,109353.61286249876,2.9769752361813566,4063.604240282686,11.38211382113821,,,4240.282685512368,11.902439024390242,,,6007.06713780919,11.447154471544714,4770.318021201412,11.024390243902438,5123.674911660775,10.243902439024389,97349.82332155478,9.756097560975608,16431.095406360422,9.78861788617886
-102904.07977089542,1.188812241657768,103727.42442088731,2.301319427335688,106060.2342625311,2.5929363779674617,109833.89724166071,2.9459765839488448,,,,,4593.639575971731,11.772357723577233,,,,,4416.961130742049,10.959349593495933,4240.282685512368,9.983739837398373,98056.53710247349,9.723577235772357,12367.491166077736,9.756097560975608
-103658.81236672134,1.1842198487344362,104482.15701671326,2.280079610065261,106814.96685835702,2.5573453328116162,5653.7102473498235,9.91869918699187,,,,,9187.279151943465,10.73170731707317,,,,,,,3886.9257950530045,9.853658536585366,98763.25088339223,9.723577235772357,11837.455830388692,9.756097560975608
-104413.54496254725,1.1842198487344362,105236.88961253918,2.256543596333172,107569.69945418293,2.5171618947324337,5300.353356890457,10.048780487804876,,,,,,,,,,,,,65194.34628975264,10.60162601626016,99293.28621908126,9.723577235772357,8833.922261484098,9.78861788617886
-105168.27755837317,1.1830717505036006,105991.6222083651,2.2284151896777438,108324.43205000885,2.475256309307003,4946.996466431094,10.211382113821138,,,,,,,,,,,,,65547.703180212,10.60162601626016,99823.32155477031,9.691056910569104,8127.208480565372,9.78861788617886
-105923.01015419909,1.1779053084648474,106746.35480419101,2.196842488329816,109079.16464583477,2.430480478304487,4770.318021201412,10.341463414634145,,,,,,,,,,,,,65901.06007067137,10.569105691056908,,,5653.7102473498235,9.886178861788617
-106677.74275002503,1.1779053084648474,107501.08740001693,2.1635476396356346,109765.28518749471,2.3867889622977554,4593.639575971731,10.504065040650406,,,,,,,,,,,,,66431.09540636043,10.536585365853657,,,5123.674911660775,9.886178861788617
-107432.47534585095,1.1750350628877655,108255.81999584287,2.1256603980181197,4770.318021201412,9.593495934959348,4240.282685512368,10.666666666666664,,,,,,,,,,,,,66784.45229681977,10.536585365853657,,,4593.639575971731,9.91869918699187
-108187.20794167687,1.1715907681952622,109010.55259166879,2.084902910823521,4416.961130742049,9.78861788617886,,,,,,,,,,,,,,,69081.27208480565,10.406504065040648,,,,
-108701.79834792181,1.1715907681952622,109559.44902499672,2.0518376817755097,4240.282685512368,9.983739837398373,,,,,,,,,,,,,,,67844.52296819788,10.471544715447152,,,,
-109187.27915194345,1.1707317073170742,4593.639575971731,9.235772357723576,,,,,,,,,,,,,,,,,,,,,,
-109717.31448763251,1.1707317073170742,4240.282685512368,9.398373983739836,,,,,,,,,,,,,,,,,,,,,,
+KN_CURVES_NPZ = """
+UEsDBC0AAAAIAAAAIQC94awW//////////8KABQAYW5nbGVzLm5weQEAEADoAAAAAAAAAG0AAAAAAAAAm+wX6hsQychQxlCtnpJa
+nFykbqWgbpNmoa6joJ6WX1RSlJgXn1+UkgoSd0vMKU4FihdnJBakAvkahsY6mjoKtQrkAy4GMBBxgNAqUFoDSutBaRMobQml7SB0
+gyOU7wKlPaG0H4Q+EARVF+YAAFBLAwQtAAAACAAAACEAPlfUJ///////////CQAUAHRhYmxlLm5weQEAEAAQgAAAAAAAACtYAAAA
+AAAAnLx5PJTvG/aPypZ9380+JUIKSeaMypKkUomURLRJaJMkoZIKbSKSLUlCEkL2PVsI2fd9G6JSnrt+3/vyez2f/57+u7oY9/s8
+zus4zpm5Zx6Y7NtpepCV5QLLFbqtncsxZ7oWga59XJOuSKAfP+vs6nzU8chZZ1u7v/+//ehpFzvs/10cjjrZYetVqhs0FAnr1Fcr
+Eq4S/t/+cd8WHVHU9H4LunLb7sbUSUNCv/Bhg4AkqHD7lDBXQULruX//QUZrs31//1GB4Pbr8IZPb6Fgu9bp6AIa2reYeDLrcZCO
+1p9LOt15quhgIBDP8x2SIetI4y+7bDr0boSPUVPJoC5/g6mqubQ//DulXXmECkO0atYWq0R4v2b3R6H3ZPT3LjnfoX+4REK///fR
+jjSSweHs8/P7diQBTUzqfrKWNNrHfx5//AeW2hlFD8hon20nsUaEjYr2/13eERp4Hms8sTsyBWY8DmJENPTzt7FHwx7yP+v0NLaS
+hGWpILbLcapXjI5+n6fqbwFo/6knfr0mGeO796qS0O8X/btAMhReD09lmUyC0iabhMgAKZhn1Z/WckoBWWpR2RsVEnp85ZG/BSOj
+deLWMaP6RArI3D0tsbjnHSz8Lc8vKkxyKVM47d7DtVgBB+7rNLRvcPOua5MBHa1x/QLViurei6bB8oFjTjrsdFgfefDTDdNUoC63
+vOgiQwMzWdkHrAPJUNl9Jnrnegriw8TCFCOh38d5mpKz74h5JoPbD9eopDFJcNhqx7kQ/Q4arV40XOskAlSEJL3xegd3crf5NneR
+0PVgzYV1GAXMOoPPW6SmwuPZv4JQodJ3Slnw4gdQCm/tLlOioX28/jgvvsZ/vvfff9DAVfe0f6VKGsyd/0yLU6Ch+rv/E4wCLGtu
+9dhGJsOkxhNyhxgZUrs9DooKpsN6TjW+4wVkcH88MLyLKwXS3uyuqLWShCTejGLHD6kgMj4hLhlERGvFUZcdLDdJ6Poknt3P+yFB
+ARUry+vHitNA769cW6mgrWQ0XLIxE8r+AVFR/Rr+CUpD14+vl7fI3j3dlI7WC6/rxG+RMyC6r3Jf/yasf0+9ufrd5j2s6x/aqI31
+A94fpv8EIoO2cV9vzbKPEHbtAqdFCna+rgga3Q5KgZNmj0sCqiVgvpHHp6vsPZQ5xa413UZE625HBRsNrSV98fOHX0/HvwJS4O9x
+qtmRBReoJw9EXljSK+rff9AQL77uVOHfyn33I7D313nmfsT08bygTw79CDrsfxuQhupVLfL3xFIgW/3nh+ChdzDUZiE3F0oGA6NR
+hxf3s6EwfHiPVxQZ1r9WIT4nvQN1r/0rjDQkACKs9cxaMb37CiWpPwlovaPNXePbBBEGvf0i79p9gN/tURZwFevX/Zhgw5ngj52O
+m3cpMPjPj3KAJKted5RMRbxO/y6QhnjxtUPI+eqiaznwVD7wh+BTGiR9iYz2WMiCnX/bcRcN4vJFytmTP0DcnzC1DzMU1K/9f4/b
+AO53n5Bf4bzqCgeTlLzFwf9EKmvJ+AcI27mj+UkSAa3r+KIMihKIEJex2WGkPR3yV0dEDCuQ0d9ftTxEN2I1ps8XZq37sVyIuXRq
+LTumF86L1xvnxa/X/TFf7L49uWAYFP+V/cZ/9/F64PU5LbkmNPJPGgRdDrczIlH+5695iAc/H9E81THra8SgYR1n7kbWDFALebFl
++0kC6mftq7OyJ2yIILNg6ZEgnAm/lpWNDXaQwNvULukm3yfUf6/vtTL8M/OAnlxXsvBoqf9w/8Wv31qJi7xhFQ1dD64Xvj/l/O7i
+1G4abD1Pa/y5IRMuqT8iBG6mouvZ3/rxjo4zBXrfjpSPmuWDBP9E5JwfGeJ6LzZs9XkPjXceWoqtEkPXu6JzzcMCCgGC7T/6PHHL
+hCJi3ItHgkTw13F7eMbgI8QSz0d+D8LzNhe8sDSUv0GGFt/45nxSAegkUB8L7F7qPzwfxaizPcZP85C/e/073/kov0L6n/C46eYB
+ldf4WcG+pfNk+/fH7aigQo5mxtZ+BP/S4BeHsPMU2xseYFRVAGXeyzQ5bpGhdD2r9onzaRC+X7LS55Eo2Ba91ZanfYRwFe0L2Xny
+6PdNii2o+bkEWPXThu3q8yyoCqsXbQIS5ud5p95V5IGt/mOZZ2pkCP9o9ZzwrBB4dr1KNeejoP7G/Q6/fpwv858fF6J+TDW5E/TT
+cImvxv35RP9YFjDrI9cc88X8k/j64kWsPtGWcrV+UlQ4Jblnf5x+EeLJXplrxND7ADrNsmYPV4pCPUfVnk6LLFB4G1nPoygPle3+
+R9NWZUP6+jc/7S4QIPf9Dif/79nQ1POlRWX2r593XndlKYC8CInEghESRGsd7eLsLgKFqaqTDVj//cV5PpiL8gm/fpwva+XAim3+
+RTBgEVbdg+WV6SXilrif+aj/cH3jrG63PIqjQjR/8+8o11z4brbcyMscm0/k74DuqWLE02ppmHxMLR3EPtVJl54XAaeCtNyJ5GzI
+eWomG3RfDgKEgS4SmQOqOcr0qlUEOHRufXvozk8wffPZ5dgkIpBM/zzZsKEQJMZbJCxjSKD4z1+LIerfQEeGvn/zTR7y74dBMonf
+TxTBhfxzLGtfUtHPS/897rI0GH3xYWLf6wKkj8Gq21bHPn6CV/L2Am3FVFCP9HS7/TQf1vO+8n4SS4Wf52LNM+VKUL9TqGFnG7dl
+gOQYR+Whr8LAc+352kXOT+D0e/Hx/HdZUIi+/D2dF6vv9QNcyjnyyL9k9B+d7XQgous7rTl22eQICWyTbrbn0Evh3/jnTIZ5+75t
+7L/zgRDmva5nFxXMS6pdzHqKIWRT7xH2W1Qo+ZdPJcgv9v3L60Kkj7/O3mb78lzYHPNW5esAFfHi+uJ/D+c5Mz6pZGieCZUPjEul
+DYVhj+xWEw6VXIhmm99955gseryKssHtUhvkgT0+pXOPah6cC3xZ84VEhBBBwmT722IoDzy78oI4Ce7ovNjlElgGbuNrpl5rksFF
+94F+3eVC2LNWcZ0d1u8yC14bUw6VgtviXT0DByqw/PPjUuQPeXJYh2YXIZ7/2z/w+g3Vp1m5D1PR38P7Dc9nXYNwG4l3Qti8oLni
+/rdckPrZ7dj5VQa8RIUGNwfngethXi7WV3IQlL1f2lQgHzS6h4hsrQSICCCvK5ktAdnmWpuiWiKYupiJ1nJXwOf3as/TFkigcXE7
+rwqzCFQnWg77D1CgS0V9kb+xDBZkZewaDDC9nj1i/6VdDu4ip7YuG1/qP5ynvN0uNik+H54mve+JJdNQ/by+/PTvY6Ghv/dH7tmh
+5jtkuDQ6lyzZmwVm9c9Gy6SFYLRJMUvsZh6Y6LomVJjIAM/qNNKmi/kQT0sx/iQmh85/qmpW64FHBOx80l3fbiqDA3vPjsr6E0Ek
+juPbWu9KyP0qf4cnj4TlxY+6u6dLoOZnLr9sKgUi7IYKz+yqgO2Hlv+krsH0qjWoNE+rgJa0O7vCWqhQyjV+W1SiFLjJEwUt7rT/
++B/eX/h5w/9evEnUbY97ZGzdKb96Uw6smmmRPBkoCCYu7M+L9PIhMtcumPFJGtZcZtw+Yl8AHssOzLF7yYJtiIlILmsh/Pb11V7Y
+SQBGBX93TlA57PbQsUjRI0JTa2aE/+/PEMyVobLVd+k8/Ru3wynY7z/zqyithIvxTw3M+ajQuWIhME35M8icOCgiWbrUP1oX3Tx1
+fWnwt92SeZb6D99/WPJCn0ORhv4eztPU+qDPN/UTVF6byLFlF4TtRkVvQgULwPpyeVXjWmkwLiuduHGgEMaTN7k1T8tAwrHIunUi
+RSDd5VrDw06AVt/5XVVDFbDXfHp9wx8CPBN0PD58oRrmYno+xxmTsPmXJ6LRuAwaWnp8T2N5vqp6l+lq3Sqw0TsuPTNJwfz97QGR
+V1VgLU1vfvieivpHlz2AY909Ghz+O0A4FkMAn/RQUuBSf73NnNgKmF7vupl+NGI14rEpunVdMi4XPGnrP5IvCWB55Z11rqMA+MQX
+37x6IYXy6uyWiG4rexn4rvg9IIZWDOFm5ZbbPOWx5ytd2W3wGWjh7jf3ZBBAJUpAjHKpBtw5vCN8REjAqfsoTw7T7++ziTEjCowu
+WyZ282M1rBvteHmungKpGsl8GwVrwLftxYHpKCrqHycL6cKnT2jwJFSbw6G6BM3j+P6tedfibmy+w6YH6eKVNWh+w89LQtDuweR6
+flg3r1uh/6YQclLV7rqLSIHfiW9ZlRrFsDzFW+VhhzTofDfcJbGxBDyahUb4vsuBwJ+yNWNPquAAj8Ww1HkCBGwenq9bXwusJygu
+Nq1EdD7oC0OGdBoFzGW+nXEOqYFtRqQkn3QKiNX5TQ18roG3z2UadwVRUf803jPm1XlOg4f23RBWUArVK5RmbmQv9ddwf/BLGSsa
+xP+bt5Z48PO+Ks+iuOsjH8rrw27zUbe9JCE+w5Y8RS+BYNIJj/ID0shvC5/z7+S0lQPCr4puQZYaELpVfWmbMgGYXwu+XZ+qhdMt
+5xYJMUR0PjQPqIYSsOf/mWmppsQDtfCLzfB77zMKXDptW//YrxYyzm3lu3+divr1mcNTiSexNOR/6UfbbqzooKF915B1OVWnaKh+
+hPDlCgNBZPj0nvLe91IB8PS6WLhG88I3S6fTJ9yLIf54m+X8iATym7UPdlay1Px9fSGLbOxZBvFKDj+ym2TB61FMUW5WDcyP6j2r
+K5MHM+ewHJXEOoDi39rjZ4lYfTa4m+6tgjbB1WZjdWSQ3n1PrUa4DpI+ntXeep0CLew6H7bp10Gx3untVU5U1K/Wuv3kyTc0pK/0
+3gVpi0Ua2uc9sbBm20Uaqp+fhN632YdL82OEu9K2OQ8e5K/5m7qvKZpLwMDBi5MbOcsgf9k6KQ0DKWy+m+XtjyoHvg+aT37vlIVe
+5WtxZy/XQsKDW8GBm+Qhjefii46TX+CA/Z7vuzcRQfrfPFqN5h+PEXuxazV1YOv62CvKjgLaL8RDZpZ9AWenS1nm1lRUb5qMmrLh
+exrSd/+1GA91OTraj9MofvrRi4bqh/Pw/7nyvqumCBTZLy5us1yJ+inuB7sArUQcnvX3eflwlYPCY6EGmyxJMDQSprxsqoDKs2Gf
+H2bLwNZy8zty6nVg3Hy/gZgmBxIvTb3v0euhyavPupCTiPobn386fbb8ULr7BaSUskvZMH94tmnKPSr3C+TOOTitNaWietvdGdc9
+jz3/xv3vTegLuqo2He0/f/26rP8uDdUP57kGIRWRK0rAnLmYp2vEjfy1P2DlYraWOPS83bhlXroC3h3eqyOuIAnp/qpaDryfwXGe
+9cTIOhmItV3n+Hm6DlTqj9wzUJWDy1sU7Df31sPC/CEur0YC0NyqKT+31UKD6QY2wd1k0CVIt7Ya1sO72YBSPWUK/G4oP7Lnaj3M
+3GNv7wMqqvf2ffcejubRkP+lKqXYbTpAR/vfCxM+FgfTUP1wntufwnjv7MDmJ1rW7LQ6Fzp/6lwBXzhSxEDx8t3Fk2sr4Y+SdfbC
+YwmUHyI3i8X9XkoD5+LK3e5vv4DbsqMBwqmy0PptmdFoRAPcHhI6ZhJLgFsirzhesdWB1a82pjONDFGZMzl32BuAm+uZ8bgwBayd
+onVZtRrAt+IT7x5VKqq3T6FhnEQpDfnfk5/Gjp+d6Gg/IjHWk/UFDdUP5yFc8b0SElkGDh/ancoonNj8I3dGXqkC+JzrQxTWiKF8
++TPI+cuEXQL5y8u5eLtceWk4+bRPbc3pehhMLj8yulkWdC60KYZaNcKzrRap+hcJMJzoNXzgUx04Cki0sf4mwfJ9VS+0Choguvas
+sfIPMuRze1CTvjeARfaWDDMSFdX7l/Brg+uVNOR/u9ictwzcoqN9o+CIbdqvaKh+OA+etxKVVzOPCXEgPc6uuF2s+VwU+ZNWWB/J
+6YI4mJZqmp04XAMGbm/Hqh5JQaXaJ7GWVQ1wqePZQl2VDEQIfOA3kvoKTLOT178aEGCH4aHP7O5fYFlAT3Z2PQmOT7z0HrrWCNoh
+esZO7djzlZgDnEfeNcLatwW2B4SpqN77XDIiK2ppyP86txI7bj2no/3KLErDn7c0VD+cB89bzSay/QUWdqRHfIbd+EF+UaSHxb1x
+vh0dYlB/U+u8FWst9H7fa/OIRwrWVgX/uNXXALanrzKX2ckA2+uA6fnGr7BPK2xzngwBEno2JL3XrIfo3tq7XxJJUHr7un2w9leQ
+lOgs0S8kgy9DdYTX6Sts28/nP7mciuq9RylB6+hXGvI/GNMwN0+ho33c//D62ez9HHP1ARnlrT/vpU9GP5cjPfrP6IpduSYC7Arb
+cxr21YDu/S9KetvFIKJvrWJfQi0EBTZpFF6ThAAH51aNyEY4HhVVOrgoDTbbTja8fNAEM69UR7y65YHPg/+B7SxWz6jd+8T8SECu
+SVfRyf4KC5Sgcr4UMgw2c1dlKTaBb37VIOs8BdV710B43fdWGvK/8ohaR+48Oto36YqzzUujwb0HX5aLJ3yFEDWXdZmBZFR/pzdW
+/Mazy9A6RYcesm5UGHR27DNUn6wBAev05J8popDRJXqZ5WgdxFo7ba2aloBpNuNP/Ye/Qrrte86cMGko6tBL32/aDDVybVu478uD
+k8TQeeGUBnD7bCPie5wE6/++vOrZhOYTI9fepFNDTeB1ubjMfZiC6l2ozuJypIuG/M/gmsFjm890tI/7+fF/8/vS4+F5W+uaH6PA
+vQyy7uxdpbuzBvp7HgTKHxZG57GYxyqPlSIK1W0LRdKiX6D/KuWc8GkJMAujRj6SboK1McpiL3Slge4mG7qCtwXSHF7fHNksD3Up
++eb5jo3gev2ITv82Epy0LZh/srwZPT9O4Mt5IBXbDDGzap1n2ymoX4XyRtp29dKQ/1388mVPeSMd7a99bZCmic1zz3ZdIm5JWOLB
+83ZVGlvLCVM2iOdzkuXvqAE2G4GV6fVC8HPN8Vk/pTpoatpaaP9EBNZdaowrr/0CPGuzY2oGxCFNY9F7a1MTKJhukk4elML8ee5q
+alkLjGvbaWZPyIHazmebzq35CsE/a8NyaNjz1ct8NeOHmlG+8r16cqHMpgV8sprcKmspqF/5r7Sf7xuiIf+bnzvQ7d9GR/s4T824
+g22BSjPiwfPW7G2UUkIzK5pfkhYedvbrC0HJbYsEoWYs/2uUu7JWisBDoaQ7l+/Vg867S2UDduJYPjTZMx82Q7rWL3aDICkYSayx
+Pub7DbQ/2pboxsrB44HzcoTBr/D8xlTaJU4S0u9CosjcBVsyOOqdO3hJ/hvEaW4P/FREQf36Mb4v0m+Uhvwvln6Ef10nHe0Pz17T
+isyiQfiy1E1St5d48LytuaK50taFFc2L6vt+dC7kC6L5JCVhOHbnDWGYTbjtuGpHAzSdtlOPGhHD+jHFKHJ3CwS9jbWq1pECY8N4
+PSG9VjDwDm1RPSQH89d3sVZHNwF7imLQwBAR6acneF3abycZatqMtOmt3+Asf3Df7wwK4l33c7sec5KG/O8xj3L6mR462tcpvsT7
+O4OG1rhf43nrMC1UUi3IivKvc0g2qkddEM0nt+qeOEktCME+/WO7v3I0Qm7SZr5drmJYPvgr7eb7BppbE+hSY5LwpucGLW+xFd4k
+dOqfEpcDC5nVvVePNsOl936Hkj4TkX5P2j00yjXIWP9S5BuDW+ELVF28mUhBvDgP7n84D75fv0Pr0PgHGlrjPHjecuoIOD9KYUH5
+d+sjI8kgVgDNJ6Ov202f3hCC9C7t9b6FjcC3Wl/5+XIxLB/sBFgqvkFrU/KUbagkCHhYcTlltYHNEUHCowZZyE5jK1GUawElx+RI
+/hQi0u/zx9W8oyQy1r9/WH32tYE7/bPPyygK4sV5cP/D+w3ft1po+ujzjobWOA+et7lqe3/xmbOg/Es81dS7giSA5hNNyuC5IWEh
+kHIXE99w/SvYX3BhGD4RheebGMzEm61gdFdQ2WWHJDhLaIzKXW6HcPcvEyMPZUF2d+urby0tAJXMePJjItJP3yTscDQfGeYSvvaq
+CbXD60tWd2aeUhAvzoP7H86D70vpC8BECg2tcR48b4euckl9mF9k4PkXPVN9Xd2MH80n7FccMgOTBMFdbPJHz+YmkCEnvtqsLAqL
+DRKNVlvbYN3XDleznxJQnyJQ/XlDB4zrfQv7bi4L10be+/s9+QayRgG0X1eISD98njugn1zSXdUOR9Zfu+UYSEG8Ac9tVsRhPLj/
+3b0qqerxjY72z4hzCRsl0dAa58Hz9ma21JDgzkUGnn93e94dnvbiQ/NJjtNrvZX7BaE9qaw16GcTyFnUe5DKRcDGaTqdh7UduoFz
+7Y94CVi/czjZfboDxFisE+WIspif3D+70awVQkiCnbI2RKTfo7ogyyMjJMjs8osPvNMBopMRPoO3KIj38qwMfWaEhvwPmErFd5vo
+aH+u5KVz12saWuM8eN6urjN5WRz1h4HnX6lbYurVQl5QoFga6f/A5om+/SFBbIKwZUfUpy0fmmGrwDGi6GkRKOSuDP2Y3Q588HzC
+yUICKphHyx8d6ATPc2+02oZkQI9wYs+gQBv85mbsJRkSkX56i+G1Qy0k4NNJ2U6gdIIGjXX9OS8K4nUk/NQIwfIH97/eB/Kn9b7Q
+0T57z9eymDgaWuM8eN7W9XvZXfn5m4Hn3yRl95UVUrxwJ2e90vf3TbCfEqkb+F4AIvvcIyddWmCV4GqDc7wiQIuJ8Tjp1gFuM38U
+r3FLwEJu1aax952geaZf1f+9DERn6m548rkNsoNv3fqmTET6/WKpUq+qJAFjpXz6Ra9OSGG9Gp14hYJ4zx3niFiOzQe4//mtFxT6
+gc07+D736j5VgSgaWuM8eN4muclPbTb/zcDzz9tYKT7NmwfGzfkEYpybQU5ToGXoJOYPnvt9nqtg/hN4QPvbe2EofP4pyV8au57S
+9DbTLHFQurfpzVaRLsi8dfnZHy8ZWLFPRmK7XzvEjOgzeSSISL99Vl3Nv3NI4NR0Z3V1ZyecD8oL8DpPQbwNu1XKye005H91ygOz
+P0rpaJ/v7PRTtzAaWuM8eN4m2ehvdPi0wMDzbzL5ngU3Kw+YMgem9yq3QKmoXEEGTQCOS6k4mIx9AxbVzihOa2GYOa1I6r3cCW6t
+tPOvzonDYcs4uWfOXeBxsMGLY7cMOEzM/pzZ3gHCr4L3nWIlIv2YjtnzBckkiIiZD6ExumADmf3q/rMUxJtUV7Igij1fwP1PTVqA
+IFlAR/v46434GufB8zVJPshpdNUCA88/Ftbh6mCflZByN6+BbbQFZgPC1EvK+KE0lWvH71etsEblop0nvzBQtZ4+2NTUCSybKgNO
+0cTh/irRAGZNF5Q/zLfeTJCBvsKB8VrWTuhcucLNY5iA9BMfUeD/EEOCWmc7Ho+wLkj9c33sgQMF8cbppZynVdOQ/+3Z7VT1IouO
+9gMDrjiTAmlojfPg+VrjS/KlPPnFwPMvwVZGmlNgJYisCk1PjvsGDhXERlcDfli1q0cp4TiWl8tVxfbkCcF+DvYVD9S70PO93Nnr
+rDuUuyFEa4t6xKQ0iAWZWa+2xvrpXoXgvgYC0u9bnvux2ackYIO6qw2/uiDgmiTB9ygF8UakPhtXL6Eh/+PkDaqQTqWj/Yq0tfZl
+t2lojfPg+aqiq2NeyPeLgedfoEwLqSOKGy7ku4Za27XCZEuprXsZH/gNZQlYktvh6PxWrQFXIbhZ73xh+CFW3y6BuwrBYjCVP+4c
+ebcbLrzv/nmoQBr0j+TVeuZ0oveTcf22MFNmPe6RQI2XMaFo0Q0VMZUiShYUxIvPz7j/yThW+xm9pqN9/PU3fI3z4Pnq+fuggq3v
+Twaef071TxTSNLjh6yETD35SGwxea/+135APRm88ZnJ1tkMxwe8lQQWbf150DGxhdgGt49JQ9j4xIAVY9v4Y6YbtlkdrPj2QhouK
+a/WaZLqA/mdIUzmBgPSLowzd5LxBAtuW19be6d3o/X2cF59ncP9TqeYxuhxJR/uHmAOPN7jR0BrnwfOVpZscV8T1k4HnX28Fl6RI
+NRdoztGP5rS3wSXbuMvplbxgIufUmP6sA3zj2hyjJwVhyNH44NPd3WC9oJUhIioGe61K9+026gFSI9sj9+PSEPcjJFX5Shf0bKOx
+ewQTkH5rtjtbJ10gwaOXEnXfxHqAzzykOU6fgngLlfhN+LF8wf2v6f1K86dP6Gh/LidtZ6AzDa1xHjxfI0IFRK/f/8HA88+s4AqH
+83EuCA1k3XomtB0e3qK1R+zlBfPW6NZ3ipj+1MTgbe8FQUo7o3zybTc48rmN3GoShRsKG0ri4npAXdWo/7yGNDQXc9BuNnfBi7s2
+Xyq9CUg/bl7xXzwnSVDs6qOndr4HMnSeDpRqUxDv9l3BtA+hNOR/Xs+4j2f409H+hPKL4hcnaWiN8+D5aqpAOPdY/AcDz79Npof+
+RC5wwsKabzQZ8w6o3D9M2NzBA7dfCZqsvNMJpmn7gkuuCcIOLpq2AV8PGIJwYG6YKLyfe6HJwtELQgkj8eu4pYH7oeuTdo1usGoI
+j5A+R0D6vZRjSn45RIK5LdOpfl96wF10ZBOHKgXxnqxYsTn+Pg3530uJS+4JnnS0HzmSXyBtQ0NrnAfPV5UPLA4lb+YZeP6VTglX
+pAZzgvKxFm87bsw/+eJWibjwQOYFj082Q51wT4ZwM8pYEK42Br15froH3GozA3QdRDF/5os/YNcLvbtPej5qkYJNR7s41R93w+X8
+78ryVgSk3xEC6doHExKs5j9C61bthczrr4MlKBTEy9HWZemEnXfc/05OlNUMu9LRvvnL3txHB2lojfPg+UrY2nV4Xm+egeffic2C
+F9w2coK1iv73LAcs37ZV/Z7n5YERvRGVTP0uOJwffohdVhDeRC3KzZX3wKT4Gh5LNVEQD7oi/bagF7Rs3HZSE6Tg9FoTt7sz3SAl
+1Zm2y4iA9LP6Kmm9bgsJDrZWPNkY0Asi7TmbDMQoiNd64+yf56405H/xln5KC/Z0KA/fX6PxoAfeSPWWUM1o6OdxHjxfTauDJrcO
+zjHw/COqmS0y2zkg8Pc7e5GSTlg/4FPOHb8SZATNIwVju8BA6JiA7LQAtDmdDjBZ3QvunF129GWimD8P+rOT+qCOvvfxDg8pCPuV
+OdK7pwekxPsW12sQkH4H7wlueaNGAr9XmlyB471Q3TEWochJgVMH30ae/tMDlS6bEkUdaMj/BkuM/Hgt6XBzSlnwyVgPup8Mrw/O
+g+drUmK1zo9Hcww8/wIG3mmz3eeA/HJC8ylqF3jLXNVauXcl7GwvFD6xvBsUbeiFaiUCWD40s8be7AWxqozEnQ0icElx3x8rzz6Y
+PpDdGL5bCqpK6VbayT1gVZZSmEQhIP3MtnGRVtGw5wsXYtwGjfvAWuZlTfA8GfazXxkc29aL7nfB/Y/l7KPkWGM62sffv8frg/Pg
++arMe97io9EcA8+/Vz68jB36HMB8cteo4EYX5Lrv/pj8gxuuvlb1ybXphnCZq2cvhglg+bDd5XdfL+h+2d7+M14EXv3IO/u+vQ+a
+Xl73e0+TgsVHD6se8PeC9x0lPT5hAtKPT1/zJo8ECetfoVHG6z5gmluzrBgiw+Q+JpfyrV5Uf9z/LCrizBp1MJ5/98Ms8eD1wXnw
+fO0StTZTXT7HwPOvM7KaL5KdA6h2Pz9KdXdBdLE864M4bki8FP5dPK8bxBJmuUQvCGD5kNJrtrUP4LOpU5G3CDQVr+3i2dwPy9/w
+ZdosSILKMVYYOdMLJZt/cfixEJB+Pg/CnSy4SCAreM3qCVc/9GhtmKY2kyHnpE6XT+fS9eL+956eNbdClQ4H/95ggdUDv38Yrw/O
+g+drkv6PHw5l3xl4/q1+lPp5Tyk7mK2zV3LGnn0G9wmoVx3kho5tKx3OyvdAwCbH6BQTAXgRI78/IbIPilVHf2QdEYGVD0P32Ib2
+g9bNnKYT9ZJwVMUxWbeyF2oUymTPf5NH+oVqDT1h/iRi/TtSNW7fD8Ypl0YlS8mQu/WQ47TJ0vXi/jeQc9Aum0gHejVri+yVPnR/
+CF4fnAfPV8/LQc8j7n1n4PlH2J4GwQ/ZwWfxS3hZOMbTTLE4xssNAsKXmouv9oCDExvrCroAlg/+JctY+8H8VLwz32YRzJ85Cz/+
+6Ic0MQ0XjjeSmJ+0kEIU+kDubY6USro80s9MW+L311EiFMm7GTYk9cOXVsHuN5nk/92PtHS9uP99jVh7oF2QDqteydv7DS3t4/XB
+efB89VR4KNRv8Z2B59+qypZIjWPskFYJAsTf2PnnHbO9VsgFWzp7jeRae0AsRDjXdZkALIMfmpZH+iHnad/Oq3IicGbt+Q3C5gMw
+X8R13eGmJBSU6z+cutUHSYPuD64/kkf6neqxoZxrJ8KDAZaxe9P96PMJ9//dD92P7qfC/e9k24CvERsd5rKxhtzSj+4vu79Ke8fl
+9f1wbmTa8GAIGeVrYFK6q8/q7ww8/zbTSTMq69lh4Omb65cse2Dr6+32pe5c4Pxmd9Z5rV4wfhl1zj+PH8uH4/Ep2f1AKSWsHl0U
+xvy5K/Zk2gB4KMRwW9tIYn6SusJwoA9YzjgHaDvLI/28/d7s4K4hwtGFHYV9RgPo/e9A3p4jJO/+pfsx/+d/6bZNWoRpGtrHeaz+
+3Q/Tj17vxfP1+tHMgfLZWQaef6ZeJ7YprGAHCXspZnVGD8xbXWRMa3FBlFuO0ufgXlhuUW+Ydo0f7FrqpLllBiC4woOZ2iMM1aUm
+Evkig8Bne+xGMkMS8xPixYht/VBv+cObYiqP9DN3V57jySPCHwyHdncAXY/na3PYXtwPq7ZczLzbRkX+ZxfYmxTfRYM1/+4nW9Lv
+x5NbFTuTlnjwfA3IYt1YWDzLwPOv1Vn++ff6FWC4/qYtXaIXKLFihIk5TmjQX/OcMoed7zQjloe6/Fg+MO4edRuAunF11S1lwpg/
+f7wt6TIIEWHEBTZZSdi37t7gXFQ/xBl5XuZZK4/0Mzi8fEgpmQh/b4/dkzGA3j95e6koOYwyAP233t1sLaMi/6vhXPU6vIaG6mdc
+0KKTNkeFI6S1Gpdbl3jwfM0dPXVZPGSWgecf56WEqqj4FeDGOtPgcaEXJtnuNlZmcsIK0WAB9319oLL3fNg8Jz+UuCb8SW8agEZV
+w+6AJGFQPbbql1PtIFzwj5sc/ikB3os/D+5iGwD3jRyOMyvlkX5XZl/s73tBBBZat/ODX0s8HdvWkWe9BtD9Vrj/CX6cPSuVQ0P1
++1Smlvt0nAq//t0/utSveL7mOQd8S3OYZeD5F73ZR7zcfQW8rrLWb6zvhXouw1OHvThBo3u515d3fRBcmL/6Qy0flg+STgIagyCn
+QOG/GCyM+fOj06XKQ9Ca2VNxsFUCPlTaV8RaD8DDtv3tzsNySL9VpMTKs4FEsPv3/togej9IUPj5Q+OuAZA5diy25wUV9V8wyT9J
+MYGG6jcqVVjU30v9z/nD87Xm81fFpI2zDDz/DJo8dxntXgGtoZ/TldT6oLSPPmFozAn2b88xFYSw87hSLab6GR+WD75d9o8G0fsp
+gb9Z2+XvDcEftf1r1mVLYH5Sr/0nZwAo4qIHCkvkkH4XX4V7brtOhH925jkImPn+dWDMP1eyRzMG4bCo6qkj96mo/z71siv7hdBQ
+/SIb+/KtW6no/OE8eL7W7F24t4tzloHnn1Mb77U52grgPaGl4BPYB5WnjHcPSXHCE/d2Wy+nfvCnFfPrnuTD8mF6zyfmIAjsWpky
+cFYY82fHXRdHh8DWJpD9RbgESNpvSdwnOwieTkp6zbFySD/8fiV+HZbsNSODsJq4tuGUCRlc3ly6+CtsEGStzmgmXqGi/lM4ZLTa
+4zYN1S9Ng+x1/wsVgv/dH7fEg+frZKJep0HzDAPPP/FLXB8u/loOm9VfhrZOYPPYlNO7W0McUGa4o7G5qh+kxd1P8GnxwZ1XRwrF
+9gyBbn+c/HNrYcyfv+VWGQ1DuI/hViVvCcxPEuXfXBkEmWt8r7195ZB+O4Kp55WOELH578zaG4ZD0OtwMjJTi4z5Z9/gnoVBkLZw
+vv7AgYr6b5dc0ctvF2mofrwmq7PNKqioX3EePF9ZOt4QniXMMPD8M96T0eDxZTmcXSbCu96kH5w+GC4kfuSAH2Lp+qpKmD/JcD39
+yM8HHy9UbnBMGgKdsAgWqb3CmD8brKO9GoaWOFavjBMScIVVOnB5yyBk3p0QUjkuh/S7Z8Tc+MqYiM1/zc9bXg6h+2Ea9PdYxFsM
+QdOLRJNuMyrqv24Lj6/62PMHvH62tsrzkgVUVC/jBC+P3hdkNH+o9GqZGnrNMPD881Y8MePzejk8r/H0uJOAncesxjWHAjlAsZeS
+cevOANgauzTz9fBi+bDxZRHfMOTmrG7O2y6MzXvvo65yjEDcSsfYyj0SmJ/cZDukOQTmz2rcvm2TQ/qJpNx2+6hFxOa/7YLr2Idh
+9mr0HUNBMuafnypYMzCe8HdPSrZQUf+lGbPcMMKej+L1u1h0+oNBJhXVC+fB5w9TkZiAZ/tmGHj+qT27KW3ttRxqw8YmurkHoPax
+r9GxExxgmRyo0Dk0AN7ubZI2abzY87tYCdkzwyDRoCxyU0cYbi0SRRvsRsDVsaW8Y5MEtIXOuLx7PATq1m6HZWlySL9Nrst/SKwm
+whfnd163bYdhMMa3r/4XCfPPNZsPig9Dc2h6Z8JaKuq/oZ6wSVYjGqqf4vV7qfnJVFQvnAefPyIKLob/Vp5h4Pk301mq+tByObCe
+sjiqdWIAOM+pnzi5hQPuePwJ1TAYBEaenMrj+7xYPgj5uVZgj69+5sv7DcKYP9/zVSwcAe6pCJs0mgTmJ0f7uGeHoN7Rsrh0hRzS
+b9M5Lt0/okRs/iPMdOYPw1OJiIKyPhLmn8GJSeeH4XHPzJtfUlTUf8vuDIqHbqKh+t148nDi5isqqhfOg88fnc5GCYe5Zxh4/iVR
+uQ1K1y8HFc2SusCSAWg6km21R54Dsnec4r0fOwgzKpsPOB3nhWuvr/2qWD0C/sTHv+uVhWH46a+5G6RRiDfwG+oXlgAd9ar9NnuH
+IW3dinjuflmk3yZHvjs9bETYwHvXTpM4AkZ3Ml7kVJMw/1xB4KzH+s9HNOMRBxX13/NnhepH19JQ/R7N1yamRVBRvXAefP4gkGQz
+P/UyGXj+uTIcd+4XWA7HVqzfOkQdhHSy/ZaHi+wwJtHk0b98CF5GWHoYbebF8mH0NPnWCJyMVFIpWSWM+bPDiW+eo8A5Ej/jySKB
++cmm0ozkYWh6fZGrp1gW6bfplHB96QQBm19+NN6/NgLPzD9k/8kgQamhc+CRdSPA73LG4CmTgvpPOzFiH51IQ/XjWFRQCXlCRfXi
+nMtgM8F48PnD09T80dpiJgPPv4xxsPwwvAwe1EW8B+9BoOyJlFnWxQ7y/VsnNx8bgpqYwTdzQrzQte1gu1v/CKwas01VwXgM1ze0
+rOsYBWeb8XHXCXHMT15uFBQYAWhJ6d0dJ4v02+QgIZvYSoAnL48bDLSNwCT1fbNONAnzzw62DwEj4Ch6b69aJwX1X8snd9cxYRqq
+H4uT6Kt4LG/xelmWpDTEhZPR/JG7qBB1P4LJwPOPw0Xd3LlkGRQ+56UHdw8Cz4jjRHgBO+x6l3z0Ud4Q+A+vLlwzyoPlQ/Guuq2j
+sPbyNe8VssKY3+ga+20eg9gfdw4pdopjfiLy2sFxBAaz0zYd8JNF+rV+Yo1uLyNg88uXDB3tUfT6/JreHa58EyOgYFVO8KqkoP5r
+vOC6z4GdhuonUrvHodmXiuq1gW1zhEoYGc0fWEMcSvFlMnA/7ziabWwRswxmT7sFT8AQ3C2YiMt7xQ7XPeW+jMoPQ6ujfF5/KQ/o
+da7LWx01CnF84/5N0sKY3yRmd4WOweNv1iY7a8SB5dR1mdzKEQh4kRl06LQs0u8ph845pTQCNr/Amscho6Au/WgX92US5p/pfXY7
+R9H95nj/jct+cmedp6L69bqXvD53lYrqdbK7W/FMKBnNH0nfuOhXTjIZuJ9rfmzQPOu9DOhaA1z6z4dA4tyD3TpB7JC8887WrR7D
+AGEWz/bF82D58HzdddYxCLKNS6SIC2N+I6288ecYmLTdf6eaLw7rNcfviq8Zhbnq2TMVO2WRfvt3uem4RxKw+eXNs7H5Uei/m6i0
+aEOCux7UA9mvR0HOK7lgOoqC+m9FEVd0yBAV1S9EcyhuxJWK6oXz4POHwAaScIAhk4H7OWf8IaUDNsvgAIfZlfDfQ0C5XTo1cIUd
+eqTm34e2/vVn+tkpfx4sH3iim46MwaBb4tAQnzDmN7ciAszHwfjhzYcJqeKYn1guOt4eBZrcnazfKrJIv9SpEEOx+wRsfpHk23Zg
+DIJZSlfOGJMw/wwqFeHG1iJU0df3Kaj/8M/T4PUru305UfMUFdUL58HnjyT/lSG56kwG7ueuTU84i/WWwe363NFZy2Eo7Ey+JHGC
+HYQHbelMrRH0enaD/mVRlZwxkLM0u0DjFQaG+qzgYNo4+LEYTGW/FIfHdSVOxQOjIPThwP2nwrJIv5r26SbJKwTwf+V77dn7MRj+
+XERfr0GCCYnFjacdxkDwZfDxY1coqP92LZvWHKmgovpd2xb6OsWGiuqF8+Dzh4rWW93N8kwG7uc1qkkzLaRlkPFC6fDOzGHw7O5s
+W7BgB733tcFGT0eg8NfiB/EjPFg+9PvelBmH9VmBG/YtF8b8xuYGQ3QCeEi1ZXah4lD0fH237PYx0F0x1lbxXQbp509TjnWwJ2Dz
+C3OSKTwOodCxYjWRhPnnqdcFxWPgv5EnXdqegvqvi/Ha4UAWFdWPR1vfJdWciuqF8+DzR2dgcNkZHiYD93PtDXyfotiXwYhjSHW0
+xAgQtMptlQzYwdVLhzty7q9fuamf38kDmt175tvdxoE24Lj9F6swvKipmnnsMgE18yS56PviMHf6xd7z0WOQwrkj7mGLDNLP0PGU
+y4e9BBjXs7bZ4TwOO9/N98iuJMHud00y0tRxYK+8xlW/h4L6T6UkVEYpgYrqh3++EK8XzoPPH4E50Yz5X9MM3M+TNE/fPj3MBtLa
+HFsWLozAQubRJ/Jb2CFm1+srP/aNwkLD20Y5DR4sHz6dUG8eB2kh4wMvFoUwv9l0fLx2Apq8N49f8hbH/ISvqJJtHCJeiF9RyZZB
++sUJ+HvsBgLICn7+ElkzDocqlLxLZoiYf26753xjHDa/UuiY3UxB/Ud45cRn8oyK6jdp8OP8le1UVK+bdRtc7oSQ0fwxOdohZd82
+zcD9PCHWcodNNRvs4HJN2dswAnmB70asNrDDVxmJMdPUUbDOa2LRUeWBEHfFb3c1JmA4Ozdk43ch8NpQP0KSmARKMUGr97I45idX
+1ClHx8HMQifv/gsZpJ+deemOCEUC7GrfuO3n2gl4G7wmgqODiPlnymJZ1zh82BSukriagvrvrMrRfLI/dl58xltVP45DvOyrmptA
+RfVapSSV3Ijx4PNHjW6I9rumaQbu5wlDZxaS09jgamMn+bXaKLg/6DbVpbMDx7D34TihMZAo4DhOIvNgz++eGvc9moDje5WjeGaF
+QOqZX7SJ/iTMnHt01d1JHPOTgZdXPo2DV9wX/nxvGaTf5oADR3glCNj8Epu2++4EsB5fnaVfRoReKflzRJiAcQlD9hoRCuq/nA+7
+L/zAnq/e+Pf59wlQ84G9nOupqF54v+HzR82ZizsPNk4zcD9PUvR8wxrOBm+idj5iC1ri2fhhqnrRaQzcE1UCtsjywC8x9hztmSWe
+FLYtVm4XJsHLYcs2j+PimJ+YSX6RnQDNoz/3EU/IIP1+fn2geGg5AZtfhFe9GpmAvWr0ppvviJh/3um+FD4BJaZNkptZKKj/TvZa
+jd7A/PkvTvvxJR68XjgPPn+YSkt/b8iZZuB+bvB2+7amW2zQ6ZTJbjG5xHPC+/CWA9VLPGLOGeJGqyfB3IMnNWVaCIxOzInGxkzC
+dsaDp1kW4pif5PkpuGP1liQ+89wpg/SLlt/uGdQhD5OkXGMW6iQYWHKtEw4nwrb383trFiYg/Ja9UvwIGfWfuOBJGz5LKsj/+zzR
+BPo+BLxeZTf/jBMxHnz+wHlwP29S5W1LdGEDfh36pWSTMcQTursiJVFpHPEkNp2tOW8+CY4dhi5dQ0LQXf2mqrZ+Euo3MI7mmIpj
+frJ24XrLBPTeFDh8YZ0M0q/1x2z40w/ycOv2hRWKZpMQsorDZO8tImjlpXQ/UJqE9SvXFnk2ktH1Sj90FZ0zpf7v83+TiAev15Xf
+Qt6qwWQ0fwjIGllmJk0zcD/nKYs3Om7LBrorHw5xvlniqZDTpLD7j0Ovo/urTEkeTAfa7Rc3sXp/mliUHRQCd3Xbm7+XTcHgY3fC
+mL44xHp/Tjstg+l3x3EVQ0wG6WeUusOo7a48kCYVcw7cmISx2eUnHzgTQWfkxtngHZNwz36LQ1IpGfUX/n0r7bWlvlMakyD47wV8
+KqoXzoPPHzXM0Lfz0dMM3M8TCA9rH+9mg3NNLJbWK8cRz++R6EdWw+MgoDpHl+DkgfaY1i2f05Z4RMKkYLXaFKTrTh3z0RFH12fy
+w2p4/S9ppF+hXmGv23F5yNzfc+FGyiR0yQ4UyFkRoT3nwGf62Un0fsNI6qpX8q+Wzgu+j/Pg9UppSxdwfExemj/+x4P7+ai/2dq4
+rWwQFXOm8sOJJR6lDEGO9wYTMO+bbGi7jAcu8Tz4Od+3xJOwrHbezGYKPCT10gvWiUPTbq1VhW6T6POeuH4/ZV2XeenIw57sp8pv
+uyYhKIAlUlifCNsNf2vuDZ1Erz/tZlSJ7Gj4//G87hc+HDuJvp9Je7/06sfak+j9H3z+CCgfW6bxdJqB+/nLezce+KuzwRfnls38
+pUs8Vr4el3heLvEIuBi+o4hOgRfcXCfQJQRbT95M9gycAt8Yq1vBdHFwSp/snHg1ie5PwvUb17WMnRaVh2Gy6WCLAPbz6d2/wlUx
+HnX/a7frJtHr661/vyCKZRLx4PuT/76AiAJ/386TsV36eXz+MK2UOSF9Z5qB+7l/7+b3TapssAz03x6nTSCe0lezM8lsk4gnrnnx
+lOnWKehdk3RI+ZsQtNdsPpmQOwX3VC+Zn5ERB075l0+lmychqenvhC+N9KPJriz6MSYH3n7sL9hhCpp9OsU7pImQmKs6kvpnEr2e
+/e/7VMSWzj++j/P8f99fssSDzx84D+7nvT/1JsNWs8EG3lRCjvcSj7VAwps21UnAnux9aRbmAYA0irvLEs8FjRlS08QUPMwOWqUr
+KA4RPlZ79DmngNI6z5biL430k9Kdtj9ZJAcyU1kH152dgjV729Xk2YlweBNvY9amKZi9HWCfakX+z/kX2/F1f6fCFOJx46sZd0he
+4sHnD5wH98f02HQ1dQIb2LUQgkR7JuDVwBneeBV2mL9gc5zr6CTy65bY020vI6egcf/dMw1NQsAXHv9tmfw0WDzsdfdcIQ6ao8Ir
+XTSw6zcaLHx5Thrp1+ir5hEeLgepB1yEDodPgfyV3LvxkwT4/qLg3uDJKVC037S50QDT5+8HuE2WeLqdHwywGE+h72P6+/b9w7Yl
+Hnz+wHlwP6fYL9/5VoYNKr8UX08jTIJ1rF+eziZ2CGiTkN8QsMTjzEt+/KV2CpxJhyiqtUIQu/zoQ2WTaQhliWkOnBeDuj3lBeHH
+p0Ao/atv2H5ppF/5ayki/wU5MM5ZXXH78xQIR0UObPhGgHucbvoiIVOw/Hm5qd56MvIz/Pwfv/92ougi1g9HZ7Sv11LAAIujT1xT
+iAefP3Ae3M9xHlutq1rduybRfK2wtfqr9aclHm7XZpNFlmkgBTtlQJUQ6JwS32l5dRoefniWyTMiBiczPN3LH2Hn/eOG3ce1pJF+
+LL7lDDETOeildN54vzAFHBXeW/KKCLDqrAoLlE3BU2LgoKQ8GZ0PvL/+zNrFTcVOgcg7b92qEgqU/6HHP8L6D/c3fP7AeXA/x3kW
+ItSYvNeWePLjfQL8x5d4Ilvuc6xRmQaecYVv/mVC0FT7ecXNhGkwyaiQn2oVAzaCxobvhVOg5XroSZGcNNIvp3zlfiO6HHjceazd
+tWYaFqaPhxonESC3oT/91PwUKEcf8JzkIqPzgffX40MyR2UbpyDilQp3TTYFbOzabfIOLvHg8wfOg+cfzvOQY/j1xsQlHgtBbcN0
+2SnEo7Vle+7+I9Po/lgnTe+clG/TkL9iHRejSgxCfMfGiDNToNa94+DHZdJIPw0L78mBRVkQmzae5bGchnU1guccQwlgrh127gl9
+GsiVG1uuzJDQ+cC/X0yloE7ScMU0OO+L2emQSoGfFQ+lx24t8eDzB86D559B/2mpbDIbrHWMsLXDHi862vKQhSE7TF+cZu01XuKp
+f7lwyeveNNQUuitXZAsB53Oti+3cTHBap3OtLFsM1o9Fxe4kT4O1StfLsX4ppF/S0IKfT5MsJJovS9T0mwafMP67iT4EmIzcq1Cw
+fxrSTVic93SQ0Pn4+22Obp8oULr6dp3r+mn4+PjW0y+vKBC0bke9RPoSDz5/4Dx4/uF+XVy/XzaQZwpGIxXnzh9gB7/2uEx+9yWe
+03zvVBOzp6Gbmjn+I1UIIlZMKXNrMaH11fXL2QliULnX4sjlPdNQr8ZwTiuXQvrNBFcH96fIwvZPGcdtM6Yhyy3TpsaJAH5c3D3j
+PtOws7aYa3U5CeXvVYVS7fw0ClgHMO5EHJuGkQGJ54QICig+Zb27dWCJB58/cB48/3AePA/w10Mo2464bHo9BT439l4LleeB5edP
+DDePToO2du7qTwlCoHX65eCGE0zISVNz9w4RA9tMAYmY69OwVSNM+1qiFNJvOqhZIdlfFjqpTvIBg9Ow+7fnz1hLApCcckOl3k+D
+b+K5DqP3JJS/2/XpP07GUGD++6xeZdA0NN3oXPX1EQUKFz9scxKbhtbBTYmmQWTEj/Pg+Yfz4HmA82S9FlW0b5kCbV0nNRUFHnj2
+TT5qhQwT6jjud0rFCEFdndWLo8FMaIm6s/KWrxgsEEpqapKm0ecFcf1m/HuyrhyXhUv+tKaP4kzYRj1mtm47ATIbL5ht752Gy417
+NzY+J6H8/ZyYvfHqA6y/rBIW5vKmwchvY3ymPwUOHXf8E7ptGn2eFufHefD8C8uwjl63ng3lQbA/LSvpCDuYCVX2BnFNIx513UZL
+1R1MsP6jFScTKgQnN4pY3C1hQso3KfnZc2Lw8ObV2wsd09B/K2Cf23kppJ+6dlp5K8iCALM1YGA7E769XD3KqUqAPZuVeJ2FmZD0
+7g/fvB8J5S/f0Tt/5j0poFBo8548heVBhcx3qhcFZiopH0pcl3hwfpwHz79czbJzsIkN5QFcIFwfsWeH0UteYTmaSzxVcf4iVm5M
+WNXgv2BxXwjYIsqFMr4zoZC561O4pRisHVfTXcXPBJGv1OgEcymkn7p67qGXUrIQd/CBofAFJqR2pC+elyHAcFRPUZguppd6UWzV
+edLS/FRKZKw8S4F8BUnHXQQmFMi8+eV8iQL31L6dZUZNg4vj74UtAWTEj/Pg+WdPKlC/oseG8sD9eZXiGxd28O3Q3D9sv8RznF/v
+861XTPR5wRD26xW91BkwfsG0l94qBsVmwz/36jDhVssNx/PaUki/P7soNhu+ywDkGrIxYpgwnHWs4QkHAby5QzzKzjHBXdjJfdKa
+hPL3URHt1qQlBSwCq2lXdjGB73CAfvsZCtBCAlfJf5lG37+D8+M8eP7hz3/wPGDhtqa0uLKD3PYJPrEnSzx/zv/wSW1iQqKXSszX
+i0Kw/oyGt8C+GWg0eSIQrCgGhz9GvLt2hgmuLqZbBOWlkH6w+P3s4xoZaKGxfDxZzwTvob5arn55kDlnqjEbwYR9OxbvWxmTUP42
+XpwxPm1Igek5n45YDyZ0cK24c8GWAjksBl1GbEzEg/PjPHj+4Z9/xvMA50lLiCnZUrzEE9z6VqeTYwYSNq7y3XNSCJv3xrS1vWdA
+Tt95s4eIGHwnHjj9+hnmDy/uyHiySCH9vBPLrs7Fy4Dz3TSXx8tmQP3g8h89WfKQ+pV9klDDhHOaB+SPapJQ/q6XEjVnV6eA/2Ht
+4Lo3TPT5jf32f55eUF3iwflxHjz/9nLfe1x7kA3lAc5jInzI88zsEo+K3vG5lRozMBwz2H3MSgib96Jn7d/NQOyMaP/PBVEIuMVL
+/VrBBC+f+y4+3ZJIv7p1n9xSbsoA98xpxfx1M6DgMRJq9lAejHWy44wXmeBPfZtoSyGh/H2QteFYBIkClKJp0z+tTPj5/ZCUmykF
+xj+n7om0XuLB+XEePP9GDXWvmluxoTyQSY1hu3eZHQYvC218SmGi/Cl9JZOkcXwGol+KGxjsEsLmPYvEB90zoBKZce9inyismiho
+Y/vFBMUTD8r9CiWRfuZPLJbH28hApAW5b+zoDLSMcRWsPSUP/dEuRy+tnYGXQhw6DgIklL+PMrQSfPgpkLXmFZcCD8ZvMCZfsp0C
+t9afWll1f4kH58d58PyL4DyiOmbPhvKgMOx5Sel1dvDsLJ0q3MtE84G1wBeHY49moFe4KfqgrhA85hC0/yQ4C4luWgYhFaKQu8/t
+8VqFGQh6UhXzI0YS6UdIzuHS1JEB7bzmMMnAGRAqzejaoCcPHisVpKKtZsDWQm/lhwUiyl9T1ouX63+RwSzoSP6+TTNw4OlVqshm
+CvIjnAfn99zho746aJqB519C23WC/kk2lAc4j4T+tfhJryWe+Qu3ifcLZ4DkGcx6aoMQNu+VyI/ALCjs/cianSwK5lkquywOzkCq
+wJYVdb6SSL/BchJ/saQM1NMD9m/LnYF8jSZOASl5EHPurKv2nwHtoDo5yiAR5S+v4bvt5EEyjM+LXrl+cgb6768eE1WjQGaZi+eF
+Sia6fw7nZ5xrECdlTjPw/Dt9Lq9gw0U2lAc4T9KbDcdkUpZ4gtoYLZnMGTATVz9Loglh897VJjGnWehc2a0v81gUJkkDHL63ZuBx
+/fCgsL0k0m/m6a6A4VlpOH1vO/+5iRn4KXiLLj4tB4lNj+/8+jgDoeuZq3PqiSh/+zx1LQK+kMH3SKXam6cz4OrbkCq+mgIEM8nR
+F/NM9HwO58dfH8XzD+fB84ClZKeL3112MBAZlTboYoK5cmm+mhgP9vzue1A/aRa2/uA+qicmhM176wN1n8+CjHKIT9wVUfC7HZab
+/GEG0ndaGYzqSyL98O9DXz67UPJMbhZcX7Dkp5bLgQFj51b6yAx8IO7IyMslovzdSj5mp5BLBrlir9Gm0hmI+mqXaSuP+cGVBvd8
+yRmkD86P8+D5F1xk7BnmyYbywFu14+SHe+zQ7RZZ7yIwg17fyY9P2CG0ZxbWf+vYY8suBPMvhg0dq2axufC2fri1KJAm915u65+B
+fYd0kp7QJZF+QZFaftZvpSHc8p1n6c5ZsC8esKVGykFnzLLfe6RmweXETV+BN0TQ3fd/qjv3aKj2v48zLmHcxnWM25ghlJDQTflU
+SLlUuohUpIuSciuSS5KSSxS6qFSUopKQ5ChClHQRStLFnY5KmJk905Fnn/M836+1fq1nnfVbzzq/tR7/7D/Mms9+7fdnf97v757Z
+ewrtFxSPwB5VQeaNIjaUGM2+IkqQ89GAW3FbmZwP2cdluuaMYn0QP+JB/mckJrxN9xAF+wHiCetYm3TBeoLHneYtOj+aA1sDIyrV
+eTRIkbhEyRjjgDR1n2SarTKUrZEyk1ThgCWzP/XtJDWs37mAbdTYBHWwrNo+ezScA5kXT8UYhWlBqHTZncglHPjyQ/Dm8Wkd+HrM
+zjKxcwRfX3RO/bbeVJ8DlLDDj35Syfn21ClTxGOCB+UPxIP8r0Gt1UosnoL9APEo2MvZPd01wTMaonZ/ewEH3Fe5FFr10cBwt+tv
+j4y4ILrP5+nRKcrgcr/ys7ktB1S6j4eo99OxftcgLTF3mzo8N2AOa9/gwOuwxVkzXLRAPsh/V14oB/IWzbyiGqsDf54ed2Un9ref
+f0XFYw0Hvio7L7sjrIvnv3vNXa1jCWycPxAP8j/Cz5u/M5WC/QDx5OU/+sk9Pwod7b6+BT+pkPjhxZ70jxyIVHlmmtFCg4ctMsHf
+13HBrG5MrVxGGQbZIdmewRwgrs5dt/4xHeuHngezNfl1nsM7Us/VvMo5U7Tg2tvJ+q+vcuCRabK5eoAOMBdcM2s1mTg/Dnh6vDgS
+y8H316D5X7a96dNCkgflD8SD/A99noX8APHYKIffZT0bhRTJ0I45X6nk+u6w8UNZLsyh/5EeWUcj816NkWYCF7Q86wddh5TgUPw0
+j8RsDjB08sssculYP0paidRRpjqMcxK9Q6S4UH9m1ptdIlqwEN5/FH7DwdfnUT+h66X0OoW4omIOOJbucl/2lY3nP+JB+QPxIP9z
+XOAa05lNwX6AeNr3m/k7/0HOy41mIkcGqOT6zqpvcB4X1oit0jtYRIPvWWE99mVckOafrBh5pQQa37uUSl9xQNDtmhlylI71c6Hf
+mGQzxoDTHos0smdzwcbwdoB0uya05aSenibOhXUF7spv7HVw/cg5JnUObmwomPYEPnZx4MGDundmPWw8/xEP6j/Eg/zPv7Ji+VAe
+BfsB4gnu7DcIm8rBPKsVRi7Q/bhQfDXYVOMiDY5KTs8MHiD1WmwkO7lECYpcM551CXPx90mRfh59rXE+bxlgUs1vfu7DhfJSQ+m8
+Yk0IkFm6ws2CC3TiZKeehQ6uXzX4R0KdHRuWpkXxpRS5cN09ectAGxvPf5k5DUXn4yb6T36nfX9w97A18j+DqHbR2DsU7AeIR3rJ
+hY4r7hxY9emJxb5OKnwNzV1rc44LJ4snz+hKopF5r2/NRToPfNIfeqw9owTOD5YflpvOBXhjtd7AgY71u+n7PJZdwoA6w4IkwSku
+WNhn5SxO0gTJYCGp2M1caLFuuhWso4PraydrnvKawYZOgUWh5UIuaHr19zY0svH8R8/vRf3nuUMtJmV42Br530uf108q7lOwHyCe
+y7dWZzQe5UBolk3x65dUiP24keb/lAuFlyKrevfRyLx3Xq5hMQ8SZc3LTcOUoE93kvVcTy586NF81DSFjvUTfKs++OEEAzambLWb
+XMeFgjeMBT1bNOFyW0lVQSrJG7KpukNaB9dnJrI+2THZEOY1uGNTABckx275x9Sx8fxHPKj/EA/yv9G++aee1VCwHyCe+SrSK8dK
+ybwys6g89wUVNO1U6s8KuMBQqypv86HB6nmrHvP28qDc44mU93oliEq4z9uaTJ7/G1N0b1DpWD/xiiERkd0MMvdrjK/gcmGnhoer
+mrUmzFvgt7+9igtURszz/Xwmrt/etOFmujSbzK1Z7GMXubBfRHJ46wM2nv+IB/Uf4kH+p7Tt6uZ3TynYDxDP6/AqqmE/+f5Jfh84
+9VS4c6PhYJ0hDwrPxq26vZIGg9lS0ewcHrASRHsb5yuB6nBQwYkHXPjEmiPx9XdVrJ/CMc1YfQcGpK5vuhuhxwMDr/N+TnRNaLnK
+NpcY5kLsDa62eQ8T19c+bBRIE7DgurFb+70XXPC58HK/ZjEbz3/Eg/oP8SD/K9ofOae8kYL9APHs6gqtWaXKhfCeNVsml1JhuWLM
+3JG1PHge96mr2JpG5r2Hs5e18MBGNMQ2T1sJ8tdO2f7gCxeswl1GKU9VsX6eCooHO/UZMLXmqH/uKh5cHlKW+H1IA/xk2wZn6PDg
+0hnnWzMbmbi+1yyBZVIfC2zS5dJ7fpL6CMnOdbzOxvMf8aD+QzzI/zy2hI5z31KwHyAe8aUmEQfsuOAvb7634Q4VBvbNHtWK4wFz
+zYfxUUMamfdChsNECfjaF3bulrASLK74pPNZgwdt8TM88vNUsX75JyWizosyoHoKGLbEkHwWrlra9RoguiflysblPNjQER9++D4T
+199kMR4V2MzC72d13EWfeYWN5z/iQf2HeJD/Bck9eJ/3gYL9APFcLOixuLGHC0YK3u8KrlIh+tO3G0vv8iCQ3a5uoUQj89606zkz
+CHy/1ie9U23KjjwodX5vPRSvivUr22IhVPVJDdyPczuEinigEXbafGW2Bpx/Z7chIYoH+553UuNzmbi+l5noE9eHLNj01/0xPJzn
+0PxHPKj/EA/yP4llgTXTOynYDxDPLNVzX99c5sJQf7HJt7NUcn2Xs2VvLw+WrvM1yRqXB+f53d6vNhFQZvPdJalGEUITnVIX7OeB
+0jXOVLEdqli/WvNN0b3lajDCu5Fh1EnyBGfVakZogOXCMZW7+TwY8VyzfmE6E9cXif+yLC6fBSa6EqvFd/JwnkPzH/Gg/kM8yP/M
+s8cOnPmdgv0A8byMcLkq0syFq5+70pqSqOT6zkMrS5kA96CLLxwG5Mm8l6Hx8zipj8RZyxeXFUF+RMTRL48HBSWvUwuWqGL90PO7
+Ejd4r1xLI6C1tKt9xRoNeH6t6EXne/L1105MOR7NxPW9jGTXsc6y4GT+zcrppyd40PzfJ1B9phI70X+IB/lfuUxyaO0gBfsB4vHp
+lvA0EeGB70OLAdpBKixRUnzzzIaAG5D5e0KTPJn3VrQYPiQgvMGGQYtVhOtuZaJn3vJg4VCaNEVfFetXUDer13GfGug+UpM+BASc
+HNMdiTXRgK1yO+JkZQh4mv75XpofE9cXOcTrcIljwc9ZK43W1/BwPm1tHK2UludB64UZyU8PTfQf4kH+R1jO040jKNgPEI+wQwV9
+nRkP0mIKtu32p5LruyfJ/CACQrOl5C+Uy5N5a9Kx1UMEpPqnxSd7K8LCSv/7NRIEnFtyk1ARV8X6lZ/csi1gtRqUT31Zc2s3ycMz
+jl0uqQHCe5kL5lgRYGuwgerkxsT1PSfTvwwGs8C7mjgVN8TD+dT4zwcYmk/wof5LTq0zdvk5bI38D/EgP0DXqzJu72k87MUDN3dK
++c3NVHJ9F2Wvl00Ad3/Ck4dZ8lDQet8uWpsPrDwXkQ5QhLbJ+nuHZhJQ/OUPn/RuFazf4y0n+tOnq4HricMR7zIJ0PCol7XvVofT
+7a/5W3wJuFwfqdJny8T1//t+NBY0kHG7WIPAPGg+IB7Uf+j7o8j/0hyUBD4/KdgP0PXE6XSj+MIUMp8FzvRwdaaS6ztL4RWvCMg3
+L5TTOSJP5q3g8RvOfPx9+cCk98Ya2wiw0/+to/ehCtYvJYr7hS2jBl8JK8tJzwnYQD2vkftAHUwXJRUezyAguy5mY4MZE9dHz7P4
+8+PH5nkTPI//+j2KCR6UPxAP8r/S+vC6vWIi2A8Qz5PIzoUfKnggUc/sOjKXCjfzB++FC/Mh41lkZ/l2efh4ZUppawQfit8zZMd4
+CiA1mtq3+CQBadcLPlzKVMH6nXNm77YfoMPhjSNfzcYImKwnzJqZoQ6Pcxf53n9C6lMTd+22NhPXt53WHB1pxYKt51X0OBsIfP+g
+Ke3UWavsCR6UPxAP8ivEg/xgMyfOmb9LHLx6Tv+Q/MaDi459YRsmU8n1XXbgNVM+WLZvXOqzRB5CpDv8RW/yIZIXqZjQpACX3Zde
+DHpEQKdJzjuP/SpYv8+v6DtFaumgVZt7dYMRH8xGp2Wv26sOnvIC9gBBnj8agSad0kxc327K23pvQxa4+NwZen2AgF3a47uPeJA8
+P/U6A9smeHD+uKcq7zB5xBr73//wID9QYqXXxGwQhz8clhVbaBEw68VNBQsalVzfuU1t3siH5s9QqGgoD3JBpwxN2/ngr7G15Eee
+Alg9FHK7MErmhZ+vPKJdVbB+3Eu2X/Sz6FBi5OkZv44PpWufGK1coQ6CvQXtSgZ8sIvQ20MMa+P66PdEfn/um0spIPDztE//uYAV
+JzAPyh+IB/kf4kF+4OEdKv9tpTikF4r5eTkR+HkVwZ1y3ePHyH4TvXL3kqg85L116lxHFZD5/tD7lmgFaNa/S3vK5oPg2fj7KzNU
+sH7h4h17tSPosDxVRa0kng/i7x8Yyhqrw4n3W9PBlQ9xRsRBt2fauP4KvphjnBgLYixYm4w/EjD3oG9ahi0bxhQC7j0xm+BB+UOI
+Jnxqv+KINfI/xIP8AH3/YJpauV5SOAHs64knme+kyPVd7bmpD/jw2EohbGOlHCwC0bNH5gjgmF1bnNpaBdh5zK+e68IHexdOm6e8
+CtavPv51UJsbHfr5DY0d9/jQ9tRWi0tVhyk2ms47D/Oh4V19StlVbVxfTWWLxPRRHVA/18pwl+XDjqYfZ/rmsvE8HCjz7k2OZuP8
+gc4f5H/0kivf08cp2A/0ItqVI0zE4VFU4IfS6wTEva0LSC6Xgpxb4atdv/Ah6/b9l7075eBdTtnKou0CMO9oqTxjpADiHHYM6yDJ
+4zi+c+pnZayf7Jzc6LnmdDjgGRMvM8CHgrIGhQ8DDKjKaxI/fYfUhyl99esBbVy/dmFA5G9dOlBESW6KnceHRlEzowBTNp6HiAfl
+D8SD/A/5D+Jvzu1PmKQtDh69Bqe628h+KwpJOZkmRa7vZsjGaAiA+O2NyQK6HATJBEh/PC2AxO89SYY/aZC5rm2u820+xP9oDEus
+Ucb6eTzIjOTK04FeN3vRbLoADuWunFRbxwAPWnxFdTfJw1CZfc9dG9d/pXSmRPBKBxy22ybe3smH9HcxB27psvE8RDwofyAe5H8o
+vyH+BtVWpzERceA4flwmL8WHYPbJu/6+UuT6bqA230EAd24z7pXdl4VeXWNBZbUAumsIubnNNLCsShnd94kPz/Mux33JVMb6ZfoF
+JLqS67vCaUM/Ni8WwDmn7BCbHAaMhkDoN0UB/r0hVH/zCpferdU60P3ih837s3zI3Ja5/JAaG89DxIPyB+JB/nfBe0mGQj8F81up
+W9Jr+8TgWFG6hNVsPozON2R1zZIi13cXotrCBLB8THXzgQ2yIPTXHxGFts8MFt+8IieA+G89mTqhylg/3VfSKstqVWFpWk5xyl4B
+hNOc1h0+zICED1xT9UUCqK8ebu2W1cb1286Xvigu1oFwy8Ixiad82DR/6HKVDBvPQ3vPqGs2JA/KH4gH+R9azyF+ean70vmPxGAy
+w/HhNh8+tNr2lJDRFySWrpklnieAzZJeBhU/ZH7h2ZI8tqVxvgDmbBSt/eGsDNRg/UdSjwUQuIaiKJWtCh0CD7/yKwJgMI2rp29l
+ANv25oBdIHl+BT3qtR3QwvW/24jwnHJ0QOm8T4m5gA++9VJ7TlHYeB7yW1LnrYpk4/yBeJD/hbi8PCZ4RMH8NfvezYg7JwYPDlDC
+Uk/xodLxkoP4Y0lYo8BYl/lSAKUvu45W5/zKI8Qt0hrzE8Dgc9aXFj3lX/6fqX45z6ReAFnPGn3znRnw23XvrMBLpD53xcf2VWnh
++o6XVDIiTuvALRHt3Z6GAkiyC02I57LwPEQ8KH8UKJj+sVFsxBr53+iUFfaaNyiYv7mZFRvtJwZufaVmFbWkX443sk0PS/66//+y
+PeOx443BeQF8GpFMsRtT+tvXT69mpqxqIM+vnKTvXhe1cH0jn9/M2xJ0wG5Hi37iWgEUVvVcivjMwvMQ8aD8gdYLyP+avwqmbkyk
+YP6XsbpE7WwxGHLa/ftnDh+EZmQYO877ex50/D/saG8Ka/l7nn/dovrLug0cnkXpwIeXCZ/uHhGA6qi6+aSPLDwPEQ/KH4gH+Z9B
+0JABYzsF809jLUufKiQGccV6l1X0yP4J9wmeNijxb+/fv7vFx79e3+1LsA7snbnwTFeJACrbGAv1m1l4HiIelD+gsuly+5dha+R/
+j2UGPTPmUTD/p+Yov9UPRIGp3u6xcJUAChY/HxRK++d5UH0DjdINc3x1QE4yhSrzRgDuOQPEwQYWnofBvhQ7/Qg2zh/ofibkfx4/
+L5VtlaFg/iAJ+9CAPaJQFn1CeVeMAHpeRUU6zfrneVB9os4o65WXzi/10DyU+F6dRt/PxvkD8SD/u5fR4Pq0SRjzN/cdqtVji4JL
+v/3zM4UCaDWP2dz6ctI/zoPqD81SVe9y+5UHzUPEg/LHRbXBlO8Nw9bI/0bvHtNnpQpjP7h2RMZ45TMRPJ/R8yr+aR5Uf7dSagJz
+5a88yM+mfglqPEbyoPyBPv9B/nc6/Zz8sLMw9oN2hYqKCwEi//j+/2/HX+nOoemvnX7l+dft7lCJ2vajEzzI/2ja2vPchYUB+YGH
+cfkLXfp/ngcd/59Or5eHLvl7nrmTfELMr5Hz76/f5x62Rv43mFqf2nFT6D++//9n/j8voD6Z4KlsMTcJqRCA0PaPHw13/P/j+S9Q
+SwECLQMtAAAACAAAACEAveGsFm0AAADoAAAACgAAAAAAAAAAAAAAgAEAAAAAYW5nbGVzLm5weVBLAQItAy0AAAAIAAAAIQA+V9Qn
+K1gAABCAAAAJAAAAAAAAAAAAAACAAakAAAB0YWJsZS5ucHlQSwUGAAAAAAIAAgBvAAAAD1kAAAAA
 """
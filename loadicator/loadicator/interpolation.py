@@ -3,8 +3,28 @@ Interpolation Module for MV Del Monte Loadicator
 Provides linear and 2D interpolation functions for hydrostatic and KN data
 """
 
+from functools import cached_property
+
 import numpy as np
-from scipy.interpolate import interp1d, interp2d
+
+
+# Hydrostatic properties returned by get_all_hydrostatic_properties
+HYDROSTATIC_PROPERTIES = ['Displacement', 'TPC', 'MTC', 'LCB', 'LCF', 'KB', 'TKM']
+
+# Standard GZ curve heel angles, in radians and their sines, computed once
+DEFAULT_HEEL_ANGLES = np.arange(0, 95, 5)
+_DEFAULT_HEEL_RAD = np.radians(DEFAULT_HEEL_ANGLES)
+_DEFAULT_SIN_HEEL = np.sin(_DEFAULT_HEEL_RAD)
+
+# Trapezoidal integration (trapezoid for NumPy 2.0+, trapz for older versions)
+_trapezoid = getattr(np, 'trapezoid', None) or np.trapz
+
+
+def _interp_rows(x, xp, table):
+    """Linearly interpolate the rows of table (one row per sorted xp value) at x"""
+    idx = min(max(int(np.searchsorted(xp, x)), 1), len(xp) - 1)
+    t = (x - xp[idx - 1]) / (xp[idx] - xp[idx - 1])
+    return table[idx - 1] + t * (table[idx] - table[idx - 1])
 
 
 class Interpolator:
@@ -21,6 +41,28 @@ class Interpolator:
         self.hydrostatic_data = data_loader.hydrostatic_data
         self.kn_curves = data_loader.kn_curves
         
+        # Float64 arrays of every hydrostatic column; the loader already keeps
+        # contiguous copies of Draft, Displacement, KB and TKM, so reuse those
+        if self.hydrostatic_data is not None:
+            self._props = {
+                col: np.ascontiguousarray(self.hydrostatic_data[col].values, dtype=np.float64)
+                for col in self.hydrostatic_data.columns
+                if col not in ('Draft', 'Displacement', 'KB', 'TKM')
+            }
+            self._props.update({
+                'Draft': data_loader.draft_arr,
+                'Displacement': data_loader.disp_arr,
+                'KB': data_loader.kb_arr,
+                'TKM': data_loader.tkm_arr
+            })
+            self._drafts = self._props['Draft']
+            self._draft_min, self._draft_max = float(self._drafts[0]), float(self._drafts[-1])
+            
+            # Same properties as one (n_drafts, n_properties) matrix, so all of
+            # them are interpolated with a single bracket search
+            self._hydro_cols = [col for col in HYDROSTATIC_PROPERTIES if col in self._props]
+            self._hydro_mat = np.column_stack([self._props[col] for col in self._hydro_cols])
+        
     def interpolate_hydrostatic(self, draft, property_name):
         """
         Interpolate hydrostatic property at given draft
@@ -35,15 +77,15 @@ class Interpolator:
         if self.hydrostatic_data is None:
             raise ValueError("Hydrostatic data not loaded")
         
-        if property_name not in self.hydrostatic_data.columns:
+        if property_name not in self._props:
             raise ValueError(f"Property '{property_name}' not found in hydrostatic data")
         
         # Get draft and property arrays
-        drafts = self.hydrostatic_data['Draft'].values
-        properties = self.hydrostatic_data[property_name].values
+        drafts = self._drafts
+        properties = self._props[property_name]
         
         # Check if draft is within range
-        draft_min, draft_max = drafts.min(), drafts.max()
+        draft_min, draft_max = self._draft_min, self._draft_max
         if draft < draft_min or draft > draft_max:
             raise ValueError(f"Draft {draft:.2f}m is outside valid range [{draft_min:.2f}m, {draft_max:.2f}m]")
         
@@ -67,11 +109,12 @@ class Interpolator:
         if self.kn_curves is None:
             raise ValueError("KN curves not loaded")
         
-        # Get available heel angles
-        available_angles = sorted(self.kn_curves.keys())
+        # KN grid: sorted angles, common displacement axis, one KN row per angle
+        loader = self.data_loader
+        angles, disps, kn_matrix = loader.kn_angles, loader.kn_disps, loader.kn_matrix
         
         # Check if heel angle is within range
-        angle_min, angle_max = min(available_angles), max(available_angles)
+        angle_max = angles[-1]
         if heel_angle < 0 or heel_angle > angle_max:
             raise ValueError(f"Heel angle {heel_angle:.1f}° is outside valid range [0°, {angle_max:.1f}°]")
         
@@ -79,52 +122,30 @@ class Interpolator:
         if heel_angle == 0:
             return 0.0
         
-        # Find the two closest heel angles
-        if heel_angle in available_angles:
-            # Exact match - interpolate only in displacement
-            df = self.kn_curves[heel_angle]
-            displacements = df['Displacement'].values
-            kn_values = df['KN'].values
-            
-            # Check displacement range
-            disp_min, disp_max = displacements.min(), displacements.max()
-            if displacement < disp_min or displacement > disp_max:
-                raise ValueError(f"Displacement {displacement:.0f}t is outside valid range [{disp_min:.0f}t, {disp_max:.0f}t]")
-            
-            kn = np.interp(displacement, displacements, kn_values)
-            return kn
+        # Find the two closest heel angles (lower == upper on an exact match)
+        upper = int(np.searchsorted(angles, heel_angle))
+        lower = upper if angles[upper] == heel_angle else upper - 1
+        if lower < 0:
+            raise ValueError(f"Heel angle {heel_angle:.1f}° is below the lowest tabulated angle {angles[0]:.1f}°")
         
-        else:
-            # Need to interpolate between two heel angles
-            # Find bounding angles
-            lower_angle = max([a for a in available_angles if a < heel_angle])
-            upper_angle = min([a for a in available_angles if a > heel_angle])
-            
-            # Get KN values at both angles
-            df_lower = self.kn_curves[lower_angle]
-            df_upper = self.kn_curves[upper_angle]
-            
-            displacements_lower = df_lower['Displacement'].values
-            kn_lower_values = df_lower['KN'].values
-            
-            displacements_upper = df_upper['Displacement'].values
-            kn_upper_values = df_upper['KN'].values
-            
-            # Check displacement range (use the more restrictive range)
-            disp_min = max(displacements_lower.min(), displacements_upper.min())
-            disp_max = min(displacements_lower.max(), displacements_upper.max())
-            
-            if displacement < disp_min or displacement > disp_max:
-                raise ValueError(f"Displacement {displacement:.0f}t is outside valid range [{disp_min:.0f}t, {disp_max:.0f}t]")
-            
-            # Interpolate KN at both angles for the given displacement
-            kn_lower = np.interp(displacement, displacements_lower, kn_lower_values)
-            kn_upper = np.interp(displacement, displacements_upper, kn_upper_values)
-            
-            # Linear interpolation between the two angles
-            kn = kn_lower + (heel_angle - lower_angle) * (kn_upper - kn_lower) / (upper_angle - lower_angle)
-            
-            return kn
+        # Check displacement range (use the more restrictive range)
+        disp_min = max(loader.kn_disp_min[lower], loader.kn_disp_min[upper])
+        disp_max = min(loader.kn_disp_max[lower], loader.kn_disp_max[upper])
+        
+        if displacement < disp_min or displacement > disp_max:
+            raise ValueError(f"Displacement {displacement:.0f}t is outside valid range [{disp_min:.0f}t, {disp_max:.0f}t]")
+        
+        # Exact match - interpolate only in displacement
+        kn_lower = np.interp(displacement, disps, kn_matrix[lower])
+        if upper == lower:
+            return kn_lower
+        
+        # Interpolate KN at the upper angle, then linearly between the two angles
+        kn_upper = np.interp(displacement, disps, kn_matrix[upper])
+        lower_angle, upper_angle = angles[lower], angles[upper]
+        kn = kn_lower + (heel_angle - lower_angle) * (kn_upper - kn_lower) / (upper_angle - lower_angle)
+        
+        return kn
     
     def get_all_hydrostatic_properties(self, draft):
         """
@@ -136,14 +157,19 @@ class Interpolator:
         Returns:
             Dictionary with all hydrostatic properties
         """
-        properties = {}
+        if self.hydrostatic_data is None:
+            raise ValueError("Hydrostatic data not loaded")
         
-        # List of properties to interpolate
-        property_names = ['Displacement', 'TPC', 'MTC', 'LCB', 'LCF', 'KB', 'TKM']
+        # Check if draft is within range
+        drafts = self._drafts
+        draft_min, draft_max = self._draft_min, self._draft_max
+        if draft < draft_min or draft > draft_max:
+            raise ValueError(f"Draft {draft:.2f}m is outside valid range [{draft_min:.2f}m, {draft_max:.2f}m]")
         
-        for prop in property_names:
-            if prop in self.hydrostatic_data.columns:
-                properties[prop] = self.interpolate_hydrostatic(draft, prop)
+        # Linear interpolation of every property row at once
+        row = _interp_rows(draft, drafts, self._hydro_mat)
+        
+        properties = dict(zip(self._hydro_cols, row))
         
         # Calculate KM
         if 'KB' in properties and 'TKM' in properties:
@@ -161,53 +187,156 @@ class Interpolator:
             heel_angles: List of heel angles to calculate (default: 0 to 90 in 5° increments)
             
         Returns:
-            Dictionary with heel angles and corresponding GZ values
+            Dictionary with heel angles and corresponding GZ/KN values (NumPy arrays)
         """
-        if heel_angles is None:
-            # Default heel angles: 0, 5, 10, 15, ..., 90
-            heel_angles = list(range(0, 95, 5))
+        gz_curve = self.calculate_gz_curves_batch(draft, [kg], heel_angles)
+        gz_curve['gz_values'] = gz_curve['gz_values'][0]
+        gz_curve['kg'] = kg
+        gz_curve['gm'] = gz_curve['gm'][0]
         
-        # Get displacement at this draft
-        displacement = self.interpolate_hydrostatic(draft, 'Displacement')
+        return gz_curve
+    
+    def calculate_gz_curves_batch(self, draft, kg_array, heel_angles=None):
+        """
+        Calculate GZ curves for one draft and several KG values
         
-        # Get hydrostatic properties
+        KN does not depend on KG, so the interpolation runs once and
+        GZ = KN - KG * sin(θ) is broadcast over all KG values.
+        
+        Args:
+            draft: Draft in meters
+            kg_array: Sequence of vertical centers of gravity (KG) in meters
+            heel_angles: List of heel angles to calculate (default: 0 to 90 in 5° increments)
+            
+        Returns:
+            Dictionary like calculate_gz_curve, with 'gz_values' shaped
+            (len(kg_array), n_angles) and 'kg'/'gm' as arrays, one entry per KG
+        """
+        # Get hydrostatic properties (including displacement) in one pass; this
+        # also validates the data and draft before any cached KN table is built
         properties = self.get_all_hydrostatic_properties(draft)
+        displacement = properties['Displacement']
+        
+        if self.kn_curves is None:
+            raise ValueError("KN curves not loaded")
+        
+        kgs = np.atleast_1d(np.asarray(kg_array, dtype=np.float64))
+        
+        if heel_angles is None:
+            # Default heel angles: 0, 5, 10, 15, ..., 90 (sines and brackets are tabulated)
+            heel_angles = DEFAULT_HEEL_ANGLES
+            angles_rad = _DEFAULT_HEEL_RAD
+            sin_heel = _DEFAULT_SIN_HEEL
+            angles, lower, upper, bracketed = self._default_brackets
+            kn_table = self._kn_draft_table
+        else:
+            angles, lower, upper, bracketed = self._angle_brackets(heel_angles)
+            angles_rad = np.radians(angles)
+            sin_heel = np.sin(angles_rad)
+            kn_table = None
         
         # Calculate GM
         km = properties['KM']
-        gm = km - kg
-        
-        # Calculate GZ for each heel angle
-        gz_curve = {
-            'heel_angles': [],
-            'gz_values': [],
-            'kn_values': [],
+        gm = km - kgs
+        
+        # Same validity rules as interpolate_kn: angles outside the data range,
+        # or displacements outside the bracketing curves, are skipped
+        disp_ok = (displacement >= self.data_loader.kn_disp_min) & (displacement <= self.data_loader.kn_disp_max)
+        valid = (angles == 0) | (bracketed & disp_ok[lower] & disp_ok[upper])
+        
+        # KN at this draft for every heel angle: read from the draft table for the
+        # default angles, else one grid lookup and linear interpolation between
+        # tabulated angles; KN = 0 when upright
+        if kn_table is not None:
+            kn_all = _interp_rows(draft, *kn_table)
+        else:
+            kn_row = self.data_loader.get_kn_row(displacement)
+            kn_all = np.interp(angles, self.data_loader.kn_angles, kn_row)
+        kn_values = np.where(angles == 0, 0.0, kn_all)[valid]
+        
+        # Calculate GZ = KN - KG * sin(θ), one row per KG
+        gz_values = kn_values[None, :] - kgs[:, None] * sin_heel[valid][None, :]
+        
+        gz_curves = {
+            'heel_angles': np.asarray(heel_angles)[valid],
+            'heel_angles_rad': angles_rad[valid],
+            'gz_values': gz_values,
+            'kn_values': kn_values,
             'displacement': displacement,
-            'kg': kg,
+            'kg': kgs,
             'km': km,
             'gm': gm,
             'kb': properties['KB']
         }
         
-        for angle in heel_angles:
-            # Get KN value
-            if angle == 0:
-                kn = 0.0
-            else:
-                try:
-                    kn = self.interpolate_kn(displacement, angle)
-                except ValueError:
-                    # If angle is outside range, skip it
-                    continue
-            
-            # Calculate GZ = KN - KG * sin(θ)
-            gz = kn - kg * np.sin(np.radians(angle))
+        return gz_curves
+    
+    @cached_property
+    def _default_brackets(self):
+        """KN grid brackets for the default heel angles (depend only on the data)"""
+        if self.kn_curves is None:
+            raise ValueError("KN curves not loaded")
+        return self._angle_brackets(DEFAULT_HEEL_ANGLES)
+    
+    @cached_property
+    def _kn_draft_table(self):
+        """
+        KN at the default heel angles tabulated against draft, so a standard
+        GZ curve needs no displacement -> KN lookup
+        
+        Displacement is piecewise linear in draft and KN is piecewise linear in
+        displacement, so KN is piecewise linear in draft with breakpoints at the
+        hydrostatic drafts and at the drafts whose displacement falls on a KN
+        grid point. Tabulating at exactly those drafts keeps the lookup exact.
+        
+        Returns:
+            Tuple of (draft grid, KN table shaped (n_drafts, n_default_angles)),
+            or None if displacement does not increase with draft
+        """
+        # Same errors as the public lookups if reached before their checks
+        if self.hydrostatic_data is None:
+            raise ValueError("Hydrostatic data not loaded")
+        if self.kn_curves is None:
+            raise ValueError("KN curves not loaded")
+        
+        drafts, disps = self._drafts, self._props['Displacement']
+        if not np.all(np.diff(disps) > 0):
+            # Displacement must increase with draft for the breakpoints to be found
+            return None
+        
+        kn_disps = self.data_loader.kn_disps
+        inside = (kn_disps > disps[0]) & (kn_disps < disps[-1])
+        grid = np.union1d(drafts, np.interp(kn_disps[inside], disps, drafts))
+        
+        kn_angles = self.data_loader.kn_angles
+        table = np.vstack([
+            np.interp(DEFAULT_HEEL_ANGLES, kn_angles, self.data_loader.get_kn_row(displacement))
+            for displacement in np.interp(grid, drafts, disps)
+        ])
+        return grid, table
+    
+    def _angle_brackets(self, heel_angles):
+        """
+        Locate the tabulated KN angles bracketing each heel angle
+        
+        Args:
+            heel_angles: Heel angles in degrees
             
-            gz_curve['heel_angles'].append(angle)
-            gz_curve['gz_values'].append(gz)
-            gz_curve['kn_values'].append(kn)
+        Returns:
+            Tuple of (angles, lower, upper, bracketed) arrays; lower == upper on
+            an exact match and bracketed is False outside the tabulated range
+        """
+        kn_angles = self.data_loader.kn_angles
+        angles = np.asarray(heel_angles, dtype=np.float64)
         
-        return gz_curve
+        upper = np.searchsorted(kn_angles, angles)
+        exact = (upper < len(kn_angles)) & (kn_angles[np.minimum(upper, len(kn_angles) - 1)] == angles)
+        lower = np.where(exact, upper, upper - 1)
+        bracketed = (lower >= 0) & (upper < len(kn_angles))
+        lower = np.clip(lower, 0, len(kn_angles) - 1)
+        upper = np.clip(upper, 0, len(kn_angles) - 1)
+        
+        return angles, lower, upper, bracketed
     
     def find_max_gz(self, gz_curve):
         """
@@ -219,15 +348,16 @@ class Interpolator:
         Returns:
             Tuple of (max_gz, angle_at_max_gz)
         """
-        gz_values = gz_curve['gz_values']
-        heel_angles = gz_curve['heel_angles']
+        gz_values = np.asarray(gz_curve['gz_values'], dtype=np.float64)
+        heel_angles = np.asarray(gz_curve['heel_angles'])
         
-        if not gz_values:
+        if gz_values.size == 0:
             return 0.0, 0.0
         
-        max_gz = max(gz_values)
-        max_idx = gz_values.index(max_gz)
-        angle_at_max = heel_angles[max_idx]
+        # Single pass for the maximum and its position
+        max_idx = int(np.argmax(gz_values))
+        max_gz = float(gz_values[max_idx])
+        angle_at_max = float(heel_angles[max_idx])
         
         return max_gz, angle_at_max
     
@@ -241,20 +371,22 @@ class Interpolator:
         Returns:
             Angle of vanishing stability in degrees (or None if not found)
         """
-        gz_values = gz_curve['gz_values']
-        heel_angles = gz_curve['heel_angles']
-        
-        for i in range(len(gz_values) - 1):
-            if gz_values[i] > 0 and gz_values[i + 1] <= 0:
-                # Linear interpolation to find exact angle
-                angle1, angle2 = heel_angles[i], heel_angles[i + 1]
-                gz1, gz2 = gz_values[i], gz_values[i + 1]
-                
-                # Interpolate to find where GZ = 0
-                vanishing_angle = angle1 - gz1 * (angle2 - angle1) / (gz2 - gz1)
-                return vanishing_angle
-        
-        return None
+        gz_values = np.asarray(gz_curve['gz_values'], dtype=np.float64)
+        heel_angles = np.asarray(gz_curve['heel_angles'])
+        
+        # First interval where GZ goes from positive to zero or negative
+        crossing = (gz_values[:-1] > 0) & (gz_values[1:] <= 0)
+        if not crossing.any():
+            return None
+        i = int(np.argmax(crossing))
+        
+        # Linear interpolation to find exact angle
+        angle1, angle2 = heel_angles[i], heel_angles[i + 1]
+        gz1, gz2 = gz_values[i], gz_values[i + 1]
+        
+        # Interpolate to find where GZ = 0
+        vanishing_angle = angle1 - gz1 * (angle2 - angle1) / (gz2 - gz1)
+        return float(vanishing_angle)
     
     def calculate_gz_area(self, gz_curve, angle_start=0, angle_end=30):
         """
@@ -268,25 +400,23 @@ class Interpolator:
         Returns:
             Area in meter-radians
         """
-        gz_values = np.array(gz_curve['gz_values'])
-        heel_angles = np.array(gz_curve['heel_angles'])
+        gz_values = np.asarray(gz_curve['gz_values'], dtype=np.float64)
+        heel_angles = np.asarray(gz_curve['heel_angles'])
+        
+        # Angles in radians for integration (stored on curves from calculate_gz_curve)
+        angles_rad = gz_curve.get('heel_angles_rad')
+        if angles_rad is None:
+            angles_rad = np.radians(heel_angles)
         
         # Filter to desired range
         mask = (heel_angles >= angle_start) & (heel_angles <= angle_end)
-        angles_filtered = heel_angles[mask]
         gz_filtered = gz_values[mask]
         
-        if len(angles_filtered) < 2:
+        if len(gz_filtered) < 2:
             return 0.0
         
-        # Convert angles to radians for integration
-        angles_rad = np.radians(angles_filtered)
-        
-        # Trapezoidal integration (trapezoid for NumPy 2.0+, trapz for older versions)
-        if hasattr(np, 'trapezoid'):
-            area = np.trapezoid(gz_filtered, angles_rad)
-        else:
-            area = np.trapz(gz_filtered, angles_rad)
+        # Trapezoidal integration
+        area = _trapezoid(gz_filtered, angles_rad[mask])
         
         return area
 
@@ -174,6 +174,119 @@ def test_report_generation():
         return False
 
 
+def test_kn_matrix():
+    """Test that the resampled KN grid matches the original curves"""
+    print("\n" + "=" * 80)
+    print("TEST 6: KN Grid")
+    print("=" * 80)
+    
+    from data_loader import DataLoader
+    from interpolation import Interpolator
+    
+    loader = DataLoader()
+    loader.load_hydrostatic_data()
+    loader.load_kn_curves()
+    
+    interp = Interpolator(loader)
+    
+    # Every grid row must reproduce the scalar interpolation of its curve
+    displacement = 50000
+    kn_row = loader.get_kn_row(displacement)
+    print(f"\nGrid shape: {loader.kn_matrix.shape}")
+    for angle, kn in zip(loader.kn_angles, kn_row):
+        expected = interp.interpolate_kn(displacement, angle)
+        assert abs(kn - expected) < 1e-9, f"KN mismatch at {angle}°: {kn} != {expected}"
+    print(f"Displacement {displacement}t → {len(kn_row)} KN values match the curves")
+    
+    print("\n✓ TEST 6 PASSED: KN grid consistent")
+
+
+def test_stability_grid():
+    """Test that the draft/KG sweep matches single-condition calculations"""
+    print("\n" + "=" * 80)
+    print("TEST 7: Stability Grid")
+    print("=" * 80)
+    
+    from data_loader import DataLoader
+    from interpolation import Interpolator
+    from calculator import StabilityCalculator
+    
+    loader = DataLoader()
+    loader.load_hydrostatic_data()
+    loader.load_kn_curves()
+    
+    interp = Interpolator(loader)
+    calc = StabilityCalculator(interp)
+    
+    drafts = [6.0, 10.0]
+    kgs = [7.0, 10.0, 14.0]
+    grid = calc.calculate_stability_grid(drafts, kgs)
+    print(f"\nGrid: {len(drafts)} drafts x {len(kgs)} KGs")
+    
+    for i, draft in enumerate(drafts):
+        for j, kg in enumerate(kgs):
+            results = calc.calculate_stability(draft, kg)
+            expected = {**results['stability'], **results['areas']}
+            for key in ('gm', 'max_gz', 'angle_at_max_gz', 'gz_at_30', 'area_0_30', 'area_0_40', 'area_30_40'):
+                assert abs(grid[key][i, j] - expected[key]) < 1e-9, f"{key} mismatch at draft {draft}, KG {kg}"
+            assert grid['compliant'][i, j] == results['compliance']['overall']['pass']
+    print(f"Compliant conditions: {int(grid['compliant'].sum())}/{grid['compliant'].size}")
+    
+    print("\n✓ TEST 7 PASSED: Stability grid consistent")
+
+
+def test_kn_draft_table():
+    """Test that the default-angle KN draft table matches the full lookup"""
+    print("\n" + "=" * 80)
+    print("TEST 8: KN Draft Table")
+    print("=" * 80)
+    
+    import numpy as np
+    from data_loader import DataLoader
+    from interpolation import Interpolator, DEFAULT_HEEL_ANGLES
+    
+    loader = DataLoader()
+    loader.load_hydrostatic_data()
+    loader.load_kn_curves()
+    
+    interp = Interpolator(loader)
+    print(f"\nTable: {len(interp._kn_draft_table[0])} drafts x {len(DEFAULT_HEEL_ANGLES)} angles")
+    
+    # Passing the angles explicitly bypasses the table
+    for draft in np.linspace(2.0, 14.0, 97):
+        tabulated = interp.calculate_gz_curve(draft, 8.5)
+        direct = interp.calculate_gz_curve(draft, 8.5, heel_angles=list(DEFAULT_HEEL_ANGLES))
+        assert len(tabulated['kn_values']) == len(direct['kn_values']), f"Angle mismatch at draft {draft:.3f}"
+        assert np.allclose(tabulated['kn_values'], direct['kn_values'], rtol=0, atol=1e-9), f"KN mismatch at draft {draft:.3f}"
+    
+    print("\n✓ TEST 8 PASSED: KN draft table consistent")
+
+
+def test_missing_hydrostatic_data():
+    """Test that a GZ curve without hydrostatic data raises ValueError"""
+    print("\n" + "=" * 80)
+    print("TEST 9: Missing Hydrostatic Data")
+    print("=" * 80)
+    
+    from data_loader import DataLoader
+    from interpolation import Interpolator
+    
+    loader = DataLoader()
+    loader.load_kn_curves()
+    interp = Interpolator(loader)
+    
+    # The input checks run before the cached KN draft table is built
+    for heel_angles in (None, [0, 10, 20]):
+        try:
+            interp.calculate_gz_curve(7.5, 9.0, heel_angles=heel_angles)
+        except ValueError as e:
+            assert "Hydrostatic data not loaded" in str(e), str(e)
+        else:
+            raise AssertionError("Expected ValueError for missing hydrostatic data")
+    
+    print("\n✓ TEST 9 PASSED: Missing hydrostatic data reported as ValueError")
+
+
 def main():
     """Run all tests"""
     print("\n" + "=" * 80)
@@ -185,14 +298,19 @@ def main():
         test_interpolation,
         test_gz_calculation,
         test_stability_calculator,
-        test_report_generation
+        test_report_generation,
+        test_kn_matrix,
+        test_stability_grid,
+        test_kn_draft_table,
+        test_missing_hydrostatic_data
     ]
     
     results = []
     for test in tests:
         try:
+            # Tests either return a bool or assert (returning None on success)
             result = test()
-            results.append(result)
+            results.append(result is not False)
         except Exception as e:
             print(f"\n✗ Test failed with exception: {e}")
             results.append(False)
@@ -215,7 +333,7 @@ def main():
         print("\n✗ SOME TESTS FAILED")
         print("\nPlease check the error messages above.")
         print("Make sure all required packages are installed:")
-        print("  pip3 install pandas numpy matplotlib scipy")
+        print("  pip3 install pandas numpy matplotlib")
     
     print("\n" + "=" * 80)
 
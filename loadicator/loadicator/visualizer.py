@@ -3,13 +3,147 @@ Visualization Module for MV Del Monte Loadicator
 Creates GZ curve plots and exports to various formats
 """
 
+import os
+import matplotlib
+# Plots are rendered to files and web responses, so the non-interactive Agg
+# backend is selected before pyplot loads a GUI one; set LOADICATOR_BACKEND
+# (e.g. to "TkAgg") for plot windows
+matplotlib.use(os.environ.get('LOADICATOR_BACKEND', 'Agg'))
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
 import numpy as np
+import threading
+import time
 from datetime import datetime
 from io import BytesIO
 
+from calculator import TIMESTAMP_FORMAT
+
+
+# Whether show_plot can open a window (pyplot figures are otherwise not created)
+_CAN_SHOW = matplotlib.get_backend().lower() != 'agg'
+
+# GZ curve plot title, filled in by _gz_plot_params
+_GZ_TITLE_TEMPLATE = (
+    'GZ CURVE - MV DEL MONTE\n'
+    'Draft: {draft:.2f}m | KG: {kg:.2f}m | Displacement: {displacement:,.0f}t | GM: {gm:.3f}m'
+)
+
+
+def _clip_curve(angles, values, start, end):
+    """
+    Get the part of a curve between two heel angles
+    
+    Heel angles ascend, so the tabulated points are a slice; an endpoint
+    that falls between tabulated angles is added by linear interpolation
+    so shaded areas end exactly at the criterion angles.
+    
+    Args:
+        angles: Ascending heel angles in degrees
+        values: Curve values at each heel angle
+        start, end: Heel angle range in degrees
+        
+    Returns:
+        (angles, values) arrays for the range
+    """
+    i_start = np.searchsorted(angles, start, side='left')
+    i_end = np.searchsorted(angles, end, side='right')
+    clipped_angles, clipped_values = angles[i_start:i_end], values[i_start:i_end]
+    
+    # Only add endpoints inside the tabulated range (no extrapolation)
+    add_start = angles[0] < start < angles[-1] and angles[i_start] != start
+    add_end = angles[0] < end < angles[-1] and angles[i_end - 1] != end
+    if add_start or add_end:
+        edges = [start] * add_start + [end] * add_end
+        edge_values = np.interp(edges, angles, values)
+        clipped_angles = np.concatenate([edges[:add_start], clipped_angles, edges[add_start:]])
+        clipped_values = np.concatenate([edge_values[:add_start], clipped_values, edge_values[add_start:]])
+    
+    return clipped_angles, clipped_values
+
+
+def _gz_plot_params(results):
+    """
+    Extract the values and format the labels used by the GZ curve plot
+    
+    Args:
+        results: Results dictionary from StabilityCalculator
+        
+    Returns:
+        dict of plot values and label strings
+    """
+    stability = results['stability']
+    areas = results['areas']
+    overall = results['compliance']['overall']
+    max_gz = stability['max_gz']
+    angle_at_max = stability['angle_at_max_gz']
+    vanishing = stability['vanishing_angle']
+    
+    title = _GZ_TITLE_TEMPLATE.format(
+        draft=results['input']['draft'],
+        kg=results['input']['kg'],
+        displacement=stability['displacement'],
+        gm=stability['gm']
+    )
+    
+    # Same format and clock as the text report's calculation time
+    timestamp = time.strftime(TIMESTAMP_FORMAT, time.localtime(results['input']['timestamp']))
+    
+    return {
+        'max_gz': max_gz,
+        'angle_at_max': angle_at_max,
+        'max_gz_label': f'Max GZ: {max_gz:.3f}m at {angle_at_max:.1f}°',
+        'vanishing': vanishing,
+        'vanishing_label': f'Vanishing Angle: {vanishing:.1f}°' if vanishing else None,
+        'area_0_30_label': f'Area 0-30°: {areas["area_0_30"]:.4f} m·rad',
+        'area_30_40_label': f'Area 30-40°: {areas["area_30_40"]:.4f} m·rad',
+        'title': title,
+        'compliance_text': f'IMO Compliance: {overall["status"]}',
+        'compliance_color': 'green' if overall['pass'] else 'red',
+        'timestamp_text': f'Calculated: {timestamp}'
+    }
+
+
+def _compliance_arrays(compliance):
+    """
+    Get the compliance criteria as label list and value, limit and pass arrays
+    
+    Args:
+        compliance: Compliance dictionary from StabilityCalculator results
+        
+    Returns:
+        (criteria, values, limits, statuses)
+    """
+    keys = [key for key in compliance if key != 'overall']
+    criteria = [compliance[key]['requirement'].split('≥')[0].strip() for key in keys]
+    values = np.fromiter((compliance[key]['value'] for key in keys), dtype=np.float64, count=len(keys))
+    limits = np.fromiter((compliance[key]['limit'] for key in keys), dtype=np.float64, count=len(keys))
+    statuses = np.fromiter((compliance[key]['pass'] for key in keys), dtype=bool, count=len(keys))
+    return criteria, values, limits, statuses
+
+
+def _bar_verts(widths, y_centers, height):
+    """
+    Get the corner vertices of horizontal bars starting at x = 0
+    
+    Args:
+        widths: Bar widths
+        y_centers: Bar center y positions
+        height: Bar height
+        
+    Returns:
+        (n, 4, 2) array of bar corners
+    """
+    verts = np.zeros((len(widths), 4, 2))
+    verts[:, 1:3, 0] = np.asarray(widths)[:, None]
+    verts[:, :2, 1] = (y_centers - height/2)[:, None]
+    verts[:, 2:, 1] = (y_centers + height/2)[:, None]
+    return verts
+
 
 class Visualizer:
     """Handles visualization of GZ curves and stability data"""
@@ -18,8 +152,33 @@ class Visualizer:
         """Initialize visualizer with default settings"""
         self.figure_size = (12, 8)
         self.dpi = 100
+        self._compliance_skeleton = None
+        self._compliance_lock = threading.Lock()
+        self._gz_blit = None
+        
+        # Default subplot margins, read once so the compliance layout does
+        # not depend on rcParams changed later (possibly by another thread)
+        self._subplot_margins = {
+            side: plt.rcParams[f'figure.subplot.{side}'] for side in ('left', 'right', 'bottom', 'top')
+        }
+    
+    def _new_figure(self, figsize, show_plot):
+        """
+        Create a figure with a single axes
         
-    def plot_gz_curve(self, results, show_plot=True, save_path=None):
+        Only figures that will be shown go through pyplot; pyplot keeps every
+        figure it creates alive until it is closed, so figures that are only
+        saved or returned (or cannot be shown under Agg) are standalone
+        Figures on an Agg canvas.
+        """
+        if show_plot and _CAN_SHOW:
+            fig = plt.figure(figsize=figsize, dpi=self.dpi)
+        else:
+            fig = Figure(figsize=figsize, dpi=self.dpi)
+            FigureCanvasAgg(fig)
+        return fig, fig.subplots()
+        
+    def plot_gz_curve(self, results, show_plot=True, save_path=None, dpi=None):
         """
         Plot GZ curve with stability information
         
@@ -27,49 +186,44 @@ class Visualizer:
             results: Results dictionary from StabilityCalculator
             show_plot: Whether to display the plot
             save_path: Path to save the plot (optional)
+            dpi: Resolution of the saved plot (defaults to the figure dpi)
             
         Returns:
             matplotlib figure object
         """
         gz_curve = results['gz_curve']
-        heel_angles = gz_curve['heel_angles']
-        gz_values = gz_curve['gz_values']
+        angles_arr = np.asarray(gz_curve['heel_angles'], dtype=np.float64)
+        gz_arr = np.asarray(gz_curve['gz_values'], dtype=np.float64)
+        params = _gz_plot_params(results)
         
         # Create figure
-        fig, ax = plt.subplots(figsize=self.figure_size, dpi=self.dpi)
+        fig, ax = self._new_figure(self.figure_size, show_plot)
         
         # Plot GZ curve
-        ax.plot(heel_angles, gz_values, 'b-', linewidth=2.5, label='GZ Curve')
-        ax.plot(heel_angles, gz_values, 'bo', markersize=5)
+        ax.plot(angles_arr, gz_arr, 'b-o', linewidth=2.5, markersize=5, label='GZ Curve', gid='gz_line')
         
         # Add zero line
         ax.axhline(y=0, color='k', linestyle='-', linewidth=0.8, alpha=0.5)
         
         # Mark maximum GZ
-        max_gz = results['stability']['max_gz']
-        angle_at_max = results['stability']['angle_at_max_gz']
-        ax.plot(angle_at_max, max_gz, 'ro', markersize=10, label=f'Max GZ: {max_gz:.3f}m at {angle_at_max:.1f}°')
+        ax.plot(params['angle_at_max'], params['max_gz'], 'ro', markersize=10, label=params['max_gz_label'],
+                gid='max_gz')
         
         # Mark vanishing angle if exists
-        if results['stability']['vanishing_angle']:
-            vanishing = results['stability']['vanishing_angle']
-            ax.axvline(x=vanishing, color='r', linestyle='--', linewidth=1.5, 
-                      label=f'Vanishing Angle: {vanishing:.1f}°', alpha=0.7)
+        if params['vanishing']:
+            ax.axvline(x=params['vanishing'], color='r', linestyle='--', linewidth=1.5, 
+                      label=params['vanishing_label'], alpha=0.7, gid='vanishing')
         
         # Shade areas for IMO criteria
         # Area 0-30°
-        mask_30 = np.array(heel_angles) <= 30
-        angles_30 = np.array(heel_angles)[mask_30]
-        gz_30 = np.array(gz_values)[mask_30]
+        angles_30, gz_30 = _clip_curve(angles_arr, gz_arr, 0, 30)
         ax.fill_between(angles_30, 0, gz_30, alpha=0.2, color='green', 
-                        label=f'Area 0-30°: {results["areas"]["area_0_30"]:.4f} m·rad')
+                        label=params['area_0_30_label'])
         
         # Area 30-40°
-        mask_30_40 = (np.array(heel_angles) >= 30) & (np.array(heel_angles) <= 40)
-        angles_30_40 = np.array(heel_angles)[mask_30_40]
-        gz_30_40 = np.array(gz_values)[mask_30_40]
+        angles_30_40, gz_30_40 = _clip_curve(angles_arr, gz_arr, 30, 40)
         ax.fill_between(angles_30_40, 0, gz_30_40, alpha=0.2, color='yellow',
-                        label=f'Area 30-40°: {results["areas"]["area_30_40"]:.4f} m·rad')
+                        label=params['area_30_40_label'])
         
         # Grid
         ax.grid(True, which='both', linestyle='--', linewidth=0.5, alpha=0.7)
@@ -80,54 +234,100 @@ class Visualizer:
         ax.set_xlabel('Heel Angle (degrees)', fontsize=12, fontweight='bold')
         ax.set_ylabel('GZ - Righting Lever (meters)', fontsize=12, fontweight='bold')
         
-        title = f'GZ CURVE - MV DEL MONTE\n'
-        title += f'Draft: {results["input"]["draft"]:.2f}m | '
-        title += f'KG: {results["input"]["kg"]:.2f}m | '
-        title += f'Displacement: {results["stability"]["displacement"]:,.0f}t | '
-        title += f'GM: {results["stability"]["gm"]:.3f}m'
-        
-        ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
+        ax.set_title(params['title'], fontsize=14, fontweight='bold', pad=20)
         
         # Legend
         ax.legend(loc='best', fontsize=9, framealpha=0.9)
         
-        # Set axis limits
-        ax.set_xlim(0, max(heel_angles))
+        # Set axis limits (heel angles ascend, so the last is the largest)
+        ax.set_xlim(0, float(angles_arr[-1]))
         
         # Adjust y-axis to show negative values if any
-        y_min = min(0, min(gz_values) * 1.1)
-        y_max = max(gz_values) * 1.1
-        ax.set_ylim(y_min, y_max)
+        gz_min, gz_max = float(gz_arr.min()), float(gz_arr.max())
+        ax.set_ylim(min(0.0, gz_min * 1.1), gz_max * 1.1)
         
         # Add compliance status text box
-        compliance_status = results['compliance']['overall']['status']
-        compliance_color = 'green' if results['compliance']['overall']['pass'] else 'red'
-        
-        textstr = f'IMO Compliance: {compliance_status}'
-        props = dict(boxstyle='round', facecolor=compliance_color, alpha=0.3)
-        ax.text(0.02, 0.98, textstr, transform=ax.transAxes, fontsize=11,
+        props = dict(boxstyle='round', facecolor=params['compliance_color'], alpha=0.3)
+        ax.text(0.02, 0.98, params['compliance_text'], transform=ax.transAxes, fontsize=11,
                 verticalalignment='top', bbox=props, fontweight='bold')
         
         # Add calculation timestamp
-        timestamp = results['input']['calculation_time']
-        ax.text(0.98, 0.02, f'Calculated: {timestamp}', transform=ax.transAxes,
+        ax.text(0.98, 0.02, params['timestamp_text'], transform=ax.transAxes,
                 fontsize=8, verticalalignment='bottom', horizontalalignment='right',
                 style='italic', alpha=0.7)
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save if path provided
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=dpi or self.dpi, bbox_inches='tight')
             print(f"✓ Plot saved to: {save_path}")
-        
+    
         # Show if requested
-        if show_plot:
+        if show_plot and _CAN_SHOW:
             plt.show()
         
         return fig
     
-    def plot_compliance_summary(self, results, show_plot=True, save_path=None):
+    def update_gz_curve(self, results):
+        """
+        Redraw only the GZ curve, max GZ marker and vanishing angle line
+        
+        For repeated interactive updates (e.g. a sweep over KG). The first call
+        plots the full figure and caches its static background; later calls
+        restore that background and blit the changed artists, so the title,
+        legend, shading and axis limits remain those of the first call. Use
+        plot_gz_curve for a complete redraw.
+        
+        Args:
+            results: Results dictionary from StabilityCalculator
+            
+        Returns:
+            matplotlib figure object
+        """
+        if self._gz_blit is None:
+            fig = self.plot_gz_curve(results, show_plot=plt.isinteractive())
+            ax = fig.axes[0]
+            artists = {line.get_gid(): line for line in ax.lines if line.get_gid()}
+            if 'vanishing' not in artists:
+                artists['vanishing'] = ax.axvline(x=0, color='r', linestyle='--', linewidth=1.5,
+                                                  alpha=0.7, visible=False)
+            
+            # Draw everything else once and keep it as the background
+            for artist in artists.values():
+                artist.set_animated(True)
+            fig.canvas.draw()
+            self._gz_blit = {
+                'fig': fig,
+                'ax': ax,
+                'artists': artists,
+                'background': fig.canvas.copy_from_bbox(ax.bbox)
+            }
+        
+        blit = self._gz_blit
+        artists = blit['artists']
+        gz_curve = results['gz_curve']
+        angles_arr = np.asarray(gz_curve['heel_angles'], dtype=np.float64)
+        gz_arr = np.asarray(gz_curve['gz_values'], dtype=np.float64)
+        
+        artists['gz_line'].set_data(angles_arr, gz_arr)
+        artists['max_gz'].set_data([results['stability']['angle_at_max_gz']], [results['stability']['max_gz']])
+        
+        vanishing = results['stability']['vanishing_angle']
+        artists['vanishing'].set_visible(bool(vanishing))
+        if vanishing:
+            artists['vanishing'].set_xdata([vanishing, vanishing])
+        
+        canvas = blit['fig'].canvas
+        canvas.restore_region(blit['background'])
+        for artist in artists.values():
+            blit['ax'].draw_artist(artist)
+        canvas.blit(blit['ax'].bbox)
+        canvas.flush_events()
+        
+        return blit['fig']
+    
+    def plot_compliance_summary(self, results, show_plot=True, save_path=None, dpi=None):
         """
         Create a visual summary of IMO compliance criteria
         
@@ -135,39 +335,71 @@ class Visualizer:
             results: Results dictionary from StabilityCalculator
             show_plot: Whether to display the plot
             save_path: Path to save the plot (optional)
+            dpi: Resolution of the saved plot (defaults to the figure dpi)
             
         Returns:
             matplotlib figure object
         """
-        compliance = results['compliance']
+        criteria, values, limits, statuses = _compliance_arrays(results['compliance'])
         
-        # Prepare data
-        criteria = []
-        values = []
-        limits = []
-        statuses = []
+        skeleton = self._build_compliance_skeleton(criteria, show_plot)
+        self._update_compliance_skeleton(skeleton, values, limits, statuses, results['compliance']['overall'])
+        fig = skeleton['fig']
         
-        for key, criterion in compliance.items():
-            if key == 'overall':
-                continue
+        # Save if path provided
+        if save_path:
+            fig.savefig(save_path, dpi=dpi or self.dpi, bbox_inches='tight')
+            print(f"✓ Compliance summary saved to: {save_path}")
+        
+        # Show if requested
+        if show_plot and _CAN_SHOW:
+            plt.show()
+        
+        return fig
+    
+    def _shared_compliance_summary(self, results):
+        """
+        Draw the compliance summary on the figure reused by the PDF exports
+        
+        The axes, labels and artists are built once and only updated per
+        call. Callers must hold _compliance_lock until they are done with
+        the returned figure, since the next call redraws it.
+        
+        Args:
+            results: Results dictionary from StabilityCalculator
             
-            criteria.append(criterion['requirement'].split('≥')[0].strip())
-            values.append(criterion['value'])
-            limits.append(criterion['limit'])
-            statuses.append(criterion['pass'])
+        Returns:
+            matplotlib figure object
+        """
+        criteria, values, limits, statuses = _compliance_arrays(results['compliance'])
         
-        # Create figure
-        fig, ax = plt.subplots(figsize=(10, 6), dpi=self.dpi)
+        skeleton = self._compliance_skeleton
+        if skeleton is None or skeleton['criteria'] != criteria:
+            skeleton = self._build_compliance_skeleton(criteria, show_plot=False)
+            self._compliance_skeleton = skeleton
+        self._update_compliance_skeleton(skeleton, values, limits, statuses, results['compliance']['overall'])
+        
+        return skeleton['fig']
+    
+    def _build_compliance_skeleton(self, criteria, show_plot):
+        """
+        Build the parts of the compliance summary that do not depend on the results
+        
+        Returns:
+            dict with the figure and the artists updated on each call
+        """
+        fig, ax = self._new_figure((10, 6), show_plot)
         
         # Bar positions
         y_pos = np.arange(len(criteria))
         bar_height = 0.35
         
-        # Plot bars
-        colors = ['green' if status else 'red' for status in statuses]
-        bars1 = ax.barh(y_pos - bar_height/2, values, bar_height, label='Actual Value', color=colors, alpha=0.7)
-        bars2 = ax.barh(y_pos + bar_height/2, limits, bar_height, label='Required Minimum', 
-                       color='blue', alpha=0.5, edgecolor='black', linewidth=1)
+        # Plot bars, one collection per series (widths and colors are set per call)
+        bars1 = PolyCollection([], facecolors='green', edgecolors='none', alpha=0.7)
+        bars2 = PolyCollection([], facecolors='blue', edgecolors='black', linewidths=1, alpha=0.5)
+        for bars in (bars1, bars2):
+            bars.sticky_edges.x.append(0)
+            ax.add_collection(bars, autolim=False)
         
         # Labels
         ax.set_yticks(y_pos)
@@ -176,62 +408,90 @@ class Visualizer:
         ax.set_title('IMO Intact Stability Code - Compliance Summary\nMV DEL MONTE', 
                     fontsize=13, fontweight='bold', pad=15)
         
-        # Legend
-        ax.legend(loc='best', fontsize=9)
-        
         # Grid
         ax.grid(True, axis='x', linestyle='--', linewidth=0.5, alpha=0.7)
         
-        # Add value labels on bars
-        for i, (bar, value, status) in enumerate(zip(bars1, values, statuses)):
-            width = bar.get_width()
-            label_x = width + max(values) * 0.02
-            label = f'{value:.4f}'
-            color = 'green' if status else 'red'
-            ax.text(label_x, bar.get_y() + bar.get_height()/2, label,
-                   ha='left', va='center', fontsize=8, fontweight='bold', color=color)
+        # Value labels on bars
+        value_texts = [
+            ax.text(0, y, '', ha='left', va='center', fontsize=8, fontweight='bold')
+            for y in y_pos - bar_height/2
+        ]
         
         # Overall status
-        overall_status = compliance['overall']['status']
-        status_color = 'green' if compliance['overall']['pass'] else 'red'
-        
-        textstr = f'Overall: {overall_status}'
-        props = dict(boxstyle='round', facecolor=status_color, alpha=0.3)
-        ax.text(0.98, 0.98, textstr, transform=ax.transAxes, fontsize=12,
-                verticalalignment='top', horizontalalignment='right', 
-                bbox=props, fontweight='bold')
-        
-        plt.tight_layout()
-        
-        # Save if path provided
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"✓ Compliance summary saved to: {save_path}")
-        
-        # Show if requested
-        if show_plot:
-            plt.show()
+        props = dict(boxstyle='round', facecolor='green', alpha=0.3)
+        status_text = ax.text(0.98, 0.98, '', transform=ax.transAxes, fontsize=12,
+                              verticalalignment='top', horizontalalignment='right', 
+                              bbox=props, fontweight='bold')
+        
+        return {
+            'criteria': criteria,
+            'fig': fig,
+            'ax': ax,
+            'bars1': bars1,
+            'bars2': bars2,
+            'y_pos': y_pos,
+            'bar_height': bar_height,
+            'value_texts': value_texts,
+            'status_text': status_text
+        }
+    
+    def _update_compliance_skeleton(self, skeleton, values, limits, statuses, overall):
+        """Set the bar widths, colors and labels of a compliance summary skeleton from criteria arrays"""
+        ax = skeleton['ax']
+        colors = np.where(statuses, 'green', 'red')
+        
+        y_pos, bar_height = skeleton['y_pos'], skeleton['bar_height']
+        verts1 = _bar_verts(values, y_pos - bar_height/2, bar_height)
+        verts2 = _bar_verts(limits, y_pos + bar_height/2, bar_height)
+        skeleton['bars1'].set_verts(verts1)
+        skeleton['bars1'].set_facecolor(colors)
+        skeleton['bars2'].set_verts(verts2)
+        
+        # Legend (the actual-value swatch shows the first bar's color)
+        ax.legend(handles=[
+            mpatches.Patch(facecolor=colors[0], alpha=0.7, label='Actual Value'),
+            mpatches.Patch(facecolor='blue', alpha=0.5, edgecolor='black', linewidth=1, label='Required Minimum')
+        ], loc='best', fontsize=9)
+        
+        # Value labels on bars
+        label_xs = values + values.max() * 0.02
+        for text, label_x, value, color in zip(skeleton['value_texts'], label_xs, values, colors):
+            text.set_x(label_x)
+            text.set_text(f'{value:.4f}')
+            text.set_color(color)
         
-        return fig
+        # Overall status
+        skeleton['status_text'].set_text(f'Overall: {overall["status"]}')
+        skeleton['status_text'].get_bbox_patch().set_facecolor('green' if overall['pass'] else 'red')
+        
+        # Rescale to the new bar widths and lay out from the default margins,
+        # since the value labels overhanging the axes depend on its position
+        ax.ignore_existing_data_limits = True
+        ax.update_datalim(np.concatenate([verts1, verts2]).reshape(-1, 2))
+        ax.autoscale_view()
+        skeleton['fig'].subplots_adjust(**self._subplot_margins)
+        skeleton['fig'].tight_layout()
     
-    def export_to_pdf(self, results, pdf_path):
+    def _write_pdf(self, results, target):
         """
-        Export complete stability report to PDF
+        Write the complete stability report as PDF
         
         Args:
             results: Results dictionary from StabilityCalculator
-            pdf_path: Path to save PDF file
+            target: Path or binary file object to write to
         """
-        with PdfPages(pdf_path) as pdf:
+        with PdfPages(target) as pdf:
             # Page 1: GZ Curve
             fig1 = self.plot_gz_curve(results, show_plot=False)
-            pdf.savefig(fig1, bbox_inches='tight')
-            plt.close(fig1)
+            pdf.savefig(fig1)
+            fig1.clear()
+            del fig1
             
-            # Page 2: Compliance Summary
-            fig2 = self.plot_compliance_summary(results, show_plot=False)
-            pdf.savefig(fig2, bbox_inches='tight')
-            plt.close(fig2)
+            # Page 2: Compliance Summary (a reused figure, so not cleared; the
+            # lock keeps concurrent exports from redrawing it mid-write)
+            with self._compliance_lock:
+                fig2 = self._shared_compliance_summary(results)
+                pdf.savefig(fig2)
             
             # Set PDF metadata
             d = pdf.infodict()
@@ -240,41 +500,47 @@ class Visualizer:
             d['Subject'] = 'GZ Curve and Stability Analysis'
             d['Keywords'] = 'Stability, GZ Curve, IMO, Marine'
             d['CreationDate'] = datetime.now()
+    
+    def export_to_pdf(self, results, pdf_path):
+        """
+        Export complete stability report to PDF
+        
+        Args:
+            results: Results dictionary from StabilityCalculator
+            pdf_path: Path to save PDF file
+        """
+        self._write_pdf(results, pdf_path)
         
         print(f"✓ PDF report saved to: {pdf_path}")
 
-    def export_to_pdf_bytes(self, results):
+    def export_to_pdf_buffer(self, results):
         """
-        Export complete stability report to PDF in memory
+        Export complete stability report to an in-memory PDF file
 
         Args:
             results: Results dictionary from StabilityCalculator
 
         Returns:
-            bytes: PDF content as bytes for download
+            BytesIO: PDF file positioned at the start, for streaming responses
         """
         buffer = BytesIO()
-        with PdfPages(buffer) as pdf:
-            # Page 1: GZ Curve
-            fig1 = self.plot_gz_curve(results, show_plot=False)
-            pdf.savefig(fig1, bbox_inches='tight')
-            plt.close(fig1)
+        self._write_pdf(results, buffer)
+        buffer.seek(0)
+        return buffer
 
-            # Page 2: Compliance Summary
-            fig2 = self.plot_compliance_summary(results, show_plot=False)
-            pdf.savefig(fig2, bbox_inches='tight')
-            plt.close(fig2)
+    def export_to_pdf_bytes(self, results):
+        """
+        Export complete stability report to PDF in memory
 
-            # Set PDF metadata
-            d = pdf.infodict()
-            d['Title'] = 'MV Del Monte - Stability Calculation Report'
-            d['Author'] = 'Loadicator v1.0'
-            d['Subject'] = 'GZ Curve and Stability Analysis'
-            d['Keywords'] = 'Stability, GZ Curve, IMO, Marine'
-            d['CreationDate'] = datetime.now()
+        Args:
+            results: Results dictionary from StabilityCalculator
 
-        buffer.seek(0)
-        return buffer.getvalue()
+        Returns:
+            bytes: PDF content as bytes for download
+        """
+        # The buffer is not referenced elsewhere, so getvalue() hands over
+        # its storage instead of copying it
+        return self.export_to_pdf_buffer(results).getvalue()
 
 
 if __name__ == "__main__":